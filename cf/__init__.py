@@ -244,6 +244,8 @@ from .domainancillary     import DomainAncillary
 from .domainaxis          import DomainAxis
 from .fieldancillary      import FieldAncillary
 from .field               import Field
+from .collapseaccumulator import CollapseAccumulator
+from .regridoperator      import RegridOperator
 from .data                import (Data,
                                   FilledArray,
                                   GatheredArray,
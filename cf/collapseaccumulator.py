@@ -0,0 +1,701 @@
+import logging
+import pickle
+
+from copy import deepcopy
+from functools import partial as functools_partial
+
+from numpy import broadcast_to as numpy_broadcast_to
+from numpy import prod as numpy_prod
+from numpy import reshape as numpy_reshape
+from numpy import transpose as numpy_transpose
+
+from numpy.ma import isMA as numpy_ma_isMA
+from numpy.ma import masked_all as numpy_ma_masked_all
+from numpy.ma import masked_where as numpy_ma_masked_where
+from numpy.ma import nomask as numpy_ma_nomask
+
+from .bounds import Bounds
+from .domainaxis import DomainAxis
+from .fieldlist import FieldList
+from .field import _collapse_methods, _collapse_weighted_methods
+
+from .data import Data
+from .data.data import _collapse_functions, _collapse_units
+from .data.collapse_functions import (multi_f,
+                                      multi_fpartial,
+                                      multi_ffinalise)
+
+from .functions import inspect as cf_inspect
+
+
+logger = logging.getLogger(__name__)
+
+
+class CollapseAccumulator:
+    '''An accumulator of collapse statistics over successive fields.
+
+    A collapse accumulator calculates statistics, such as running
+    means, extrema and variances, over a collapse axis that grows as
+    new field constructs are added to it. Each field construct added
+    with `update` contributes only its own data to partial statistics
+    that are kept in memory, so the cost of an update does not depend
+    on how much data has already been accumulated. This is useful
+    when data arrive one time step at a time, for instance during
+    operational ingestion.
+
+    All field constructs added to an accumulator must have the same
+    domain, apart from the sizes of, and coordinates along, the
+    collapse axes.
+
+    At any time, the collapsed field constructs for the data
+    accumulated so far are returned by the `field` and `fields`
+    methods. These have the same metadata as would result from
+    collapsing the concatenation of all of the accumulated field
+    constructs with `cf.Field.collapse`, including updated cell
+    methods and coordinate bounds.
+
+    An accumulator may be saved to a file with `save` and restored
+    with `load`, so that accumulation can be resumed after a restart.
+
+    .. versionadded:: 3.8.0
+
+    .. seealso:: `cf.Field.collapse`
+
+    **Examples:**
+
+    >>> a = cf.CollapseAccumulator(['mean', 'maximum', 'sd'], axes='T')
+    >>> for f in time_steps:
+    ...     a.update(f)
+    ...
+    >>> mean = a.field('mean')
+    >>> a.save('accumulator.pkl')
+
+    and after a restart:
+
+    >>> a = cf.CollapseAccumulator.load('accumulator.pkl')
+    >>> a.update(g)
+    >>> fl = a.fields()
+
+    '''
+    def __init__(self, methods, axes='T', weights=None, ddof=1, mtol=1):
+        '''**Initialization**
+
+    :Parameters:
+
+        methods: (sequence of) `str`
+            The collapse methods. Each method must be one that may be
+            calculated from a single pass over the data, i.e. one of
+            ``'maximum'``, ``'minimum'``, ``'maximum_absolute_value'``,
+            ``'minimum_absolute_value'``, ``'mean'``,
+            ``'mean_absolute_value'``, ``'root_mean_square'``,
+            ``'mid_range'``, ``'range'``, ``'sample_size'``,
+            ``'sum'``, ``'sum_of_squares'``, ``'standard_deviation'``
+            and ``'variance'``, or one of their aliases accepted by
+            `cf.Field.collapse`.
+
+        axes: (sequence of) `str`, optional
+            The collapse axes, defined by those which would be
+            selected by passing each given axis description to a call
+            of each field construct's `~cf.Field.domain_axis`
+            method. By default the time axis, ``'T'``, is collapsed.
+
+        weights: optional
+            Specify the weights for weighted collapse methods, as
+            for the *weights* parameter of `cf.Field.weights`. The
+            weights are always created as true cell measures (see the
+            *measure* parameter of `cf.Field.weights`), so that
+            weights calculated from different field constructs are
+            comparable, even for a field construct with a single
+            element along a collapse axis. By default the collapses
+            are unweighted.
+
+            *Parameter example:*
+              To weight by time coordinate cell size:
+              ``weights='T'``.
+
+        ddof: number, optional
+            The delta degrees of freedom for the
+            ``'standard_deviation'`` and ``'variance'`` collapses.
+
+        mtol: number, optional
+            Set the fraction of input data elements which is allowed
+            to contain missing data when contributing to an individual
+            output data element, as for `cf.Field.collapse`.
+
+        '''
+        if isinstance(methods, str):
+            methods = (methods,)
+
+        if isinstance(axes, (str, int)):
+            axes = (axes,)
+
+        data_methods = []
+        for method in methods:
+            data_method = _collapse_methods.get(method)
+            if data_method not in _collapse_functions:
+                raise ValueError(
+                    "Can't accumulate collapse method: {!r}".format(method))
+
+            data_methods.append(data_method)
+        # --- End: for
+
+        if not data_methods:
+            raise ValueError("Can't accumulate: No collapse methods")
+
+        funcs = []
+        fpartials = []
+        ffinalises = []
+        weighted = []
+        for method in data_methods:
+            func, fpartial, ffinalise, w = _collapse_functions[method]
+            if method in ('sd', 'var'):
+                func = functools_partial(func, ddof=ddof)
+
+            funcs.append(func)
+            fpartials.append(fpartial)
+            ffinalises.append(ffinalise)
+            weighted.append(w)
+        # --- End: for
+
+        self._methods = tuple(methods)
+        self._data_methods = tuple(data_methods)
+        self._axes = tuple(axes)
+        self._weights = weights
+        self._ddof = ddof
+        self._mtol = mtol
+
+        self._func = functools_partial(multi_f, functions=tuple(funcs),
+                                       weighted=tuple(weighted))
+        self._fpartial = functools_partial(multi_fpartial,
+                                           fpartials=tuple(fpartials))
+        self._ffinalise = functools_partial(multi_ffinalise,
+                                            ffinalises=tuple(ffinalises))
+
+        # The accumulated state
+        self._template = None
+        self._template_iaxes = None
+        self._collapse_axes = None
+        self._partial = None
+        self._sub_samples = 0
+        self._masked = False
+        self._Nmax = 0
+        self._sizes = None
+        self._coordinate_bounds = None
+
+    def __repr__(self):
+        '''Called by the `repr` built-in function.
+
+    x.__repr__() <==> repr(x)
+
+        '''
+        return '<CF {}: {}>'.format(self.__class__.__name__, self)
+
+    def __str__(self):
+        '''Called by the `str` built-in function.
+
+    x.__str__() <==> str(x)
+
+        '''
+        out = '{} over {}'.format(', '.join(self._methods),
+                                  ', '.join(map(str, self._axes)))
+        if self._template is not None:
+            out = '{}: {}'.format(self._template.identity(''), out)
+
+        return '{} ({} updates)'.format(out, self._sub_samples)
+
+    # ----------------------------------------------------------------
+    # Attributes
+    # ----------------------------------------------------------------
+    @property
+    def methods(self):
+        '''The collapse methods.
+
+    **Examples:**
+
+    >>> a = cf.CollapseAccumulator(['mean', 'maximum'])
+    >>> a.methods
+    ('mean', 'maximum')
+
+        '''
+        return self._methods
+
+    @property
+    def sample_size(self):
+        '''The number of elements accumulated along the collapse axes.
+
+    **Examples:**
+
+    >>> a.sample_size
+    0
+    >>> a.update(f)
+    >>> f.domain_axis('T').get_size()
+    12
+    >>> a.sample_size
+    12
+
+        '''
+        return self._Nmax
+
+    # ----------------------------------------------------------------
+    # Methods
+    # ----------------------------------------------------------------
+    def _collapse_axes_keys(self, f):
+        '''Return the domain axis keys of the collapse axes.
+
+    :Parameters:
+
+        f: `Field`
+
+    :Returns:
+
+        `list`
+
+        '''
+        keys = []
+        for axis in self._axes:
+            key = f.domain_axis(axis, key=True, default=None)
+            if key is None:
+                raise ValueError(
+                    "Can't accumulate {!r}: Can't find the collapse axis "
+                    "identified by {!r}".format(f, axis)
+                )
+
+            keys.append(key)
+        # --- End: for
+
+        return keys
+
+    def _check_domain(self, f, iaxes):
+        '''Check that a field construct is compatible with the template.
+
+    The non-collapse axes must be in the same order as those of the
+    template, with the same sizes and equal dimension coordinates.
+
+    :Parameters:
+
+        f: `Field`
+
+        iaxes: `list` of `int`
+            The positions of the collapse axes in the field
+            construct's data.
+
+    :Returns:
+
+        `None`
+
+        '''
+        template = self._template
+
+        shape = [n for i, n in enumerate(f.data.shape) if i not in iaxes]
+        template_shape = [n for i, n in enumerate(template.data.shape)
+                          if i not in self._template_iaxes]
+
+        if shape != template_shape:
+            raise ValueError(
+                "Can't accumulate {!r}: Non-collapse axes have shape {}, "
+                "but expected shape {}".format(f, tuple(shape),
+                                               tuple(template_shape))
+            )
+
+        template_axes = [axis
+                         for i, axis in enumerate(template.get_data_axes())
+                         if i not in self._template_iaxes]
+        axes = [axis for i, axis in enumerate(f.get_data_axes())
+                if i not in iaxes]
+
+        for axis, template_axis in zip(axes, template_axes):
+            dim = f.dimension_coordinate(axis, default=None)
+            template_dim = template.dimension_coordinate(template_axis,
+                                                         default=None)
+            if dim is None and template_dim is None:
+                continue
+
+            if (dim is None or template_dim is None or
+                    not dim.equals(template_dim)):
+                raise ValueError(
+                    "Can't accumulate {!r}: Non-collapse axis has dimension "
+                    "coordinates {!r}, but expected {!r}".format(
+                        f, dim, template_dim)
+                )
+        # --- End: for
+
+        if not f.Units.equivalent(template.Units):
+            raise ValueError(
+                "Can't accumulate {!r}: Units {!r} are not equivalent to "
+                "{!r}".format(f, f.Units, template.Units)
+            )
+
+    def _update_coordinate_bounds(self, f, keys):
+        '''Update the extent of the collapse axis coordinates.
+
+    :Parameters:
+
+        f: `Field`
+
+        keys: `list`
+            The domain axis keys of the collapse axes of *f*, in the
+            same order as the template's collapse axes.
+
+    :Returns:
+
+        `None`
+
+        '''
+        for key, template_key in zip(keys, self._collapse_axes):
+            dim = f.dimension_coordinate(key, default=None)
+            if dim is None:
+                continue
+
+            units = self._template.dimension_coordinate(
+                template_key).Units
+
+            if dim.has_bounds():
+                data = dim.bounds.data
+            else:
+                data = dim.data
+
+            if not data.Units.equals(units):
+                data = data.copy()
+                data.Units = units
+
+            array = data.array
+            lower = array.min()
+            upper = array.max()
+
+            bounds = self._coordinate_bounds.get(template_key)
+            if bounds is not None:
+                lower = min(lower, bounds[0])
+                upper = max(upper, bounds[1])
+
+            self._coordinate_bounds[template_key] = (lower, upper)
+
+    def copy(self):
+        '''Return a deep copy.
+
+    ``a.copy()`` is equivalent to ``copy.deepcopy(a)``.
+
+    :Returns:
+
+        `CollapseAccumulator`
+            The deep copy.
+
+    **Examples:**
+
+    >>> b = a.copy()
+
+        '''
+        return deepcopy(self)
+
+    def field(self, method=None):
+        '''Return the collapsed field construct for one method.
+
+    .. seealso:: `fields`, `update`
+
+    :Parameters:
+
+        method: `str`, optional
+            The collapse method, which must be one of those given
+            when the accumulator was initialised. May be omitted if
+            only one method was given.
+
+    :Returns:
+
+        `Field`
+            The collapsed field construct for the data accumulated so
+            far.
+
+    **Examples:**
+
+    >>> a = cf.CollapseAccumulator(['mean', 'maximum'], axes='T')
+    >>> a.update(f)
+    >>> g = a.field('maximum')
+
+        '''
+        if method is None:
+            if len(self._methods) > 1:
+                raise ValueError(
+                    "Must specify a collapse method from {}".format(
+                        self._methods)
+                )
+
+            return self.fields()[0]
+
+        if method not in self._methods:
+            raise ValueError(
+                "Collapse method {!r} is not being accumulated. Choose "
+                "from {}".format(method, self._methods)
+            )
+
+        return self.fields()[self._methods.index(method)]
+
+    def fields(self):
+        '''Return the collapsed field constructs for all methods.
+
+    .. seealso:: `field`, `update`
+
+    :Returns:
+
+        `FieldList`
+            The collapsed field constructs for the data accumulated
+            so far, in the same order as the collapse methods.
+
+    **Examples:**
+
+    >>> a = cf.CollapseAccumulator(['mean', 'maximum'], axes='T')
+    >>> a.update(f)
+    >>> a.update(g)
+    >>> mean, maximum = a.fields()
+
+        '''
+        template = self._template
+        if template is None:
+            raise ValueError(
+                "Can't create collapsed fields: No fields have been "
+                "accumulated")
+
+        shape = template.data.shape
+        units = template.Units
+
+        if self._partial is None:
+            # All accumulated data are missing
+            values = [numpy_ma_masked_all(shape, dtype=template.dtype)
+                      for _ in self._methods]
+        else:
+            # Finalise a copy of the partial statistics, leaving the
+            # partial statistics unchanged so that accumulation may
+            # continue
+            N, values = self._ffinalise(deepcopy(self._partial),
+                                        self._sub_samples)
+            values = [
+                Data._collapse_mask(x, self._masked, n, self._Nmax,
+                                    self._mtol).reshape(shape)
+                for n, x in zip(N, values)
+            ]
+        # --- End: if
+
+        # Collapsed domain axes, with their accumulated sizes
+        domain_axes = {key: DomainAxis(size)
+                       for key, size in zip(self._collapse_axes,
+                                            self._sizes)}
+
+        out = FieldList()
+        for method, data_method, value in zip(self._methods,
+                                              self._data_methods, values):
+            g = template.copy()
+
+            new_units = _collapse_units(data_method, units)
+            if new_units is None:
+                new_units = units
+
+            g.set_data(Data(value, units=new_units), set_axes=False,
+                       copy=False)
+
+            # Set the collapsed coordinates to span all of the
+            # accumulated cells
+            for key, (lower, upper) in self._coordinate_bounds.items():
+                dim = g.dimension_coordinate(key)
+                coord_units = dim.Units
+                dim.set_data(Data([(lower + upper) * 0.5],
+                                  units=coord_units), copy=False)
+                dim.set_bounds(
+                    Bounds(data=Data([[lower, upper]], units=coord_units)),
+                    copy=False)
+            # --- End: for
+
+            g._update_cell_methods(method=data_method,
+                                   domain_axes=domain_axes,
+                                   input_axes=self._axes)
+            out.append(g)
+        # --- End: for
+
+        return out
+
+    def inspect(self):
+        '''Inspect the object for debugging.
+
+    .. seealso:: `cf.inspect`
+
+    :Returns:
+
+        `None`
+
+        '''
+        print(cf_inspect(self))  # pragma: no cover
+
+    @classmethod
+    def load(cls, filename):
+        '''Load an accumulator from a file.
+
+    .. seealso:: `save`
+
+    :Parameters:
+
+        filename: `str`
+            The name of a file created by `save`.
+
+    :Returns:
+
+        `CollapseAccumulator`
+            The accumulator.
+
+    **Examples:**
+
+    >>> a = cf.CollapseAccumulator.load('accumulator.pkl')
+
+        '''
+        with open(filename, 'rb') as fh:
+            a = pickle.load(fh)
+
+        if not isinstance(a, cls):
+            raise ValueError(
+                "Can't load {}: {!r} does not contain a {}".format(
+                    cls.__name__, filename, cls.__name__)
+            )
+
+        return a
+
+    def save(self, filename):
+        '''Save the accumulator to a file.
+
+    The accumulated state, but no accumulated data, is saved, so the
+    file is small. The accumulator may be restored with `load`.
+
+    .. seealso:: `load`
+
+    :Parameters:
+
+        filename: `str`
+            The name of the file.
+
+    :Returns:
+
+        `None`
+
+    **Examples:**
+
+    >>> a.save('accumulator.pkl')
+
+        '''
+        with open(filename, 'wb') as fh:
+            pickle.dump(self, fh, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def update(self, f):
+        '''Add a field construct to the accumulated statistics.
+
+    Only the data of the new field construct are read, and the
+    partial statistics are updated in place.
+
+    .. seealso:: `field`, `fields`
+
+    :Parameters:
+
+        f: `Field`
+            The field construct to add. Its domain must be the same
+            as all previously added field constructs, apart from the
+            sizes of, and coordinates along, the collapse axes.
+
+    :Returns:
+
+        `None`
+
+    **Examples:**
+
+    >>> a = cf.CollapseAccumulator('mean', axes='T')
+    >>> a.update(f[0])
+    >>> a.update(f[1:])
+
+        '''
+        keys = self._collapse_axes_keys(f)
+        data_axes = f.get_data_axes()
+        iaxes = [data_axes.index(key) for key in keys if key in data_axes]
+
+        if self._template is None:
+            # --------------------------------------------------------
+            # Create the template for the collapsed field constructs
+            # from the first field construct
+            # --------------------------------------------------------
+            template = f.collapse('maximum', axes=keys,
+                                  _update_cell_methods=False,
+                                  _create_zero_size_cell_bounds=True)
+            template.data.to_memory()
+            self._template = template
+            self._template_iaxes = iaxes
+            self._collapse_axes = keys
+            self._sizes = [0] * len(keys)
+            self._coordinate_bounds = {}
+        else:
+            self._check_domain(f, iaxes)
+
+        # ------------------------------------------------------------
+        # Get the new data, with the collapse axes flattened into a
+        # single trailing axis
+        # ------------------------------------------------------------
+        data = f.data
+        units = self._template.Units
+        if not data.Units.equals(units):
+            data = data.copy()
+            data.Units = units
+
+        array = data.array
+
+        weights = None
+        if (self._weights is not None and
+                not _collapse_weighted_methods.isdisjoint(self._methods)):
+            w = f.weights(self._weights, axes=keys, measure=True,
+                          data=True)
+            weights = numpy_broadcast_to(w.array, array.shape)
+
+        non_iaxes = [i for i in range(array.ndim) if i not in iaxes]
+        order = non_iaxes + iaxes
+        new_shape = tuple([array.shape[i] for i in non_iaxes])
+        n = int(numpy_prod([array.shape[i] for i in iaxes]))
+        new_shape += (n,)
+
+        array = numpy_reshape(numpy_transpose(array, order), new_shape)
+        if weights is not None:
+            weights = numpy_reshape(numpy_transpose(weights, order),
+                                    new_shape)
+
+        for i, key in enumerate(keys):
+            self._sizes[i] += f.domain_axes[key].get_size()
+
+        self._Nmax += n
+        self._update_coordinate_bounds(f, keys)
+
+        masked = numpy_ma_isMA(array) and array.mask is not numpy_ma_nomask
+        if masked:
+            self._masked = True
+            if array.mask.all():
+                # All of the new data are missing
+                return
+
+        if weights is not None:
+            if weights.min() < 0:
+                raise ValueError("Can't accumulate with negative weights")
+
+            if (weights == 0).any():
+                # Mask the array where the weights are zero
+                array = numpy_ma_masked_where(weights == 0, array,
+                                              copy=True)
+                masked = True
+                self._masked = True
+                if array.mask.all():
+                    return
+        # --- End: if
+
+        # ------------------------------------------------------------
+        # Update the partial statistics
+        # ------------------------------------------------------------
+        p_out = self._func(array, axis=array.ndim - 1, weights=weights,
+                           masked=masked)
+
+        if self._partial is None:
+            self._partial = self._fpartial(p_out)
+        else:
+            self._partial = self._fpartial(self._partial, p_out)
+
+        self._sub_samples += 1
+
+        logger.info(
+            'Accumulated {!r}: {} updates'.format(f, self._sub_samples)
+        )  # pragma: no cover
@@ -110,6 +110,7 @@ CONSTANTS = {
     'WORKSPACE_FACTOR_1': 2.0,
     'WORKSPACE_FACTOR_2': 8.0,
     'REGRID_LOGGING': False,
+    'REGRID_WORKERS': 1,
     'COLLAPSE_PARALLEL_MODE': 0,
     'RELAXED_IDENTITIES': False,
     # 'IGNORE_IDENTITIES': False,  # no longer used
@@ -143,6 +144,11 @@ _file_to_fh = {}
 
 _stash2standard_name = {}
 
+# The STASH to standard name conversion table records that apply to
+# (submodel, STASH code, UM version, LBCODE, BPLAT, BPLON, atol, rtol)
+# keys
+_stash2standard_name_matches = {}
+
 # ---------------------------------------------------------------------
 # Coordinate reference constants TODO: turn these into functions
 # ---------------------------------------------------------------------
@@ -1208,3 +1208,119 @@ def sd_ffinalise(out, sub_samples=None):
     sd **= 0.5
 
     return asanyarray(N, sd)
+
+
+# ---------------------------------------------------------------------
+# Multiple statistics from a single pass
+# ---------------------------------------------------------------------
+def multi_f(a, axis=None, weights=None, masked=False, functions=(),
+            weighted=()):
+    '''Evaluate several collapse functions on the same array.
+
+    This allows several statistics to be calculated from one pass
+    over the data. Bind the *functions* and *weighted* parameters
+    with `functools.partial` before passing the result to
+    `Data._collapse`.
+
+    :Parameters:
+
+        a: `numpy.ndarray`
+            Input array. Not all missing data.
+
+        axis: `int`, optional
+            Axis along which to operate. By default, flattened input
+            is used.
+
+        weights: array-like, optional
+            Weights associated with values of the array. Only passed
+            to the collapse functions which are flagged as weighted.
+
+        masked: `bool`, optional
+
+        functions: sequence of functions
+            The collapse functions, such as `max_f` and `mean_f`.
+
+        weighted: sequence of `bool`
+            For each of the *functions*, whether or not it accepts
+            weights.
+
+    :Returns:
+
+        `tuple`
+            The output of each collapse function, in the same order
+            as *functions*.
+
+    '''
+    out = []
+    for func, w in zip(functions, weighted):
+        if w and weights is not None:
+            out.append(func(a, axis=axis, weights=weights, masked=masked))
+        else:
+            out.append(func(a, axis=axis, masked=masked))
+    # --- End: for
+
+    return tuple(out)
+
+
+def multi_fpartial(out, out1=None, group=False, fpartials=()):
+    '''Combine partial outputs for several collapse functions.
+
+    :Parameters:
+
+        out: `tuple`
+            Either an output from a previous call to `multi_fpartial`;
+            or, if *out1* is `None`, an output from `multi_f`.
+
+        out1: `tuple`, optional
+            An output from `multi_f`.
+
+        group: `bool`, optional
+
+        fpartials: sequence of functions
+            The partial functions, such as `max_fpartial` and
+            `mean_fpartial`, in the same order as the functions given
+            to `multi_f`.
+
+    :Returns:
+
+        `tuple`
+
+    '''
+    if out1 is None:
+        out1 = (None,) * len(fpartials)
+
+    return tuple([fpartial(x, x1, group=group)
+                  for fpartial, x, x1 in zip(fpartials, out, out1)])
+
+
+def multi_ffinalise(out, sub_samples=None, ffinalises=()):
+    '''Finalise the outputs of several collapse functions.
+
+    :Parameters:
+
+        out: `tuple`
+            An output from `multi_fpartial`.
+
+        sub_samples: optional
+
+        ffinalises: sequence of functions
+            The finalise functions, such as `max_ffinalise` and
+            `mean_ffinalise`, in the same order as the functions given
+            to `multi_f`.
+
+    :Returns:
+
+        2-`tuple` of `tuple`
+            The sample sizes and the collapsed values for each
+            statistic.
+
+    '''
+    N = []
+    values = []
+    for ffinalise, x in zip(ffinalises, out):
+        n, value = ffinalise(x, sub_samples)
+        N.append(n)
+        values.append(value)
+    # --- End: for
+
+    return tuple(N), tuple(values)
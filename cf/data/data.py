@@ -1,6 +1,7 @@
 import itertools
 import operator
 
+from functools import partial as functools_partial
 from functools import reduce as functools_reduce
 from operator import itemgetter
 from operator import mul as operator_mul
@@ -27,6 +28,7 @@ from numpy import arctan            as numpy_arctan
 # from numpy import arctan2           as numpy_arctan2  AT2
 from numpy import arctanh           as numpy_arctanh
 from numpy import array             as numpy_array
+from numpy import array_equal       as numpy_array_equal
 from numpy import asanyarray        as numpy_asanyarray
 from numpy import ceil              as numpy_ceil
 from numpy import cos               as numpy_cos
@@ -51,6 +53,7 @@ from numpy import nanpercentile     as numpy_nanpercentile
 from numpy import ndarray           as numpy_ndarray
 from numpy import ndenumerate       as numpy_ndenumerate
 from numpy import ndindex           as numpy_ndindex
+from numpy import moveaxis          as numpy_moveaxis
 from numpy import ndim              as numpy_ndim
 from numpy import newaxis           as numpy_newaxis
 from numpy import ones              as numpy_ones
@@ -83,6 +86,8 @@ from numpy.ma import array          as numpy_ma_array
 from numpy.ma import count          as numpy_ma_count
 from numpy.ma import empty          as numpy_ma_empty
 from numpy.ma import filled         as numpy_ma_filled
+from numpy.ma import getdata        as numpy_ma_getdata
+from numpy.ma import getmaskarray   as numpy_ma_getmaskarray
 from numpy.ma import is_masked      as numpy_ma_is_masked
 from numpy.ma import isMA           as numpy_ma_isMA
 from numpy.ma import masked         as numpy_ma_masked
@@ -131,6 +136,7 @@ from .filledarray import FilledArray
 from .partition import Partition
 from .partitionmatrix import PartitionMatrix
 from .collapse_functions import *
+from . import moving_window_functions
 
 from . import (NetCDFArray,
                UMArray,
@@ -156,6 +162,87 @@ logger = logging.getLogger(__name__)
 _year_length = 365.242198781
 _month_length = _year_length / 12
 
+# --------------------------------------------------------------------
+# Map each collapse method that may be calculated together with
+# others in a single pass over the data (see `Data.collapse_multiple`)
+# to its collapse functions and whether or not it may be weighted
+# --------------------------------------------------------------------
+_collapse_functions = {
+    'max': (max_f, max_fpartial, max_ffinalise, False),
+    'min': (min_f, min_fpartial, min_ffinalise, False),
+    'maximum_absolute_value': (max_abs_f, max_abs_fpartial,
+                               max_abs_ffinalise, False),
+    'minimum_absolute_value': (min_abs_f, min_abs_fpartial,
+                               min_abs_ffinalise, False),
+    'mean': (mean_f, mean_fpartial, mean_ffinalise, True),
+    'mean_absolute_value': (mean_abs_f, mean_abs_fpartial,
+                            mean_abs_ffinalise, True),
+    'root_mean_square': (root_mean_square_f, root_mean_square_fpartial,
+                         root_mean_square_ffinalise, True),
+    'mid_range': (mid_range_f, mid_range_fpartial, mid_range_ffinalise,
+                  False),
+    'range': (range_f, range_fpartial, range_ffinalise, False),
+    'sample_size': (sample_size_f, sample_size_fpartial,
+                    sample_size_ffinalise, False),
+    'sum': (sum_f, sum_fpartial, sum_ffinalise, False),
+    'sum_of_squares': (sum_of_squares_f, sum_of_squares_fpartial,
+                       sum_of_squares_ffinalise, False),
+    'sd': (sd_f, sd_fpartial, sd_ffinalise, True),
+    'var': (var_f, var_fpartial, var_ffinalise, True),
+}
+
+
+# --------------------------------------------------------------------
+# Map each moving window method to its moving window function
+# --------------------------------------------------------------------
+_moving_window_functions = {
+    'sum': moving_window_functions.moving_sum,
+    'mean': moving_window_functions.moving_mean,
+    'maximum': moving_window_functions.moving_max,
+    'minimum': moving_window_functions.moving_min,
+    'range': moving_window_functions.moving_range,
+    'standard_deviation': moving_window_functions.moving_sd,
+    'variance': moving_window_functions.moving_var,
+}
+
+
+def _collapse_units(method, units):
+    '''Return the units of data collapsed with a given method.
+
+    :Parameters:
+
+        method: `str`
+            The name of an unweighted `Data` collapse method, such as
+            ``'max'`` or ``'var'``.
+
+        units: `Units`
+            The units of the uncollapsed data.
+
+    :Returns:
+
+        `Units` or `None`
+            The units of the collapsed data, or `None` if they are
+            the same as the uncollapsed data.
+
+    **Examples:**
+
+    >>> _collapse_units('var', Units('m'))
+    <Units: m2>
+    >>> print(_collapse_units('mean', Units('m')))
+    None
+
+    '''
+    if method in ('var', 'sum_of_squares'):
+        if units:
+            return units ** 2
+
+        return units
+
+    if method == 'sample_size':
+        return Units('1')
+
+    return None
+
 
 def _convert_to_builtin_type(x):
     '''Convert a non-JSON-encodable object to a JSON-encodable built-in
@@ -1970,6 +2057,110 @@ place.
                 partition._process_partition = True
         # --- End: if
 
+    def _prefetched_partitions(self):
+        '''Iterate over the partitions, prefetching the data of those
+    stored in PP and UM fields files.
+
+    The partitions are prefetched in batches with
+    `_prefetch_partitions`. The prefetched records of a batch that
+    have not been used are released when the next batch is
+    prefetched, and when the iteration ends, so that at most one batch
+    is held in memory and no prefetched records outlive the loop.
+
+    .. versionadded:: 3.8.0
+
+    :Returns:
+
+        generator
+            The partitions of the flattened partition matrix.
+
+    **Examples:**
+
+    >>> for partition in d._prefetched_partitions():
+    ...     partition.open(config)
+    ...     array = partition.array
+    ...     partition.close()
+
+        '''
+        prefetched = []
+        try:
+            stop = 0
+            for i, partition in enumerate(self.partitions.matrix.flat):
+                if i == stop:
+                    UMArray.release(prefetched)
+                    prefetched = []
+                    stop = self._prefetch_partitions(i, prefetched)
+
+                yield partition
+        finally:
+            UMArray.release(prefetched)
+
+    def _prefetch_partitions(self, start, prefetched):
+        '''Prefetch the data of a batch of partitions stored in PP and UM
+    fields files.
+
+    The batch starts at the given position in the flattened partition
+    matrix, and contains as many partitions as fit into the chunk size
+    given by `cf.chunksize`. The packed records of the batch are read
+    with one call to the UM C library for each file, so that they are
+    not read one at a time when the partitions are conformed.
+
+    .. versionadded:: 3.8.0
+
+    .. seealso:: `_prefetched_partitions`
+
+    :Parameters:
+
+        start: `int`
+            The position of the first partition of the batch in the
+            flattened partition matrix.
+
+        prefetched: `list`
+            The subarrays whose records have been prefetched are
+            appended to this list, which is owned by the caller and
+            must be passed to `UMArray.release` once the batch has
+            been used.
+
+    :Returns:
+
+        `int`
+            The position of the first partition after the batch.
+
+    **Examples:**
+
+    >>> prefetched = []
+    >>> d._prefetch_partitions(0, prefetched)
+    12
+    >>> cf.data.UMArray.release(prefetched)
+
+        '''
+        partitions = self.partitions
+        n_partitions = partitions.size
+        if n_partitions == 1:
+            return n_partitions
+
+        itemsize = self.dtype.itemsize
+        chunksize = cf_chunksize()
+
+        nbytes = 0
+        subarrays = []
+        flat = partitions.matrix.flat
+        for stop in range(start, n_partitions):
+            partition = flat[stop]
+            nbytes += partition.size * itemsize
+            if stop > start and nbytes > chunksize:
+                break
+
+            if (getattr(partition, '_process_partition', True)
+                    and not partition.in_memory):
+                subarrays.append(partition.subarray)
+        else:
+            stop = n_partitions
+
+        prefetched.extend(UMArray.prefetch(subarrays))
+
+        return stop
+
     def _share_lock_files(self, parallelise):
         '''TODO
 
@@ -2134,6 +2325,137 @@ place.
         # --- End: if
         return processed_partitions
 
+    def _share_arrays(self, arrays):
+        '''Share in-memory partition arrays with equal arrays seen before.
+
+    The subarray of each partition that is in memory is replaced by an
+    equal array from *arrays*, if there is one, so that a single array
+    is referenced by all of the data that contain it. Otherwise the
+    subarray is added to *arrays*. Arrays with equal hash values are
+    only shared if they also have the same shape, data type, values
+    and mask.
+
+    A shared array is never changed in place, since a partition whose
+    subarray is referenced elsewhere copies it before it is modified.
+
+    .. versionadded:: 3.8.0
+
+    :Parameters:
+
+        arrays: `dict`
+            The arrays seen before, in lists keyed by their hash
+            values and whether or not they are masked arrays. Updated
+            in place.
+
+    :Returns:
+
+        `None`
+
+    **Examples:**
+
+    >>> arrays = {}
+    >>> d = cf.Data([1, 2, 3], 'm')
+    >>> e = cf.Data([1, 2, 3], 'km')
+    >>> d._share_arrays(arrays)
+    >>> e._share_arrays(arrays)
+    >>> len(arrays)
+    1
+
+        '''
+        for partition in self.partitions.matrix.flat:
+            if not partition.in_memory:
+                continue
+
+            subarray = partition.subarray
+            masked = numpy_ma_isMA(subarray)
+            candidates = arrays.setdefault(
+                (hash_array(subarray), masked), [])
+            for array in candidates:
+                if array is subarray:
+                    break
+
+                if (array.shape != subarray.shape or
+                        array.dtype != subarray.dtype):
+                    continue
+
+                if masked:
+                    # Compare the underlying data, rather than using
+                    # numpy.ma.allequal, which fails for strings
+                    if not (numpy_array_equal(
+                            numpy_ma_getmaskarray(array),
+                            numpy_ma_getmaskarray(subarray)) and
+                            numpy_array_equal(
+                                numpy_ma_getdata(array),
+                                numpy_ma_getdata(subarray))):
+                        continue
+                elif not numpy_array_equal(array, subarray):
+                    continue
+
+                partition.subarray = array
+                break
+            else:
+                # No equal array has been seen before
+                candidates.append(subarray)
+        # --- End: for
+
+    def _shares_arrays(self, other):
+        '''Whether two data share the same arrays in the same way.
+
+    If True then the two data have equal values, but if False they
+    may still have equal values. Data containing NaNs never share
+    arrays in this sense, because NaNs are not equal to themselves.
+
+    .. versionadded:: 3.8.0
+
+    .. seealso:: `_share_arrays`
+
+    :Parameters:
+
+        other: `Data`
+            The data to compare with.
+
+    :Returns:
+
+        `bool`
+
+    **Examples:**
+
+    >>> d._shares_arrays(d.copy())
+    True
+    >>> d._shares_arrays(d + 0)
+    False
+
+        '''
+        if (self.shape != other.shape or
+                self.dtype != other.dtype or
+                self.Units != other.Units or
+                self._axes != other._axes or
+                self._flip() != other._flip() or
+                self._pmshape != other._pmshape or
+                self._auxiliary_mask is not None or
+                other._auxiliary_mask is not None):
+            return False
+
+        for partition0, partition1 in zip(self.partitions.matrix.flat,
+                                          other.partitions.matrix.flat):
+            if (partition0.subarray is not partition1.subarray or
+                    not partition0.in_memory or
+                    partition0.location != partition1.location or
+                    partition0.shape != partition1.shape or
+                    partition0.axes != partition1.axes or
+                    partition0.flip != partition1.flip or
+                    partition0.part or partition1.part or
+                    not partition0.Units.equals(partition1.Units)):
+                return False
+
+            subarray = partition0.subarray
+            if subarray.dtype.kind in 'fc' and numpy_isnan(subarray).any():
+                # NaNs are not equal to themselves
+                return False
+        # --- End: for
+
+        return True
+
     @_inplace_enabled(default=False)
     def diff(self, axis=-1, n=1, inplace=False):
         '''Calculate the n-th discrete difference along the given axis.
@@ -3486,6 +3808,181 @@ place.
 
         return d
 
+    @_inplace_enabled(default=False)
+    def moving_window(self, method, window_size=None, axis=None,
+                      weights=None, mode=None, cval=None, origin=0,
+                      ddof=1, inplace=False):
+        '''Perform moving window calculations along an axis.
+
+    Each moving window statistic is calculated with an algorithm whose
+    cost does not depend on the window size, so long windows are as
+    fast as short ones. Any window that contains missing data produces
+    missing data.
+
+    .. versionadded:: 3.8.0
+
+    .. seealso:: `convolution_filter`, `cumsum`
+
+    :Parameters:
+
+        method: `str`
+            The moving window method. One of ``'sum'``, ``'mean'``,
+            ``'maximum'``, ``'minimum'``, ``'range'``,
+            ``'standard_deviation'`` and ``'variance'``.
+
+        window_size: `int`
+            The size of the window.
+
+        axis: `int`
+            Select the axis over which the moving window is
+            calculated, as for `convolution_filter`.
+
+        weights: array-like, optional
+            One dimensional weights along the window axis. Weights
+            are used by the ``'sum'``, ``'mean'``,
+            ``'standard_deviation'`` and ``'variance'`` methods, and
+            ignored otherwise. Weights beyond the edges of the axis
+            are extended in the same way as the data, except that
+            they are zero if *mode* is ``'constant'``.
+
+        mode: `str`, optional
+            How the input array is extended when the window overlaps
+            an array border, as for `convolution_filter`.
+
+        cval: scalar, optional
+            Value to fill past the edges of the array if *mode* is
+            ``'constant'``, as for `convolution_filter`.
+
+        origin: `int`, optional
+            Controls the placement of the window, as for
+            `convolution_filter`.
+
+        ddof: number, optional
+            The delta degrees of freedom for the
+            ``'standard_deviation'`` and ``'variance'`` methods.
+
+        {{inplace: `bool`, optional}}
+
+    :Returns:
+
+        `Data` or `None`
+            The moving window values, or `None` if the operation was
+            in-place.
+
+    **Examples:**
+
+    >>> d = cf.Data(numpy.arange(12).reshape(3, 4), 'metres')
+    >>> print(d.moving_window('maximum', 3, axis=1).array)
+    [[-- 2.0 3.0 --]
+     [-- 6.0 7.0 --]
+     [-- 10.0 11.0 --]]
+    >>> print(d.moving_window('sum', 3, axis=1, mode='wrap').array)
+    [[4.0 3.0 6.0 5.0]
+     [16.0 15.0 18.0 17.0]
+     [28.0 27.0 30.0 29.0]]
+
+        '''
+        try:
+            func = _moving_window_functions[method]
+        except KeyError:
+            raise ValueError(
+                "Can't calculate moving window: Invalid method {!r}. "
+                "Expected one of {}".format(
+                    method, tuple(_moving_window_functions)))
+
+        if method in ('standard_deviation', 'variance'):
+            func = functools_partial(func, ddof=ddof)
+
+        d = _inplace_enabled_define_and_cleanup(self)
+
+        iaxis = d._parse_axes(axis)
+        if len(iaxis) != 1:
+            raise ValueError(
+                "Can't calculate moving window: Must select exactly one "
+                "axis. Got {!r}".format(axis))
+
+        iaxis = iaxis[0]
+
+        window_size = int(window_size)
+
+        # Default mode to 'wrap' if the axis is cyclic
+        if mode is None:
+            if iaxis in d.cyclic():
+                mode = 'wrap'
+            else:
+                mode = 'constant'
+        # --- End: if
+
+        # Set cval to NaN if it is currently None, so that the edges
+        # will be filled with missing data if the mode is 'constant'
+        if cval is None:
+            cval = numpy_nan
+
+        # Extend the weights past the edges of the axis
+        if weights is not None and method in ('sum', 'mean',
+                                              'standard_deviation',
+                                              'variance'):
+            if isinstance(weights, self.__class__):
+                weights = weights.array
+
+            weights = numpy_asanyarray(weights, dtype=float).reshape(-1)
+            if weights.size != self.shape[iaxis]:
+                raise ValueError(
+                    "Can't calculate moving window: The weights (size {}) "
+                    "do not match the selected axis (size {})".format(
+                        weights.size, self.shape[iaxis]))
+
+            weights = moving_window_functions.pad(weights, window_size,
+                                                  origin=origin, mode=mode,
+                                                  cval=0)
+        else:
+            weights = None
+
+        units = self.Units
+        if method == 'variance':
+            units = units ** 2
+
+        # Section the data into sections up to a chunk in size, each
+        # of which spans the whole window axis, and calculate the
+        # moving window for each section with missing data replaced
+        # by NaNs
+        sections = self.section([iaxis], chunks=True)
+        for key, data in sections.items():
+            data.dtype = float
+            input_array = data.array
+            masked = numpy_ma_is_masked(input_array)
+            if masked:
+                input_array = input_array.filled(numpy_nan)
+            else:
+                input_array = numpy_asanyarray(input_array)
+
+            input_array = numpy_moveaxis(input_array, iaxis, -1)
+            input_array = moving_window_functions.pad(
+                input_array, window_size, origin=origin, mode=mode,
+                cval=cval)
+
+            output_array = func(input_array, window_size, weights=weights)
+            output_array = numpy_moveaxis(output_array, -1, iaxis)
+
+            if masked or (mode == 'constant' and numpy_isnan(cval)):
+                with numpy_errstate(invalid='ignore'):
+                    output_array = numpy_ma_masked_invalid(output_array)
+            # --- End: if
+
+            sections[key] = type(self)(output_array, units=units,
+                                       fill_value=self.fill_value)
+
+        # Glue the sections back together again
+        out = self.reconstruct_sectioned_data(sections,
+                                              cyclic=self.cyclic())
+
+        if inplace:
+            d.__dict__ = out.__dict__
+        else:
+            d = out
+
+        return d
+
     @_inplace_enabled(default=False)
     def cumsum(self, axis, masked_as_zero=False, inplace=False):
         '''Return the data cumulatively summed along the given axis.
@@ -5873,17 +6370,22 @@ place.
     @_inplace_enabled(default=False)
     def _collapse(self, func, fpartial, ffinalise, axes=None,
                   squeeze=False, weights=None, mtol=1, units=None,
-                  inplace=False, i=False, _preserve_partitions=False,
-                  **kwargs):
+                  weighted=None, inplace=False, i=False,
+                  _preserve_partitions=False, **kwargs):
         '''Collapse the data.
 
+    Several statistics may be calculated from a single pass over the
+    data by providing sequences of collapse functions for *func*,
+    *fpartial* and *ffinalise*. In this case a `list` of `Data`
+    objects is returned, one for each statistic.
+
     :Parameters:
 
-        func: function
+        func: function or sequence of functions
 
-        fpartial: function
+        fpartial: function or sequence of functions
 
-        ffinalize: function
+        ffinalize: function or sequence of functions
 
         axes: (sequence of) `int`, optional
             The axes to be collapsed. By default flattened input is
@@ -5898,6 +6400,17 @@ place.
 
         weights: *optional*
 
+        units: `Units` or sequence, optional
+            The units of the collapsed data. By default the units are
+            unchanged. If *func* is a sequence then *units* must be a
+            sequence of the same length, with `None` elements
+            indicating unchanged units.
+
+        weighted: sequence of `bool`, optional
+            If *func* is a sequence then, for each function, whether
+            or not it accepts the *weights*. By default all functions
+            accept weights. Ignored if *func* is a single function.
+
         {{inplace: `bool`, optional}}
 
         {{i: deprecated at version 3.0.0}}
@@ -5912,10 +6425,48 @@ place.
 
     :Returns:
 
-        `Data` or `None`
+        `Data` or `list` or `None`
+            The collapsed data, or a list of collapsed data if *func*
+            is a sequence.
 
         '''
         d = _inplace_enabled_define_and_cleanup(self)
+
+        if isinstance(func, (list, tuple)):
+            # --------------------------------------------------------
+            # Multiple statistics: Combine the collapse functions so
+            # that they are all evaluated from one pass over the data
+            # --------------------------------------------------------
+            if inplace:
+                raise ValueError(
+                    "Can't collapse in-place with multiple collapse "
+                    "functions"
+                )
+
+            n_outputs = len(func)
+            if weighted is None:
+                weighted = (True,) * n_outputs
+
+            if units is None:
+                units = (None,) * n_outputs
+
+            if not (len(fpartial) == len(ffinalise) == len(weighted) ==
+                    len(units) == n_outputs):
+                raise ValueError(
+                    "Can't collapse: Inconsistent numbers of collapse "
+                    "functions"
+                )
+
+            func = functools_partial(multi_f, functions=tuple(func),
+                                     weighted=tuple(weighted))
+            fpartial = functools_partial(multi_fpartial,
+                                         fpartials=tuple(fpartial))
+            ffinalise = functools_partial(multi_ffinalise,
+                                          ffinalises=tuple(ffinalise))
+            all_units = tuple(units)
+        else:
+            n_outputs = None
+            all_units = (units,)
         ndim = d._ndim
         self_axes = d._axes
         self_shape = d._shape
@@ -5930,6 +6481,9 @@ place.
             Nmax = d._size
         elif not axes and axes != 0:
             # Collapse no axes
+            if n_outputs is not None:
+                return [d.copy() for _ in range(n_outputs)]
+
             if inplace:
                 d = None
             return d
@@ -6072,15 +6626,19 @@ place.
             d.varray
 
         # -------------------------------------------------------------
-        # Initialise the output data array
+        # Initialise the output data arrays (one for each statistic)
         # -------------------------------------------------------------
-        new = d[(Ellipsis,) + (0,)*n_collapse_axes]
+        index = (Ellipsis,) + (0,)*n_collapse_axes
+        news = [d[index] for _ in all_units]
+        for new in news:
+            new._auxiliary_mask = None
+            for partition in new.partitions.matrix.flat:
+                # Do this so as not to upset the ref count on the
+                # parittion's of d
+                del partition.subarray
+        # --- End: for
 
-        new._auxiliary_mask = None
-        for partition in new.partitions.matrix.flat:
-            # Do this so as not to upset the ref count on the
-            # parittion's of d
-            del partition.subarray
+        new = news[0]
 
         # d.to_memory()
 
@@ -6089,24 +6647,29 @@ place.
 
         datatype = d.dtype
 
-        if units is None:
-            new_units = new.Units
-        else:
-            new_units = units
+        all_new_units = [new.Units if units is None else units
+                         for units in all_units]
 
         p_axes = new._axes[:n_non_collapse_axes]
-        p_units = new_units
 
         c_slice = (slice(None),) * n_collapse_axes
 
-        config = new.partition_configuration(
-            readonly=False,
-            auxiliary_mask=None,  # DCH ??x
-            extra_memory=False
-        )
+        configs = [
+            x.partition_configuration(
+                readonly=False,
+                auxiliary_mask=None,  # DCH ??x
+                extra_memory=False
+            )
+            for x in news
+        ]
 
         if mpi_on:
             mode = collapse_parallel_mode()
+            if n_outputs is not None:
+                # Multiple statistics are only parallelised over the
+                # partitions of the output arrays
+                mode = 1
+
             if mode == 0:
                 # Calculate the number of partitions in each subspace,
                 # assuming this will always be the same in each one and
@@ -6158,84 +6721,113 @@ place.
         # flagged for processing.
         new._flag_partitions_for_processing(_parallelise_collapse)
 
-        processed_partitions = []
+        processed_partitions = [[] for _ in news]
         for pmindex, partition in numpy_ndenumerate(new.partitions.matrix):
             if partition._process_partition:
                 # Only process the partition if it is flagged
-                partition.open(config)
+                partitions = [partition]
+                partitions.extend(x.partitions.matrix[pmindex]
+                                  for x in news[1:])
 
-                # Save the position of the partition in the partition
-                # matrix
-                partition._pmindex = pmindex
+                for partition, config, p_units in zip(
+                        partitions, configs, all_new_units):
+                    partition.open(config)
 
-                partition.axes = p_axes
-                partition.flip = []
-                partition.part = []
-                partition.Units = p_units
+                    # Save the position of the partition in the
+                    # partition matrix
+                    partition._pmindex = pmindex
 
-                if squeeze:
-                    # Note: parentheses for line continuation (not a tuple):
-                    partition.location = (
-                        partition.location[:n_non_collapse_axes])
-                    partition.shape = partition.shape[:n_non_collapse_axes]
+                    partition.axes = p_axes
+                    partition.flip = []
+                    partition.part = []
+                    partition.Units = p_units
+
+                    if squeeze:
+                        # Note: parentheses for line continuation (not
+                        # a tuple):
+                        partition.location = (
+                            partition.location[:n_non_collapse_axes])
+                        partition.shape = (
+                            partition.shape[:n_non_collapse_axes])
+                # --- End: for
 
-                indices = partition.indices[:n_non_collapse_axes] + c_slice
+                indices = (partitions[0].indices[:n_non_collapse_axes] +
+                           c_slice)
 
-                partition.subarray = d._collapse_subspace(
+                subarrays = d._collapse_subspace(
                     func, fpartial, ffinalise,
                     indices, n_non_collapse_axes, n_collapse_axes,
                     Nmax, mtol, _preserve_partitions=_preserve_partitions,
                     _parallelise_collapse_subspace=_parallelise_collapse_sub,
+                    _n_outputs=n_outputs,
                     **kwargs)
 
-                partition.close(keep_in_memory=keep_in_memory)
+                if n_outputs is None:
+                    subarrays = (subarrays,)
 
-                # Add each partition to a list of processed partitions
-                processed_partitions.append(partition)
+                for partition, subarray, processed in zip(
+                        partitions, subarrays, processed_partitions):
+                    partition.subarray = subarray
+                    partition.close(keep_in_memory=keep_in_memory)
+
+                    # Add each partition to a list of processed
+                    # partitions
+                    processed.append(partition)
             # --- End: if
         # --- End: for
 
-        # processed_partitions contains a list of all the partitions
-        # that have been processed on this rank. In the serial case
-        # this is all of them and this line of code has no
-        # effect. Otherwise the processed partitions from each rank
-        # are distributed to every rank and processed_partitions now
-        # contains all the processed partitions from every rank.
-        processed_partitions = self._share_partitions(processed_partitions,
-                                                      _parallelise_collapse)
-
-        # Put the processed partitions back in the partition matrix
-        # according to each partitions _pmindex attribute set above.
-        pm = new.partitions.matrix
-        for partition in processed_partitions:
-            pm[partition._pmindex] = partition
+        for new, processed, new_units in zip(news, processed_partitions,
+                                             all_new_units):
+            # processed contains a list of all the partitions that
+            # have been processed on this rank. In the serial case
+            # this is all of them and this line of code has no
+            # effect. Otherwise the processed partitions from each
+            # rank are distributed to every rank and processed now
+            # contains all the processed partitions from every rank.
+            processed = self._share_partitions(processed,
+                                               _parallelise_collapse)
+
+            # Put the processed partitions back in the partition
+            # matrix according to each partitions _pmindex attribute
+            # set above.
+            new_datatype = datatype
+            pm = new.partitions.matrix
+            for partition in processed:
+                pm[partition._pmindex] = partition
+
+                p_datatype = partition.subarray.dtype
+                if new_datatype != p_datatype:
+                    new_datatype = numpy_result_type(p_datatype,
+                                                     new_datatype)
+            # --- End: for
 
-            p_datatype = partition.subarray.dtype
-            if datatype != p_datatype:
-                datatype = numpy_result_type(p_datatype, datatype)
+            # Share the lock files created by each rank for each
+            # partition now in a temporary file so that __del__ knows
+            # which lock files to check if present
+            new._share_lock_files(_parallelise_collapse)
+
+            new._all_axes = None
+#            new._flip = []
+            new._flip([])
+            new._Units = new_units
+            new.dtype = new_datatype
+
+            if squeeze:
+                new._axes = p_axes
+                new._ndim = ndim - n_collapse_axes
+                new._shape = new._shape[:new._ndim]
+            else:
+                new_axes = new._axes
+                if new_axes != original_self_axes:
+                    iaxes = [new_axes.index(axis)
+                             for axis in original_self_axes]
+                    new.transpose(iaxes, inplace=True)
+            # --- End: if
         # --- End: for
 
-        # Share the lock files created by each rank for each partition
-        # now in a temporary file so that __del__ knows which lock
-        # files to check if present
-        new._share_lock_files(_parallelise_collapse)
-
-        new._all_axes = None
-#        new._flip = []
-        new._flip([])
-        new._Units = new_units
-        new.dtype = datatype
-
-        if squeeze:
-            new._axes = p_axes
-            new._ndim = ndim - n_collapse_axes
-            new._shape = new._shape[:new._ndim]
-        else:
-            new_axes = new._axes
-            if new_axes != original_self_axes:
-                iaxes = [new_axes.index(axis) for axis in original_self_axes]
-                new.transpose(iaxes, inplace=True)
-        # --- End: if
+        if n_outputs is not None:
+            # Multiple statistics: Return a list of new Data objects
+            return news
 
         # ------------------------------------------------------------
         # Update d in place and return
@@ -6249,7 +6841,7 @@ place.
                            mtol, weights=None,
                            _preserve_partitions=False,
                            _parallelise_collapse_subspace=True,
-                           **kwargs):
+                           _n_outputs=None, **kwargs):
         '''
 
 Collapse a subspace of a data array.
@@ -6282,11 +6874,17 @@ dimensions.
 
     weights : dict, optional
 
+    _n_outputs : int, optional
+        The number of statistics calculated by *func*, if it combines
+        several collapse functions (see `multi_f`).
+
     kwargs : *optional*
 
 :Returns:
 
-    `list`
+    `numpy.ndarray` or `list`
+        The collapsed array, or a list of collapsed arrays if
+        *_n_outputs* is set.
 
 **Examples:**
 
@@ -6335,7 +6933,7 @@ dimensions.
         # will be flagged for processing.
         data._flag_partitions_for_processing(_parallelise_collapse_subspace)
 
-        for i, partition in enumerate(data.partitions.matrix.flat):
+        for i, partition in enumerate(data._prefetched_partitions()):
             if partition._process_partition:
                 # Only process a partition if flagged
                 partition.open(config)
@@ -6586,7 +7184,7 @@ dimensions.
             # just finalise.
             out = self._collapse_finalise(
                 ffinalise, out, sub_samples, masked, Nmax, mtol, data,
-                n_non_collapse_axes
+                n_non_collapse_axes, n_outputs=_n_outputs
             )
         # --- End: if
 
@@ -6594,10 +7192,37 @@ dimensions.
 
     @classmethod
     def _collapse_finalise(cls, ffinalise, out, sub_samples, masked,
-                           Nmax, mtol, data, n_non_collapse_axes):
+                           Nmax, mtol, data, n_non_collapse_axes,
+                           n_outputs=None):
         '''TODO
 
+    :Parameters:
+
+        n_outputs: `int`, optional
+            The number of statistics returned by *ffinalise*, if it
+            combines several finalise functions (see
+            `multi_ffinalise`). By default *ffinalise* returns a
+            single statistic.
+
+    :Returns:
+
+        `numpy.ndarray` or `list`
+
         '''
+        if n_outputs is not None:
+            # Multiple statistics
+            if out is None:
+                # no data - return all masked
+                return [
+                    numpy_ma_masked_all(data.shape[:n_non_collapse_axes],
+                                        data.dtype)
+                    for _ in range(n_outputs)
+                ]
+
+            N, out = ffinalise(out, sub_samples)
+            return [cls._collapse_mask(x, masked, n, Nmax, mtol)
+                    for n, x in zip(N, out)]
+
         if out is not None:
             # Finalise
             N, out = ffinalise(out, sub_samples)
@@ -7556,7 +8181,7 @@ False
             # array_out is not a scalar array, so it can safely be
             # indexed with partition.indices in all cases.
             # --------------------------------------------------------
-            for partition in partitions.matrix.flat:
+            for partition in self._prefetched_partitions():
                 partition.open(config)
                 p_array = partition.array
 
@@ -9143,6 +9768,109 @@ False
         '''
         self.Units = Units(value, self.get_calendar(default=None))
 
+    def collapse_multiple(self, methods, axes=None, squeeze=False,
+                          mtol=1, weights=None, ddof=0,
+                          _preserve_partitions=False):
+        '''Collapse axes with several statistics from one pass over the
+    data.
+
+    This is equivalent to calling each of the collapse methods in
+    turn, but the data are only read once, which considerably reduces
+    the I/O when the data are stored in files.
+
+    The weights, if provided, are only applied to the statistics that
+    may be weighted (``'mean'``, ``'mean_absolute_value'``,
+    ``'root_mean_square'``, ``'sd'`` and ``'var'``). Note that data
+    array elements with zero weight are omitted from all of the
+    statistics.
+
+    .. versionadded:: 3.8.0
+
+    .. seealso:: `maximum`, `minimum`, `mean`, `mid_range`, `range`,
+                 `sum`, `sd`, `var`
+
+    :Parameters:
+
+        methods: sequence of `str`
+            The collapse methods, each of which is the name of a
+            `Data` collapse method. Must be one or more of
+            ``'max'``, ``'min'``, ``'maximum_absolute_value'``,
+            ``'minimum_absolute_value'``, ``'mean'``,
+            ``'mean_absolute_value'``, ``'root_mean_square'``,
+            ``'mid_range'``, ``'range'``, ``'sample_size'``,
+            ``'sum'``, ``'sum_of_squares'``, ``'sd'`` and ``'var'``.
+
+        axes: (sequence of) `int`, optional
+            The axes to be collapsed. By default flattened input is
+            used. Each axis is identified by its integer position. No
+            axes are collapsed if *axes* is an empty sequence.
+
+        squeeze: `bool`, optional
+            If True then collapsed axes are removed. By default the
+            axes which are collapsed are left in the result as axes
+            with size 1.
+
+        mtol: number, optional
+
+        weights: data-like or dict, optional
+            Weights associated with values of the array. See `mean`
+            for details.
+
+        ddof: number, optional
+            The delta degrees of freedom for the ``'sd'`` and
+            ``'var'`` statistics.
+
+    :Returns:
+
+        `list` of `Data`
+            The collapsed arrays, in the same order as *methods*.
+
+    **Examples:**
+
+    >>> d = cf.Data([[1, 2, 4], [1, 4, 9]], 'm')
+    >>> mn, mx, avg = d.collapse_multiple(['min', 'max', 'mean'], axes=1)
+    >>> print(mn.array)
+    [[1]
+     [1]]
+    >>> print(mx.array)
+    [[4]
+     [9]]
+    >>> print(avg.array)
+    [[2.33333333]
+     [4.66666667]]
+
+        '''
+        funcs = []
+        fpartials = []
+        ffinalises = []
+        weighted = []
+        all_units = []
+        for method in methods:
+            x = _collapse_functions.get(method)
+            if x is None:
+                raise ValueError(
+                    "Can't collapse: Can't calculate {!r} with other "
+                    "statistics".format(method)
+                )
+
+            func, fpartial, ffinalise, w = x
+            if method in ('sd', 'var'):
+                func = functools_partial(func, ddof=ddof)
+
+            funcs.append(func)
+            fpartials.append(fpartial)
+            ffinalises.append(ffinalise)
+            weighted.append(w)
+
+            all_units.append(_collapse_units(method, self.Units))
+        # --- End: for
+
+        return self._collapse(funcs, fpartials, ffinalises, axes=axes,
+                              squeeze=squeeze, weights=weights,
+                              mtol=mtol, units=all_units,
+                              weighted=weighted,
+                              _preserve_partitions=_preserve_partitions)
+
     @_deprecated_kwarg_check('i')
     def maximum(self, axes=None, squeeze=False, mtol=1, inplace=False,
                 i=False, _preserve_partitions=False):
@@ -10513,6 +11241,11 @@ False
                 self.__class__.__name__, self.Units, other.Units))
             return False
 
+        if isinstance(other, Data) and self._shares_arrays(other):
+            # The values are the same arrays, so there is no need to
+            # compare them
+            return True
+
         config = self.partition_configuration(readonly=True)
 
         other.to_memory()
@@ -0,0 +1,158 @@
+from numpy import asanyarray      as numpy_asanyarray
+from numpy import broadcast_to    as numpy_broadcast_to
+from numpy import clip            as numpy_clip
+from numpy import errstate        as numpy_errstate
+from numpy import float64         as numpy_float64
+from numpy import full            as numpy_full
+from numpy import isnan           as numpy_isnan
+from numpy import log             as numpy_log
+from numpy import minimum         as numpy_minimum
+from numpy import nan             as numpy_nan
+from numpy import searchsorted    as numpy_searchsorted
+from numpy import take_along_axis as numpy_take_along_axis
+from numpy import where           as numpy_where
+from numpy import zeros           as numpy_zeros
+
+from numpy.ma import filled       as numpy_ma_filled
+from numpy.ma import getmaskarray as numpy_ma_getmaskarray
+from numpy.ma import MaskedArray  as numpy_ma_MaskedArray
+
+
+# --------------------------------------------------------------------
+# Interpolation functions
+#
+# Each function interpolates along the last axis of an array, and is
+# vectorised over all of its other axes, so that the cost is
+# dominated by reading and writing the arrays.
+# --------------------------------------------------------------------
+
+def linear(x, y, x_new, log=False):
+    '''Linear interpolation along the last axis of an array.
+
+    The source coordinates may be the same for every point of the
+    other axes (for instance, the pressure levels of a vertical
+    dimension coordinate) or may differ between them (for instance,
+    the three dimensional pressure of a hybrid sigma-pressure
+    coordinate). In either case the source coordinates of each
+    interpolation must be monotonic, and the source coordinates of
+    all interpolations must have the same direction.
+
+    :Parameters:
+
+        x: `numpy.ndarray`
+            The source coordinates. Either a one dimensional array
+            with the size of the last axis of *y*, or an array that
+            broadcasts to the shape of *y*. Missing values are not
+            allowed.
+
+        y: `numpy.ndarray`
+            The source data, which may be a masked array.
+
+        x_new: `numpy.ndarray`
+            The one dimensional destination coordinates.
+
+        log: `bool`, optional
+            If True then interpolate linearly in the natural logarithm
+            of the coordinates, rather than in the coordinates
+            themselves. The coordinates must be positive.
+
+    :Returns:
+
+        `numpy.ma.MaskedArray`
+            The interpolated data, with the shape of *y* except for
+            the last axis, whose size is that of *x_new*. Values are
+            missing where a destination coordinate is outside of the
+            range of the source coordinates, or where either of the
+            two source values that contribute to it is missing.
+
+    **Examples:**
+
+    >>> x = numpy.array([1000, 850, 500])
+    >>> y = numpy.array([[10.0, 4.0, -20.0], [12.0, 6.0, -18.0]])
+    >>> print(linear(x, y, numpy.array([925, 700, 200])))
+    [[7.0 -6.2857142857142865 --]
+     [9.0 -4.2857142857142865 --]]
+
+    '''
+    x = numpy_ma_filled(numpy_asanyarray(x, dtype=numpy_float64),
+                        numpy_nan)
+    x_new = numpy_asanyarray(x_new, dtype=numpy_float64)
+
+    n = y.shape[-1]
+    if n < 2:
+        raise ValueError(
+            "Can't interpolate from fewer than two source points")
+
+    if x.size == n:
+        x = x.reshape(n)
+
+    if log:
+        with numpy_errstate(divide='ignore', invalid='ignore'):
+            x = numpy_log(x)
+            x_new = numpy_log(x_new)
+    # --- End: if
+
+    y_mask = numpy_ma_getmaskarray(y)
+    y = numpy_ma_filled(y, 0)
+    if y.dtype.kind != 'f':
+        y = y.astype(numpy_float64)
+
+    # Make the source coordinates increase
+    first = x.reshape(-1, n)[0]
+    if first[-1] < first[0]:
+        x = x[..., ::-1]
+        y = y[..., ::-1]
+        y_mask = y_mask[..., ::-1]
+
+    if x.ndim == 1:
+        # The same source coordinates for every interpolation
+        i0 = numpy_clip(numpy_searchsorted(x, x_new, side='right') - 1,
+                        0, n - 2)
+        x0 = x[i0]
+        x1 = x[i0 + 1]
+        outside = (x_new < x[0]) | (x_new > x[-1])
+
+        y0 = y[..., i0]
+        y1 = y[..., i0 + 1]
+        mask = y_mask[..., i0] | y_mask[..., i0 + 1] | outside
+    else:
+        # Different source coordinates for each interpolation. Find
+        # the number of source coordinates that are no greater than
+        # each destination coordinate with a binary search that is
+        # vectorised over all interpolations, so that the number of
+        # passes over the arrays grows with the logarithm of the
+        # number of source levels.
+        x = numpy_broadcast_to(x, y.shape)
+        shape = y.shape[:-1] + x_new.shape
+        count = numpy_zeros(shape, dtype='int32')
+        upper = numpy_full(shape, n, dtype='int32')
+        for _ in range(n.bit_length()):
+            mid = (count + upper) // 2
+            numpy_minimum(mid, n - 1, out=mid)
+            active = count < upper
+            below = numpy_take_along_axis(x, mid, axis=-1) <= x_new
+            count = numpy_where(active & below, mid + 1, count)
+            upper = numpy_where(active & ~below, mid, upper)
+
+        i0 = numpy_clip(count - 1, 0, n - 2)
+        i1 = i0 + 1
+
+        x0 = numpy_take_along_axis(x, i0, axis=-1)
+        x1 = numpy_take_along_axis(x, i1, axis=-1)
+        outside = (x_new < x[..., :1]) | (x_new > x[..., -1:])
+
+        y0 = numpy_take_along_axis(y, i0, axis=-1)
+        y1 = numpy_take_along_axis(y, i1, axis=-1)
+        mask = (numpy_take_along_axis(y_mask, i0, axis=-1) |
+                numpy_take_along_axis(y_mask, i1, axis=-1) | outside)
+    # --- End: if
+
+    with numpy_errstate(divide='ignore', invalid='ignore'):
+        w = (x_new - x0) / (x1 - x0)
+        out = y1 - y0
+        out *= w
+        out += y0
+
+    mask = mask | numpy_isnan(out)
+
+    return numpy_ma_MaskedArray(out, mask=mask)
@@ -0,0 +1,440 @@
+from numpy import concatenate as numpy_concatenate
+from numpy import cumsum      as numpy_cumsum
+from numpy import errstate    as numpy_errstate
+from numpy import full        as numpy_full
+from numpy import inf         as numpy_inf
+from numpy import isnan       as numpy_isnan
+from numpy import maximum     as numpy_maximum
+from numpy import minimum     as numpy_minimum
+from numpy import nan         as numpy_nan
+from numpy import nanmean     as numpy_nanmean
+from numpy import pad         as numpy_pad
+from numpy import sqrt        as numpy_sqrt
+from numpy import where       as numpy_where
+
+
+# --------------------------------------------------------------------
+# Moving window functions
+#
+# Each function operates along the last axis of a floating point
+# array that has already been extended past its edges by `pad`, so
+# that an array of size n along the window axis has size
+# n+window_size-1, and returns an array of size n along that axis in
+# which element i is the statistic of the padded elements i to
+# i+window_size-1.
+#
+# Missing values are represented by NaNs, and any window that
+# contains a missing value has a NaN result.
+#
+# All functions are O(n), independent of the window size.
+# --------------------------------------------------------------------
+
+# Map the scipy.ndimage boundary modes to their numpy.pad equivalents
+_pad_modes = {
+    'reflect': 'symmetric',
+    'mirror': 'reflect',
+    'nearest': 'edge',
+    'wrap': 'wrap',
+    'constant': 'constant',
+}
+
+
+def window_offsets(window_size, origin=0):
+    '''Return the number of points before and after the window centre.
+
+    The window placement is the same as that of
+    `scipy.ndimage.convolve1d` with the same *origin*.
+
+    :Parameters:
+
+        window_size: `int`
+
+        origin: `int`, optional
+
+    :Returns:
+
+        2-`tuple` of `int`
+
+    **Examples:**
+
+    >>> window_offsets(3)
+    (1, 1)
+    >>> window_offsets(4)
+    (1, 2)
+    >>> window_offsets(3, origin=1)
+    (0, 2)
+
+    '''
+    if window_size < 1:
+        raise ValueError(
+            "Window size must be a positive integer: Got {}".format(
+                window_size))
+
+    before = window_size - 1 - window_size // 2 - origin
+    after = window_size - 1 - before
+    if before < 0 or after < 0:
+        raise ValueError(
+            "Invalid origin for window size {}: Got {}".format(
+                window_size, origin))
+
+    return before, after
+
+
+def pad(a, window_size, origin=0, mode='constant', cval=numpy_nan):
+    '''Extend the last axis of an array past its edges.
+
+    :Parameters:
+
+        a: `numpy.ndarray`
+
+        window_size: `int`
+
+        origin: `int`, optional
+
+        mode: `str`, optional
+            One of ``'reflect'``, ``'constant'``, ``'nearest'``,
+            ``'mirror'`` or ``'wrap'``, with the same meanings as for
+            `scipy.ndimage.convolve1d`.
+
+        cval: number, optional
+            The value beyond the edges if *mode* is ``'constant'``.
+
+    :Returns:
+
+        `numpy.ndarray`
+
+    '''
+    try:
+        np_mode = _pad_modes[mode]
+    except KeyError:
+        raise ValueError(
+            "Invalid mode: {!r}. Expected one of {}".format(
+                mode, tuple(_pad_modes)))
+
+    before, after = window_offsets(window_size, origin)
+    if not before and not after:
+        return a
+
+    pad_width = [(0, 0)] * (a.ndim - 1) + [(before, after)]
+
+    kwargs = {}
+    if np_mode == 'constant':
+        kwargs['constant_values'] = cval
+
+    return numpy_pad(a, pad_width, mode=np_mode, **kwargs)
+
+
+def _window_sum(a, window_size):
+    '''Moving sum of an array that has no missing values.
+
+    :Parameters:
+
+        a: `numpy.ndarray`
+
+        window_size: `int`
+
+    :Returns:
+
+        `numpy.ndarray`
+
+    '''
+    c = numpy_cumsum(a, axis=-1)
+    out = c[..., window_size-1:].copy()
+    out[..., 1:] -= c[..., :-window_size]
+    return out
+
+
+def _missing(a, window_size):
+    '''Locate the windows that contain missing values.
+
+    :Parameters:
+
+        a: `numpy.ndarray`
+
+        window_size: `int`
+
+    :Returns:
+
+        `numpy.ndarray` or `None`
+            Boolean array that is True where a window contains any
+            missing values, or `None` if there are no missing values.
+
+    '''
+    nan = numpy_isnan(a)
+    if not nan.any():
+        return None
+
+    return _window_sum(nan.astype('int32'), window_size) > 0
+
+
+def moving_sum(a, window_size, weights=None):
+    '''The moving sum, or moving weighted sum.
+
+    :Parameters:
+
+        a: `numpy.ndarray`
+
+        window_size: `int`
+
+        weights: `numpy.ndarray`, optional
+            Padded weights, broadcastable to *a*.
+
+    :Returns:
+
+        `numpy.ndarray`
+
+    '''
+    missing = _missing(a, window_size)
+    if missing is not None:
+        a = numpy_where(numpy_isnan(a), 0.0, a)
+
+    if weights is not None:
+        a = a * weights
+
+    out = _window_sum(a, window_size)
+
+    if missing is not None:
+        out[missing] = numpy_nan
+
+    return out
+
+
+def moving_mean(a, window_size, weights=None):
+    '''The moving mean, or moving weighted mean.
+
+    :Parameters:
+
+        a: `numpy.ndarray`
+
+        window_size: `int`
+
+        weights: `numpy.ndarray`, optional
+            Padded weights, broadcastable to *a*.
+
+    :Returns:
+
+        `numpy.ndarray`
+
+    '''
+    out = moving_sum(a, window_size, weights=weights)
+    if weights is None:
+        out /= window_size
+    else:
+        with numpy_errstate(invalid='ignore', divide='ignore'):
+            out /= _window_sum(weights, window_size)
+
+    return out
+
+
+def _moving_extremum(a, window_size, func, fill):
+    '''The moving maximum or minimum.
+
+    Uses the van Herk/Gil-Werman algorithm, which needs three
+    comparisons per element for any window size.
+
+    :Parameters:
+
+        a: `numpy.ndarray`
+
+        window_size: `int`
+
+        func: `numpy.ufunc`
+            `numpy.maximum` or `numpy.minimum`.
+
+        fill: number
+            A value that is never selected by *func*.
+
+    :Returns:
+
+        `numpy.ndarray`
+
+    '''
+    size = a.shape[-1]
+    n = size - window_size + 1
+
+    # Split the window axis into blocks of the window size
+    n_blocks = -(-size // window_size)
+    extra = n_blocks * window_size - size
+    if extra:
+        a = numpy_concatenate(
+            (a, numpy_full(a.shape[:-1] + (extra,), fill, dtype=a.dtype)),
+            axis=-1
+        )
+
+    shape = a.shape
+    blocks = a.reshape(shape[:-1] + (n_blocks, window_size))
+
+    # Running extrema from the start and the end of each block. Each
+    # window spans at most two blocks, and so its extremum is that of
+    # the extremum from its start to the end of its first block, and
+    # the extremum from the start of its last block to its end.
+    prefix = func.accumulate(blocks, axis=-1).reshape(shape)
+    suffix = func.accumulate(blocks[..., ::-1], axis=-1)[..., ::-1]
+    suffix = suffix.reshape(shape)
+
+    return func(suffix[..., :n], prefix[..., window_size-1:window_size-1+n])
+
+
+def moving_max(a, window_size, weights=None):
+    '''The moving maximum.
+
+    :Parameters:
+
+        a: `numpy.ndarray`
+
+        window_size: `int`
+
+        weights: ignored
+
+    :Returns:
+
+        `numpy.ndarray`
+
+    '''
+    return _moving_extremum(a, window_size, numpy_maximum, -numpy_inf)
+
+
+def moving_min(a, window_size, weights=None):
+    '''The moving minimum.
+
+    :Parameters:
+
+        a: `numpy.ndarray`
+
+        window_size: `int`
+
+        weights: ignored
+
+    :Returns:
+
+        `numpy.ndarray`
+
+    '''
+    return _moving_extremum(a, window_size, numpy_minimum, numpy_inf)
+
+
+def moving_range(a, window_size, weights=None):
+    '''The moving range.
+
+    :Parameters:
+
+        a: `numpy.ndarray`
+
+        window_size: `int`
+
+        weights: ignored
+
+    :Returns:
+
+        `numpy.ndarray`
+
+    '''
+    out = moving_max(a, window_size)
+    out -= moving_min(a, window_size)
+    return out
+
+
+def moving_var(a, window_size, weights=None, ddof=1):
+    '''The moving variance, or moving weighted variance.
+
+    The weighted variance is defined as for the ``'variance'``
+    collapse method, i.e. with reliability weights.
+
+    :Parameters:
+
+        a: `numpy.ndarray`
+
+        window_size: `int`
+
+        weights: `numpy.ndarray`, optional
+            Padded weights, broadcastable to *a*.
+
+        ddof: number, optional
+            The delta degrees of freedom.
+
+    :Returns:
+
+        `numpy.ndarray`
+
+    '''
+    missing = _missing(a, window_size)
+
+    # Remove the mean of each series before accumulating, so that
+    # the variance is not swamped by cancellation between large sums
+    with numpy_errstate(invalid='ignore'):
+        centre = numpy_nanmean(a, axis=-1, keepdims=True)
+
+    centre = numpy_where(numpy_isnan(centre), 0.0, centre)
+
+    a = a - centre
+    if missing is not None:
+        a = numpy_where(numpy_isnan(a), 0.0, a)
+
+    if weights is None:
+        V1 = float(window_size)
+        s1 = _window_sum(a, window_size)
+        s2 = _window_sum(a * a, window_size)
+    else:
+        V1 = _window_sum(weights, window_size)
+        wa = weights * a
+        s1 = _window_sum(wa, window_size)
+        s2 = _window_sum(wa * a, window_size)
+
+    with numpy_errstate(invalid='ignore', divide='ignore'):
+        s1 /= V1
+        s2 /= V1
+        s1 *= s1
+        var = s2 - s1
+
+        # Rounding may create tiny negative variances
+        var = numpy_maximum(var, 0.0)
+
+        # Values with no degrees of freedom are missing, as for the
+        # 'variance' collapse method
+        if weights is None:
+            if ddof:
+                if V1 - ddof <= 0:
+                    var[...] = numpy_nan
+                else:
+                    var *= V1 / (V1 - ddof)
+        elif ddof == 1:
+            V2 = _window_sum(weights * weights, window_size)
+            V1 *= V1
+            denominator = V1 - V2
+            var *= V1 / denominator
+            var = numpy_where(denominator <= 0, numpy_nan, var)
+        elif ddof:
+            raise ValueError(
+                "Can only calculate a weighted variance with a delta "
+                "degrees of freedom (ddof) of 0 or 1: Got {}".format(ddof)
+            )
+    # --- End: with
+
+    if missing is not None:
+        var[missing] = numpy_nan
+
+    return var
+
+
+def moving_sd(a, window_size, weights=None, ddof=1):
+    '''The moving standard deviation.
+
+    :Parameters:
+
+        a: `numpy.ndarray`
+
+        window_size: `int`
+
+        weights: `numpy.ndarray`, optional
+            Padded weights, broadcastable to *a*.
+
+        ddof: number, optional
+            The delta degrees of freedom.
+
+    :Returns:
+
+        `numpy.ndarray`
+
+    '''
+    return numpy_sqrt(moving_var(a, window_size, weights=weights,
+                                 ddof=ddof))
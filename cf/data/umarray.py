@@ -17,7 +17,8 @@ class UMArray(abstract.FileArray):
     def __init__(self, filename=None, dtype=None, ndim=None,
                  shape=None, size=None, header_offset=None,
                  data_offset=None, disk_length=None, fmt=None,
-                 word_size=None, byte_ordering=None):
+                 word_size=None, byte_ordering=None, int_hdr=None,
+                 real_hdr=None):
         '''**Initialization**
 
     :Parameters:
@@ -53,6 +54,18 @@ class UMArray(abstract.FileArray):
 
         byte_ordering: `str`, optional
 
+        int_hdr: `numpy.ndarray`, optional
+            The integer header of the record. If set, along with
+            *real_hdr*, then the header is not read from the file
+            when the data array is accessed.
+
+            .. versionadded:: 3.8.0
+
+        real_hdr: `numpy.ndarray`, optional
+            The real header of the record.
+
+            .. versionadded:: 3.8.0
+
     **Examples:**
 
     >>> a = UMFileArray(file='file.pp', header_offset=3156, data_offset=3420,
@@ -72,11 +85,29 @@ class UMArray(abstract.FileArray):
                          data_offset=data_offset,
                          disk_length=disk_length, fmt=fmt,
                          word_size=word_size,
-                         byte_ordering=byte_ordering)
+                         byte_ordering=byte_ordering,
+                         int_hdr=int_hdr, real_hdr=real_hdr)
 
         # By default, do not close the UM file after data array access
         self._close = False
 
+    def __getstate__(self):
+        '''Called when pickling.
+
+    A prefetched record is not pickled.
+
+    .. versionadded:: 3.8.0
+
+    :Returns:
+
+        `dict`
+            A dictionary of the instance's attributes
+
+        '''
+        state = self.__dict__.copy()
+        state.pop('_prefetched', None)
+        return state
+
     def __getitem__(self, indices):
         '''Implement indexing
 
@@ -87,16 +118,36 @@ class UMArray(abstract.FileArray):
         '''
         f = self.open()
 
-        rec = Rec.from_file_and_offsets(
-            f, self.header_offset, self.data_offset, self.disk_length)
+        int_hdr = self.int_hdr
+        real_hdr = self.real_hdr
+        if int_hdr is None or real_hdr is None:
+            rec = Rec.from_file_and_offsets(
+                f, self.header_offset, self.data_offset, self.disk_length)
+            int_hdr = rec.int_hdr
+            real_hdr = rec.real_hdr
+        else:
+            rec = Rec(int_hdr, real_hdr, self.header_offset,
+                      self.data_offset, self.disk_length, file=f)
 
-        int_hdr = rec.int_hdr
-        real_hdr = rec.real_hdr
+        shape = (int_hdr.item(17,), int_hdr.item(18,))
 
-        array = rec.get_data().reshape(int_hdr.item(17,), int_hdr.item(18,))
+        if indices is not Ellipsis:
+            indices = parse_indices(shape, indices)
+
+        if int_hdr.item(20,) % 10 == 0:
+            # Unpacked data: take a view of the rows spanned by the
+            # indices directly from the memory-mapped file
+            array, indices = self._mapped_rows(rec, shape, indices)
+        else:
+            array = getattr(self, '_prefetched', None)
+            if array is None:
+                array = rec.get_data()
+            else:
+                del self._prefetched
+
+            array = array.reshape(shape)
 
         if indices is not Ellipsis:
-            indices = parse_indices(array.shape, indices)
             array = get_subspace(array, indices)
 
         LBUSER2 = int_hdr.item(38,)
@@ -105,12 +156,144 @@ class UMArray(abstract.FileArray):
             # Return the numpy array now if it is a boolean array
             return array.astype(bool)
 
-        integer_array = LBUSER2 == 2
+        return self._unpack(array, rec, LBUSER2 == 2)
+
+    @staticmethod
+    def prefetch(arrays, max_workers=None):
+        '''Read and unpack the packed records of many arrays concurrently.
+
+    The records of each file are read and decoded in bulk, with runs of
+    records in parallel threads, and each decoded record is kept by
+    its array until the array is next indexed or until it is released
+    with `release`. Arrays that are not `UMArray` instances, or whose
+    records are not packed, are ignored.
+
+    .. versionadded:: 3.8.0
+
+    :Parameters:
+
+        arrays: sequence
+            The arrays.
+
+        max_workers: `int`, optional
+            The maximum number of threads to use for each file. By
+            default the number of CPUs is used.
+
+    :Returns:
+
+        `list`
+            The arrays that now keep a decoded record.
+
+    **Examples:**
+
+    >>> arrays = cf.data.UMArray.prefetch(
+    ...     [p.subarray for p in d.partitions.flat])
+    >>> cf.data.UMArray.release(arrays)
+
+        '''
+        files = {}
+        for a in arrays:
+            if not isinstance(a, UMArray):
+                continue
+
+            if getattr(a, '_prefetched', None) is not None:
+                continue
+
+            int_hdr = a.int_hdr
+            if int_hdr is None or a.real_hdr is None:
+                continue
+
+            if int_hdr.item(20,) % 10 == 0:
+                # Unpacked records are not worth prefetching
+                continue
+
+            files.setdefault(a.filename, []).append(a)
+        # --- End: for
+
+        out = []
+        for arrays in files.values():
+            if len(arrays) < 2:
+                continue
+
+            f = arrays[0].open()
+            data = f._c_interface.read_records_data(
+                f.fd,
+                [(a.data_offset, a.disk_length, a.int_hdr, a.real_hdr)
+                 for a in arrays],
+                f.byte_ordering, f.word_size, max_workers=max_workers)
+
+            for a, array in zip(arrays, data):
+                a._prefetched = array
+
+            out.extend(arrays)
+        # --- End: for
+
+        return out
+
+    @staticmethod
+    def release(arrays):
+        '''Release the prefetched records of arrays that have not yet
+    been indexed.
+
+    .. versionadded:: 3.8.0
+
+    .. seealso:: `prefetch`
+
+    :Parameters:
+
+        arrays: sequence of `UMArray`
+            The arrays.
+
+    :Returns:
+
+        `None`
+
+    **Examples:**
+
+    >>> arrays = cf.data.UMArray.prefetch(
+    ...     [p.subarray for p in d.partitions.flat])
+    >>> cf.data.UMArray.release(arrays)
+
+        '''
+        for a in arrays:
+            a.__dict__.pop('_prefetched', None)
+
+    def _unpack(self, array, rec, integer_array):
+        '''Convert raw record values to a native, masked and scaled
+    array.
+
+    Missing values are identified from BMDI, and the values are
+    scaled by BMKS and offset by BDATUM. The conversion from the
+    file's byte order to the native byte order is combined with the
+    scaling, so that a view of the file is copied only once.
+
+    .. versionadded:: 3.8.0
+
+    :Parameters:
+
+        array: `numpy.ndarray`
+            The raw values, possibly a non-native byte order view of
+            the file.
+
+        rec: `Rec`
+            The record.
+
+        integer_array: `bool`
+            Whether or not the record contains integer values.
+
+    :Returns:
+
+        `numpy.ndarray`
+            A new array with native byte order.
+
+        '''
+        real_hdr = rec.real_hdr
+        dtype = array.dtype.newbyteorder('=')
 
         # ------------------------------------------------------------
-        # Convert to a masked array
+        # Find missing values from BMDI, before any scaling
         # ------------------------------------------------------------
-        # Set the fill_value from BMDI
+        mask = None
         fill_value = real_hdr.item(17,)
         if fill_value != -1.0e30:
             # -1.0e30 is the flag for no missing data
@@ -119,32 +302,132 @@ class UMArray(abstract.FileArray):
                 # values
                 fill_value = int(fill_value)
 
-            # Mask any missing values
             mask = (array == fill_value)
-            if mask.any():
-                array = numpy.ma.masked_where(mask, array, copy=False)
+            if not mask.any():
+                mask = None
         # --- End: if
 
         # ------------------------------------------------------------
-        # Unpack the array using the scale_factor and add_offset, if
-        # either is available
+        # Copy to native byte order, applying the scale_factor (BMKS)
+        # in the same pass if it is neither 0 nor 1, and then the
+        # add_offset (BDATUM) if it is not 0
         # ------------------------------------------------------------
-        # Treat BMKS as a scale_factor if it is neither 0 nor 1
+        out = numpy.empty(array.shape, dtype=dtype)
+
         scale_factor = real_hdr.item(18,)
         if scale_factor != 1.0 and scale_factor != 0.0:
             if integer_array:
                 scale_factor = int(scale_factor)
-            array *= scale_factor
 
-        # Treat BDATUM as an add_offset if it is not 0
+            numpy.multiply(array, scale_factor, out=out, casting='unsafe')
+        else:
+            out[...] = array
+
         add_offset = real_hdr.item(4,)
         if add_offset != 0.0:
             if integer_array:
                 add_offset = int(add_offset)
-            array += add_offset
 
-        # Return the numpy array
-        return array
+            numpy.add(out, add_offset, out=out, casting='unsafe')
+
+        if mask is not None:
+            out = numpy.ma.masked_where(mask, out, copy=False)
+
+        return out
+
+    def _mapped_rows(self, rec, shape, indices):
+        '''Return a view of the rows of an unpacked record that are
+    spanned by indices.
+
+    The rows of unpacked data are contiguous in the file, so the view
+    is taken from a memory map of the file without reading or copying
+    any other part of it. The view has the byte order of the file.
+
+    .. versionadded:: 3.8.0
+
+    :Parameters:
+
+        rec: `Rec`
+            The record.
+
+        shape: `tuple`
+            The shape of the record's data array.
+
+        indices: `list` or `Ellipsis`
+            The parsed indices of the data array.
+
+    :Returns:
+
+        `numpy.ndarray`, `list` or `Ellipsis`
+            The view of the rows, and the indices relative to those
+            rows.
+
+    **Examples:**
+
+    >>> array, indices = a._mapped_rows(rec, (73, 96),
+    ...                                 [slice(10, 20, 1), slice(0, 96, 1)])
+    >>> array.shape
+    (10, 96)
+    >>> array.dtype
+    dtype('>f4')
+    >>> indices
+    [slice(0, 10, 1), slice(0, 96, 1)]
+
+        '''
+        nrows, ncols = shape
+
+        start = 0
+        stop = nrows
+        if indices is not Ellipsis:
+            rows = indices[0]
+            if isinstance(rows, slice):
+                rows = range(*rows.indices(nrows))
+                if rows:
+                    start = min(rows[0], rows[-1])
+                    stop = max(rows[0], rows[-1]) + 1
+
+                    row_stop = rows.stop - start
+                    if row_stop < 0:
+                        row_stop = None
+
+                    rows = slice(rows.start - start, row_stop, rows.step)
+                else:
+                    rows = indices[0]
+            else:
+                rows = numpy.asanyarray(rows)
+                if rows.dtype == bool:
+                    rows = numpy.where(rows)[0]
+
+                if rows.size:
+                    start = int(rows.min())
+                    stop = int(rows.max()) + 1
+                    rows = (rows - start).tolist()
+                else:
+                    rows = indices[0]
+            # --- End: if
+
+            indices = [rows] + list(indices[1:])
+        # --- End: if
+
+        f = rec.file
+        word_size = f.word_size
+        dtype, _ = rec.get_type_and_num_words()
+        if f.byte_ordering == 'big_endian':
+            dtype = dtype.newbyteorder('>')
+        else:
+            dtype = dtype.newbyteorder('<')
+
+        try:
+            array = numpy.frombuffer(
+                f.mmap(), dtype=dtype, count=(stop - start) * ncols,
+                offset=rec.data_offset + start * ncols * word_size)
+        except ValueError:
+            raise IOError(
+                "Can't read rows {}:{} of the record at offset {} "
+                "of {}".format(start, stop, self.header_offset,
+                               self.filename))
+
+        return array.reshape(stop - start, ncols), indices
 
     def __str__(self):
         '''x.__str__() <==> str(x)
@@ -180,6 +463,24 @@ class UMArray(abstract.FileArray):
         '''
         return self._get_component('disk_length')
 
+    @property
+    def int_hdr(self):
+        '''The integer header of the record, if stored.
+
+    .. versionadded:: 3.8.0
+
+        '''
+        return self._get_component('int_hdr', None)
+
+    @property
+    def real_hdr(self):
+        '''The real header of the record, if stored.
+
+    .. versionadded:: 3.8.0
+
+        '''
+        return self._get_component('real_hdr', None)
+
     @property
     def fmt(self):
         '''TODO
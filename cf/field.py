@@ -1,4 +1,5 @@
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from functools import reduce
 from operator import mul as operator_mul
 from operator import itemgetter
@@ -10,33 +11,57 @@ try:
 except ImportError:
     pass
 
+try:
+    from scipy.spatial import cKDTree as scipy_cKDTree
+except ImportError:
+    pass
+
 from numpy import arange as numpy_arange
+from numpy import arcsin as numpy_arcsin
 from numpy import argmax as numpy_argmax
+from numpy import argsort as numpy_argsort
 from numpy import array as numpy_array
 from numpy import array_equal as numpy_array_equal
 
 from numpy import asanyarray as numpy_asanyarray
 from numpy import can_cast as numpy_can_cast
+from numpy import ceil as numpy_ceil
+from numpy import clip as numpy_clip
+from numpy import column_stack as numpy_column_stack
+from numpy import cos as numpy_cos
 from numpy import diff as numpy_diff
 from numpy import empty as numpy_empty
 from numpy import finfo as numpy_finfo
-from numpy import full as numpy_full
+from numpy import flatnonzero as numpy_flatnonzero
+from numpy import floor as numpy_floor
+from numpy import inf as numpy_inf
 from numpy import isnan as numpy_isnan
+from numpy import maximum as numpy_maximum
+from numpy import meshgrid as numpy_meshgrid
+from numpy import minimum as numpy_minimum
 from numpy import nan as numpy_nan
 from numpy import ndarray as numpy_ndarray
 from numpy import ndim as numpy_ndim
 from numpy import pi as numpy_pi
 from numpy import prod as numpy_prod
+from numpy import radians as numpy_radians
 from numpy import reshape as numpy_reshape
+from numpy import searchsorted as numpy_searchsorted
 from numpy import shape as numpy_shape
+from numpy import sin as numpy_sin
 from numpy import size as numpy_size
 from numpy import squeeze as numpy_squeeze
 from numpy import tile as numpy_tile
+from numpy import transpose as numpy_transpose
 from numpy import unique as numpy_unique
+from numpy import unravel_index as numpy_unravel_index
 from numpy import where as numpy_where
+from numpy import zeros as numpy_zeros
 
+from numpy.ma import getmaskarray as numpy_ma_getmaskarray
 from numpy.ma import is_masked as numpy_ma_is_masked
 from numpy.ma import isMA as numpy_ma_isMA
+from numpy.ma import masked_all as numpy_ma_masked_all
 
 from numpy.ma import MaskedArray as numpy_ma_MaskedArray
 from numpy.ma import where as numpy_ma_where
@@ -64,10 +89,12 @@ from . import List
 
 from .constants import masked as cf_masked
 
-from .functions import (parse_indices, chunksize, equals, _section)
+from .functions import (parse_indices, chunksize, equals, _section,
+                        hash_array, regrid_workers)
 from .functions import relaxed_identities as cf_relaxed_identities
 from .query import Query, ge, gt, le, lt, eq
 from .regrid import Regrid
+from .regridoperator import RegridOperator
 from .timeduration import TimeDuration
 from .units import Units
 from .subspacefield import SubspaceField
@@ -77,9 +104,16 @@ from .data import RaggedContiguousArray
 from .data import RaggedIndexedArray
 from .data import RaggedIndexedContiguousArray
 from .data import GatheredArray
+from .data import interpolation_functions
 
 from . import mixin
 
+from . import mpi_on
+if mpi_on:
+    from . import mpi_comm
+    from . import mpi_rank
+    from . import mpi_size
+
 from .functions import (_DEPRECATION_ERROR,
                         _DEPRECATION_ERROR_ARG,
                         _DEPRECATION_ERROR_KWARGS,
@@ -202,6 +236,44 @@ _collapse_weighted_methods = set((
     'root_mean_square',
 ))
 
+# --------------------------------------------------------------------
+# These Data methods may be calculated together from a single pass
+# over the data when several collapse methods are given
+# --------------------------------------------------------------------
+_collapse_multiple_methods = set((
+    'max',
+    'min',
+    'maximum_absolute_value',
+    'minimum_absolute_value',
+    'mean',
+    'mean_absolute_value',
+    'root_mean_square',
+    'mid_range',
+    'range',
+    'sample_size',
+    'sum',
+    'sum_of_squares',
+    'sd',
+    'var',
+))
+
+# --------------------------------------------------------------------
+# These Data methods collapse all of the selected axes, including
+# those of size 1
+# --------------------------------------------------------------------
+_collapse_all_sizes_methods = set((
+    'sum_of_weights',
+    'sum_of_weights2',
+    'sample_size',
+    'integral',
+    'maximum_absolute_value',
+    'minimum_absolute_value',
+    'mean_absolute_value',
+    'range',
+    'root_mean_square',
+    'sum_of_squares',
+))
+
 # --------------------------------------------------------------------
 # These Data methods may specify a number of degrees of freedom
 # --------------------------------------------------------------------
@@ -240,6 +312,29 @@ _xxx = namedtuple(
 )
 
 
+def _unit_sphere_cartesian(lat, lon):
+    '''Return the cartesian coordinates of points on the unit sphere.
+
+    .. versionadded:: 3.8.0
+
+    :Parameters:
+
+        lat, lon: `numpy.ndarray`
+            The latitudes and longitudes of the points, in radians.
+
+    :Returns:
+
+        `numpy.ndarray`
+            The x, y and z coordinates of the points, with shape
+            ``(n, 3)``.
+
+    '''
+    cos_lat = numpy_cos(lat)
+    return numpy_column_stack((cos_lat * numpy_cos(lon),
+                               cos_lat * numpy_sin(lon),
+                               numpy_sin(lat)))
+
+
 class Field(mixin.PropertiesData,
             cfdm.Field):
     '''A field construct of the CF data model.
@@ -3867,234 +3962,950 @@ class Field(mixin.PropertiesData,
         '''
         return method in conservative_regridding_methods
 
-    def _regrid_update_coordinates(self, dst, dst_dict, dst_coords,
-                                   src_axis_keys, dst_axis_keys,
-                                   cartesian=False,
-                                   dst_axis_sizes=None,
-                                   dst_coords_2D=False,
-                                   dst_coord_order=None):
-        '''Update the coordinates of the new field.
+    @classmethod
+    def _regrid_get_source_signature(cls, coords, *args):
+        '''Return a description of a source grid.
+
+    The description is used to check that a field construct's source
+    grid is the same as the one used to create a regrid operator.
+
+    .. versionadded:: 3.8.0
 
     :Parameters:
 
-        dst: Field or `dict`
-            The object containing the destination grid.
+        coords: sequence of coordinate constructs
+            The source grid coordinates.
 
-        dst_dict: `bool`
-            Whether dst is a dictionary.
+        args: *optional*
+            Other hashable values that must match, such as the
+            regridding method and the cyclicity of the grid.
 
-        dst_coords: sequence
-            The destination coordinates.
+    :Returns:
 
-        src_axis_keys: sequence
-            The keys of the regridding axes in the source field.
+        `tuple`
+            The description of the source grid.
 
-        dst_axis_keys: sequence
-            The keys of the regridding axes in the destination field.
+        '''
+        signature = []
+        for coord in coords:
+            # Hash the coordinate and bounds values, rather than
+            # storing them, so that the description is small
+            bounds = coord.get_bounds(None)
+            if bounds is not None:
+                bounds = hash_array(
+                    numpy_asanyarray(bounds.array, dtype=float))
+
+            signature.append((
+                coord.shape,
+                str(coord.Units),
+                hash_array(numpy_asanyarray(coord.array, dtype=float)),
+                bounds,
+            ))
+        # --- End: for
 
-        cartesian: `bool`, optional
-            Whether regridding is Cartesian of spherical, False by
-            default.
+        signature.extend(args)
 
-        dst_axis_sizes: sequence, optional
-            The sizes of the destination axes.
+        return tuple(signature)
 
-        dst_coords_2D: `bool`, optional
-            Whether the destination coordinates are 2D, currently only
-            applies to spherical regridding.
+    @classmethod
+    def _regrid_create_operator(cls, src_coords, src_grid_kwargs,
+                                use_bounds, dstfield, dstfracfield, method,
+                                ignore_degenerate, coord_sys, src_signature,
+                                parameters, nonconservative1D=False,
+                                src_mask=None, shared=False):
+        '''Create a regrid operator with ESMPy.
 
-        dst_coord_order: `list`, optional
-            A list of lists specifying the ordering of the axes for
-            each 2D destination coordinate.
+    The regridding weights are created for the source grid without
+    any missing data values, unless a source mask is given.
 
-        '''
-# NOTE: May be common ground between cartesian and shperical that
-# could save some lines of code.
+    .. versionadded:: 3.8.0
 
-        # Remove the source coordinates of new field
-#        self.remove_items(axes=src_axis_keys)
-#        for key in self.constructs.filter_by_axis('or', *src_axis_keys):
-        for key in self.coordinates.filter_by_axis('or', *src_axis_keys):
-            self.del_construct(key)
+    :Parameters:
 
-        if cartesian:
-            # Make axes map
-            if not dst_dict:
-                axis_map = {}
-                for k_s, k_d in zip(src_axis_keys, dst_axis_keys):
-                    axis_map[k_d] = k_s
-            # --- End: if
+        src_coords: sequence of coordinate constructs
+            The source grid coordinates.
 
-            # Insert coordinates from dst into new field
-            if dst_dict:
-                for k_s, d in zip(src_axis_keys, dst_coords):
-                    self.domain_axes[k_s].set_size(d.size)
-                    self.set_construct(d, axes=[k_s])
-            else:
-                for k_d in dst_axis_keys:
-                    d = dst.dimension_coordinate(k_d)
-                    k_s = axis_map[k_d]
-                    self.domain_axes[k_s].set_size(d.size)
-                    self.set_construct(d, axes=[k_s])
+        src_grid_kwargs: `dict`
+            Keyword arguments to `Regrid.create_grid` for creating the
+            source grid.
 
-                for aux_key, aux in dst.auxiliary_coordinates.filter_by_axis(
-                        'subset', *dst_axis_keys).items():
-                    aux_axes = [axis_map[k_d] for k_d in
-                                dst.get_data_axes(aux_key)]
-                    self.set_construct(aux, axes=aux_axes)
-        else:
-            # Give destination grid latitude and longitude standard names
-            dst_coords[0].standard_name = 'longitude'
-            dst_coords[1].standard_name = 'latitude'
+        use_bounds: `bool`
+            Whether or not to use the coordinate bounds.
 
-            # Insert 'X' and 'Y' coordinates from dst into new field
-            for axis_key, axis_size in zip(src_axis_keys, dst_axis_sizes):
-                self.domain_axes[axis_key].set_size(axis_size)
+        dstfield: ESMPy Field
+            The destination field.
 
-            if dst_dict:
-                if dst_coords_2D:
-                    for coord, coord_order in zip(
-                            dst_coords, dst_coord_order):
-                        axis_keys = [src_axis_keys[index] for
-                                     index in coord_order]
-                        self.set_construct(coord, axes=axis_keys)
-                else:
-                    for coord, axis_key in zip(dst_coords, src_axis_keys):
-                        self.set_construct(coord, axes=[axis_key])
-            else:
-                for src_axis_key, dst_axis_key in zip(
-                        src_axis_keys, dst_axis_keys):
-                    # try:
-                    #     self.set_construct(
-                    #         dst.dimension_coordinate(dst_axis_key),
-                    #         axes=[src_axis_key]
-                    #     )
-                    # except AttributeError:
-                    #     pass
-                    dim_coord = dst.dimension_coordinate(dst_axis_key,
-                                                         default=None)
-                    if dim_coord is not None:
-                        self.set_construct(dim_coord, axes=[src_axis_key])
+        dstfracfield: ESMPy Field
+            The destination fraction field.
 
-                    for aux in dst.auxiliary_coordinates.filter_by_axis(
-                            'exact', dst_axis_key).values():
-                        self.set_construct(aux, axes=[src_axis_key])
-                # --- End: for
+        method: `str`
+            The regridding method.
 
-                for aux_key, aux in dst.auxiliary_coordinates.filter_by_axis(
-                        'exact', *dst_axis_keys).items():
-                    aux_axes = dst.get_data_axes(aux_key)
-                    if aux_axes == tuple(dst_axis_keys):
-                        self.set_construct(aux, axes=src_axis_keys)
-                    else:
-                        self.set_construct(aux, axes=src_axis_keys[::-1])
-        # --- End: if
+        ignore_degenerate: `bool`
+            Whether or not to ignore degenerate cells.
 
-        # Copy names of dimensions from destination to source field
-        if not dst_dict:
-            for src_axis_key, dst_axis_key in zip(
-                    src_axis_keys, dst_axis_keys):
-                ncdim = dst.domain_axes[dst_axis_key].nc_get_dimension(None)
-                if ncdim is not None:
-                    self.domain_axes[src_axis_key].nc_set_dimension(ncdim)
-        # --- End: if
+        coord_sys: `str`
+            The coordinate system of the grids, either
+            ``'spherical'`` or ``'Cartesian'``.
 
-    # ----------------------------------------------------------------
-    # End of worker functions for regridding
-    # ----------------------------------------------------------------
+        src_signature: `tuple`
+            The description of the source grid, as returned by
+            `_regrid_get_source_signature`.
 
-    # ----------------------------------------------------------------
-    # Worker functions for weights
-    # ----------------------------------------------------------------
-    def _weights_area_XY(self, comp, weights_axes, auto=False,
-                         measure=False, radius=None, methods=False):
-        '''Calculate area weights from X and Y dimension coordinate
-    constructs.
+        parameters: `dict`
+            The description of the destination grid.
 
-    :Parameters:
+        nonconservative1D: `bool`, optional
+            If True then the source and destination grids have been
+            padded with a leading extra dimension of size 2 to allow
+            non-conservative regridding along a single axis. The
+            padding is removed from the weights.
 
-        measure: `bool`
-            If True then make sure that the weights represent true
-            cell sizes.
+        src_mask: `numpy.ndarray`, optional
+            The source grid mask, with the shape of the source grid
+            coordinates, that is True for missing source points.
 
-        methods: `bool`, optional
-            If True then add a description of the method used to
-            create the weights to the *comp* dictionary, as opposed to
-            the actual weights.
+        shared: `bool`, optional
+            If True, and cf is being run in parallel with MPI whilst
+            ESMF runs on a single process within each MPI process,
+            then the weights are created on the first process only
+            and are then shared with every other process. Must be the
+            same on all processes. When ESMF is itself running in
+            parallel, the weights are always created collectively by
+            all processes, each of which then holds all of the
+            weights.
 
     :Returns:
 
-        `bool` or `None`
+        `RegridOperator`
+            The regrid operator.
 
         '''
-        out = set()
+        pet_count = Regrid.initialize().pet_count
+
+        if shared and mpi_on and pet_count == 1:
+            # Create the weights once, on the first process, and
+            # share them with the other processes. ESMF is running on
+            # a single process, so its object creation is not
+            # collective and the other processes do not need to take
+            # part in it.
+            weights = None
+            if mpi_rank == 0:
+                operator = cls._regrid_create_operator(
+                    src_coords, src_grid_kwargs, use_bounds, dstfield,
+                    dstfracfield, method, ignore_degenerate, coord_sys,
+                    src_signature, parameters,
+                    nonconservative1D=nonconservative1D,
+                    src_mask=src_mask)
+                weights = (operator.weights, operator.src_shape,
+                           operator.dst_shape)
+
+            weights, src_shape, dst_shape = mpi_comm.bcast(weights, root=0)
+
+            return RegridOperator(weights, method, src_shape, dst_shape,
+                                  coord_sys=coord_sys,
+                                  src_signature=src_signature,
+                                  parameters=parameters, src_mask=src_mask)
+        # --- End: if
 
-        xdims = dict(self.dimension_coordinates('X'))
-        ydims = dict(self.dimension_coordinates('Y'))
+        if src_mask is not None:
+            mask = src_mask
+            if nonconservative1D:
+                mask = numpy_tile(mask, (2, 1))
 
-        if not (xdims and ydims):
-            if auto:
-                return
+            src_grid_kwargs = src_grid_kwargs.copy()
+            src_grid_kwargs['mask'] = mask
 
-            raise ValueError(
-                "Insufficient coordinate constructs for calculating "
-                "area weights"
-            )
+        srcgrid = Regrid.create_grid(src_coords, use_bounds,
+                                     **src_grid_kwargs)
+        srcfield = Regrid.create_field(srcgrid, 'srcfield')
+        srcfracfield = Regrid.create_field(srcgrid, 'srcfracfield')
 
-        xkey, xcoord = xdims.popitem()
-        ykey, ycoord = ydims.popitem()
+        regridSrc2Dst = Regrid(
+            srcfield, dstfield, srcfracfield, dstfracfield,
+            method=method, ignore_degenerate=ignore_degenerate,
+            factors=True
+        )
 
-        if xdims or ydims:
-            if auto:
-                return
+        # When ESMF is running in parallel, each process holds only
+        # part of the ESMPy fields, so get the shapes of the whole
+        # grids
+        src_shape = tuple(int(n) for n in srcgrid.max_index)
+        dst_shape = tuple(int(n) for n in dstfield.grid.max_index)
+
+        weights = regridSrc2Dst.get_weights(int(numpy_prod(src_shape)),
+                                            int(numpy_prod(dst_shape)))
+
+        if nonconservative1D:
+            # Each source point appears twice in the padded source
+            # grid, and the two rows of the padded destination grid
+            # are the same, so keep the first destination row and
+            # combine the weights of both copies of each source point
+            weights = weights[0::2, 0::2] + weights[0::2, 1::2]
+            src_shape = src_shape[1:]
+            dst_shape = dst_shape[1:]
+
+        # Release memory from ESMF
+        regridSrc2Dst.destroy()
+        srcfracfield.destroy()
+        srcfield.destroy()
+        srcgrid.destroy()
 
-            raise ValueError(
-                "Ambiguous coordinate constructs for calculating area "
-                "weights"
-            )
+        return RegridOperator(weights, method, src_shape, dst_shape,
+                              coord_sys=coord_sys,
+                              src_signature=src_signature,
+                              parameters=parameters, src_mask=src_mask)
 
-        if (xcoord.Units.equivalent(Units('radians')) and
-                ycoord.Units.equivalent(Units('radians'))):
-            pass
-        elif (xcoord.Units.equivalent(Units('metres')) and
-              ycoord.Units.equivalent(Units('metres'))):
-            radius = None
-        else:
-            if auto:
-                return
+    @staticmethod
+    def _regrid_overlap_weights(src_bounds, dst_bounds, period=None):
+        '''Create the first-order conservative weights of one axis.
 
-            raise ValueError(
-                "Insufficient coordinate constructs for calculating "
-                "area weights"
-            )
+    The weight of a source cell for a destination cell is the
+    fraction of the destination cell that is overlapped by the source
+    cell.
 
-        xaxis = self.get_data_axes(xkey)[0]
-        yaxis = self.get_data_axes(ykey)[0]
+    .. versionadded:: 3.8.0
 
-        for axis in (xaxis, yaxis):
-            if axis in weights_axes:
-                if auto:
-                    return
+    :Parameters:
 
-                raise ValueError(
-                    "Multiple weights specifications for {!r} "
-                    "axis".format(
-                        self.constructs.domain_axis_identity(axis))
-                )
-        # --- End: if
+        src_bounds: `numpy.ndarray`
+            The source cell bounds, with shape ``(n_src, 2)``.
 
-        if measure and radius is not None:
-            radius = self.radius(default=radius)
+        dst_bounds: `numpy.ndarray`
+            The destination cell bounds, with shape ``(n_dst, 2)``.
 
-        if measure or xcoord.size > 1:
-            if not xcoord.has_bounds():
-                if auto:
-                    return
+        period: number, optional
+            The period of the axis, if it is periodic.
 
-                raise ValueError(
-                    "Can't create area weights: No bounds for {!r} "
-                    "axis".format(xcoord.identity())
-                )
+    :Returns:
+
+        `numpy.ndarray`
+            The weights, with shape ``(n_dst, n_src)``.
+
+    **Examples:**
+
+    >>> Field._regrid_overlap_weights(numpy.array([[0, 1], [1, 2]]),
+    ...                               numpy.array([[0.5, 1.5]]))
+    array([[0.5, 0.5]])
+    >>> Field._regrid_overlap_weights(numpy.array([[0, 180], [180, 360]]),
+    ...                               numpy.array([[-90, 90]]), period=360)
+    array([[0.5, 0.5]])
+
+        '''
+        src_lower = src_bounds.min(axis=1)
+        src_upper = src_bounds.max(axis=1)
+        dst_lower = dst_bounds.min(axis=1).reshape(-1, 1)
+        dst_upper = dst_bounds.max(axis=1).reshape(-1, 1)
+
+        if period is None:
+            shifts = (0,)
+        else:
+            # Find the whole periods by which the source cells need
+            # to be shifted to overlap any destination cell
+            start = numpy_floor((dst_lower.min() - src_upper.max()) / period)
+            stop = numpy_ceil((dst_upper.max() - src_lower.min()) / period)
+            shifts = numpy_arange(start, stop + 1) * period
+
+        overlap = numpy_zeros((dst_lower.size, src_lower.size))
+        for shift in shifts:
+            overlap += numpy_maximum(
+                numpy_minimum(dst_upper, src_upper + shift) -
+                numpy_maximum(dst_lower, src_lower + shift),
+                0.0
+            )
+        # --- End: for
+
+        size = dst_upper - dst_lower
+        size[size == 0] = numpy_inf
+
+        return overlap / size
+
+    @classmethod
+    def _regrid_create_separable_operator(cls, src_coords, dst_coords,
+                                          method, src_signature,
+                                          parameters):
+        '''Create a first-order conservative regrid operator without ESMPy.
+
+    When the source and destination grids both have one dimensional
+    longitude and latitude coordinates, the first-order conservative
+    weights are the product of longitude weights and latitude
+    weights. The area of a grid cell is proportional to the product
+    of its longitude range and the range of the sines of its
+    latitudes, and the cell boundaries are lines of constant
+    longitude and latitude.
+
+    .. versionadded:: 3.8.0
+
+    :Parameters:
+
+        src_coords: sequence of `DimensionCoordinate`
+            The source longitude and latitude coordinates, which must
+            have bounds.
+
+        dst_coords: sequence of `DimensionCoordinate`
+            The destination longitude and latitude coordinates, which
+            must have bounds.
+
+        method: `str`
+            The regridding method, either ``'conservative'`` or
+            ``'conservative_1st'``.
+
+        src_signature: `tuple`
+            The description of the source grid, as returned by
+            `_regrid_get_source_signature`.
+
+        parameters: `dict`
+            The description of the destination grid.
+
+    :Returns:
+
+        `RegridOperator`
+            The regrid operator.
+
+        '''
+        degrees = Units('degrees')
+
+        axis_weights = []
+        for src_coord, dst_coord, period in zip(src_coords, dst_coords,
+                                                (360.0, None)):
+            bounds = []
+            for coord in (src_coord, dst_coord):
+                b = coord.get_bounds().data.copy()
+                b.Units = degrees
+                b = b.array
+                if period is None:
+                    # Latitude cells are weighted by the range of the
+                    # sines of their latitudes
+                    b = numpy_sin(numpy_radians(numpy_clip(b, -90, 90)))
+
+                bounds.append(b)
+            # --- End: for
+
+            axis_weights.append(cls._regrid_overlap_weights(
+                bounds[0], bounds[1], period=period))
+        # --- End: for
+
+        return RegridOperator(
+            None, method,
+            [c.size for c in src_coords],
+            [c.size for c in dst_coords],
+            coord_sys='spherical', src_signature=src_signature,
+            parameters=parameters, axis_weights=axis_weights
+        )
+
+    def _regrid_with_operator(self, operator, axis_indices,
+                              dst_axis_sizes, fracfield=False,
+                              use_src_mask=True, create_kwargs=None):
+        '''Regrid the data with the weights of a regrid operator.
+
+    The data are regridded in chunks that contain the whole of the
+    regridding axes, and all of the grids in each chunk are regridded
+    with a single sparse matrix product.
+
+    If the weights depend on the source mask then the grids of each
+    chunk are grouped by their masks, and the grids of each group are
+    regridded together with weights created for their mask. The
+    weights for each distinct mask are created only once.
+
+    .. versionadded:: 3.8.0
+
+    :Parameters:
+
+        operator: `RegridOperator`
+            The regrid operator.
+
+        axis_indices: sequence of `int`
+            The positions of the regridding axes in the data, in the
+            order of the axes of the regridding grid.
+
+        dst_axis_sizes: sequence of `int`
+            The sizes of the regridding axes after regridding, in the
+            order of the axes of the regridding grid.
+
+        fracfield: `bool`, optional
+            For conservative regridding, return the fraction of each
+            destination grid cell involved in the regridding instead
+            of the regridded data.
+
+        use_src_mask: `bool`, optional
+            For nearest source to destination regridding, whether or
+            not to use the source mask.
+
+        create_kwargs: `dict`, optional
+            If set then the weights depend on the source mask, and
+            the weights for each distinct mask of the data are
+            created by passing these keyword parameters to
+            `_regrid_create_operator`. By default the weights of
+            *operator* are used for all grids.
+
+    :Returns:
+
+        `Data`
+            The regridded data.
+
+        '''
+        axis_indices = list(axis_indices)
+        n_axes = len(axis_indices)
+
+        # Regrid operators for each distinct source mask, keyed by the
+        # hash of the mask
+        masked_operators = {}
+
+        def load(key, d):
+            array = d.array
+
+            # Move the regridding axes to the front, and stack the
+            # grids along a single trailing axis
+            other_axes = [i for i in range(array.ndim)
+                          if i not in axis_indices]
+            order = axis_indices + other_axes
+            array = numpy_transpose(array, order)
+            other_shape = array.shape[n_axes:]
+            array = array.reshape(array.shape[:n_axes] + (-1,))
+
+            if create_kwargs is None or not numpy_ma_is_masked(array):
+                groups = [(operator, None)]
+            else:
+                # Group the grids by their masks, creating the weights
+                # for each new mask
+                mask = numpy_ma_getmaskarray(array)
+                grids = {}
+                for i in range(array.shape[-1]):
+                    m = mask[..., i]
+                    if m.any():
+                        grids.setdefault(hash_array(m), []).append(i)
+                    else:
+                        grids.setdefault(None, []).append(i)
+                # --- End: for
+
+                groups = []
+                for mask_hash, indices in grids.items():
+                    if mask_hash is None:
+                        op = operator
+                    else:
+                        op = masked_operators.get(mask_hash)
+                        if op is None:
+                            op = self._regrid_create_operator(
+                                src_mask=mask[..., indices[0]],
+                                **create_kwargs)
+                            masked_operators[mask_hash] = op
+                    # --- End: if
+
+                    groups.append((op, indices))
+                # --- End: for
+            # --- End: if
+
+            return array, groups, order, other_shape
+
+        def regrid(array, groups, order, other_shape):
+            if len(groups) == 1 and groups[0][1] is None:
+                array = operator._regrid_array(array, fracfield=fracfield,
+                                               use_src_mask=use_src_mask)
+            else:
+                out = None
+                for op, grids in groups:
+                    regridded = op._regrid_array(
+                        array[..., grids], fracfield=fracfield,
+                        use_src_mask=use_src_mask)
+
+                    if out is None:
+                        out = numpy_ma_masked_all(
+                            regridded.shape[:-1] + (array.shape[-1],),
+                            dtype=regridded.dtype)
+
+                    out[..., grids] = regridded
+                # --- End: for
+
+                array = out
+            # --- End: if
+
+            # Restore the original axis order
+            array = array.reshape(tuple(dst_axis_sizes) + other_shape)
+            return numpy_transpose(array, numpy_argsort(order))
+
+        # When ESMF is running in parallel, creating new weights is
+        # collective, so every process must load every section in the
+        # same order
+        distribute = (create_kwargs is None
+                      or Regrid.initialize().pet_count == 1)
+
+        sections = self.data.section(axis_indices, chunks=True)
+
+        return self._regrid_sections(sections, load, regrid,
+                                     distribute=distribute)
+
+    def _regrid_interpolate_1d(self, axis, z, dst_z, ln_z=False,
+                               data=None):
+        '''Linearly interpolate the data along one axis.
+
+    The data are interpolated in chunks that contain the whole of the
+    interpolation axis, and each chunk is interpolated at all of its
+    points at once.
+
+    .. versionadded:: 3.8.0
+
+    :Parameters:
+
+        axis: `int`
+            The position of the interpolation axis in the data.
+
+        z: `Data`
+            The source coordinates. Either one dimensional, with the
+            size of the interpolation axis, or with the same number of
+            dimensions as the field's data, where each dimension has
+            either the size of the corresponding data dimension or
+            size 1.
+
+        dst_z: `Data`
+            The one dimensional destination coordinates, in the same
+            units as *z*.
+
+        ln_z: `bool`, optional
+            If True then interpolate linearly in the natural logarithm
+            of the coordinates.
+
+        data: `Data`, optional
+            The data to interpolate, such as the data of a metadata
+            construct. By default the field's data are interpolated.
+
+    :Returns:
+
+        `Data`
+            The interpolated data.
+
+        '''
+        if data is None:
+            data = self.data
+
+        dst_z = dst_z.array
+        if z.ndim == 1:
+            x = z.array
+
+        # Move the interpolation axis to the end
+        order = [i for i in range(data.ndim) if i != axis] + [axis]
+
+        def load(key, d):
+            if z.ndim == 1:
+                x_section = x
+            else:
+                # Select the source coordinates of this chunk
+                indices = []
+                for start, size, z_size in zip(key, d.shape, z.shape):
+                    if start is None or z_size == 1:
+                        indices.append(slice(None))
+                    else:
+                        indices.append(slice(start, start + size))
+                # --- End: for
+
+                x_section = numpy_transpose(z[tuple(indices)].array, order)
+            # --- End: if
+
+            return x_section, numpy_transpose(d.array, order)
+
+        def regrid(x_section, array):
+            array = interpolation_functions.linear(x_section, array, dst_z,
+                                                   log=ln_z)
+            return numpy_transpose(array, numpy_argsort(order))
+
+        sections = data.section([axis], chunks=True)
+
+        return self._regrid_sections(sections, load, regrid,
+                                     units=data.Units)
+
+    def _regrid_sections(self, sections, load, regrid, units=None,
+                         distribute=True):
+        '''Regrid independent sections of the data in parallel.
+
+    Each section is read by *load* in the calling thread, so that all
+    file access and the creation of any new weights are serial, and
+    is then regridded by *regrid* in one of `cf.regrid_workers`
+    threads. The threads share the same weights, and the numpy and
+    scipy operations that apply them release the global interpreter
+    lock. At most one section per thread is read ahead of the
+    regridding.
+
+    When cf is run in parallel with MPI, the sections are also
+    distributed across the processes and the regridded sections are
+    then shared between all of them.
+
+    .. versionadded:: 3.8.0
+
+    :Parameters:
+
+        sections: `dict`
+            The sections of the data, as returned by `Data.section`.
+
+        load: function
+            Called as ``load(key, d)`` for each section *d* with key
+            *key*, returning a `tuple` of the arguments to *regrid*.
+
+        regrid: function
+            Returns the regridded `numpy` array of a section, given
+            the arguments returned by *load*.
+
+        units: `Units`, optional
+            The units of the regridded data. By default the units of
+            the field are used.
+
+        distribute: `bool`, optional
+            If False then do not distribute the sections across the
+            MPI processes, so that every process loads and regrids
+            every section.
+
+    :Returns:
+
+        `Data`
+            The regridded data.
+
+        '''
+        distribute = distribute and mpi_on
+
+        keys = sorted(sections)
+        if distribute:
+            keys = keys[mpi_rank::mpi_size]
+
+        workers = min(regrid_workers(), len(keys))
+
+        regridded = {}
+        if workers <= 1:
+            for key in keys:
+                regridded[key] = regrid(*load(key, sections[key]))
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                pending = []
+                for key in keys:
+                    if len(pending) >= workers:
+                        k, future = pending.pop(0)
+                        regridded[k] = future.result()
+
+                    pending.append(
+                        (key, executor.submit(regrid,
+                                              *load(key, sections[key]))))
+                # --- End: for
+
+                for k, future in pending:
+                    regridded[k] = future.result()
+            # --- End: with
+        # --- End: if
+
+        if distribute:
+            # Share the sections regridded on each process with every
+            # other process
+            for x in mpi_comm.allgather(regridded):
+                regridded.update(x)
+        # --- End: if
+
+        if units is None:
+            units = self.Units
+
+        for key, array in regridded.items():
+            sections[key] = Data(array, units=units)
+
+        return Data.reconstruct_sectioned_data(sections)
+
+    def _regrid_interpolate_1d_constructs(self, axis_key, z, dst_z,
+                                          ln_z=False):
+        '''Linearly interpolate metadata constructs along one axis.
+
+    Domain ancillary and field ancillary constructs that span the
+    interpolation axis are interpolated in-place with the same source
+    coordinates as the field's data, and lose any bounds. Such a
+    construct is removed if its source coordinates vary along axes
+    that it does not span. Cell measure constructs that span the
+    interpolation axis are removed, since the sizes of the new cells
+    are not known.
+
+    .. versionadded:: 3.8.0
+
+    :Parameters:
+
+        axis_key: `str`
+            The domain axis construct key of the interpolation axis.
+
+        z: `Data`
+            The source coordinates, as for `_regrid_interpolate_1d`.
+
+        dst_z: `Data`
+            The one dimensional destination coordinates, in the same
+            units as *z*.
+
+        ln_z: `bool`, optional
+            If True then interpolate linearly in the natural logarithm
+            of the coordinates.
+
+    :Returns:
+
+        `None`
+
+        '''
+        data_axes = self.get_data_axes()
+
+        for key in self.cell_measures.filter_by_axis('or', axis_key):
+            self.del_construct(key)
+
+        for key, construct in self.constructs.filter_by_type(
+                'domain_ancillary', 'field_ancillary').filter_by_axis(
+                    'or', axis_key).items():
+            construct_axes = self.get_data_axes(key)
+            if not set(construct_axes).issubset(data_axes):
+                self.del_construct(key)
+                continue
+
+            if z.ndim == 1:
+                construct_z = z
+            else:
+                # Select the source coordinates of the axes spanned by
+                # the construct, in the construct's axis order
+                positions = [data_axes.index(axis)
+                             for axis in construct_axes]
+                other = [i for i in range(z.ndim) if i not in positions]
+                if any(z.shape[i] > 1 for i in other):
+                    self.del_construct(key)
+                    continue
+
+                construct_z = z.squeeze(other)
+                construct_z.transpose(
+                    [sorted(positions).index(i) for i in positions],
+                    inplace=True)
+            # --- End: if
+
+            construct.set_data(
+                self._regrid_interpolate_1d(
+                    construct_axes.index(axis_key), construct_z, dst_z,
+                    ln_z=ln_z, data=construct.data),
+                copy=False)
+            if construct.construct_type == 'domain_ancillary':
+                construct.del_bounds(None)
+        # --- End: for
+
+    def _regrid_update_coordinates(self, dst, dst_dict, dst_coords,
+                                   src_axis_keys, dst_axis_keys,
+                                   cartesian=False,
+                                   dst_axis_sizes=None,
+                                   dst_coords_2D=False,
+                                   dst_coord_order=None):
+        '''Update the coordinates of the new field.
+
+    :Parameters:
+
+        dst: Field or `dict`
+            The object containing the destination grid.
+
+        dst_dict: `bool`
+            Whether dst is a dictionary.
+
+        dst_coords: sequence
+            The destination coordinates.
+
+        src_axis_keys: sequence
+            The keys of the regridding axes in the source field.
+
+        dst_axis_keys: sequence
+            The keys of the regridding axes in the destination field.
+
+        cartesian: `bool`, optional
+            Whether regridding is Cartesian of spherical, False by
+            default.
+
+        dst_axis_sizes: sequence, optional
+            The sizes of the destination axes.
+
+        dst_coords_2D: `bool`, optional
+            Whether the destination coordinates are 2D, currently only
+            applies to spherical regridding.
+
+        dst_coord_order: `list`, optional
+            A list of lists specifying the ordering of the axes for
+            each 2D destination coordinate.
+
+        '''
+# NOTE: May be common ground between cartesian and shperical that
+# could save some lines of code.
+
+        # Remove the source coordinates of new field
+#        self.remove_items(axes=src_axis_keys)
+#        for key in self.constructs.filter_by_axis('or', *src_axis_keys):
+        for key in self.coordinates.filter_by_axis('or', *src_axis_keys):
+            self.del_construct(key)
+
+        if cartesian:
+            # Make axes map
+            if not dst_dict:
+                axis_map = {}
+                for k_s, k_d in zip(src_axis_keys, dst_axis_keys):
+                    axis_map[k_d] = k_s
+            # --- End: if
+
+            # Insert coordinates from dst into new field
+            if dst_dict:
+                for k_s, d in zip(src_axis_keys, dst_coords):
+                    self.domain_axes[k_s].set_size(d.size)
+                    self.set_construct(d, axes=[k_s])
+            else:
+                for k_d in dst_axis_keys:
+                    d = dst.dimension_coordinate(k_d)
+                    k_s = axis_map[k_d]
+                    self.domain_axes[k_s].set_size(d.size)
+                    self.set_construct(d, axes=[k_s])
+
+                for aux_key, aux in dst.auxiliary_coordinates.filter_by_axis(
+                        'subset', *dst_axis_keys).items():
+                    aux_axes = [axis_map[k_d] for k_d in
+                                dst.get_data_axes(aux_key)]
+                    self.set_construct(aux, axes=aux_axes)
+        else:
+            # Give destination grid latitude and longitude standard names
+            dst_coords[0].standard_name = 'longitude'
+            dst_coords[1].standard_name = 'latitude'
+
+            # Insert 'X' and 'Y' coordinates from dst into new field
+            for axis_key, axis_size in zip(src_axis_keys, dst_axis_sizes):
+                self.domain_axes[axis_key].set_size(axis_size)
+
+            if dst_dict:
+                if dst_coords_2D:
+                    for coord, coord_order in zip(
+                            dst_coords, dst_coord_order):
+                        axis_keys = [src_axis_keys[index] for
+                                     index in coord_order]
+                        self.set_construct(coord, axes=axis_keys)
+                else:
+                    for coord, axis_key in zip(dst_coords, src_axis_keys):
+                        self.set_construct(coord, axes=[axis_key])
+            else:
+                for src_axis_key, dst_axis_key in zip(
+                        src_axis_keys, dst_axis_keys):
+                    # try:
+                    #     self.set_construct(
+                    #         dst.dimension_coordinate(dst_axis_key),
+                    #         axes=[src_axis_key]
+                    #     )
+                    # except AttributeError:
+                    #     pass
+                    dim_coord = dst.dimension_coordinate(dst_axis_key,
+                                                         default=None)
+                    if dim_coord is not None:
+                        self.set_construct(dim_coord, axes=[src_axis_key])
+
+                    for aux in dst.auxiliary_coordinates.filter_by_axis(
+                            'exact', dst_axis_key).values():
+                        self.set_construct(aux, axes=[src_axis_key])
+                # --- End: for
+
+                for aux_key, aux in dst.auxiliary_coordinates.filter_by_axis(
+                        'exact', *dst_axis_keys).items():
+                    aux_axes = dst.get_data_axes(aux_key)
+                    if aux_axes == tuple(dst_axis_keys):
+                        self.set_construct(aux, axes=src_axis_keys)
+                    else:
+                        self.set_construct(aux, axes=src_axis_keys[::-1])
+        # --- End: if
+
+        # Copy names of dimensions from destination to source field
+        if not dst_dict:
+            for src_axis_key, dst_axis_key in zip(
+                    src_axis_keys, dst_axis_keys):
+                ncdim = dst.domain_axes[dst_axis_key].nc_get_dimension(None)
+                if ncdim is not None:
+                    self.domain_axes[src_axis_key].nc_set_dimension(ncdim)
+        # --- End: if
+
+    # ----------------------------------------------------------------
+    # End of worker functions for regridding
+    # ----------------------------------------------------------------
+
+    # ----------------------------------------------------------------
+    # Worker functions for weights
+    # ----------------------------------------------------------------
+    def _weights_area_XY(self, comp, weights_axes, auto=False,
+                         measure=False, radius=None, methods=False):
+        '''Calculate area weights from X and Y dimension coordinate
+    constructs.
+
+    :Parameters:
+
+        measure: `bool`
+            If True then make sure that the weights represent true
+            cell sizes.
+
+        methods: `bool`, optional
+            If True then add a description of the method used to
+            create the weights to the *comp* dictionary, as opposed to
+            the actual weights.
+
+    :Returns:
+
+        `bool` or `None`
+
+        '''
+        out = set()
+
+        xdims = dict(self.dimension_coordinates('X'))
+        ydims = dict(self.dimension_coordinates('Y'))
+
+        if not (xdims and ydims):
+            if auto:
+                return
+
+            raise ValueError(
+                "Insufficient coordinate constructs for calculating "
+                "area weights"
+            )
+
+        xkey, xcoord = xdims.popitem()
+        ykey, ycoord = ydims.popitem()
+
+        if xdims or ydims:
+            if auto:
+                return
+
+            raise ValueError(
+                "Ambiguous coordinate constructs for calculating area "
+                "weights"
+            )
+
+        if (xcoord.Units.equivalent(Units('radians')) and
+                ycoord.Units.equivalent(Units('radians'))):
+            pass
+        elif (xcoord.Units.equivalent(Units('metres')) and
+              ycoord.Units.equivalent(Units('metres'))):
+            radius = None
+        else:
+            if auto:
+                return
+
+            raise ValueError(
+                "Insufficient coordinate constructs for calculating "
+                "area weights"
+            )
+
+        xaxis = self.get_data_axes(xkey)[0]
+        yaxis = self.get_data_axes(ykey)[0]
+
+        for axis in (xaxis, yaxis):
+            if axis in weights_axes:
+                if auto:
+                    return
+
+                raise ValueError(
+                    "Multiple weights specifications for {!r} "
+                    "axis".format(
+                        self.constructs.domain_axis_identity(axis))
+                )
+        # --- End: if
+
+        if measure and radius is not None:
+            radius = self.radius(default=radius)
+
+        if measure or xcoord.size > 1:
+            if not xcoord.has_bounds():
+                if auto:
+                    return
+
+                raise ValueError(
+                    "Can't create area weights: No bounds for {!r} "
+                    "axis".format(xcoord.identity())
+                )
 
             if methods:
                 comp[(xaxis,)] = 'linear ' + xcoord.identity()
@@ -8982,7 +9793,7 @@ class Field(mixin.PropertiesData,
 
     :Parameters:
 
-        method: `str`
+        method: `str` or sequence of `str`
             Define the collapse method. All of the axes specified by
             the *axes* parameter are collapsed simultaneously by this
             method. The method is given by one of the following
@@ -9101,6 +9912,30 @@ class Field(mixin.PropertiesData,
             ...     'time: minimum within years', within_years=cf.M())
             >>> g = g.collapse('mean over years', axes='T')
 
+            Several statistics may be calculated from the same axes
+            by providing a sequence of collapse methods, in which case
+            a `FieldList` containing one collapsed field construct for
+            each method is returned. When possible, all of the
+            statistics are calculated from a single pass over the
+            data, which is much faster than collapsing for each method
+            separately when the data are stored in files. For
+            example:
+
+            >>> fl = f.collapse(['minimum', 'maximum', 'mean', 'sd'],
+            ...                 axes='T')
+
+            is equivalent to, but faster than:
+
+            >>> fl = cf.FieldList([f.collapse(m, axes='T')
+            ...                    for m in ('minimum', 'maximum', 'mean',
+            ...                              'sd')])
+
+            A sequence may also contain CF-like cell methods strings,
+            such as ``['T: mean', 'X: maximum']``, in which case each
+            one is collapsed separately.
+
+            .. versionadded:: 3.8.0
+
         axes: (sequence of) `str`, optional
             The axes to be collapsed, defined by those which would be
             selected by passing each given axis description to a call
@@ -10058,10 +10893,11 @@ class Field(mixin.PropertiesData,
 
     :Returns:
 
-        `Field` or `numpy.ndarray`
+        `Field` or `FieldList` or `numpy.ndarray`
              The collapsed field construct. Alternatively, if the
              *regroup* parameter is True then a `numpy` array is
-             returned.
+             returned; or if *method* is a sequence then a
+             `FieldList` of collapsed field constructs is returned.
 
     **Examples:**
 
@@ -10079,6 +10915,68 @@ class Field(mixin.PropertiesData,
             _DEPRECATION_ERROR_KWARGS(
                 self, 'collapse', kwargs)  # pragma: no cover
 
+        if isinstance(method, str):
+            methods = None
+        else:
+            # --------------------------------------------------------
+            # Multiple collapse methods
+            # --------------------------------------------------------
+            if inplace:
+                raise ValueError(
+                    "Can't collapse in-place with multiple collapse methods")
+
+            method = tuple(method)
+            if not method:
+                raise ValueError("Can't collapse: No collapse methods")
+
+            methods = []
+            for m in method:
+                if ':' in m or ' within ' in m or ' over ' in m:
+                    # CF-like cell methods strings and climatological
+                    # methods are parsed by the collapse for each
+                    # method
+                    methods = None
+                    break
+
+                m2 = _collapse_methods.get(m, None)
+                if m2 is None:
+                    raise ValueError(
+                        "Unknown collapse method: {!r}".format(m))
+
+                methods.append(m2)
+            # --- End: for
+
+            grouped = (group is not None or regroup or
+                       within_days is not None or
+                       within_years is not None or
+                       over_days is not None or over_years is not None)
+
+            if (methods is None or grouped or
+                    not _collapse_multiple_methods.issuperset(methods) or
+                    len(set([m in _collapse_all_sizes_methods
+                             for m in methods])) > 1):
+                # The statistics can't all be calculated from a single
+                # pass over the data, so collapse for each method
+                # separately
+                return FieldList([
+                    self.collapse(
+                        m, axes=axes, squeeze=squeeze, mtol=mtol,
+                        weights=weights, ddof=ddof, a=a, group=group,
+                        regroup=regroup, within_days=within_days,
+                        within_years=within_years, over_days=over_days,
+                        over_years=over_years, coordinate=coordinate,
+                        group_by=group_by, group_span=group_span,
+                        group_contiguous=group_contiguous,
+                        measure=measure, scale=scale, radius=radius,
+                        great_circle=great_circle, verbose=verbose,
+                        _create_zero_size_cell_bounds=(
+                            _create_zero_size_cell_bounds),
+                        _update_cell_methods=_update_cell_methods)
+                    for m in method
+                ])
+
+            method = methods[0]
+
         if inplace:
             f = self
         else:
@@ -10237,12 +11135,7 @@ class Field(mixin.PropertiesData,
 #    'sum_of_weights2'       : 'sum_of_weights2',
 #            }
 
-            if method in (
-                    'sum_of_weights', 'sum_of_weights2', 'sample_size',
-                    'integral', 'maximum_absolute_value',
-                    'minimum_absolute_value', 'mean_absolute_value',
-                    'range', 'root_mean_square', 'sum_of_squares'
-            ):
+            if method in _collapse_all_sizes_methods:
                 collapse_axes = collapse_axes_all_sizes.copy()
             else:
                 collapse_axes = collapse_axes_all_sizes.filter_by_size(gt(1))
@@ -10448,7 +11341,13 @@ class Field(mixin.PropertiesData,
                 '    Input weights           = {!r}'.format(weights)
             )  # pragma: no cover
 
-            if method not in _collapse_weighted_methods:
+            if methods is None:
+                weighted = method in _collapse_weighted_methods
+            else:
+                weighted = not _collapse_weighted_methods.isdisjoint(
+                    methods)
+
+            if not weighted:
                 weights = None
 
             d_kwargs = {}
@@ -10491,7 +11390,9 @@ class Field(mixin.PropertiesData,
                     "Must set the 'weights' parameter "
                     "for {!r} collapses".format(method))
 
-            if method in _collapse_ddof_methods:
+            if method in _collapse_ddof_methods or (
+                    methods is not None and
+                    not _collapse_ddof_methods.isdisjoint(methods)):
                 d_kwargs['ddof'] = ddof
 
             # ========================================================
@@ -10506,16 +11407,29 @@ class Field(mixin.PropertiesData,
             logger.info(
                 '    f.dtype = {}'.format(f.dtype))  # pragma: no cover
 
-            getattr(f.data, method)(axes=iaxes, squeeze=squeeze, mtol=mtol,
-                                    inplace=True, **d_kwargs)
+            if methods is None:
+                getattr(f.data, method)(axes=iaxes, squeeze=squeeze,
+                                        mtol=mtol, inplace=True,
+                                        **d_kwargs)
+            else:
+                # Calculate all of the statistics from one pass over
+                # the data
+                collapsed_data = f.data.collapse_multiple(
+                    methods, axes=iaxes, squeeze=squeeze, mtol=mtol,
+                    **d_kwargs)
 
             if squeeze:
+                collapsed_data_axes = [axis for axis in data_axes
+                                       if axis not in collapse_axes]
+            else:
+                collapsed_data_axes = data_axes
+
+            if squeeze and methods is None:
                 # ----------------------------------------------------
                 # Remove the collapsed axes from the field's list of
                 # data array axes
                 # ----------------------------------------------------
-                f.set_data_axes([axis for axis in data_axes
-                                 if axis not in collapse_axes])
+                f.set_data_axes(collapsed_data_axes)
 
             logger.info('  After collapse of data:')  # pragma: no cover
             logger.info(
@@ -10635,9 +11549,33 @@ class Field(mixin.PropertiesData,
                 dim.set_bounds(bounds, copy=False)
             # --- End: for
 
+            if methods is not None:
+                # Now that the collapsed domain axes have been resized,
+                # replace the field's data with the first statistic
+                f.set_data(collapsed_data[0], axes=collapsed_data_axes,
+                           copy=False)
+
             # --------------------------------------------------------
             # Update the cell methods
             # --------------------------------------------------------
+            if methods is not None:
+                # Create a field construct for each statistic
+                out = FieldList()
+                for m, data in zip(methods, collapsed_data):
+                    g = f.copy()
+                    g.set_data(data, set_axes=False, copy=False)
+                    if _update_cell_methods:
+                        g._update_cell_methods(m,
+                                               domain_axes=collapse_axes,
+                                               input_axes=axes_in,
+                                               within=within, over=over,
+                                               verbose=verbose)
+
+                    out.append(g)
+                # --- End: for
+
+                return out
+
             if _update_cell_methods:
                 f._update_cell_methods(method,
                                        domain_axes=collapse_axes,
@@ -10646,6 +11584,10 @@ class Field(mixin.PropertiesData,
                                        verbose=verbose)
         # --- End: for
 
+        if methods is not None:
+            # There were no collapse axes
+            return FieldList([f.copy() for m in methods])
+
         # ------------------------------------------------------------
         # Return the collapsed field (or the classification array)
         # ------------------------------------------------------------
@@ -11961,6 +12903,290 @@ class Field(mixin.PropertiesData,
         logger.info('    Modified cell methods = {}'.format(
             self.cell_methods.ordered()))  # pragma: no cover
 
+    def _indices_monotonic(self, item, value):
+        '''Find the index defined by a range condition on a dimension
+    coordinate construct.
+
+    A simple ``lt``, ``le``, ``gt``, ``ge`` or ``wi`` condition on the
+    (necessarily monotonic) values of a dimension coordinate construct
+    selects a contiguous range of cells, which is found by a binary
+    search of the coordinate values, rather than by evaluating the
+    condition for every cell. Reference time condition values are
+    converted to the units of the coordinates once, so no coordinate
+    values are converted to date-time objects.
+
+    .. versionadded:: 3.8.0
+
+    .. seealso:: `indices`
+
+    :Parameters:
+
+        item: `DimensionCoordinate`
+            The dimension coordinate construct.
+
+        value:
+            The condition.
+
+    :Returns:
+
+        `slice` or `None`
+            The index, or `None` if the condition is not a simple
+            range condition, can not be compared with the coordinates
+            without evaluating it for every cell, or selects no cells.
+
+    **Examples:**
+
+    >>> t = f.dimension_coordinate('T')
+    >>> f._indices_monotonic(t, cf.wi(cf.dt('1960-01-01'),
+    ...                               cf.dt('1960-12-31')))
+    slice(1, 13, 1)
+    >>> print(f._indices_monotonic(t, cf.month(1)))
+    None
+
+        '''
+        if not isinstance(value, Query) or value.attr:
+            return
+
+        try:
+            condition = value.value
+        except AttributeError:
+            # Compound condition
+            return
+
+        operator = value.operator
+        if operator not in ('lt', 'le', 'gt', 'ge', 'wi'):
+            return
+
+        # Convert the condition value to numbers in the units of the
+        # coordinates
+        condition = Data.asdata(condition)
+        if condition.dtype.kind not in 'iuf':
+            return
+
+        units = condition.Units
+        if units:
+            if not units.equivalent(item.Units):
+                return
+
+            if units.isreftime and (units._canonical_calendar !=
+                                    item.Units._canonical_calendar):
+                # Reference times in different calendars are left to
+                # the full evaluation of the condition
+                return
+
+            if not units.equals(item.Units):
+                condition = condition.copy()
+                condition.Units = item.Units
+        # --- End: if
+
+        condition = condition.array
+        if operator == 'wi':
+            if condition.size != 2:
+                return
+
+            condition = condition.flatten()
+        elif condition.size != 1:
+            return
+
+        array = item.array
+        if numpy_ma_is_masked(array):
+            return
+
+        array = numpy_asanyarray(array)
+
+        size = array.size
+        decreasing = size > 1 and not item.increasing
+        if decreasing:
+            array = array[::-1]
+
+        # Find the range [start, stop) of the increasing array that
+        # satisfies the condition
+        if operator == 'lt':
+            start, stop = 0, numpy_searchsorted(array, condition, 'left')
+        elif operator == 'le':
+            start, stop = 0, numpy_searchsorted(array, condition, 'right')
+        elif operator == 'gt':
+            start, stop = numpy_searchsorted(array, condition, 'right'), size
+        elif operator == 'ge':
+            start, stop = numpy_searchsorted(array, condition, 'left'), size
+        else:
+            start = numpy_searchsorted(array, condition[0], 'left')
+            stop = numpy_searchsorted(array, condition[1], 'right')
+
+        start = int(start)
+        stop = int(stop)
+        if start >= stop:
+            return
+
+        if decreasing:
+            start, stop = size - stop, size - start
+
+        return slice(start, stop, 1)
+
+    def _horizontal_spatial_index(self):
+        '''Return a spatial index of the horizontal grid cells.
+
+    The spatial index is a KD-tree of the positions of the cell
+    centres on the unit sphere, as defined by the latitude and
+    longitude coordinate constructs. These may be 1-d dimension
+    coordinate constructs or 2-d auxiliary coordinate constructs of
+    a curvilinear grid. Cells with missing coordinate values are
+    excluded.
+
+    The spatial index is cached, and is only rebuilt if the latitude
+    or longitude coordinates change.
+
+    .. versionadded:: 3.8.0
+
+    .. seealso:: `nearest_indices`
+
+    :Returns:
+
+        `tuple`
+            The domain axis keys of the horizontal axes, their sizes,
+            the KD-tree, and the flattened horizontal indices of the
+            points in the KD-tree.
+
+        '''
+        try:
+            scipy_cKDTree
+        except NameError:
+            raise ImportError(
+                "Must install scipy to create a horizontal spatial index")
+
+        lat_key = self.coordinate('latitude', key=True, default=None)
+        lon_key = self.coordinate('longitude', key=True, default=None)
+        if lat_key is None or lon_key is None:
+            raise ValueError(
+                "Can't create a horizontal spatial index: Can't find "
+                "unique latitude and longitude coordinate constructs")
+
+        lat = self.constructs[lat_key]
+        lon = self.constructs[lon_key]
+        lat_axes = self.get_data_axes(lat_key)
+        lon_axes = self.get_data_axes(lon_key)
+
+        if lat.ndim == 1 and lon.ndim == 1 and lat_axes != lon_axes:
+            axes = lat_axes + lon_axes
+        elif lat.ndim == 2 and set(lat_axes) == set(lon_axes):
+            axes = lat_axes
+        else:
+            raise ValueError(
+                "Can't create a horizontal spatial index: Latitude and "
+                "longitude coordinates must be either 1-d with different "
+                "axes or 2-d with the same axes")
+
+        arrays = []
+        for c, units in zip((lat, lon), ('degrees_north', 'degrees_east')):
+            data = c.data
+            if not data.Units:
+                data = data.override_units(units)
+            elif not data.Units.equivalent(Units(units)):
+                raise ValueError(
+                    "Can't create a horizontal spatial index: {!r} "
+                    "has units {!r}".format(c, data.Units))
+
+            data = data.copy()
+            data.Units = Units('radians')
+            arrays.append(data.array)
+        # --- End: for
+
+        lat_array, lon_array = arrays
+        if lat.ndim == 2 and lon_axes != lat_axes:
+            lon_array = lon_array.T
+
+        cache_key = (lat_key, lon_key, axes,
+                     hash_array(lat_array), hash_array(lon_array))
+        cached = self._custom.get('horizontal_spatial_index')
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
+
+        if lat.ndim == 1:
+            lat_array, lon_array = numpy_meshgrid(lat_array, lon_array,
+                                                  indexing='ij')
+
+        shape = lat_array.shape
+
+        valid = ~(numpy_ma_getmaskarray(lat_array) |
+                  numpy_ma_getmaskarray(lon_array))
+        cells = numpy_flatnonzero(valid)
+
+        lat_array = numpy_asanyarray(lat_array)[valid]
+        lon_array = numpy_asanyarray(lon_array)[valid]
+
+        tree = scipy_cKDTree(_unit_sphere_cartesian(lat_array, lon_array))
+
+        out = (axes, shape, tree, cells)
+        self._custom['horizontal_spatial_index'] = (cache_key, out)
+
+        return out
+
+    def _update_window_bounds(self, axis_key, window_size, mode, origin):
+        '''Update the bounds of an axis after a moving window calculation.
+
+    The new bounds of each cell span the cells that contributed to
+    its window.
+
+    .. versionadded:: 3.8.0
+
+    .. seealso:: `convolution_filter`, `moving_window`
+
+    :Parameters:
+
+        axis_key: `str`
+            The domain axis construct key of the window axis.
+
+        window_size: `int`
+            The size of the window.
+
+        mode: `str`
+            The resolved boundary mode of the window calculation.
+
+        origin: `int`
+            The placement of the window.
+
+    :Returns:
+
+        `None`
+
+        '''
+        coord = self.dimension_coordinate(axis_key, default=None)
+        if coord is None or not coord.has_bounds():
+            return
+
+        old_bounds = coord.bounds.array
+        length = old_bounds.shape[0]
+        new_bounds = numpy_empty((length, 2))
+        lower_offset = window_size // 2 + origin
+        upper_offset = window_size - 1 - lower_offset
+        if mode == 'wrap':
+            if coord.direction():
+                new_bounds[:, 0] = (
+                    coord.roll(0, upper_offset).bounds.array[:, 0])
+                new_bounds[:, 1] = (
+                    coord.roll(0, -lower_offset).bounds.array[:, 1]
+                    + coord.period()
+                )
+            else:
+                new_bounds[:, 0] = (
+                    coord.roll(0, upper_offset).bounds.array[:, 0]
+                    + 2 * coord.period()
+                )
+                new_bounds[:, 1] = (
+                    coord.roll(0, -lower_offset).bounds.array[:, 1]
+                    + coord.period()
+                )
+        else:
+            new_bounds[upper_offset:length, 0] = old_bounds[
+                0:length - upper_offset, 0]
+            new_bounds[0:upper_offset, 0] = old_bounds[0, 0]
+            new_bounds[0:length - lower_offset, 1] = old_bounds[
+                lower_offset:length, 1]
+            new_bounds[length - lower_offset:length, 1] = old_bounds[
+                length - 1, 1]
+
+        coord.set_bounds(Bounds(data=Data(new_bounds, units=coord.Units)))
+
     @_deprecated_kwarg_check('axes')
     def direction(self, identity, axes=None, **kwargs):
         '''Whether or not a domain axis is increasing.
@@ -12501,28 +13727,45 @@ class Field(mixin.PropertiesData,
                         index = slice(None)
 
                 elif item is not None:
-                    # -------------------------------------------------
-                    # 1-dimensional CASE 3: All other 1-d cases
-                    # -------------------------------------------------
-                    logger.debug('    1-d CASE 3:')  # pragma: no cover
+                    index = None
+                    if item.construct_type == 'dimension_coordinate':
+                        index = self._indices_monotonic(item, value)
 
-                    item_match = (value == item)
+                    if index is not None:
+                        # --------------------------------------------
+                        # 1-dimensional CASE 3: Subspace criterion is
+                        #                       a range condition on a
+                        #                       monotonic dimension
+                        #                       coordinate
+                        # --------------------------------------------
+                        logger.debug('    1-d CASE 3:')  # pragma: no cover
 
-                    if not item_match.any():
-                        raise ValueError(
-                            "No {!r} axis indices found from: {}".format(
-                                identity, value)
-                        )
+                        if envelope or full:
+                            ind = (numpy_arange(index.start, index.stop),)
+                            index = slice(None)
+                    else:
+                        # --------------------------------------------
+                        # 1-dimensional CASE 4: All other 1-d cases
+                        # --------------------------------------------
+                        logger.debug('    1-d CASE 4:')  # pragma: no cover
 
-                    index = numpy_asanyarray(item_match)
+                        item_match = (value == item)
 
-                    if envelope or full:
-                        if numpy_ma_isMA(index):
-                            ind = numpy_ma_where(index)
-                        else:
-                            ind = numpy_where(index)
+                        if not item_match.any():
+                            raise ValueError(
+                                "No {!r} axis indices found from: {}".format(
+                                    identity, value)
+                            )
 
-                        index = slice(None)
+                        index = numpy_asanyarray(item_match)
+
+                        if envelope or full:
+                            if numpy_ma_isMA(index):
+                                ind = numpy_ma_where(index)
+                            else:
+                                ind = numpy_where(index)
+
+                            index = slice(None)
 
                 else:
                     raise ValueError(
@@ -13337,14 +14580,20 @@ class Field(mixin.PropertiesData,
     def moving_window(self, method, window_size=None, axis=None,
                       weights=None, mode=None, cval=None, origin=0,
                       scale=None, radius='earth', great_circle=False,
-                      inplace=False):
+                      ddof=1, inplace=False):
         '''Perform moving window calculations along an axis.
 
-    Moving mean, sum, and integral calculations are possible.
+    Moving mean, sum, integral, maximum, minimum, range, standard
+    deviation and variance calculations are possible.
 
-    By default moving means are unweighted, but weights based on the
-    axis cell sizes (or custom weights) may applied to the calculation
-    via the *weights* parameter.
+    The cost of each calculation does not depend on the window size,
+    so long windows are as fast as short ones. Any window that
+    contains missing data produces missing data.
+
+    By default moving means, standard deviations and variances are
+    unweighted, but weights based on the axis cell sizes (or custom
+    weights) may applied to the calculation via the *weights*
+    parameter.
 
     By default moving integrals must be weighted.
 
@@ -13370,16 +14619,31 @@ class Field(mixin.PropertiesData,
             https://ncas-cms.github.io/cf-python/analysis.html#collapse-methods
             for precise definitions):
 
-            ==================  ============================  ========
-            *method*            Description                   Weighted
-            ==================  ============================  ========
-            ``'sum'``           The sum of the values.        Never
+            ========================  ============================  ========
+            *method*                  Description                   Weighted
+            ========================  ============================  ========
+            ``'sum'``                 The sum of the values.        Never
+
+            ``'mean'``                The weighted or unweighted    May be
+                                      mean of the values.
+
+            ``'integral'``            The integral of values.       Always
+
+            ``'maximum'``             The maximum of the values.    Never
 
-            ``'mean'``          The weighted or unweighted    May be
-                                mean of the values.
+            ``'minimum'``             The minimum of the values.    Never
 
-            ``'integral'``      The integral of values.       Always
-            ==================  ============================  ========
+            ``'range'``               The absolute difference       Never
+                                      between the maximum and the
+                                      minimum of the values.
+
+            ``'standard_deviation'``  The weighted or unweighted    May be
+                                      standard deviation of the
+                                      values.
+
+            ``'variance'``            The weighted or unweighted    May be
+                                      variance of the values.
+            ========================  ============================  ========
 
             * Methods that are "Never" weighted ignore the *weights*
               parameter, even if it is set.
@@ -13523,6 +14787,18 @@ class Field(mixin.PropertiesData,
               To scale all weights so that they lie between 0 and 0.5:
               ``scale=0.5``.
 
+        ddof: number, optional
+            The delta degrees of freedom in the calculation of a
+            standard deviation or variance. The number of degrees of
+            freedom used in the calculation is (N-*ddof*) where N
+            represents the number of non-missing elements in the
+            window. By default *ddof* is 1, as for `collapse`.
+
+            Ignored for methods other than ``'standard_deviation'``
+            and ``'variance'``.
+
+            .. versionadded:: 3.8.0
+
         {{inplace: `bool`, optional}}
 
     :Returns:
@@ -13619,7 +14895,8 @@ class Field(mixin.PropertiesData,
      [ 1.05  2.85  1.74  3.15  2.28  3.27  1.29  0.9 ]]
 
         '''
-        method_values = ('mean', 'sum', 'integral')
+        method_values = ('mean', 'sum', 'integral', 'maximum', 'minimum',
+                         'range', 'standard_deviation', 'variance')
         if method not in method_values:
             raise ValueError(
                 "Non-valid 'method' parameter value: {!r}. "
@@ -13637,7 +14914,16 @@ class Field(mixin.PropertiesData,
         axis = f.domain_axis(axis, key=True)
         iaxis = self.get_data_axes().index(axis)
 
-        if method == 'sum' or weights is False:
+        # Default mode to 'wrap' if the axis is cyclic
+        if mode is None:
+            if f.iscyclic(axis):
+                mode = 'wrap'
+            else:
+                mode = 'constant'
+        # --- End: if
+
+        if method not in ('mean', 'integral', 'standard_deviation',
+                          'variance') or weights is False:
             weights = None
 
         if method == 'integral':
@@ -13676,33 +14962,27 @@ class Field(mixin.PropertiesData,
                           scale=scale, radius=radius,
                           great_circle=great_circle, data=True)
 
-            # Multiply the field by the (possibly adjusted) weights
-            if numpy_can_cast(w.dtype, f.dtype):
-                f *= w
-            else:
-                f = f * w
-        # --- End: if
+            if method == 'integral':
+                # Multiply the field by the weights, which also sets
+                # the units of the integral
+                if numpy_can_cast(w.dtype, f.dtype):
+                    f *= w
+                else:
+                    f = f * w
 
-        # Create the window weights
-        window = numpy_full((window_size,), 1.0)
-        if weights is None and method == 'mean':
-            # If there is no data weighting, make sure that the sum of
-            # the window weights is 1.
-            window /= window.size
-
-        f.convolution_filter(window, axis=axis, mode=mode, cval=cval,
-                             origin=origin, update_bounds=True,
-                             inplace=True)
-
-        if weights is not None and method == 'mean':
-            # Divide the field by the running sum of the adjusted data
-            # weights
-            w.convolution_filter(window=window, axis=iaxis, mode=mode,
-                                 cval=0, origin=origin, inplace=True)
-            if numpy_can_cast(w.dtype, f.dtype):
-                f /= w
-            else:
-                f = f / w
+                w = None
+        else:
+            w = None
+
+        data_method = method
+        if method == 'integral':
+            data_method = 'sum'
+
+        f.data.moving_window(data_method, window_size, axis=iaxis,
+                             weights=w, mode=mode, cval=cval,
+                             origin=origin, ddof=ddof, inplace=True)
+
+        f._update_window_bounds(axis, window_size, mode, origin)
 
         # Add a cell method
         if f.domain_axis(axis).get_size() > 1 or method == 'integral':
@@ -13711,6 +14991,154 @@ class Field(mixin.PropertiesData,
 
         return f
 
+    def nearest_indices(self, latitude, longitude, k=1, distance=False,
+                        radius='earth'):
+        '''Find the horizontal grid cells nearest to given locations.
+
+    The grid cells are those defined by the latitude and longitude
+    coordinate constructs, which may be 1-d dimension coordinate
+    constructs or, for curvilinear grids (such as rotated pole or
+    tripolar grids), 2-d auxiliary coordinate constructs. Distances
+    are great circle distances between the cell centres and the
+    locations.
+
+    Many locations may be found at once. The cells are found from a
+    spatial index (a KD-tree of the cell positions on the unit
+    sphere), which is created when first needed and stored with the
+    field construct, so that subsequent calls are fast, including
+    calls on copies of the field construct. The spatial index is
+    rebuilt only if the latitude or longitude coordinates change.
+
+    .. versionadded:: 3.8.0
+
+    .. seealso:: `indices`, `radius`, `subspace`
+
+    :Parameters:
+
+        latitude: number, sequence of numbers, or `Data`
+            The latitudes of the locations. Numbers are assumed to be
+            in degrees north, unless they are given by `Data` with
+            units.
+
+        longitude: number, sequence of numbers, or `Data`
+            The longitudes of the locations, with the same size as
+            *latitude*. Numbers are assumed to be in degrees east,
+            unless they are given by `Data` with units.
+
+        k: `int`, optional
+            The number of nearest cells to find for each location,
+            ordered by increasing distance. By default only the
+            nearest cell is found.
+
+        distance: `bool`, optional
+            If True then also return the distances from each location
+            to its nearest cells.
+
+        radius: optional
+            Specify the radius used for calculating distances, as for
+            the *default* parameter of the `radius` method. Ignored
+            unless *distance* is True. By default *radius* is
+            ``'earth'``.
+
+    :Returns:
+
+        `dict` or 2-`tuple` of `dict` and `Data`
+            The indices of the nearest cells, keyed by the domain axis
+            construct keys of the horizontal axes. Each index is an
+            integer `numpy` array, with one element per location if
+            *k* is 1, or otherwise with shape ``(n, k)`` where ``n``
+            is the number of locations. If *distance* is True then the
+            great circle distances, with the same shape as the
+            indices, are also returned.
+
+    **Examples:**
+
+    >>> print(f)
+    Field: air_temperature (ncvar%ta)
+    ---------------------------------
+    Data            : air_temperature(atmosphere_hybrid_height_coordinate(1), grid_latitude(10), grid_longitude(9)) K
+    Cell methods    : grid_latitude(10): grid_longitude(9): mean where land (interval: 0.1 degrees) time(1): maximum
+    Field ancils    : air_temperature standard_error(grid_latitude(10), grid_longitude(9)) = [[0.76, ..., 0.32]] K
+    Dimension coords: atmosphere_hybrid_height_coordinate(1) = [1.5]
+                    : grid_latitude(10) = [2.2, ..., -1.76] degrees
+                    : grid_longitude(9) = [-4.7, ..., -1.18] degrees
+                    : time(1) = [2019-01-01 00:00:00]
+    Auxiliary coords: latitude(grid_latitude(10), grid_longitude(9)) = [[53.941, ..., 50.225]] degrees_N
+                    : longitude(grid_longitude(9), grid_latitude(10)) = [[2.004, ..., 8.156]] degrees_E
+                    : long_name=Grid latitude name(grid_latitude(10)) = [--, ..., b'kappa']
+    >>> indices = f.nearest_indices([52.0, 51.2], [5.3, 6.1])
+    >>> indices
+    {'domainaxis1': array([5, 7]), 'domainaxis2': array([8, 7])}
+    >>> g = f[:, indices['domainaxis1'][0], indices['domainaxis2'][0]]
+    >>> print(g.construct('latitude').array)
+    [[51.984]]
+    >>> print(g.construct('longitude').array)
+    [[5.411]]
+
+    Find the three nearest cells to each location, and their
+    distances:
+
+    >>> indices, distance = f.nearest_indices([52.0, 51.2], [5.3, 6.1],
+    ...                                       k=3, distance=True)
+    >>> indices
+    {'domainaxis1': array([[5, 4, 5],
+                           [7, 6, 6]]),
+     'domainaxis2': array([[8, 0, 0],
+                           [7, 0, 8]])}
+    >>> print(distance)
+    [[7805.708975521694, ..., 38362.85702851293]] m
+
+        '''
+        k = int(k)
+        if k < 1:
+            raise ValueError(
+                "Can't find nearest cells: k must be a positive integer. "
+                "Got {!r}".format(k))
+
+        axes, shape, tree, cells = self._horizontal_spatial_index()
+
+        if k > cells.size:
+            raise ValueError(
+                "Can't find {} nearest cells: There are only {} cells "
+                "with latitude and longitude coordinates".format(
+                    k, cells.size))
+
+        points = []
+        for x, units in zip((latitude, longitude),
+                            ('degrees_north', 'degrees_east')):
+            x = Data.asdata(x)
+            if not x.Units:
+                x = x.override_units(units)
+            else:
+                x = x.copy()
+
+            x.Units = Units('radians')
+            points.append(x.array.flatten())
+        # --- End: for
+
+        lat, lon = points
+        if lat.size != lon.size:
+            raise ValueError(
+                "Can't find nearest cells: Different numbers of latitudes "
+                "({}) and longitudes ({})".format(lat.size, lon.size))
+
+        chord, i = tree.query(_unit_sphere_cartesian(lat, lon), k=k)
+
+        indices = numpy_unravel_index(cells[i], shape)
+        out = dict(zip(axes, indices))
+
+        if not distance:
+            return out
+
+        # Convert the straight-line distance through the unit sphere
+        # to the great circle distance
+        distance = 2 * numpy_arcsin(numpy_minimum(chord, 2.0) / 2)
+        distance = Data(distance, units='radians') * self.radius(
+            default=radius)
+        distance.override_units('m', inplace=True)
+
+        return out, distance
+
     @_deprecated_kwarg_check('i')
     @_inplace_enabled(default=False)
     def convolution_filter(self, window=None, axis=None, mode=None,
@@ -13986,42 +15414,7 @@ class Field(mixin.PropertiesData,
 
         # Update the bounds of the convolution axis if necessary
         if update_bounds:
-            coord = f.dimension_coordinate(axis_key, default=None)
-            if coord is not None and coord.has_bounds():
-                old_bounds = coord.bounds.array
-                length = old_bounds.shape[0]
-                new_bounds = numpy_empty((length, 2))
-                len_weights = len(window)
-                lower_offset = len_weights // 2 + origin
-                upper_offset = len_weights - 1 - lower_offset
-                if mode == 'wrap':
-                    if coord.direction():
-                        new_bounds[:, 0] = (
-                            coord.roll(0, upper_offset).bounds.array[:, 0])
-                        new_bounds[:, 1] = (
-                            coord.roll(0, -lower_offset).bounds.array[:, 1]
-                            + coord.period()
-                        )
-                    else:
-                        new_bounds[:, 0] = (
-                            coord.roll(0, upper_offset).bounds.array[:, 0]
-                            + 2 * coord.period()
-                        )
-                        new_bounds[:, 1] = (
-                            coord.roll(0, -lower_offset).bounds.array[:, 1]
-                            + coord.period()
-                        )
-                else:
-                    new_bounds[upper_offset:length, 0] = old_bounds[
-                        0:length - upper_offset, 0]
-                    new_bounds[0:upper_offset, 0] = old_bounds[0, 0]
-                    new_bounds[0:length - lower_offset, 1] = old_bounds[
-                        lower_offset:length, 1]
-                    new_bounds[length - lower_offset:length, 1] = old_bounds[
-                        length - 1, 1]
-
-                coord.set_bounds(Bounds(data=Data(new_bounds, units=coord.Units)))
-        # --- End: if
+            f._update_window_bounds(axis_key, len(window), mode, origin)
 
         return f
 
@@ -18523,11 +19916,12 @@ class Field(mixin.PropertiesData,
 
     @_deprecated_kwarg_check('i')
     @_inplace_enabled(default=False)
-    def regrids(self, dst, method, src_cyclic=None, dst_cyclic=None,
+    def regrids(self, dst, method=None, src_cyclic=None, dst_cyclic=None,
                 use_src_mask=True, use_dst_mask=False,
                 fracfield=False, src_axes=None, dst_axes=None,
                 axis_order=None, ignore_degenerate=True,
-                inplace=False, i=False, _compute_field_mass=None):
+                return_operator=False, separable=False, inplace=False,
+                i=False, _compute_field_mass=None):
         '''Return the field regridded onto a new latitude-longitude grid.
 
     Regridding, also called remapping or interpolation, is the process
@@ -18599,6 +19993,36 @@ class Field(mixin.PropertiesData,
     `regridding utility
     <https://www.earthsystemcog.org/projects/esmf/regridding>`_.
 
+    The exception is first-order conservative regridding between
+    grids that both have one dimensional latitude and longitude
+    coordinates when the *separable* parameter is True, for which the
+    weights are the products of separate longitude and latitude
+    weights. These are calculated directly, without `ESMPy`, treating
+    the cell boundaries as lines of constant longitude and latitude,
+    and are applied to one axis at a time. This is not possible if the
+    destination mask is used.
+
+    **Regrid operators**
+
+    Creating the regridding weights is usually by far the most
+    expensive part of regridding. The weights may be returned in a
+    `RegridOperator` by setting the *return_operator* parameter, and
+    the regrid operator may then be used in place of the destination
+    grid to regrid any field construct with the same source grid,
+    without recreating the weights. Applying a regrid operator does
+    not require the `ESMPy` package. A regrid operator may also be
+    saved to disk with `RegridOperator.save`.
+
+    When a regrid operator is used or returned, the regridding
+    weights are applied to all of the slices of the field at once, as
+    a single sparse matrix product for each chunk of data. Missing
+    source values are accounted for by renormalising the weights,
+    except for methods whose weights depend on the source mask
+    (second-order conservative and patch recovery regridding, and
+    nearest source to destination regridding with *use_src_mask* set
+    to False), for which weights are created once for each distinct
+    source mask.
+
 
     **Logging**
 
@@ -18641,11 +20065,11 @@ class Field(mixin.PropertiesData,
 
     .. versionadded:: 1.0.4
 
-    .. seealso:: `regridc`
+    .. seealso:: `regridc`, `RegridOperator`
 
     :Parameters:
 
-        dst: `Field` or `dict`
+        dst: `Field`, `dict` or `RegridOperator`
             The field containing the new grid. If dst is a field list
             the first field in the list is used. Alternatively a
             dictionary can be passed containing the keywords
@@ -18655,9 +20079,20 @@ class Field(mixin.PropertiesData,
             order and this must be specified by the keyword 'axes' as
             either of the tuples ``('X', 'Y')`` or ``('Y', 'X')``.
 
+            Alternatively, a regrid operator that was created by an
+            earlier call with the *return_operator* parameter set may
+            be given, in which case its destination grid and weights
+            are used. The source grid of the field construct must be
+            the same as the one used to create the regrid operator,
+            and the *method*, *src_cyclic*, *dst_cyclic*, *dst_axes*
+            and *use_dst_mask* parameters are ignored.
+
+            .. versionadded:: 3.8.0 (`RegridOperator` destination)
+
         method: `str`
             Specify the regridding method. The *method* parameter must
-            be one of the following:
+            be one of the following, and may be omitted if *dst* is a
+            regrid operator:
 
             ======================  ==================================
             Method                  Description
@@ -18808,6 +20243,7 @@ class Field(mixin.PropertiesData,
             recalculated every time the mask of an X-Y slice changes
             with respect to the previous one, so this option allows
             the user to minimise how frequently the mask changes.
+            Ignored if all slices are regridded at once.
 
         ignore_degenerate: `bool`, optional
             True by default. Instructs ESMPy to ignore degenerate
@@ -18820,6 +20256,27 @@ class Field(mixin.PropertiesData,
             conservative regridding.  Other methods always skip
             degenerate cells.
 
+        return_operator: `bool`, optional
+            If True then do not regrid the field construct, but
+            instead return a `RegridOperator` that contains the
+            regridding weights and the destination grid. The weights
+            are created for the source grid without any missing data
+            values. Requires ESMPy version 8.0.0 or later.
+
+            .. versionadded:: 3.8.0
+
+        separable: `bool`, optional
+            If True then create first-order conservative weights
+            between grids with one dimensional latitude and longitude
+            coordinates without `ESMPy`, as the products of separate
+            longitude and latitude weights (see the *Implementation*
+            section). These treat the cell boundaries as lines of
+            constant longitude and latitude, and so may differ slightly
+            from the weights created by `ESMPy`, whose cell
+            boundaries are great circles. Ignored for other methods
+            and grids. By default the weights are created by `ESMPy`.
+
+            .. versionadded:: 3.8.0
 
         {{inplace: `bool`, optional}}
 
@@ -18838,8 +20295,9 @@ class Field(mixin.PropertiesData,
 
     :Returns:
 
-        `Field`
-            The regridded field construct.
+        `Field` or `RegridOperator`
+            The regridded field construct, or the regrid operator if
+            *return_operator* is True.
 
     **Examples:**
 
@@ -18873,124 +20331,170 @@ class Field(mixin.PropertiesData,
     field, g.
 
     >>> h = f.regrids(g, 'linear, src_axes={'X': 'ncdim%x', 'Y': 'ncdim%y'},
-    ...               src_cyclic=True)
-
-    Regrid f to the grid of g iterating over the 'Z' axis last and the
-    'T' axis next to last to minimise the number of times the mask is
-    changed.
-
-    >>> h = f.regrids(g, 'nearest_dtos', axis_order='ZT')
-
-        '''
-        # Initialise ESMPy for regridding if found
-        manager = Regrid.initialize()
-
-        f = _inplace_enabled_define_and_cleanup(self)
-
-        # If dst is a dictionary set flag
-        dst_dict = not isinstance(dst, f.__class__)
-
-        # Retrieve the source field's latitude and longitude coordinates
-        src_axis_keys, src_axis_sizes, src_coord_keys, src_coords, \
-            src_coords_2D = f._regrid_get_latlong('source', axes=src_axes)
-
-        # Retrieve the destination field's latitude and longitude coordinates
-        if dst_dict:
-            # dst is a dictionary
-            try:
-                dst_coords = (dst['longitude'], dst['latitude'])
-            except KeyError:
-                raise ValueError(
-                    "Keys 'longitude' and 'latitude' must be"
-                    " specified for destination."
-                )
-
-            if dst_coords[0].ndim == 1:
-                dst_coords_2D = False
-                dst_axis_sizes = [coord.size for coord in dst_coords]
-            elif dst_coords[0].ndim == 2:
-                try:
-                    dst_axes = dst['axes']
-                except KeyError:
-                    raise ValueError(
-                        "Key 'axes' must be specified for 2D"
-                        " latitude/longitude coordinates."
-                    )
-                dst_coords_2D = True
-                if dst_axes == ('X', 'Y'):
-                    dst_axis_sizes = dst_coords[0].shape
-                elif dst_axes == ('Y', 'X'):
-                    dst_axis_sizes = dst_coords[0].shape[::-1]
-                else:
-                    raise ValueError(
-                        "Keyword 'axes' must either be "
-                        "('X', 'Y') or ('Y', 'X')."
-                    )
-                if dst_coords[0].shape != dst_coords[1].shape:
-                    raise ValueError(
-                        'Longitude and latitude coordinates for '
-                        'destination must have the same shape.'
-                    )
-            else:
-                raise ValueError(
-                    'Longitude and latitude coordinates for '
-                    'destination must have 1 or 2 dimensions.'
-                )
+    ...               src_cyclic=True)
 
-            dst_axis_keys = None
-        else:
-            # dst is a Field
-            dst_axis_keys, dst_axis_sizes, dst_coord_keys, dst_coords, \
-                dst_coords_2D = dst._regrid_get_latlong('destination',
-                                                        axes=dst_axes)
-
-        # Automatically detect the cyclicity of the source longitude if
-        # src_cyclic is None
-        if src_cyclic is None:
-            src_cyclic = f.iscyclic(src_axis_keys[0])
-
-        # Automatically detect the cyclicity of the destination longitude if
-        # dst is not a dictionary and dst_cyclic is None
-        if not dst_dict and dst_cyclic is None:
-            dst_cyclic = dst.iscyclic(dst_axis_keys[0])
-        elif dst_dict and dst_cyclic is None:
-            dst = dst.copy()
-#            dst['longitude'] = dst['longitude'].copy()
-#            dst['longitude'].autoperiod()
-            dst['longitude'] = dst['longitude'].autoperiod()
-            dst_cyclic = dst['longitude'].isperiodic
+    Regrid f to the grid of g iterating over the 'Z' axis last and the
+    'T' axis next to last to minimise the number of times the mask is
+    changed.
+
+    >>> h = f.regrids(g, 'nearest_dtos', axis_order='ZT')
+
+    Create the regridding weights once, and use them to regrid many
+    field constructs that are on the same grid as ``f``:
+
+    >>> op = f.regrids(g, 'conservative', return_operator=True)
+    >>> h = f.regrids(op)
+    >>> h2 = f2.regrids(op)
+    >>> op.save('regrid_operator.pkl')
+
+        '''
+        regrid_operator = isinstance(dst, RegridOperator)
+
+        f = _inplace_enabled_define_and_cleanup(self)
+
+        # Retrieve the source field's latitude and longitude coordinates
+        src_axis_keys, src_axis_sizes, src_coord_keys, src_coords, \
+            src_coords_2D = f._regrid_get_latlong('source', axes=src_axes)
 
         # Get the axis indices and their order for the source field
         src_axis_indices, src_order = f._regrid_get_axis_indices(
             src_axis_keys)
 
-        # Get the axis indices and their order for the destination field.
-        if not dst_dict:
-            dst = dst.copy()
-            dst_axis_indices, dst_order = dst._regrid_get_axis_indices(
-                dst_axis_keys)
-
         # Get the order of the X and Y axes for each 2D auxiliary coordinate.
         src_coord_order = None
-        dst_coord_order = None
         if src_coords_2D:
             src_coord_order = self._regrid_get_coord_order(
                 src_axis_keys, src_coord_keys)
 
-        if dst_coords_2D:
+        if regrid_operator:
+            # --------------------------------------------------------
+            # dst is a regrid operator: Retrieve the destination grid
+            # from it
+            # --------------------------------------------------------
+            operator = dst
+            if operator.coord_sys != 'spherical':
+                raise ValueError(
+                    "Can't regrid with {!r}: Use regridc for Cartesian "
+                    "regridding".format(operator)
+                )
+
+            if method is not None and method != operator.method:
+                raise ValueError(
+                    "Can't regrid with {!r}: Can't change the regridding "
+                    "method to {!r}".format(operator, method)
+                )
+
+            method = operator.method
+            src_cyclic = operator._get_parameter('src_cyclic')
+            dst_cyclic = operator._get_parameter('dst_cyclic')
+            dst = operator._get_parameter('dst')
+            dst_dict = operator._get_parameter('dst_dict')
+            dst_axis_keys = operator._get_parameter('dst_axis_keys')
+            dst_axis_sizes = operator._get_parameter('dst_axis_sizes')
+            dst_coords = [
+                c.copy() for c in operator._get_parameter('dst_coords')]
+            dst_coords_2D = operator._get_parameter('dst_coords_2D')
+            dst_coord_order = operator._get_parameter('dst_coord_order')
+
+            operator._check_source(
+                'spherical',
+                self._regrid_get_source_signature(
+                    src_coords, method, src_cyclic, src_coord_order)
+            )
+        else:
+            # If dst is a dictionary set flag
+            dst_dict = not isinstance(dst, f.__class__)
+
+            # Retrieve the destination field's latitude and longitude
+            # coordinates
             if dst_dict:
-                if dst_axes == ('X', 'Y'):
-                    dst_coord_order = [[0, 1], [0, 1]]
-                elif dst_axes == ('Y', 'X'):
-                    dst_coord_order = [[1, 0], [1, 0]]
+                # dst is a dictionary
+                try:
+                    dst_coords = (dst['longitude'], dst['latitude'])
+                except KeyError:
+                    raise ValueError(
+                        "Keys 'longitude' and 'latitude' must be"
+                        " specified for destination."
+                    )
+
+                if dst_coords[0].ndim == 1:
+                    dst_coords_2D = False
+                    dst_axis_sizes = [coord.size for coord in dst_coords]
+                elif dst_coords[0].ndim == 2:
+                    try:
+                        dst_axes = dst['axes']
+                    except KeyError:
+                        raise ValueError(
+                            "Key 'axes' must be specified for 2D"
+                            " latitude/longitude coordinates."
+                        )
+                    dst_coords_2D = True
+                    if dst_axes == ('X', 'Y'):
+                        dst_axis_sizes = dst_coords[0].shape
+                    elif dst_axes == ('Y', 'X'):
+                        dst_axis_sizes = dst_coords[0].shape[::-1]
+                    else:
+                        raise ValueError(
+                            "Keyword 'axes' must either be "
+                            "('X', 'Y') or ('Y', 'X')."
+                        )
+                    if dst_coords[0].shape != dst_coords[1].shape:
+                        raise ValueError(
+                            'Longitude and latitude coordinates for '
+                            'destination must have the same shape.'
+                        )
                 else:
                     raise ValueError(
-                        "Keyword 'axes' must either be ('X', 'Y') or "
-                        "('Y', 'X')."
+                        'Longitude and latitude coordinates for '
+                        'destination must have 1 or 2 dimensions.'
                     )
+
+                dst_axis_keys = None
             else:
-                dst_coord_order = dst._regrid_get_coord_order(
-                    dst_axis_keys, dst_coord_keys)
+                # dst is a Field
+                dst_axis_keys, dst_axis_sizes, dst_coord_keys, dst_coords, \
+                    dst_coords_2D = dst._regrid_get_latlong('destination',
+                                                            axes=dst_axes)
+
+            # Automatically detect the cyclicity of the source longitude if
+            # src_cyclic is None
+            if src_cyclic is None:
+                src_cyclic = f.iscyclic(src_axis_keys[0])
+
+            # Automatically detect the cyclicity of the destination
+            # longitude if dst is not a dictionary and dst_cyclic is
+            # None
+            if not dst_dict and dst_cyclic is None:
+                dst_cyclic = dst.iscyclic(dst_axis_keys[0])
+            elif dst_dict and dst_cyclic is None:
+                dst = dst.copy()
+                dst['longitude'] = dst['longitude'].autoperiod()
+                dst_cyclic = dst['longitude'].isperiodic
+
+            # Get the axis indices and their order for the destination
+            # field.
+            if not dst_dict:
+                dst = dst.copy()
+                dst_axis_indices, dst_order = dst._regrid_get_axis_indices(
+                    dst_axis_keys)
+
+            # Get the order of the X and Y axes for each 2D auxiliary
+            # coordinate.
+            dst_coord_order = None
+            if dst_coords_2D:
+                if dst_dict:
+                    if dst_axes == ('X', 'Y'):
+                        dst_coord_order = [[0, 1], [0, 1]]
+                    elif dst_axes == ('Y', 'X'):
+                        dst_coord_order = [[1, 0], [1, 0]]
+                    else:
+                        raise ValueError(
+                            "Keyword 'axes' must either be ('X', 'Y') or "
+                            "('Y', 'X')."
+                        )
+                else:
+                    dst_coord_order = dst._regrid_get_coord_order(
+                        dst_axis_keys, dst_coord_keys)
         # --- End: if
 
         # Get the shape of each section after it has been regridded.
@@ -19007,126 +20511,229 @@ class Field(mixin.PropertiesData,
         # Check the bounds of the coordinates
         self._regrid_check_bounds(src_coords, dst_coords, method)
 
-        # Slice the source data into 2D latitude/longitude sections,
-        # also getting a list of dictionary keys in the order
-        # requested. If axis_order has not been set, then the order is
-        # random, and so in this case the order in which sections are
-        # regridded is random.
-        section_keys, sections = self._regrid_get_reordered_sections(
-            axis_order, src_axis_keys, src_axis_indices)
-
         # Bounds must be used if the regridding method is conservative.
         use_bounds = self._regrid_use_bounds(method)
 
-        # Retrieve the destination field's mask if appropriate
-        dst_mask = None
-        if not dst_dict and use_dst_mask and dst.data.ismasked:
-            dst_mask = dst._regrid_get_destination_mask(dst_order,
-                                                        axes=dst_axis_keys)
+        # The first-order conservative weights between grids with one
+        # dimensional latitude and longitude coordinates are
+        # separable, and may be created without ESMPy if requested
+        separable = (
+            separable
+            and not regrid_operator
+            and method in ('conservative', 'conservative_1st')
+            and not src_coords_2D
+            and not dst_coords_2D
+            and _compute_field_mass is None
+            and not (use_dst_mask and not dst_dict and dst.data.ismasked)
+            and RegridOperator._available()
+        )
 
-        # Retrieve the destination ESMPy grid and fields
-        dstgrid = Regrid.create_grid(
-            dst_coords, use_bounds, mask=dst_mask, cyclic=dst_cyclic,
-            coords_2D=dst_coords_2D, coord_order=dst_coord_order
+        # Regrid with sparse weights only when a regrid operator is
+        # being used or returned, for separable regridding, or when
+        # ESMF is running in parallel, in which case each process
+        # holds only part of each ESMPy field. Otherwise the ESMPy
+        # regridder is applied directly.
+        use_weights = (
+            separable or regrid_operator or return_operator
+            or Regrid.initialize().pet_count > 1
         )
-        # dstfield will be reused to receive the regridded source data
-        # for each section, one after the other
-        dstfield = Regrid.create_field(dstgrid, 'dstfield')
-        dstfracfield = Regrid.create_field(dstgrid, 'dstfracfield')
-
-        # Regrid each section
-        old_mask = None
-        unmasked_grid_created = False
-        for k in section_keys:
-            d = sections[k]  # d is a Data object
-            # Retrieve the source field's grid, create the ESMPy grid and a
-            # handle to regridding.dst_dict
-            src_data = d.squeeze().transpose(src_order).array
-            if (not (method == 'nearest_stod' and use_src_mask)
-                    and numpy_ma_is_masked(src_data)):
-                mask = src_data.mask
-                if not numpy_array_equal(mask, old_mask):
-                    # Release old memory
-                    if old_mask is not None:
-                        regridSrc2Dst.destroy()
-                        srcfracfield.destroy()
-                        srcfield.destroy()
-                        srcgrid.destroy()
-
-                    # (Re)create the source ESMPy grid and fields
-                    srcgrid = Regrid.create_grid(
-                        src_coords, use_bounds, mask=mask, cyclic=src_cyclic,
-                        coords_2D=src_coords_2D, coord_order=src_coord_order
-                    )
-                    srcfield = Regrid.create_field(srcgrid, 'srcfield')
-                    srcfracfield = Regrid.create_field(
-                        srcgrid, 'srcfracfield')
-                    # (Re)initialise the regridder
-                    regridSrc2Dst = Regrid(
-                        srcfield, dstfield, srcfracfield, dstfracfield,
-                        method=method, ignore_degenerate=ignore_degenerate
-                    )
-                    old_mask = mask
+
+        if not (regrid_operator or separable):
+            # Initialise ESMPy for regridding if found
+            manager = Regrid.initialize()
+
+            # Retrieve the destination field's mask if appropriate
+            dst_mask = None
+            if not dst_dict and use_dst_mask and dst.data.ismasked:
+                dst_mask = dst._regrid_get_destination_mask(
+                    dst_order, axes=dst_axis_keys)
+
+            # Retrieve the destination ESMPy grid and fields
+            dstgrid = Regrid.create_grid(
+                dst_coords, use_bounds, mask=dst_mask, cyclic=dst_cyclic,
+                coords_2D=dst_coords_2D, coord_order=dst_coord_order
+            )
+            # dstfield will be reused to receive the regridded source
+            # data for each section, one after the other
+            dstfield = Regrid.create_field(dstgrid, 'dstfield')
+            dstfracfield = Regrid.create_field(dstgrid, 'dstfracfield')
+
+        create_kwargs = None
+        if use_weights and not regrid_operator:
+            # --------------------------------------------------------
+            # Create the regridding weights for the unmasked source
+            # grid
+            # --------------------------------------------------------
+            if return_operator and not dst_dict:
+                # Keep only the metadata of the destination field
+                dst.del_data()
+
+            src_signature = self._regrid_get_source_signature(
+                src_coords, method, src_cyclic, src_coord_order)
+            parameters = dict(src_cyclic=src_cyclic,
+                              dst_cyclic=dst_cyclic,
+                              dst=dst,
+                              dst_dict=dst_dict,
+                              dst_axis_keys=dst_axis_keys,
+                              dst_axis_sizes=dst_axis_sizes,
+                              dst_coords=[c.copy() for c in dst_coords],
+                              dst_coords_2D=dst_coords_2D,
+                              dst_coord_order=dst_coord_order)
+
+            if separable:
+                operator = self._regrid_create_separable_operator(
+                    src_coords, dst_coords, method, src_signature,
+                    parameters)
             else:
-                # The source data for this section is either a) not
-                # masked or b) has the same mask as the previous
-                # section.
-                if not unmasked_grid_created or old_mask is not None:
-                    # Create the source ESMPy grid and fields
-                    srcgrid = Regrid.create_grid(
-                        src_coords, use_bounds, cyclic=src_cyclic,
-                        coords_2D=src_coords_2D, coord_order=src_coord_order
-                    )
-                    srcfield = Regrid.create_field(srcgrid, 'srcfield')
-                    srcfracfield = Regrid.create_field(srcgrid, 'srcfracfield')
-                    # Initialise the regridder. This also creates the
-                    # weights needed for the regridding.
-                    regridSrc2Dst = Regrid(
-                        srcfield, dstfield, srcfracfield, dstfracfield,
-                        method=method, ignore_degenerate=ignore_degenerate
+                src_grid_kwargs = dict(cyclic=src_cyclic,
+                                       coords_2D=src_coords_2D,
+                                       coord_order=src_coord_order)
+
+                operator = self._regrid_create_operator(
+                    src_coords, src_grid_kwargs, use_bounds, dstfield,
+                    dstfracfield, method, ignore_degenerate, 'spherical',
+                    src_signature, parameters, shared=True)
+
+            if return_operator:
+                if not separable:
+                    dstfracfield.destroy()
+                    dstfield.destroy()
+                    dstgrid.destroy()
+
+                return operator
+
+            # If the weights depend on the source mask then new
+            # weights will be needed for each distinct mask of the
+            # source data
+            if RegridOperator._mask_dependent(method, use_src_mask):
+                create_kwargs = dict(
+                    src_coords=src_coords, src_grid_kwargs=src_grid_kwargs,
+                    use_bounds=use_bounds, dstfield=dstfield,
+                    dstfracfield=dstfracfield, method=method,
+                    ignore_degenerate=ignore_degenerate,
+                    coord_sys='spherical', src_signature=None,
+                    parameters=None)
+        # --- End: if
+
+        if use_weights:
+            # Regrid all sections with a single sparse matrix product
+            # per chunk of data
+            new_data = self._regrid_with_operator(
+                operator, src_axis_indices, dst_axis_sizes,
+                fracfield=fracfield, use_src_mask=use_src_mask,
+                create_kwargs=create_kwargs)
+
+            if not (regrid_operator or separable):
+                dstfracfield.destroy()
+                dstfield.destroy()
+                dstgrid.destroy()
+        else:
+            # Slice the source data into 2D latitude/longitude
+            # sections, also getting a list of dictionary keys in the
+            # order requested. If axis_order has not been set, then
+            # the order is random, and so in this case the order in
+            # which sections are regridded is random.
+            section_keys, sections = self._regrid_get_reordered_sections(
+                axis_order, src_axis_keys, src_axis_indices)
+
+            # Regrid each section
+            old_mask = None
+            unmasked_grid_created = False
+            for k in section_keys:
+                d = sections[k]  # d is a Data object
+                # Retrieve the source field's grid, create the ESMPy
+                # grid and a handle to regridding.dst_dict
+                src_data = d.squeeze().transpose(src_order).array
+
+                if (not (method == 'nearest_stod' and use_src_mask)
+                        and numpy_ma_is_masked(src_data)):
+                    mask = src_data.mask
+                    if not numpy_array_equal(mask, old_mask):
+                        # Release old memory
+                        if old_mask is not None:
+                            regridSrc2Dst.destroy()
+                            srcfracfield.destroy()
+                            srcfield.destroy()
+                            srcgrid.destroy()
+
+                        # (Re)create the source ESMPy grid and fields
+                        srcgrid = Regrid.create_grid(
+                            src_coords, use_bounds, mask=mask,
+                            cyclic=src_cyclic, coords_2D=src_coords_2D,
+                            coord_order=src_coord_order
+                        )
+                        srcfield = Regrid.create_field(srcgrid, 'srcfield')
+                        srcfracfield = Regrid.create_field(
+                            srcgrid, 'srcfracfield')
+                        # (Re)initialise the regridder
+                        regridSrc2Dst = Regrid(
+                            srcfield, dstfield, srcfracfield, dstfracfield,
+                            method=method, ignore_degenerate=ignore_degenerate
+                        )
+                        old_mask = mask
+                else:
+                    # The source data for this section is either a) not
+                    # masked or b) has the same mask as the previous
+                    # section.
+                    if not unmasked_grid_created or old_mask is not None:
+                        # Create the source ESMPy grid and fields
+                        srcgrid = Regrid.create_grid(
+                            src_coords, use_bounds, cyclic=src_cyclic,
+                            coords_2D=src_coords_2D,
+                            coord_order=src_coord_order
+                        )
+                        srcfield = Regrid.create_field(srcgrid, 'srcfield')
+                        srcfracfield = Regrid.create_field(
+                            srcgrid, 'srcfracfield')
+                        # Initialise the regridder. This also creates the
+                        # weights needed for the regridding.
+                        regridSrc2Dst = Regrid(
+                            srcfield, dstfield, srcfracfield, dstfracfield,
+                            method=method, ignore_degenerate=ignore_degenerate
+                        )
+                        unmasked_grid_created = True
+                        old_mask = None
+                # --- End: if
+
+                # Fill the source and destination fields (the destination
+                # field gets filled with a fill value, the source field
+                # with the section's data)
+                self._regrid_fill_fields(src_data, srcfield, dstfield)
+
+                # Run regridding (dstfield is an ESMF field)
+                dstfield = regridSrc2Dst.run_regridding(srcfield, dstfield)
+
+                # Compute field mass if requested for conservative regridding
+                if (_compute_field_mass is not None and method in
+                        conservative_regridding_methods):
+                    # Update the _compute_field_mass dictionary in-place,
+                    # thereby making the field mass available after
+                    # returning
+                    self._regrid_compute_field_mass(
+                        _compute_field_mass, k, srcgrid, srcfield,
+                        srcfracfield, dstgrid, dstfield
                     )
-                    unmasked_grid_created = True
-                    old_mask = None
-            # --- End: if
 
-            # Fill the source and destination fields (the destination
-            # field gets filled with a fill value, the source field
-            # with the section's data)
-            self._regrid_fill_fields(src_data, srcfield, dstfield)
-
-            # Run regridding (dstfield is an ESMF field)
-            dstfield = regridSrc2Dst.run_regridding(srcfield, dstfield)
-
-            # Compute field mass if requested for conservative regridding
-            if (_compute_field_mass is not None and method in
-                    conservative_regridding_methods):
-                # Update the _compute_field_mass dictionary in-place,
-                # thereby making the field mass available after
-                # returning
-                self._regrid_compute_field_mass(
-                    _compute_field_mass, k, srcgrid, srcfield,
-                    srcfracfield, dstgrid, dstfield
-                )
+                # Get the regridded data or frac field as a numpy array
+                # (regridded_data is a numpy array)
+                regridded_data = self._regrid_get_regridded_data(
+                    method, fracfield, dstfield, dstfracfield)
 
-            # Get the regridded data or frac field as a numpy array
-            # (regridded_data is a numpy array)
-            regridded_data = self._regrid_get_regridded_data(
-                method, fracfield, dstfield, dstfracfield)
-
-            # Insert regridded data, with axes in order of the
-            # original section. This puts the regridded data back into
-            # the sections dictionary, with the same key, as a new
-            # Data object. Note that the reshape is necessary to
-            # replace any size 1 dimensions that we squeezed out
-            # earlier.
-            sections[k] = Data(
-                regridded_data.transpose(src_order).reshape(shape),
-                units=self.Units
-            )
-        # --- End: for
+                # Insert regridded data, with axes in order of the
+                # original section. This puts the regridded data back into
+                # the sections dictionary, with the same key, as a new
+                # Data object. Note that the reshape is necessary to
+                # replace any size 1 dimensions that we squeezed out
+                # earlier.
+                sections[k] = Data(
+                    regridded_data.transpose(src_order).reshape(shape),
+                    units=self.Units
+                )
+            # --- End: for
 
-        # Construct new data from regridded sections
-        new_data = Data.reconstruct_sectioned_data(sections)
+            # Construct new data from regridded sections
+            new_data = Data.reconstruct_sectioned_data(sections)
+        # --- End: if
 
         # Construct new field.
         # Note: cannot call `_inplace_enabled_define_and_cleanup(self)` to
@@ -19144,8 +20751,14 @@ class Field(mixin.PropertiesData,
 #            f.domain_axes[k_s].set_size(new_size)
 
         # Update coordinate references of new field
+        if use_weights:
+            # Regrid domain ancillaries with the same operator
+            dst_grid = operator
+        else:
+            dst_grid = dst
+
         f._regrid_update_coordinate_references(
-            dst, src_axis_keys, dst_axis_sizes, method, use_dst_mask,
+            dst_grid, src_axis_keys, dst_axis_sizes, method, use_dst_mask,
             src_cyclic=src_cyclic, dst_cyclic=dst_cyclic
         )
 
@@ -19170,13 +20783,14 @@ class Field(mixin.PropertiesData,
 
         # Release old memory from ESMF (this ought to happen garbage
         # collection, but it doesn't seem to work there!)
-        regridSrc2Dst.destroy()
-        dstfracfield.destroy()
-        srcfracfield.destroy()
-        dstfield.destroy()
-        srcfield.destroy()
-        dstgrid.destroy()
-        srcgrid.destroy()
+        if not use_weights:
+            regridSrc2Dst.destroy()
+            dstfracfield.destroy()
+            srcfracfield.destroy()
+            dstfield.destroy()
+            srcfield.destroy()
+            dstgrid.destroy()
+            srcgrid.destroy()
 
 #        if f.data.fits_in_one_chunk_in_memory(f.data.dtype.itemsize):
 #            f.varray
@@ -19187,9 +20801,10 @@ class Field(mixin.PropertiesData,
 
     @_deprecated_kwarg_check('i')
     @_inplace_enabled(default=False)
-    def regridc(self, dst, axes, method, use_src_mask=True,
+    def regridc(self, dst, axes, method=None, use_src_mask=True,
                 use_dst_mask=False, fracfield=False, axis_order=None,
-                ignore_degenerate=True, inplace=False, i=False,
+                ignore_degenerate=True, return_operator=False, z=None,
+                ln_z=False, inplace=False, i=False,
                 _compute_field_mass=None):
         '''Return the field with the specified Cartesian axes regridded
     onto a new grid.
@@ -19253,6 +20868,38 @@ class Field(mixin.PropertiesData,
     `regridding utility
     <https://www.earthsystemcog.org/projects/esmf/regridding>`_.
 
+    The exception is linear interpolation along a single axis, such
+    as the interpolation of model levels to pressure levels, which
+    does not use `ESMPy`. All of the points of the other axes are
+    interpolated at once, and the source coordinates may differ
+    between these points (see the *z* parameter). Domain ancillary and
+    field ancillary constructs that span the interpolation axis are
+    interpolated in the same way, without their bounds, unless their
+    source coordinates would vary along axes that they do not span, in
+    which case they are removed. Cell measure constructs that span the
+    interpolation axis are removed.
+
+
+    **Regrid operators**
+
+    Creating the regridding weights is usually by far the most
+    expensive part of regridding. The weights may be returned in a
+    `RegridOperator` by setting the *return_operator* parameter, and
+    the regrid operator may then be used in place of the destination
+    grid to regrid any field construct with the same source grid,
+    without recreating the weights. Applying a regrid operator does
+    not require the `ESMPy` package.
+
+    When a regrid operator is used or returned, the regridding
+    weights are applied to all of the slices of the field at once, as
+    a single sparse matrix product for each chunk of data. Missing
+    source values are accounted for by renormalising the weights,
+    except for methods whose weights depend on the source mask
+    (second-order conservative and patch recovery regridding, and
+    nearest source to destination regridding with *use_src_mask* set
+    to False), for which weights are created once for each distinct
+    source mask.
+
 
     **Logging**
 
@@ -19260,16 +20907,26 @@ class Field(mixin.PropertiesData,
     `cf.regrid_logging`. If it is logging takes place after every
     call. By default logging is disabled.
 
-    .. seealso:: `regrids`
+    .. seealso:: `regrids`, `RegridOperator`
 
     :Parameters:
 
-        dst: `Field` or `dict`
+        dst: `Field`, `dict` or `RegridOperator`
             The field containing the new grid or a dictionary with the
             axes specifiers as keys referencing dimension coordinates.
             If dst is a field list the first field in the list is
             used.
 
+            Alternatively, a regrid operator that was created by an
+            earlier call with the *return_operator* parameter set may
+            be given, in which case its destination grid and weights
+            are used. The source grid of the field construct must be
+            the same as the one used to create the regrid operator,
+            and the *method* and *use_dst_mask* parameters are
+            ignored.
+
+            .. versionadded:: 3.8.0 (`RegridOperator` destination)
+
         axes:
             Select dimension coordinates from the source and
             destination fields for regridding. See `cf.Field.axes` TODO for
@@ -19279,7 +20936,8 @@ class Field(mixin.PropertiesData,
 
         method: `str`
             Specify the regridding method. The *method* parameter must
-            be one of the following:
+            be one of the following, and may be omitted if *dst* is a
+            regrid operator:
 
             ======================  ==================================
             Method                  Description
@@ -19404,6 +21062,7 @@ class Field(mixin.PropertiesData,
             recalculated every time the mask of a slice changes with
             respect to the previous one, so this option allows the
             user to minimise how frequently the mask changes.
+            Ignored if all slices are regridded at once.
 
         ignore_degenerate: `bool`, optional
             True by default. Instructs ESMPy to ignore degenerate
@@ -19416,6 +21075,38 @@ class Field(mixin.PropertiesData,
             conservative regridding.  Other methods always skip
             degenerate cells.
 
+        return_operator: `bool`, optional
+            If True then do not regrid the field construct, but
+            instead return a `RegridOperator` that contains the
+            regridding weights and the destination grid. The weights
+            are created for the source grid without any missing data
+            values. Requires ESMPy version 8.0.0 or later.
+
+            .. versionadded:: 3.8.0
+
+        z: optional
+            For linear interpolation along a single axis, select the
+            source coordinates with a construct of the field that
+            spans the interpolation axis, instead of using its
+            dimension coordinates. The construct is selected by
+            passing the *z* value to the field's `construct` method,
+            e.g. ``'air_pressure'``. The construct may span other axes
+            of the field, in which case the source coordinates vary
+            between their points, as is the case for the pressure of
+            a hybrid sigma-pressure coordinate. The units of the
+            construct must be equivalent to those of the destination
+            coordinates. By default the dimension coordinates of the
+            interpolation axis are used.
+
+            .. versionadded:: 3.8.0
+
+        ln_z: `bool`, optional
+            For linear interpolation along a single axis, if True then
+            interpolate linearly in the natural logarithm of the
+            source and destination coordinates, as is common for
+            interpolation in pressure.
+
+            .. versionadded:: 3.8.0
 
         {{inplace: `bool`, optional}}
 
@@ -19434,9 +21125,10 @@ class Field(mixin.PropertiesData,
 
     :Returns:
 
-        `Field` or `None`
-            The regridded field construct, or `None` if the operation
-            was in-place.
+        `Field`, `RegridOperator` or `None`
+            The regridded field construct, or the regrid operator if
+            *return_operator* is True, or `None` if the operation was
+            in-place.
 
     **Examples:**
 
@@ -19455,6 +21147,14 @@ class Field(mixin.PropertiesData,
 
     >>> h = f.regridc(g, axes=('T'), method='linear')
 
+    Interpolate the Z axis of field ``f``, whose three dimensional
+    pressures are in its ``'air_pressure'`` auxiliary coordinate
+    construct, to the pressure levels in the dimension coordinate
+    ``p``, linearly in the logarithm of pressure:
+
+    >>> h = f.regridc({'Z': p}, axes='Z', method='linear',
+    ...               z='air_pressure', ln_z=True)
+
     Regrid the X and Y axes of field ``f`` conservatively onto a grid
     contained in field ``g``:
 
@@ -19465,21 +21165,16 @@ class Field(mixin.PropertiesData,
 
     >>> h = f.regridc(g, axes=('X','Y'), use_dst_mask=True, method='linear')
 
-        '''
-        # Initialise ESMPy for regridding if found
-        manager = Regrid.initialize()
+    Create the regridding weights for the T axis once, and use them
+    to regrid many field constructs that have the same T coordinates
+    as ``f``:
 
-        f = _inplace_enabled_define_and_cleanup(self)
+    >>> op = f.regridc(g, axes='T', method='linear', return_operator=True)
+    >>> h = f.regridc(op, axes='T')
+    >>> h2 = f2.regridc(op, axes='T')
 
-        # If dst is a dictionary set flag
-        dst_dict = not isinstance(dst, f.__class__)
-#        if isinstance(dst, self.__class__):
-#            dst_dict = False
-#            # If dst is a field list use the first field
-#            if isinstance(dst, FieldList):
-#                dst = dst[0]
-#        else:
-#            dst_dict = True
+        '''
+        regrid_operator = isinstance(dst, RegridOperator)
 
         # Get the number of axes
         if isinstance(axes, str):
@@ -19490,45 +21185,157 @@ class Field(mixin.PropertiesData,
             raise ValueError(
                 'Between 1 and 3 axes must be individually specified.')
 
+        # Linear interpolation along a single axis is done without
+        # ESMPy
+        interpolate_1d = (n_axes == 1
+                          and method in ('linear', 'bilinear')
+                          and not regrid_operator
+                          and not return_operator
+                          and _compute_field_mass is None)
+
+        if (z is not None or ln_z) and not interpolate_1d:
+            raise ValueError(
+                "Can't set the z or ln_z parameters unless linearly "
+                "interpolating along a single axis"
+            )
+
+        # Initialise ESMPy for regridding if found. Applying a regrid
+        # operator does not need ESMPy.
+        if not (regrid_operator or interpolate_1d):
+            manager = Regrid.initialize()
+
+        f = _inplace_enabled_define_and_cleanup(self)
+
         # Retrieve the source axis keys and dimension coordinates
         src_axis_keys, src_coords = f._regrid_get_cartesian_coords(
             'source', axes)
 
-        # Retrieve the destination axis keys and dimension coordinates
-        if dst_dict:
-            dst_coords = []
-            for axis in axes:
-                try:
-                    dst_coords.append(dst[axis])
-                except KeyError:
-                    raise ValueError(
-                        "Axis {!r} not specified in dst.".format(axis))
-            # --- End: for
-            dst_axis_keys = None
+        if regrid_operator:
+            # --------------------------------------------------------
+            # dst is a regrid operator: Retrieve the destination grid
+            # from it
+            # --------------------------------------------------------
+            operator = dst
+            if operator.coord_sys != 'Cartesian':
+                raise ValueError(
+                    "Can't regrid with {!r}: Use regrids for spherical "
+                    "regridding".format(operator)
+                )
+
+            if method is not None and method != operator.method:
+                raise ValueError(
+                    "Can't regrid with {!r}: Can't change the regridding "
+                    "method to {!r}".format(operator, method)
+                )
+
+            method = operator.method
+            dst = operator._get_parameter('dst')
+            dst_dict = operator._get_parameter('dst_dict')
+            dst_axis_keys = operator._get_parameter('dst_axis_keys')
+            dst_coords = [
+                c.copy() for c in operator._get_parameter('dst_coords')]
+            if len(dst_coords) != n_axes:
+                raise ValueError(
+                    "Can't regrid with {!r}: The regrid operator has {} "
+                    "axes, but {} axes were given".format(
+                        operator, len(dst_coords), n_axes)
+                )
         else:
-            dst_axis_keys, dst_coords = dst._regrid_get_cartesian_coords(
-                'destination', axes)
-
-        # Check that the units of the source and the destination
-        # coords are equivalent and if so set the units of the source
-        # coords to those of the destination coords
-        for src_coord, dst_coord in zip(src_coords, dst_coords):
-            if src_coord.Units.equivalent(dst_coord.Units):
-                src_coord.units = dst_coord.units
+            # If dst is a dictionary set flag
+            dst_dict = not isinstance(dst, f.__class__)
+
+            # Retrieve the destination axis keys and dimension coordinates
+            if dst_dict:
+                dst_coords = []
+                for axis in axes:
+                    try:
+                        dst_coords.append(dst[axis])
+                    except KeyError:
+                        raise ValueError(
+                            "Axis {!r} not specified in dst.".format(axis))
+                # --- End: for
+                dst_axis_keys = None
             else:
+                dst_axis_keys, dst_coords = \
+                    dst._regrid_get_cartesian_coords('destination', axes)
+        # --- End: if
+
+        if z is not None:
+            # Get the source coordinates for interpolation from the
+            # given construct, broadcastable to the shape of the data
+            z_key = f.construct(z, key=True, default=None)
+            if z_key is None:
+                raise ValueError(
+                    "Can't find {!r} source coordinates".format(z))
+
+            z_axes = f.get_data_axes(z_key, default=None)
+            data_axes = f.get_data_axes()
+            if (z_axes is None or src_axis_keys[0] not in z_axes
+                    or not set(z_axes).issubset(data_axes)):
+                raise ValueError(
+                    "Can't interpolate with {!r} source coordinates that "
+                    "do not span the interpolation axis, or that span "
+                    "axes that are not spanned by the data".format(z)
+                )
+
+            src_z = f.constructs[z_key].data.copy()
+            for axis in data_axes:
+                if axis not in z_axes:
+                    src_z.insert_dimension(position=src_z.ndim,
+                                           inplace=True)
+                    z_axes = tuple(z_axes) + (axis,)
+            # --- End: for
+            src_z.transpose([z_axes.index(axis) for axis in data_axes],
+                            inplace=True)
+
+            if not src_z.Units.equivalent(dst_coords[0].Units):
                 raise ValueError(
-                    "Units of source and destination domains are not "
+                    "Units of source and destination coordinates are not "
                     "equivalent: {!r}, {!r}".format(
-                        src_coord.Units, dst_coord.Units)
+                        src_z.Units, dst_coords[0].Units)
                 )
+
+            src_z.Units = dst_coords[0].Units
+        else:
+            # Check that the units of the source and the destination
+            # coords are equivalent and if so set the units of the
+            # source coords to those of the destination coords
+            for src_coord, dst_coord in zip(src_coords, dst_coords):
+                if src_coord.Units.equivalent(dst_coord.Units):
+                    src_coord.units = dst_coord.units
+                else:
+                    raise ValueError(
+                        "Units of source and destination domains are not "
+                        "equivalent: {!r}, {!r}".format(
+                            src_coord.Units, dst_coord.Units)
+                    )
+            # --- End: for
+
+            if interpolate_1d:
+                src_z = src_coords[0].data
         # --- End: if
 
+        if regrid_operator:
+            operator._check_source(
+                'Cartesian',
+                self._regrid_get_source_signature(src_coords, method)
+            )
+
         # Get the axis indices and their order for the source field
         src_axis_indices, src_order = f._regrid_get_axis_indices(
             src_axis_keys)
 
+        # Regrid with sparse weights only when a regrid operator is
+        # being used or returned, or when ESMF is running in
+        # parallel, in which case each process holds only part of
+        # each ESMPy field. Otherwise the ESMPy regridder is applied
+        # directly.
+        use_weights = not interpolate_1d and (
+            regrid_operator or return_operator or manager.pet_count > 1
+        )
+
         # Get the axis indices and their order for the destination field.
-        if not dst_dict:
+        if not dst_dict and not regrid_operator:
             dst_axis_indices, dst_order = dst._regrid_get_axis_indices(
                 dst_axis_keys)
 
@@ -19540,8 +21347,13 @@ class Field(mixin.PropertiesData,
         src_axis_indices_ext = src_axis_indices
         src_order_ext = src_order
         # Proceed if there is only one regridding dimension, but more than
-        # one dimension to the field that is not of size one.
-        if n_axes == 1 and f.squeeze().ndim > 1:
+        # one dimension to the field that is not of size one. This is
+        # not done when regridding with sparse weights, which must not
+        # depend on the other axes of the field and which regrid all
+        # sections at once, nor for linear interpolation along a
+        # single axis.
+        if (n_axes == 1 and f.squeeze().ndim > 1
+                and not (use_weights or interpolate_1d)):
             # Find the length and index of the longest axis not including
             # the axis along which regridding will be performed.
             src_shape = numpy_array(f.shape)
@@ -19601,129 +21413,202 @@ class Field(mixin.PropertiesData,
                 [numpy_finfo('float32').epsneg, numpy_finfo('float32').eps]
             ))]
 
-        # Section the data into slices of up to three dimensions getting a
-        # list of reordered keys if required. Reordering on an extended axis
-        # will not have any effect as all the items in the keys will be None.
-        # Therefore it is only checked if the axes specified in axis_order
-        # are in the regridding axes as this is informative to the user.
-        section_keys, sections = f._regrid_get_reordered_sections(
-            axis_order, src_axis_keys, src_axis_indices_ext)
+        dst_axis_sizes = [c.size for c in dst_coords]
 
         # Use bounds if the regridding method is conservative.
         use_bounds = f._regrid_use_bounds(method)
 
-        # Retrieve the destination field's mask if appropriate
-        dst_mask = None
-        if not dst_dict and use_dst_mask and dst.data.ismasked:
-            dst_mask = dst._regrid_get_destination_mask(
-                dst_order,
-                axes=dst_axes_keys,
-                cartesian=True,
-                coords_ext=coords_ext)
-
-        # Create the destination ESMPy grid and fields
-        dstgrid = Regrid.create_grid(coords_ext + dst_coords, use_bounds,
-                                     mask=dst_mask, cartesian=True)
-        dstfield = Regrid.create_field(dstgrid, 'dstfield')
-        dstfracfield = Regrid.create_field(dstgrid, 'dstfracfield')
-
-        # Regrid each section
-        old_mask = None
-        unmasked_grid_created = False
-        for k in section_keys:
-            d = sections[k]
-            subsections = d.data.section(src_axis_indices_ext, chunks=True,
-                                         min_step=2)
-            for k2 in subsections.keys():
-                d2 = subsections[k2]
-                # Retrieve the source field's grid, create the ESMPy grid
-                # and a handle to regridding.
-                src_data = d2.squeeze().transpose(src_order_ext).array
-                if nonconservative1D:
-                    src_data = numpy_tile(src_data, (2, 1))
-
-                if (not (method == 'nearest_stod' and use_src_mask)
-                        and numpy_ma_is_masked(src_data)):
-                    mask = src_data.mask
-                    if not numpy_array_equal(mask, old_mask):
-                        # Release old memory
-                        if old_mask is not None:
-                            regridSrc2Dst.destroy()
-                            srcfracfield.destroy()
-                            srcfield.destroy()
-                            srcgrid.destroy()
+        if not (regrid_operator or interpolate_1d):
+            # Retrieve the destination field's mask if appropriate
+            dst_mask = None
+            if not dst_dict and use_dst_mask and dst.data.ismasked:
+                dst_mask = dst._regrid_get_destination_mask(
+                    dst_order,
+                    axes=dst_axes_keys,
+                    cartesian=True,
+                    coords_ext=coords_ext)
+
+            # Create the destination ESMPy grid and fields
+            dstgrid = Regrid.create_grid(coords_ext + dst_coords,
+                                         use_bounds, mask=dst_mask,
+                                         cartesian=True)
+            dstfield = Regrid.create_field(dstgrid, 'dstfield')
+            dstfracfield = Regrid.create_field(dstgrid, 'dstfracfield')
+
+        create_kwargs = None
+        if use_weights and not regrid_operator:
+            # --------------------------------------------------------
+            # Create the regridding weights for the unmasked source
+            # grid
+            # --------------------------------------------------------
+            if return_operator and not dst_dict:
+                # Keep only the metadata of the destination field
+                dst = dst.copy()
+                dst.del_data()
+
+            operator = self._regrid_create_operator(
+                coords_ext + src_coords, dict(cartesian=True), use_bounds,
+                dstfield, dstfracfield, method, ignore_degenerate,
+                'Cartesian',
+                self._regrid_get_source_signature(src_coords, method),
+                dict(dst=dst,
+                     dst_dict=dst_dict,
+                     dst_axis_keys=dst_axis_keys,
+                     dst_coords=[c.copy() for c in dst_coords]),
+                nonconservative1D=nonconservative1D, shared=True
+            )
 
-                        # (Re)create the source ESMPy grid and fields
-                        srcgrid = Regrid.create_grid(coords_ext + src_coords,
-                                                     use_bounds, mask=mask,
-                                                     cartesian=True)
-                        srcfield = Regrid.create_field(srcgrid, 'srcfield')
-                        srcfracfield = Regrid.create_field(srcgrid,
-                                                           'srcfracfield')
-                        # (Re)initialise the regridder
-                        regridSrc2Dst = Regrid(
-                            srcfield, dstfield, srcfracfield, dstfracfield,
-                            method=method,
-                            ignore_degenerate=ignore_degenerate
-                        )
-                        old_mask = mask
-                else:
-                    if not unmasked_grid_created or old_mask is not None:
-                        # Create the source ESMPy grid and fields
-                        srcgrid = Regrid.create_grid(
-                            coords_ext + src_coords, use_bounds,
-                            cartesian=True
-                        )
-                        srcfield = Regrid.create_field(srcgrid, 'srcfield')
-                        srcfracfield = Regrid.create_field(
-                            srcgrid, 'srcfracfield')
-                        # Initialise the regridder
-                        regridSrc2Dst = Regrid(
-                            srcfield, dstfield, srcfracfield,
-                            dstfracfield, method=method,
-                            ignore_degenerate=ignore_degenerate
-                        )
-                        unmasked_grid_created = True
-                        old_mask = None
-                # --- End: if
+            if return_operator:
+                dstfracfield.destroy()
+                dstfield.destroy()
+                dstgrid.destroy()
+
+                return operator
+
+            # If the weights depend on the source mask then new
+            # weights will be needed for each distinct mask of the
+            # source data
+            if RegridOperator._mask_dependent(method, use_src_mask):
+                create_kwargs = dict(
+                    src_coords=coords_ext + src_coords,
+                    src_grid_kwargs=dict(cartesian=True),
+                    use_bounds=use_bounds, dstfield=dstfield,
+                    dstfracfield=dstfracfield, method=method,
+                    ignore_degenerate=ignore_degenerate,
+                    coord_sys='Cartesian', src_signature=None,
+                    parameters=None, nonconservative1D=nonconservative1D)
+        # --- End: if
 
-                # Fill the source and destination fields
-                f._regrid_fill_fields(src_data, srcfield, dstfield)
+        if interpolate_1d:
+            # Interpolate all sections at once, without ESMPy
+            new_data = f._regrid_interpolate_1d(
+                src_axis_indices[0], src_z, dst_coords[0].data, ln_z=ln_z)
+
+            # Interpolate the domain and field ancillary constructs
+            # that span the interpolation axis
+            f._regrid_interpolate_1d_constructs(
+                src_axis_keys[0], src_z, dst_coords[0].data, ln_z=ln_z)
+        elif use_weights:
+            # Regrid all sections with a single sparse matrix product
+            # per chunk of data
+            new_data = f._regrid_with_operator(
+                operator, src_axis_indices, dst_axis_sizes,
+                fracfield=fracfield, use_src_mask=use_src_mask,
+                create_kwargs=create_kwargs)
+
+            if not regrid_operator:
+                dstfracfield.destroy()
+                dstfield.destroy()
+                dstgrid.destroy()
+        else:
+            # Section the data into slices of up to three dimensions
+            # getting a list of reordered keys if required. Reordering
+            # on an extended axis will not have any effect as all the
+            # items in the keys will be None. Therefore it is only
+            # checked if the axes specified in axis_order are in the
+            # regridding axes as this is informative to the user.
+            section_keys, sections = f._regrid_get_reordered_sections(
+                axis_order, src_axis_keys, src_axis_indices_ext)
+
+            # Regrid each section
+            old_mask = None
+            unmasked_grid_created = False
+            for k in section_keys:
+                d = sections[k]
+                subsections = d.data.section(src_axis_indices_ext, chunks=True,
+                                             min_step=2)
+                for k2 in subsections.keys():
+                    d2 = subsections[k2]
+                    # Retrieve the source field's grid, create the ESMPy grid
+                    # and a handle to regridding.
+                    src_data = d2.squeeze().transpose(src_order_ext).array
+                    if nonconservative1D:
+                        src_data = numpy_tile(src_data, (2, 1))
+
+                    if (not (method == 'nearest_stod' and use_src_mask)
+                            and numpy_ma_is_masked(src_data)):
+                        mask = src_data.mask
+                        if not numpy_array_equal(mask, old_mask):
+                            # Release old memory
+                            if old_mask is not None:
+                                regridSrc2Dst.destroy()
+                                srcfracfield.destroy()
+                                srcfield.destroy()
+                                srcgrid.destroy()
+
+                            # (Re)create the source ESMPy grid and fields
+                            srcgrid = Regrid.create_grid(
+                                coords_ext + src_coords, use_bounds,
+                                mask=mask, cartesian=True)
+                            srcfield = Regrid.create_field(srcgrid, 'srcfield')
+                            srcfracfield = Regrid.create_field(srcgrid,
+                                                               'srcfracfield')
+                            # (Re)initialise the regridder
+                            regridSrc2Dst = Regrid(
+                                srcfield, dstfield, srcfracfield, dstfracfield,
+                                method=method,
+                                ignore_degenerate=ignore_degenerate
+                            )
+                            old_mask = mask
+                    else:
+                        if not unmasked_grid_created or old_mask is not None:
+                            # Create the source ESMPy grid and fields
+                            srcgrid = Regrid.create_grid(
+                                coords_ext + src_coords, use_bounds,
+                                cartesian=True
+                            )
+                            srcfield = Regrid.create_field(srcgrid, 'srcfield')
+                            srcfracfield = Regrid.create_field(
+                                srcgrid, 'srcfracfield')
+                            # Initialise the regridder
+                            regridSrc2Dst = Regrid(
+                                srcfield, dstfield, srcfracfield,
+                                dstfracfield, method=method,
+                                ignore_degenerate=ignore_degenerate
+                            )
+                            unmasked_grid_created = True
+                            old_mask = None
+                    # --- End: if
 
-                # Run regridding
-                dstfield = regridSrc2Dst.run_regridding(srcfield, dstfield)
+                    # Fill the source and destination fields
+                    f._regrid_fill_fields(src_data, srcfield, dstfield)
 
-                # Compute field mass if requested for conservative regridding
-                if (_compute_field_mass is not None and method in
-                        conservative_regridding_methods):
-                    f._regrid_compute_field_mass(
-                        _compute_field_mass, k, srcgrid, srcfield,
-                        srcfracfield, dstgrid, dstfield
-                    )
+                    # Run regridding
+                    dstfield = regridSrc2Dst.run_regridding(srcfield, dstfield)
 
-                # Get the regridded data or frac field as a numpy array
-                regridded_data = f._regrid_get_regridded_data(
-                    method, fracfield, dstfield, dstfracfield)
+                    # Compute field mass if requested for conservative
+                    # regridding
+                    if (_compute_field_mass is not None and method in
+                            conservative_regridding_methods):
+                        f._regrid_compute_field_mass(
+                            _compute_field_mass, k, srcgrid, srcfield,
+                            srcfracfield, dstgrid, dstfield
+                        )
 
-                if nonconservative1D:
-                    # For nonconservative regridding along one dimension
-                    # where that dimension has not been padded out take
-                    # only one of the two rows of data as they should be
-                    # nearly identical.
-                    regridded_data = regridded_data[0]
-
-                # Insert regridded data, with axes in correct order
-                subsections[k2] = Data(
-                    regridded_data.squeeze().transpose(
-                        src_order_ext).reshape(shape),
-                    units=f.Units
-                )
+                    # Get the regridded data or frac field as a numpy array
+                    regridded_data = f._regrid_get_regridded_data(
+                        method, fracfield, dstfield, dstfracfield)
+
+                    if nonconservative1D:
+                        # For nonconservative regridding along one dimension
+                        # where that dimension has not been padded out take
+                        # only one of the two rows of data as they should be
+                        # nearly identical.
+                        regridded_data = regridded_data[0]
+
+                    # Insert regridded data, with axes in correct order
+                    subsections[k2] = Data(
+                        regridded_data.squeeze().transpose(
+                            src_order_ext).reshape(shape),
+                        units=f.Units
+                    )
+                # --- End: for
+                sections[k] = Data.reconstruct_sectioned_data(subsections)
             # --- End: for
-            sections[k] = Data.reconstruct_sectioned_data(subsections)
-        # --- End: for
 
-        # Construct new data from regridded sections
-        new_data = Data.reconstruct_sectioned_data(sections)
+            # Construct new data from regridded sections
+            new_data = Data.reconstruct_sectioned_data(sections)
+        # --- End: if
 
         # Construct new field
 #        if i:
@@ -19735,11 +21620,15 @@ class Field(mixin.PropertiesData,
         # # Update ancillary variables of new field
         # f._conform_ancillary_variables(src_axis_keys, keep_size_1=False)
 
-        dst_axis_sizes = [c.size for c in dst_coords]
-
         # Update coordinate references of new field
+        if use_weights:
+            # Regrid domain ancillaries with the same operator
+            dst_grid = operator
+        else:
+            dst_grid = dst
+
         f._regrid_update_coordinate_references(
-            dst, src_axis_keys, dst_axis_sizes, method, use_dst_mask,
+            dst_grid, src_axis_keys, dst_axis_sizes, method, use_dst_mask,
             cartesian=True, axes=axes, n_axes=n_axes
         )
 
@@ -19756,13 +21645,14 @@ class Field(mixin.PropertiesData,
         f.set_data(new_data, axes=self.get_data_axes())
 
         # Release old memory
-        regridSrc2Dst.destroy()
-        dstfracfield.destroy()
-        srcfracfield.destroy()
-        dstfield.destroy()
-        srcfield.destroy()
-        dstgrid.destroy()
-        srcgrid.destroy()
+        if not (use_weights or interpolate_1d):
+            regridSrc2Dst.destroy()
+            dstfracfield.destroy()
+            srcfracfield.destroy()
+            dstfield.destroy()
+            srcfield.destroy()
+            dstgrid.destroy()
+            srcgrid.destroy()
 
         return f
 
@@ -1,6 +1,7 @@
 import atexit
 import csv
 import os
+import pickle
 import platform
 import re
 import resource
@@ -54,7 +55,8 @@ import cfdm
 import cfunits
 
 from .          import __version__, __file__
-from .constants import CONSTANTS, _file_to_fh, _stash2standard_name
+from .constants import (CONSTANTS, _file_to_fh, _stash2standard_name,
+                        _stash2standard_name_matches)
 
 from . import mpi_on
 from . import mpi_size
@@ -187,6 +189,7 @@ def configuration(
     free_memory_factor=None,
     log_level=None,
     regrid_logging=None,
+    regrid_workers=None,
     relaxed_identities=None,
 ):
     '''View or set any number of constants in the project-wide configuration.
@@ -203,6 +206,7 @@ def configuration(
     * `free_memory_factor`
     * `log_level`
     * `regrid_logging`
+    * `regrid_workers`
     * `relaxed_identities`
 
     The following settings are also included in the dictionary that is
@@ -230,7 +234,8 @@ def configuration(
     .. seealso:: `atol`, `rtol`, `tempdir`, `of_fraction`, `chunksize`,
                  `collapse_parallel_mode`, `total_memory`,
                  `free_memory_factor`, `fm_threshold`, `min_total_memory`,
-                 `log_level`, `regrid_logging`, `relaxed_identities`
+                 `log_level`, `regrid_logging`, `regrid_workers`,
+                 `relaxed_identities`
 
     :Parameters:
 
@@ -285,6 +290,11 @@ def configuration(
             to disable it). The default is to not change the current
             behaviour.
 
+        regrid_workers: `int`, optional
+            The new number of threads used to apply regridding
+            weights. The default is to not change the current
+            behaviour.
+
         `relaxed_identities`: `bool`, optional
             The new value; if `True`, use 'relaxed' mode when getting a
             construct identity. The default is to not change the current
@@ -307,6 +317,7 @@ def configuration(
      'total_memory': 8287346688.0,
      'free_memory_factor': 0.1,
      'regrid_logging': False,
+     'regrid_workers': 1,
      'collapse_parallel_mode': 0,
      'relaxed_identities': False,
      'log_level': 'WARNING',
@@ -327,6 +338,7 @@ def configuration(
      'total_memory': 8287346688.0,
      'free_memory_factor': 0.1,
      'regrid_logging': False,
+     'regrid_workers': 1,
      'collapse_parallel_mode': 0,
      'relaxed_identities': False,
      'log_level': 'WARNING',
@@ -341,6 +353,7 @@ def configuration(
      'total_memory': 8287346688.0,
      'free_memory_factor': 0.1,
      'regrid_logging': False,
+     'regrid_workers': 1,
      'collapse_parallel_mode': 0,
      'relaxed_identities': False,
      'log_level': 'INFO',
@@ -359,6 +372,7 @@ def configuration(
         new_free_memory_factor=free_memory_factor,
         new_log_level=log_level,
         new_regrid_logging=regrid_logging,
+        new_regrid_workers=regrid_workers,
         new_relaxed_identities=relaxed_identities,
     )
 
@@ -401,6 +415,7 @@ def _configuration(**kwargs):
         'new_free_memory_factor': free_memory_factor,
         'new_log_level': log_level,
         'new_regrid_logging': regrid_logging,
+        'new_regrid_workers': regrid_workers,
         'new_relaxed_identities': relaxed_identities,
     }
     for setting_alias, new_value in kwargs.items():  # for all input kwargs...
@@ -949,6 +964,61 @@ def REGRID_LOGGING(*new_regrid_logging):
     return regrid_logging(*new_regrid_logging)
 
 
+def regrid_workers(*arg):
+    '''The number of threads used to apply regridding weights.
+
+    Regridding with a `cf.RegridOperator`, and linear interpolation
+    along a single axis, apply the same weights to each independent
+    section of the data (for instance, to each time step or level),
+    and the sections may be regridded concurrently by this number of
+    threads on each process. When cf is run in parallel with MPI the sections
+    are also distributed across the processes.
+
+    Each thread holds a section in memory, so increasing the number of
+    threads increases the memory required for regridding.
+
+    .. versionadded:: 3.8.0
+
+    .. seealso:: `cf.chunksize`, `cf.regrid_logging`
+
+    :Parameters:
+
+        arg: `int`, optional
+            The new number of threads, which must be a positive
+            integer. The default is to not change the current
+            behaviour.
+
+    :Returns:
+
+        `int`
+            The value prior to the change, or the current value if no
+            new value was specified.
+
+    **Examples:**
+
+    >>> cf.regrid_workers()
+    1
+    >>> cf.regrid_workers(4)
+    1
+    >>> cf.regrid_workers()
+    4
+
+    '''
+    old = CONSTANTS['REGRID_WORKERS']
+    if arg:
+        workers = arg[0]
+        if (not isinstance(workers, (int, _numpy_integer)) or
+                isinstance(workers, bool) or workers < 1):
+            raise ValueError(
+                "Invalid number of regrid workers: {!r}. Must be a "
+                "positive integer.".format(workers)
+            )
+
+        CONSTANTS['REGRID_WORKERS'] = int(workers)
+
+    return old
+
+
 def collapse_parallel_mode(*arg):
     '''Which mode to use when collapse is run in parallel. There are three
     possible modes:
@@ -2015,6 +2085,11 @@ def load_stash2standard_name(table=None, delimiter='!', merge=True):
 
     This used when reading PP and UM fields files.
 
+    The parsed table is kept in a binary file in the user's cache
+    directory (``$XDG_CACHE_HOME/cf-python``, or
+    ``~/.cache/cf-python``), which is used instead of parsing the
+    table again until the table file is modified.
+
     :Parameters:
 
         table: `str`, optional
@@ -2043,6 +2118,73 @@ def load_stash2standard_name(table=None, delimiter='!', merge=True):
     >>> cf.load_stash2standard_name('my_table3.txt', merge=True)
     >>> cf.load_stash2standard_name('my_table4.txt', merge=False)
 
+    '''
+    if table is None:
+        # Use default conversion table
+        merge = False
+        package_path = os.path.dirname(__file__)
+        table = os.path.join(package_path, 'etc/STASH_to_CF.txt')
+    elif merge and not _stash2standard_name:
+        # Merge with the default table, which has not been loaded yet
+        load_stash2standard_name()
+
+    stash2sn = _load_stash2standard_name_cache(table, delimiter)
+    if stash2sn is None:
+        stash2sn = _parse_stash2standard_name(table, delimiter)
+        _save_stash2standard_name_cache(table, delimiter, stash2sn)
+
+    if not merge:
+        _stash2standard_name.clear()
+
+    _stash2standard_name.update(stash2sn)
+    _stash2standard_name_matches.clear()
+
+    return _stash2standard_name
+
+
+def _get_stash2standard_name():
+    '''Return the STASH to standard name conversion table.
+
+    The default table is loaded if no table has been loaded yet, so
+    that it is not loaded until it is first needed.
+
+    .. versionadded:: 3.8.0
+
+    .. seealso:: `load_stash2standard_name`
+
+    :Returns:
+
+        `dict`
+            The STASH to standard name conversion table.
+
+    '''
+    if not _stash2standard_name:
+        load_stash2standard_name()
+
+    return _stash2standard_name
+
+
+def _parse_stash2standard_name(table, delimiter):
+    '''Parse a STASH to standard name conversion table.
+
+    .. versionadded:: 3.8.0
+
+    .. seealso:: `load_stash2standard_name`
+
+    :Parameters:
+
+        table: `str`
+            The conversion table file.
+
+        delimiter: `str`
+            The delimiter of the table columns.
+
+    :Returns:
+
+        `dict`
+            The conversion table, keyed by (submodel, STASH code)
+            tuples.
+
     '''
     # 0  Model
     # 1  STASH code
@@ -2057,13 +2199,6 @@ def load_stash2standard_name(table=None, delimiter='!', merge=True):
     # Number matching regular expression
     number_regex = '([-+]?\d*\.?\d+(e[-+]?\d+)?)'
 
-    if table is None:
-        # Use default conversion table
-        merge = False
-        package_path = os.path.dirname(__file__)
-        table = os.path.join(package_path, 'etc/STASH_to_CF.txt')
-    # --- End: if
-
     with open(table, 'r') as open_table:
         lines = csv.reader(open_table, delimiter=delimiter,
                            skipinitialspace=True)
@@ -2139,12 +2274,113 @@ def load_stash2standard_name(table=None, delimiter='!', merge=True):
             stash2sn[key] = line
     # --- End: for
 
-    if not merge:
-        _stash2standard_name.clear()
+    return stash2sn
 
-    _stash2standard_name.update(stash2sn)
 
-    return _stash2standard_name
+def _stash2standard_name_cache_file(table, delimiter):
+    '''Return the name of the binary file of a parsed conversion table.
+
+    .. versionadded:: 3.8.0
+
+    :Parameters:
+
+        table: `str`
+            The conversion table file.
+
+        delimiter: `str`
+            The delimiter of the table columns.
+
+    :Returns:
+
+        `str`
+
+    '''
+    cache_dir = os.environ.get('XDG_CACHE_HOME')
+    if not cache_dir:
+        cache_dir = _os_path_join(_os_path_expanduser('~'), '.cache')
+
+    h = hashlib_md5(
+        repr((__version__, _os_path_abspath(table), delimiter)).encode(
+            'utf-8'))
+
+    return _os_path_join(cache_dir, 'cf-python',
+                         'stash2standard_name_{}.pickle'.format(
+                             h.hexdigest()))
+
+
+def _load_stash2standard_name_cache(table, delimiter):
+    '''Load a parsed conversion table from its binary file.
+
+    .. versionadded:: 3.8.0
+
+    :Parameters:
+
+        table: `str`
+            The conversion table file.
+
+        delimiter: `str`
+            The delimiter of the table columns.
+
+    :Returns:
+
+        `dict` or `None`
+            The parsed conversion table, or `None` if there is no
+            binary file for the current version of the table file.
+
+    '''
+    try:
+        stat = os.stat(table)
+        with open(_stash2standard_name_cache_file(table, delimiter),
+                  'rb') as fh:
+            mtime, size, stash2sn = pickle.load(fh)
+    except Exception:
+        return None
+
+    if (mtime, size) != (stat.st_mtime_ns, stat.st_size):
+        return None
+
+    return stash2sn
+
+
+def _save_stash2standard_name_cache(table, delimiter, stash2sn):
+    '''Save a parsed conversion table to its binary file.
+
+    Nothing is saved if the cache directory is not writable.
+
+    .. versionadded:: 3.8.0
+
+    :Parameters:
+
+        table: `str`
+            The conversion table file.
+
+        delimiter: `str`
+            The delimiter of the table columns.
+
+        stash2sn: `dict`
+            The parsed conversion table.
+
+    :Returns:
+
+        `None`
+
+    '''
+    cache_file = _stash2standard_name_cache_file(table, delimiter)
+    tmp_file = '{}.{}.tmp'.format(cache_file, getpid())
+    try:
+        stat = os.stat(table)
+        os.makedirs(_os_path_dirname(cache_file), exist_ok=True)
+        with open(tmp_file, 'wb') as fh:
+            pickle.dump((stat.st_mtime_ns, stat.st_size, stash2sn), fh,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+    # --- End: try
 
 
 def flat(x):
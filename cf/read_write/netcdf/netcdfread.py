@@ -7,6 +7,30 @@ import cfdm
 from ...constants import _file_to_fh
 
 
+# netCDF attributes which name other netCDF variables
+_reference_attributes = (
+    'ancillary_variables',
+    'bounds',
+    'cell_measures',
+    'climatology',
+    'coordinates',
+    'formula_terms',
+    'geometry',
+    'grid_mapping',
+    'interior_ring',
+    'node_coordinates',
+    'node_count',
+    'part_node_count',
+)
+
+# netCDF attributes of "key: value [value ...]" pairs whose keys are
+# not netCDF variable names
+_keyword_reference_attributes = (
+    'cell_measures',
+    'formula_terms',
+)
+
+
 class NetCDFRead(cfdm.read_write.netcdf.NetCDFRead):
     '''TODO
 
@@ -326,6 +350,153 @@ class NetCDFRead(cfdm.read_write.netcdf.NetCDFRead):
                 if ncdimensions:
                     g['variable_dimensions'][ncvar] = tuple(
                         map(str, ncdimensions))
+        # --- End: if
+
+        # ------------------------------------------------------------
+        # Do not create fields that could not be selected
+        # ------------------------------------------------------------
+        select = g.get('select')
+        if select and not g['extra']:
+            g['do_not_create_field'].update(self._unselected(select))
+
+    def _parse_reference_attribute(self, attr, value):
+        '''Return the netCDF variable names in a netCDF attribute.
+
+    The names are parsed in the same way as when the field constructs
+    are created. The keys of ``cell_measures`` and ``formula_terms``
+    attributes (such as ``area:`` or ``ps:``) are not netCDF variable
+    names and are ignored, whilst the keys of an extended
+    ``grid_mapping`` attribute name grid mapping variables.
+
+    .. versionadded:: 3.8.0
+
+    :Parameters:
+
+        attr: `str`
+            The name of the netCDF attribute.
+
+        value: `str`
+            The value of the netCDF attribute.
+
+    :Returns:
+
+        `list` of `str`
+            The netCDF variable names.
+
+    **Examples:**
+
+    >>> n._parse_reference_attribute('cell_measures',
+    ...                              'area: areacella volume: vol')
+    ['areacella', 'vol']
+    >>> n._parse_reference_attribute('grid_mapping', 'crs: x y')
+    ['crs', 'x', 'y']
+    >>> n._parse_reference_attribute('coordinates', 'lat lon')
+    ['lat', 'lon']
+
+        '''
+        words = value.split()
+
+        if attr in _keyword_reference_attributes:
+            out = []
+            key = None
+            for word in words:
+                if word.endswith(':'):
+                    key = word
+                elif key is not None:
+                    out.append(word)
+            # --- End: for
+
+            return out
+
+        return [word.rstrip(':') for word in words]
+
+    def _unselected(self, select):
+        '''Return the netCDF variables that could not be selected.
+
+    A field created from an unselected netCDF variable would be
+    discarded after the read, so there is no need to create it. A
+    netCDF variable is unselected if it is not named by any other
+    netCDF variable and its attributes do not satisfy the *select*
+    criteria, or if it is named, directly or indirectly, by such a
+    netCDF variable. Only the raw netCDF attributes are inspected.
+
+    .. versionadded:: 3.8.0
+
+    :Parameters:
+
+        select: sequence of `str` or `Query` or `re.Pattern`
+            The *select* criteria, as accepted by the *select*
+            parameter of `cf.read`.
+
+    :Returns:
+
+        `set`
+            The names of the unselected netCDF variables.
+
+    **Examples:**
+
+    >>> n._unselected(['air_temperature'])
+    {'pr', 'cell_area', 'lwe_precipitation_rate'}
+
+        '''
+        g = self.read_vars
+
+        variables = set(g['variables']).difference(g['do_not_create_field'])
+
+        # ------------------------------------------------------------
+        # Find the netCDF variables named by each netCDF variable,
+        # including the coordinate variables of its dimensions
+        # ------------------------------------------------------------
+        references = {}
+        for ncvar in variables:
+            refs = set(ncdim for ncdim in g['variable_dimensions'][ncvar]
+                       if g['variable_dimensions'].get(ncdim) == (ncdim,))
+
+            attributes = g['variable_attributes'][ncvar]
+            for attr in _reference_attributes:
+                value = attributes.get(attr)
+                if isinstance(value, str):
+                    refs.update(self._parse_reference_attribute(attr, value))
+            # --- End: for
+
+            refs.intersection_update(variables)
+            refs.discard(ncvar)
+            references[ncvar] = refs
+        # --- End: for
+
+        referenced = set().union(*references.values())
+
+        # ------------------------------------------------------------
+        # Find the unreferenced netCDF variables whose attributes do
+        # not match the select criteria
+        # ------------------------------------------------------------
+        unselected = set()
+        for ncvar in variables.difference(referenced):
+            properties = g['global_attributes'].copy()
+            properties.update(g['variable_attributes'][ncvar])
+
+            f = self.implementation.initialise_Field()
+            self.implementation.set_properties(f, properties, copy=False)
+            self.implementation.nc_set_variable(f, ncvar)
+            if not f.match_by_identity(*select):
+                unselected.add(ncvar)
+        # --- End: for
+
+        # ------------------------------------------------------------
+        # Add the netCDF variables named, directly or indirectly, by
+        # unselected netCDF variables. Fields created from these
+        # would not be returned, because they are referenced by an
+        # unreferenced variable.
+        # ------------------------------------------------------------
+        todo = list(unselected)
+        while todo:
+            for ncvar in references[todo.pop()]:
+                if ncvar not in unselected:
+                    unselected.add(ncvar)
+                    todo.append(ncvar)
+        # --- End: while
+
+        return unselected
 
     def file_open(self, filename, flatten=True, verbose=None):
         '''Open the netCDf file for reading.
@@ -1,11 +1,16 @@
 import logging
 import os
+import pickle
 
-from glob        import glob
-from os.path     import isdir
+from concurrent.futures import ProcessPoolExecutor
+from glob               import glob
+from hashlib            import md5 as hashlib_md5
+from os.path            import isdir
+
+from numpy import integer as numpy_integer
 
 from .netcdf import NetCDFRead
-from .um     import UMRead
+from .um     import UMRead, LazyUMField
 
 from ..cfimplementation import implementation
 
@@ -13,9 +18,16 @@ from ..fieldlist import FieldList
 
 from ..aggregate import aggregate as cf_aggregate
 
+from ..data.partition import _remove_temporary_files
+
 from ..decorators import _manage_log_level_via_verbosity
 
-from ..functions import flat, _DEPRECATION_ERROR_FUNCTION_KWARGS
+from ..functions import abspath, flat, _DEPRECATION_ERROR_FUNCTION_KWARGS
+from ..functions import (chunksize as cf_chunksize,
+                         free_memory_factor as cf_free_memory_factor,
+                         tempdir as cf_tempdir)
+
+from .. import __version__
 
 
 # --------------------------------------------------------------------
@@ -37,7 +49,7 @@ def read(files, external=None, verbose=None, warnings=False,
          extra=None, recursive=False, followlinks=False, um=None,
          chunk=True, field=None, height_at_top_of_model=None,
          select_options=None, follow_symlinks=False, mask=True,
-         warn_valid=False):
+         warn_valid=False, workers=1, cache=None):
     '''Read field constructs from netCDF, CDL, PP or UM fields datasets.
 
     Input datasets are mapped to field constructs in memory which are
@@ -325,6 +337,14 @@ def read(files, external=None, verbose=None, warnings=False,
             equivalent to
             ``fl = cf.read(file).select_by_identity('air_temperature')``.
 
+            The criteria are also tested against the netCDF
+            attributes and PP headers of each variable before its
+            field construct is created, so that field constructs
+            which could not be selected are never created. Any
+            identity may be used, such as ``'ncvar%tas'`` for netCDF
+            files, or ``'stash_code=3236'``, ``'lbproc=128'`` and
+            ``'lbtim=122'`` for PP and UM fields files.
+
         recursive: `bool`, optional
             If True then recursively read sub-directories of any
             directories specified with the *files* parameter.
@@ -380,6 +400,46 @@ def read(files, external=None, verbose=None, warnings=False,
 
             .. versionadded:: 3.4.0
 
+        workers: `int`, optional
+            The number of processes with which to read the files
+            concurrently. The fields from each file are combined in
+            the same order as if the files had been read one after
+            another, before any aggregation. By default the files are
+            read one after another.
+
+            Reading many files concurrently can be much faster when
+            most of the time is spent parsing the file headers and
+            metadata. CDL files are always read in the calling
+            process.
+
+            *Parameter example:*
+              To read the files with four processes: ``workers=4``
+
+            .. versionadded:: 3.8.0
+
+        cache: `str`, optional
+            The name of a directory in which to keep the field
+            constructs read from each file, so that a later read of an
+            unchanged file does not need to parse it again. Data that
+            have not been read into memory are not kept, and are
+            still read from the original file when needed. A file
+            is read again if its size or modification time has
+            changed, or if it is read with different keyword
+            parameters, cf version, or `cf.chunksize`,
+            `cf.free_memory_factor` or `cf.tempdir` settings. A
+            file that is read again replaces its out of date entry
+            in the directory. The directory is created if it does
+            not exist. By default no directory is used.
+
+            The files in the directory are Python pickles, so the
+            directory must only be writable by trusted users. CDL
+            files are never kept in the directory.
+
+            *Parameter example:*
+              ``cache='~/.cache/cf-python'``
+
+            .. versionadded:: 3.8.0
+
         um: `dict`, optional
             For Met Office (UK) PP files and Met Office (UK) fields
             files only, provide extra decoding instructions. This
@@ -436,6 +496,27 @@ def read(files, external=None, verbose=None, warnings=False,
                                           "atmosphere_hybrid_height_coordinate"
                                           dimension coordinate
                                           construct will be created.
+
+            ``'lazy'``                    If True then the field
+                                          construct of each variable
+                                          that forms a single field
+                                          construct is returned as a
+                                          `LazyUMField`, whose
+                                          STASH code, LBPROC, LBTIM,
+                                          shape, units and CF
+                                          properties are found from
+                                          the headers alone. It is
+                                          populated with its
+                                          coordinates, data and cell
+                                          methods when any other
+                                          attribute is accessed,
+                                          after which it is a
+                                          `Field`. Lazy field
+                                          constructs are not
+                                          aggregated, squeezed,
+                                          unsqueezed nor cached.
+                                          By default *lazy* is
+                                          False.
             ============================  =====================================
 
             If format is specified as ``'PP'`` then the word size and
@@ -453,6 +534,12 @@ def read(files, external=None, verbose=None, warnings=False,
               little-endian PP files from version 5.1 of the UM:
               ``um={'fmt': 'PP', 'endian': 'little', 'version': 5.1}``
 
+            *Parameter example:*
+              To create only the air temperature field construct of
+              a fields file that contains many variables:
+              ``f = cf.read(file, um={'lazy': True})`` followed by
+              ``f.select('air_temperature')``
+
             .. versionadded:: 1.5
 
         umversion: deprecated at version 3.0.0
@@ -542,9 +629,21 @@ def read(files, external=None, verbose=None, warnings=False,
     if isinstance(select, str):
         select = (select,)
 
+    lazy = bool(um and um.get('lazy'))
+
     if squeeze and unsqueeze:
         raise ValueError("squeeze and unsqueeze can not both be True")
 
+    if (not isinstance(workers, (int, numpy_integer)) or
+            isinstance(workers, bool) or workers < 1):
+        raise ValueError(
+            "Invalid number of workers: {!r}. Must be a positive "
+            "integer.".format(workers))
+
+    if cache is not None:
+        cache = os.path.expanduser(os.path.expandvars(cache))
+        os.makedirs(cache, exist_ok=True)
+
     if follow_symlinks and not recursive:
         raise ValueError(
             "Can't set follow_symlinks={0} when recursive={1}".format(
@@ -569,6 +668,16 @@ def read(files, external=None, verbose=None, warnings=False,
 
     ftypes = set()
 
+    # The files to be read, and their formats
+    file_list = []
+
+    # In-memory metadata arrays, shared between all of the fields
+    metadata_arrays = {}
+
+    # Field constructs of UM variables whose creation has been
+    # deferred
+    lazy_fields = []
+
     # Count the number of fields (in all files) and the number of
     # files
     field_counter = -1
@@ -604,8 +713,6 @@ def read(files, external=None, verbose=None, warnings=False,
             files2 = files3
 
         for filename in files2:
-            logger.info('File: {0}'.format(filename))  # pragma: no cover
-
             if um:
                 ftype = 'UM'
             else:
@@ -637,24 +744,77 @@ def read(files, external=None, verbose=None, warnings=False,
             # --- End: if
 
             ftypes.add(ftype)
+            file_list.append((filename, ftype))
+        # --- End: for
+    # --- End: for
+
+    # ----------------------------------------------------------------
+    # Read the files into fields
+    # ----------------------------------------------------------------
+    read_kwargs = dict(
+        external=external,
+        ignore_read_error=ignore_read_error,
+        verbose=verbose, warnings=warnings,
+        aggregate=aggregate,
+        aggregate_options=aggregate_options,
+        selected_fmt=fmt, um=um,
+        extra=extra,
+        height_at_top_of_model=height_at_top_of_model,
+        chunk=chunk,
+        mask=mask,
+        warn_valid=warn_valid,
+        select=select,
+    )
+
+    # Find the fields of any files that have been read before
+    cached_fields = {}
+    cache_files = {}
+    if cache is not None:
+        for i, (filename, ftype) in enumerate(file_list):
+            cache_file = _cache_file(cache, filename, ftype, read_kwargs)
+            if cache_file is None:
+                continue
+
+            fields = _load_cache_file(cache_file)
+            if fields is None:
+                cache_files[i] = cache_file
+            else:
+                cached_fields[i] = fields
+        # --- End: for
+    # --- End: if
+
+    if workers > 1 and len(file_list) - len(cached_fields) > 1:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        futures = {
+            i: executor.submit(_read_a_file_in_worker, filename,
+                               ftype=ftype, **read_kwargs)
+            for i, (filename, ftype) in enumerate(file_list)
+            if ftype != 'CDL' and i not in cached_fields
+            and not (lazy and ftype == 'UM')
+        }
+    else:
+        executor = None
+        futures = {}
+
+    try:
+        for i, (filename, ftype) in enumerate(file_list):
+            logger.info('File: {0}'.format(filename))  # pragma: no cover
 
             # --------------------------------------------------------
             # Read the file into fields
             # --------------------------------------------------------
-            fields = _read_a_file(
-                filename, ftype=ftype,
-                external=external,
-                ignore_read_error=ignore_read_error,
-                verbose=verbose, warnings=warnings,
-                aggregate=aggregate,
-                aggregate_options=aggregate_options,
-                selected_fmt=fmt, um=um,
-                extra=extra,
-                height_at_top_of_model=height_at_top_of_model,
-                chunk=chunk,
-                mask=mask,
-                warn_valid=warn_valid,
-            )
+            if i in cached_fields:
+                fields = cached_fields.pop(i)
+            else:
+                if i in futures:
+                    fields = futures.pop(i).result()
+                else:
+                    fields = _read_a_file(filename, ftype=ftype,
+                                          **read_kwargs)
+
+                if i in cache_files:
+                    _save_cache_file(cache_files[i], fields)
+            # --- End: if
 
             # --------------------------------------------------------
             # Select matching fields (not from UM files)
@@ -662,16 +822,43 @@ def read(files, external=None, verbose=None, warnings=False,
             if select and ftype != 'UM':
                 fields = fields.select_by_identity(*select)
 
+            # --------------------------------------------------------
+            # Set aside lazy UM fields, which are not aggregated
+            # --------------------------------------------------------
+            if lazy and ftype == 'UM':
+                lazy_fields.extend(f for f in fields
+                                   if isinstance(f, LazyUMField))
+                fields = [f for f in fields
+                          if not isinstance(f, LazyUMField)]
+            # --- End: if
+
+            # --------------------------------------------------------
+            # Share equal metadata arrays with the fields already
+            # read
+            # --------------------------------------------------------
+            _share_metadata_arrays(fields, metadata_arrays)
+
             # --------------------------------------------------------
             # Add this file's fields to those already read from other
             # files
             # --------------------------------------------------------
             field_list.extend(fields)
 
-            field_counter = len(field_list)
+            field_counter = len(field_list) + len(lazy_fields)
             file_counter += 1
         # --- End: for
-    # --- End: for
+    finally:
+        if executor is not None:
+            for future in futures.values():
+                future.cancel()
+
+            executor.shutdown()
+    # --- End: try
+
+    if (aggregate and 'UM' in ftypes and fmt in (None, 'UM') and
+            'strict_units' not in aggregate_options):
+        # For PP fields, the default is strict_units=False
+        aggregate_options['relaxed_units'] = True
 
     logger.info(
         "Read {0} field{1} from {2} file{3}".format(
@@ -694,6 +881,8 @@ def read(files, external=None, verbose=None, warnings=False,
         )  # pragma: no cover
     # --- End: if
 
+    field_list.extend(lazy_fields)
+
     # ----------------------------------------------------------------
     # Sort by netCDF variable name
     # ----------------------------------------------------------------
@@ -730,10 +919,12 @@ def read(files, external=None, verbose=None, warnings=False,
     # ----------------------------------------------------------------
     if squeeze:
         for f in field_list:
-            f.squeeze(inplace=True)
+            if not isinstance(f, LazyUMField):
+                f.squeeze(inplace=True)
     elif unsqueeze:
         for f in field_list:
-            f.unsqueeze(inplace=True)
+            if not isinstance(f, LazyUMField):
+                f.unsqueeze(inplace=True)
     # --- End: if
 
     if nfields is not None and len(field_list) != nfields:
@@ -747,6 +938,313 @@ def read(files, external=None, verbose=None, warnings=False,
     return field_list
 
 
+def _cache_file(cache, filename, ftype, read_kwargs):
+    '''Return the name of the cache file for the fields of a file.
+
+    The name has two parts. The first depends on the file's name,
+    the names of any external files, the keyword parameters used to
+    read it, the cf version, and the `cf.chunksize`,
+    `cf.free_memory_factor` and `cf.tempdir` settings that control
+    how its data are partitioned and stored. The second depends on
+    the sizes and modification times of the file and of any external
+    files. When a cache file is saved, any others with the same first
+    part are deleted, so that a changed file replaces its cache file
+    rather than adding another.
+
+    .. versionadded:: 3.8.0
+
+    :Parameters:
+
+        cache: `str`
+            The cache directory.
+
+        filename: `str`
+            The name of the file.
+
+        ftype: `str`
+            The format of the file.
+
+        read_kwargs: `dict`
+            The keyword parameters to `_read_a_file`.
+
+    :Returns:
+
+        `str` or `None`
+            The name of the cache file, or `None` if the fields of
+            the file can not be cached.
+
+    '''
+    if ftype == 'CDL':
+        return None
+
+    if ftype == 'UM' and (read_kwargs['um'] or {}).get('lazy'):
+        # Lazy UM fields refer to the open file, so can't be cached
+        return None
+
+    description = [__version__, ftype, cf_chunksize(),
+                   cf_free_memory_factor(), cf_tempdir()]
+    state = []
+    try:
+        for x in (filename,) + tuple(flat(read_kwargs['external'] or ())):
+            stat = os.stat(x)
+            description.extend((x, abspath(x)))
+            state.extend((stat.st_size, stat.st_mtime_ns))
+    except OSError:
+        return None
+
+    description.extend(
+        (key, value) for key, value in sorted(read_kwargs.items())
+        if key not in ('aggregate', 'aggregate_options', 'external',
+                       'ignore_read_error', 'verbose', 'warnings')
+    )
+
+    return os.path.join(
+        cache,
+        '{}_{}.pickle'.format(
+            hashlib_md5(repr(description).encode('utf-8')).hexdigest(),
+            hashlib_md5(repr(state).encode('utf-8')).hexdigest()))
+
+
+def _load_cache_file(cache_file):
+    '''Load the fields of a file from its cache file.
+
+    .. versionadded:: 3.8.0
+
+    :Parameters:
+
+        cache_file: `str`
+            The name of the cache file.
+
+    :Returns:
+
+        `FieldList` or `None`
+            The cached fields, or `None` if the cache file does not
+            exist or can not be loaded.
+
+    '''
+    try:
+        with open(cache_file, 'rb') as fh:
+            return pickle.load(fh)
+    except FileNotFoundError:
+        return None
+    except Exception as error:
+        logger.warning(
+            "WARNING: Can't load cache file {}: {}".format(
+                cache_file, error))  # pragma: no cover
+
+        return None
+
+
+def _save_cache_file(cache_file, fields):
+    '''Save the fields of a file to its cache file.
+
+    The cache file is replaced atomically, so that concurrent reads
+    never see a partly written file, and any out of date cache files
+    of the same file are deleted. Fields with data in temporary files
+    (see `cf.tempdir`) are not saved, because the temporary files are
+    deleted when this process exits. Prefetched PP and UM records are
+    never saved.
+
+    .. versionadded:: 3.8.0
+
+    :Parameters:
+
+        cache_file: `str`
+            The name of the cache file, as returned by `_cache_file`.
+
+        fields: `FieldList`
+            The fields to save.
+
+    :Returns:
+
+        `None`
+
+    '''
+    for data in _data_objects(fields):
+        if any(p.in_cached_file for p in data.partitions.matrix.flat):
+            logger.info(
+                "Not saving cache file {}: Data are in temporary "
+                "files".format(cache_file))  # pragma: no cover
+            return
+    # --- End: for
+
+    tmp_file = '{}.{}.tmp'.format(cache_file, os.getpid())
+    try:
+        with open(tmp_file, 'wb') as fh:
+            pickle.dump(fields, fh, protocol=pickle.HIGHEST_PROTOCOL)
+
+        os.replace(tmp_file, cache_file)
+    except Exception as error:
+        logger.warning(
+            "WARNING: Can't save cache file {}: {}".format(
+                cache_file, error))  # pragma: no cover
+
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+
+        return
+    # --- End: try
+
+    # Delete the out of date cache files of the same file
+    prefix = os.path.basename(cache_file).split('_')[0]
+    for x in glob(os.path.join(os.path.dirname(cache_file),
+                               prefix + '_*.pickle')):
+        if x != cache_file:
+            try:
+                os.remove(x)
+            except OSError:
+                pass
+    # --- End: for
+
+
+def _share_metadata_arrays(fields, arrays):
+    '''Share equal in-memory metadata arrays between fields.
+
+    Fields read from the same grid often have their own copies of the
+    same coordinate, bounds and cell measure arrays. Each such array
+    is replaced by the first equal array seen, so that only one copy
+    is kept in memory. A shared array is copied before it is changed,
+    so changing the metadata of one field does not affect any other
+    field.
+
+    .. versionadded:: 3.8.0
+
+    :Parameters:
+
+        fields: sequence of `Field`
+            The fields whose metadata arrays are to be shared.
+
+        arrays: `dict`
+            The metadata arrays seen so far, as required by
+            `Data._share_arrays`. Updated in place.
+
+    :Returns:
+
+        `None`
+
+    '''
+    for f in fields:
+        for construct in f.constructs.filter_by_data().values():
+            data = construct.get_data(None)
+            if data is not None:
+                data._share_arrays(arrays)
+
+            get_bounds = getattr(construct, 'get_bounds', None)
+            if get_bounds is not None:
+                bounds = get_bounds(None)
+                if bounds is not None:
+                    data = bounds.get_data(None)
+                    if data is not None:
+                        data._share_arrays(arrays)
+            # --- End: if
+        # --- End: for
+    # --- End: for
+
+
+def _data_objects(fields):
+    '''Return the data of fields and of their metadata constructs.
+
+    .. versionadded:: 3.8.0
+
+    :Parameters:
+
+        fields: sequence of `Field`
+            The fields.
+
+    :Returns:
+
+        generator
+            The `Data` objects of the fields and of their metadata
+            constructs, including bounds and interior rings.
+
+    '''
+    for f in fields:
+        data = f.get_data(None)
+        if data is not None:
+            yield data
+
+        for construct in f.constructs.filter_by_data().values():
+            data = construct.get_data(None)
+            if data is not None:
+                yield data
+
+            for name in ('get_bounds', 'get_interior_ring'):
+                get = getattr(construct, name, None)
+                if get is None:
+                    continue
+
+                component = get(None)
+                if component is not None:
+                    data = component.get_data(None)
+                    if data is not None:
+                        yield data
+            # --- End: for
+        # --- End: for
+    # --- End: for
+
+
+def _cached_arrays_to_memory(fields):
+    '''Move partitions stored in temporary files into memory.
+
+    A partition that has been moved to a temporary file (see
+    `cf.TEMPDIR`) refers to a file that is deleted when the process
+    that created it exits. Such partitions are read back into memory,
+    and their temporary files deleted, before the fields are passed to
+    another process.
+
+    .. versionadded:: 3.8.0
+
+    :Parameters:
+
+        fields: sequence of `Field`
+            The fields. Their data are changed in place.
+
+    :Returns:
+
+        `None`
+
+    '''
+    for data in _data_objects(fields):
+        for partition in data.partitions.matrix.flat:
+            if partition.in_cached_file:
+                subarray = partition.subarray
+                partition.subarray = subarray[...]
+                _remove_temporary_files(subarray._partition_file)
+        # --- End: for
+    # --- End: for
+
+
+def _read_a_file_in_worker(filename, **kwargs):
+    '''Read the contents of a single file in a worker process.
+
+    The fields are read with `_read_a_file`, and any of their data
+    that have been moved to temporary files are moved back into
+    memory, because the worker process deletes its temporary files
+    when it exits.
+
+    .. versionadded:: 3.8.0
+
+    :Parameters:
+
+        filename: `str`
+            See `_read_a_file`.
+
+        kwargs: *optional*
+            See `_read_a_file`.
+
+    :Returns:
+
+        `FieldList`
+            The fields in the file.
+
+    '''
+    fields = _read_a_file(filename, **kwargs)
+    _cached_arrays_to_memory(fields)
+    return fields
+
+
 def _plural(n):  # pragma: no cover
     '''Return a suffix which reflects a word's plural.
 
@@ -760,7 +1258,7 @@ def _read_a_file(filename, ftype=None, aggregate=True,
                  verbose=None, warnings=False, external=None,
                  selected_fmt=None, um=None, extra=None,
                  height_at_top_of_model=None, chunk=True, mask=True,
-                 warn_valid=False):
+                 warn_valid=False, select=None):
     '''Read the contents of a single file into a field list.
 
     :Parameters:
@@ -788,6 +1286,14 @@ def _read_a_file(filename, ftype=None, aggregate=True,
 
             .. versionadded:: 3.4.0
 
+        select: sequence of `str` or `Query` or `re.Pattern`, optional
+            Do not create fields that could not be selected by these
+            criteria. The fields returned by `read` are still
+            selected after aggregation, so some fields that do not
+            satisfy the criteria may be returned.
+
+            .. versionadded:: 3.8.0
+
         verbose: `int` or `str` or `None`, optional
             If an integer from ``-1`` to ``3``, or an equivalent string
             equal ignoring case to one of:
@@ -827,6 +1333,7 @@ def _read_a_file(filename, ftype=None, aggregate=True,
     endian = None
     height_at_top_of_model = None
     umversion = 405
+    lazy = False
 
     if um:
         # ftype = 'UM'
@@ -835,6 +1342,7 @@ def _read_a_file(filename, ftype=None, aggregate=True,
         endian = um.get('endian')
         umversion = um.get('version')
         height_at_top_of_model = um.get('height_at_top_of_model')
+        lazy = bool(um.get('lazy'))
         if fmt in ('PP', 'pp', 'pP', 'Pp'):
             fmt = fmt.upper()
             # For PP format, there is a default word size and
@@ -846,7 +1354,9 @@ def _read_a_file(filename, ftype=None, aggregate=True,
                 endian = 'big'
         # --- End: if
 
-        if umversion is not None:
+        if umversion is None:
+            umversion = 405
+        else:
             umversion = float(str(umversion).replace('.', '0', 1))
 #    else:
 #        try:
@@ -869,6 +1379,7 @@ def _read_a_file(filename, ftype=None, aggregate=True,
         # then 'cfa' will be changed to True in
         # netcdf.read
         'cfa': False,
+        'select': select,
     }
 
     # ----------------------------------------------------------------
@@ -907,14 +1418,7 @@ def _read_a_file(filename, ftype=None, aggregate=True,
                          verbose=verbose, set_standard_name=False,
                          height_at_top_of_model=height_at_top_of_model,
                          fmt=fmt, word_size=word_size, endian=endian,
-                         chunk=chunk)  # , mask=mask, warn_valid=warn_valid)
-
-        # PP fields are aggregated intrafile prior to interfile
-        # aggregation
-        if aggregate:
-            # For PP fields, the default is strict_units=False
-            if 'strict_units' not in aggregate_options:
-                aggregate_options['relaxed_units'] = True
+                         chunk=chunk, select=select, lazy=lazy)  # , mask=mask, warn_valid=warn_valid)
     else:
         fields = ()
 
@@ -922,7 +1426,8 @@ def _read_a_file(filename, ftype=None, aggregate=True,
     # Check for cyclic dimensions
     # ----------------------------------------------------------------
     for f in fields:
-        f.autocyclic()
+        if not isinstance(f, LazyUMField):
+            f.autocyclic()
 
     # ----------------------------------------------------------------
     # Return the fields
@@ -1 +1 @@
-from .umread import UMRead
+from .umread import UMRead, LazyUMField
@@ -13,6 +13,7 @@ from numpy import array        as numpy_array
 from numpy import clip         as numpy_clip
 from numpy import column_stack as numpy_column_stack
 from numpy import cos          as numpy_cos
+from numpy import datetime64   as numpy_datetime64
 from numpy import deg2rad      as numpy_deg2rad
 from numpy import dtype        as numpy_dtype
 from numpy import empty        as numpy_empty
@@ -38,12 +39,14 @@ from ...decorators         import (_manage_log_level_via_verbosity,
                                    _manage_log_level_via_verbose_attr)
 from ...functions          import (equals, open_files_threshold_exceeded,
                                    close_one_file, abspath,
-                                   load_stash2standard_name)
+                                   _get_stash2standard_name)
 from ...functions import (atol as cf_atol,
                           rtol as cf_rtol)
 from ...units              import Units
+from ...constants          import _stash2standard_name_matches
 
 from ...data.data import Data, Partition, PartitionMatrix
+from ...field     import Field
 
 from ...data              import UMArray
 from ...data.functions    import _open_um_file, _close_um_file
@@ -355,6 +358,89 @@ _rotated_latitude_longitude_lbcodes = set((101, 102, 111))
 
 _axis = {'area': None}
 
+# --------------------------------------------------------------------
+# The number of days in a 365_day year before the start of each month
+# --------------------------------------------------------------------
+_365_day_month_start = numpy_array(
+    (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334))
+_365_day_month_length = numpy_array(
+    (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31))
+
+
+def _date2num(dates, year0, calendar):
+    '''Convert dates to days since the start of a given year.
+
+    The dates are converted with integer array arithmetic, which gives
+    the same values as `cftime.date2num`. Only the ``'360_day'`` and
+    ``'365_day'`` calendars, and the ``'gregorian'`` calendar after
+    its introduction, are supported.
+
+    .. versionadded:: 3.8.0
+
+    :Parameters:
+
+        dates: `numpy.ndarray`
+            The dates, one per row, as the header values
+            ``(year, month, day, hour, minute)``.
+
+        year0: `int`
+            The reference year. Times are days since the start of
+            this year.
+
+        calendar: `str`
+            The calendar.
+
+    :Returns:
+
+        `numpy.ndarray` or `None`
+            The times in days since the start of *year0*, or `None`
+            if the calendar is not supported or any date is not
+            valid.
+
+    **Examples:**
+
+    >>> _date2num(numpy.array([[1991, 2, 1, 12, 0]]), 1991, '360_day')
+    array([30.5])
+
+    '''
+    dates = dates.astype('int64')
+    year, month, day, hour, minute = dates.T
+
+    if not ((1 <= month) & (month <= 12) &
+            (0 <= hour) & (hour <= 23) &
+            (0 <= minute) & (minute <= 59)).all():
+        return
+
+    if calendar == '360_day':
+        month_length = 30
+        days = (year - year0) * 360 + (month - 1) * 30
+    elif calendar == '365_day':
+        month_length = _365_day_month_length[month - 1]
+        days = (year - year0) * 365 + _365_day_month_start[month - 1]
+    elif calendar == 'gregorian':
+        if year0 < 1583 or year.min() < 1583:
+            return
+
+        month_start = ((year - 1970).astype('datetime64[Y]') +
+                       (month - 1).astype('timedelta64[M]'))
+        month_length = (
+            (month_start + 1).astype('datetime64[D]') -
+            month_start.astype('datetime64[D]')
+        ).astype('int64')
+        days = (
+            month_start.astype('datetime64[D]') -
+            numpy_datetime64('{:04d}-01-01'.format(year0), 'D')
+        ).astype('int64')
+    else:
+        return
+
+    if not ((1 <= day) & (day <= month_length)).all():
+        return
+
+    minutes = (days + day - 1) * 1440 + hour * 60 + minute
+
+    return minutes / 1440.0
+
 
 class UMField:
     '''TODO
@@ -362,7 +448,7 @@ class UMField:
     '''
     def __init__(self, var, fmt, byte_ordering, word_size, um_version,
                  set_standard_name, height_at_top_of_model, verbose=None,
-                 implementation=None, **kwargs):
+                 implementation=None, select=None, lazy=False, **kwargs):
         '''**Initialization**
 
     :Parameters:
@@ -410,6 +496,20 @@ class UMField:
             increasing verbosity, the more description that is printed
             about the read process.
 
+        select: sequence of `str` or `Query` or `re.Pattern`, optional
+            Do not create field constructs that could not be selected
+            by these criteria, as tested by `is_selected`.
+
+            .. versionadded:: 3.8.0
+
+        lazy: `bool`, optional
+            If True then do not create the field construct of a
+            variable with one group of records, but instead set the
+            `lazy` attribute to a `LazyUMField` that is populated
+            when it is first needed.
+
+            .. versionadded:: 3.8.0
+
         kwargs: *optional*
             Keyword arguments providing extra CF properties for each
             return field constuct.
@@ -417,6 +517,8 @@ class UMField:
         '''
         self._bool = False
 
+        self.lazy = None
+
         self.implementation = implementation
 
         self.verbose = verbose
@@ -524,7 +626,6 @@ class UMField:
         LBCODE = int_hdr[lbcode]
         LBPROC = int_hdr[lbproc]
         LBVC = int_hdr[lbvc]
-        LBUSER5 = int_hdr[lbuser5]
         BPLAT = real_hdr[bplat]
         BPLON = real_hdr[bplon]
         BDX = real_hdr[bdx]
@@ -622,7 +723,8 @@ class UMField:
 
         # The STASH code has been set in the PP header, so try to find
         # its standard_name from the conversion table
-        stash_records = stash2standard_name.get((submodel, stash), None)
+        stash_record = self.stash_record(submodel, stash, LBCODE, BPLAT,
+                                         BPLON)
 
         um_Units = None
         um_condition = None
@@ -630,45 +732,32 @@ class UMField:
         long_name = None
         standard_name = None
 
-        if stash_records:
-            um_version = self.um_version
-            for (long_name,
-                 units,
-                 valid_from,
-                 valid_to,
-                 standard_name,
-                 cf_info,
-                 um_condition) in stash_records:
-
-                # Check that conditions are met
-                if not self.test_um_version(valid_from, valid_to, um_version):
-                    continue
-
-                if um_condition:
-                    if not self.test_um_condition(um_condition,
-                                                  LBCODE, BPLAT, BPLON):
-                        continue
-
-                # Still here? Then we have our standard_name, etc.
-#                if standard_name:
-#                    if set_standard_name:
-#                        cf_properties['standard_name'] = standard_name
-#                    else:
-#                        attributes['_standard_name'] = standard_name
-                if standard_name and set_standard_name:
-                    cf_properties['standard_name'] = standard_name
-
-                cf_properties['long_name'] = long_name.rstrip()
-
-                um_Units = _Units.get(units, None)
-                if um_Units is None:
-                    um_Units = Units(units)
-                    _Units[units] = um_Units
-
-                self.um_Units = um_Units
-                self.cf_info = cf_info
-
-                break
+        if stash_record is not None:
+            (long_name,
+             units,
+             valid_from,
+             valid_to,
+             standard_name,
+             cf_info,
+             um_condition) = stash_record
+
+#            if standard_name:
+#                if set_standard_name:
+#                    cf_properties['standard_name'] = standard_name
+#                else:
+#                    attributes['_standard_name'] = standard_name
+            if standard_name and set_standard_name:
+                cf_properties['standard_name'] = standard_name
+
+            cf_properties['long_name'] = long_name.rstrip()
+
+            um_Units = _Units.get(units, None)
+            if um_Units is None:
+                um_Units = Units(units)
+                _Units[units] = um_Units
+
+            self.um_Units = um_Units
+            self.cf_info = cf_info
         # --- End: if
 
         if stash:
@@ -691,13 +780,85 @@ class UMField:
         if long_name is None:
             cf_properties['long_name'] = identity
 
-        for recs, nz, nt in zip(groups, groups_nz, groups_nt):
+        # ------------------------------------------------------------
+        # Do not create field constructs that could not be selected
+        # ------------------------------------------------------------
+        if select and not self.is_selected(select, groups, cf_properties,
+                                           identity, standard_name,
+                                           submodel, kwargs):
+            return
+
+        self._create_args = dict(
+            var=var, groups=groups, groups_nz=groups_nz,
+            groups_nt=groups_nt, int_hdr=int_hdr, real_hdr=real_hdr,
+            cf_properties=cf_properties, attributes=attributes,
+            identity=identity, standard_name=standard_name,
+            set_standard_name=set_standard_name, submodel=submodel,
+            kwargs=kwargs)
+
+        if lazy and len(groups) == 1:
+            # --------------------------------------------------------
+            # Defer the creation of the field construct until it is
+            # needed
+            # --------------------------------------------------------
+            self.lazy = LazyUMField(self)
+            return
+
+        self.create_fields()
+
+    def create_fields(self):
+        '''Create the field constructs of the variable.
+
+    The field constructs are appended to the `fields` attribute.
+
+    .. versionadded:: 3.8.0
+
+    :Returns:
+
+        `list`
+            The field constructs.
+
+        '''
+        args = self._create_args
+        var = args['var']
+        int_hdr = args['int_hdr']
+        real_hdr = args['real_hdr']
+        cf_properties = args['cf_properties']
+        attributes = args['attributes']
+        identity = args['identity']
+        standard_name = args['standard_name']
+        set_standard_name = args['set_standard_name']
+        submodel = args['submodel']
+        kwargs = args['kwargs']
+
+        filename = self.filename
+        stash = self.stash
+        it = self.it
+        iz = self.iz
+        iy = self.iy
+        ix = self.ix
+        LBROW = self.lbrow
+        LBNPT = self.lbnpt
+        LBTIM = self.lbtim
+        LBPROC = self.lbproc
+        LBVC = self.lbvc
+        BPLAT = self.bplat
+        BPLON = self.bplon
+
+        for recs, nz, nt in zip(args['groups'], args['groups_nz'],
+                                args['groups_nt']):
             self.recs = recs
             self.nz = nz
             self.nt = nt
             self.z_recs = recs[:nz]
             self.t_recs = recs[::nz]
 
+            # Header columns for the Z and T records
+            headers = var.headers(recs)
+            self.z_int_hdr = headers['int_hdr'][:nz]
+            self.z_real_hdr = headers['real_hdr'][:nz]
+            self.t_int_hdr = headers['int_hdr'][::nz]
+
             LBUSER5 = recs[0].int_hdr.item(lbuser5,)
 
 #            self.cell_method_axis_name = {'area': 'area'}
@@ -715,7 +876,8 @@ class UMField:
             # Set some derived metadata quantities
             # --------------------------------------------------------
             logger.detail(self.__dict__)  # pragma: no cover
-            self.printfdr()      # pragma: no cover
+            if logger.isEnabledFor(logging.INFO):
+                self.printfdr()  # pragma: no cover
 
             # --------------------------------------------------------
             # Create the 'T' dimension coordinate
@@ -912,6 +1074,117 @@ class UMField:
 
         self._bool = True
 
+        return self.fields
+
+    def is_selected(self, select, groups, cf_properties, identity,
+                    standard_name, submodel, kwargs):
+        '''Whether or not the field constructs could be selected.
+
+    The *select* criteria are tested against the field constructs
+    returned by `header_fields`, so the variable's coordinates, data
+    and cell methods do not need to be created in order to reject it.
+
+    .. versionadded:: 3.8.0
+
+    :Parameters:
+
+        select: sequence of `str` or `Query` or `re.Pattern`
+            The criteria, as accepted by `cf.Field.match_by_identity`.
+
+        groups, cf_properties, identity, standard_name, submodel, kwargs:
+            See `header_fields`.
+
+    :Returns:
+
+        `bool`
+            True if any of the field constructs could be selected.
+
+        '''
+        for field in self.header_fields(groups, cf_properties, identity,
+                                        standard_name, submodel, kwargs):
+            if field.match_by_identity(*select):
+                return True
+        # --- End: for
+
+        return False
+
+    def header_fields(self, groups, cf_properties, identity,
+                      standard_name, submodel, kwargs):
+        '''Field constructs with the properties found from the PP headers.
+
+    The returned field constructs have no metadata constructs and no
+    data. There is one for each distinct missing data value of the
+    groups of records.
+
+    .. versionadded:: 3.8.0
+
+    :Parameters:
+
+        groups: `list`
+            The groups of records that each define a field construct.
+
+        cf_properties: `dict`
+            The CF properties derived from the STASH code.
+
+        identity: `str`
+            The field construct identity.
+
+        standard_name: `str` or `None`
+            The standard name derived from the STASH code.
+
+        submodel: `int`
+            The submodel identifier.
+
+        kwargs: `dict`
+            Extra CF properties for each field construct.
+
+    :Returns:
+
+        `list` of `Field`
+            The field constructs.
+
+        '''
+        properties = cf_properties.copy()
+        properties['Conventions'] = __Conventions__
+        properties['runid'] = self.decode_lbexp()
+        properties['lbproc'] = str(self.lbproc)
+        properties['lbtim'] = str(self.lbtim)
+        properties['stash_code'] = str(self.stash)
+        properties['submodel'] = str(submodel)
+        if standard_name:
+            properties['standard_name'] = standard_name
+
+        fill_values = []
+        for recs in groups:
+            fill_value = recs[0].real_hdr.item(bmdi,)
+            if fill_value == _BMDI_no_missing_data_value:
+                fill_value = None
+
+            if fill_value not in fill_values:
+                fill_values.append(fill_value)
+        # --- End: for
+
+        out = []
+        for fill_value in fill_values:
+            field = self.implementation.initialise_Field()
+
+            field_properties = properties.copy()
+            if fill_value is not None:
+                field_properties['_FillValue'] = fill_value
+
+            field_properties.update(kwargs)
+
+            self.implementation.set_properties(
+                field, field_properties, copy=False)
+            field.Units = self.um_Units
+            field.id = identity
+            self.implementation.nc_set_variable(field, identity)
+
+            out.append(field)
+        # --- End: for
+
+        return out
+
     def __bool__(self):
         '''x.__bool__() <==> bool(x)
 
@@ -993,16 +1266,12 @@ class UMField:
         '''
         field = self.field
 
+        z_real_hdr = self.z_real_hdr
+
         # "a" domain ancillary
-        array = numpy_array(
-            [rec.real_hdr[blev] for rec in self.z_recs],  # Zsea
-            dtype=float)
-        bounds0 = numpy_array(
-            [rec.real_hdr[brlev] for rec in self.z_recs],  # Zsea lower
-            dtype=float)
-        bounds1 = numpy_array(
-            [rec.real_hdr[brsvd1] for rec in self.z_recs],  # Zsea upper
-            dtype=float)
+        array = z_real_hdr[:, blev].astype(float)  # Zsea
+        bounds0 = z_real_hdr[:, brlev].astype(float)  # Zsea lower
+        bounds1 = z_real_hdr[:, brsvd1].astype(float)  # Zsea upper
         bounds = numpy_column_stack((bounds0, bounds1))
 
         # Insert new Z axis
@@ -1037,12 +1306,9 @@ class UMField:
                 field, dc, axes=[_axis['z']], copy=False)
 
         # "b" domain ancillary
-        array = numpy_array([rec.real_hdr[bhlev] for rec in self.z_recs],
-                            dtype=float)
-        bounds0 = numpy_array([rec.real_hdr[bhrlev] for rec in self.z_recs],
-                              dtype=float)
-        bounds1 = numpy_array([rec.real_hdr[brsvd2] for rec in self.z_recs],
-                              dtype=float)
+        array = z_real_hdr[:, bhlev].astype(float)
+        bounds0 = z_real_hdr[:, bhrlev].astype(float)
+        bounds1 = z_real_hdr[:, brsvd2].astype(float)
         bounds = numpy_column_stack((bounds0, bounds1))
 
         ac = self.implementation.initialise_DomainAncillary()
@@ -1088,12 +1354,11 @@ class UMField:
 
         field = self.field
 
-        array = numpy_array([rec.real_hdr[blev] for rec in self.z_recs],
-                            dtype=float)
-        bounds0 = numpy_array([rec.real_hdr[brlev] for rec in self.z_recs],
-                              dtype=float)
-        bounds1 = numpy_array([rec.real_hdr[brsvd1] for rec in self.z_recs],
-                              dtype=float)
+        z_real_hdr = self.z_real_hdr
+
+        array = z_real_hdr[:, blev].astype(float)
+        bounds0 = z_real_hdr[:, brlev].astype(float)
+        bounds1 = z_real_hdr[:, brsvd1].astype(float)
         bounds = numpy_column_stack((bounds0, bounds1))
 
         # Create Z domain axis construct
@@ -1110,12 +1375,9 @@ class UMField:
         self.implementation.set_auxiliary_coordinate(
             self.field, ac, axes=[_axis['z']], copy=False)
 
-        array = numpy_array([rec.real_hdr[bhlev] for rec in self.z_recs],
-                            dtype=float)
-        bounds0 = numpy_array([rec.real_hdr[bhrlev] for rec in self.z_recs],
-                              dtype=float)
-        bounds1 = numpy_array([rec.real_hdr[brsvd2] for rec in self.z_recs],
-                              dtype=float)
+        array = z_real_hdr[:, bhlev].astype(float)
+        bounds0 = z_real_hdr[:, bhrlev].astype(float)
+        bounds1 = z_real_hdr[:, brsvd2].astype(float)
         bounds = numpy_column_stack((bounds0, bounds1))
 
         # ac = AuxiliaryCoordinate()
@@ -1156,31 +1418,23 @@ class UMField:
         `DimensionCoordinate`
 
         '''
-        array = []
-        bounds = []
-        ak_array = []
-        ak_bounds = []
-        bk_array = []
-        bk_bounds = []
-
-        for rec in self.z_recs:
-            BLEV, BRLEV, BHLEV, BHRLEV, BULEV, BHULEV = self.header_bz(rec)
+        z_real_hdr = self.z_real_hdr.astype(float)
+        BLEV = z_real_hdr[:, blev]
+        BRLEV = z_real_hdr[:, brlev]
+        BHLEV = z_real_hdr[:, bhlev]
+        BHRLEV = z_real_hdr[:, bhrlev]
+        BULEV = z_real_hdr[:, brsvd1]
+        BHULEV = z_real_hdr[:, brsvd2]
 
-            array.append(BLEV + BHLEV/_pstar)
-            bounds.append([BRLEV + BHRLEV/_pstar, BULEV + BHULEV/_pstar])
+        array = BLEV + BHLEV/_pstar
+        bounds = numpy_column_stack((BRLEV + BHRLEV/_pstar,
+                                     BULEV + BHULEV/_pstar))
 
-            ak_array.append(BHLEV)
-            ak_bounds.append((BHRLEV, BHULEV))
+        ak_array = BHLEV
+        ak_bounds = numpy_column_stack((BHRLEV, BHULEV))
 
-            bk_array.append(BLEV)
-            bk_bounds.append((BRLEV, BULEV))
-
-        array = numpy_array(array, dtype=float)
-        bounds = numpy_array(bounds, dtype=float)
-        ak_array = numpy_array(ak_array, dtype=float)
-        ak_bounds = numpy_array(ak_bounds, dtype=float)
-        bk_array = numpy_array(bk_array, dtype=float)
-        bk_bounds = numpy_array(bk_bounds, dtype=float)
+        bk_array = BLEV
+        bk_bounds = numpy_column_stack((BRLEV, BULEV))
 
         # Insert new Z axis
         da = self.implementation.initialise_DomainAxis(size=array.size)
@@ -1427,6 +1681,37 @@ class UMField:
 
         return ctime
 
+    def ctimes(self):
+        '''Return the climatological times of the T records.
+
+    .. versionadded:: 3.8.0
+
+    .. seealso:: `ctime`
+
+    :Returns:
+
+        `numpy.ndarray`
+
+        '''
+        t_int_hdr = self.t_int_hdr
+        LBVTIME = t_int_hdr[:, lbyr:lbmin+1].astype('int64')
+        LBDTIME = t_int_hdr[:, lbyrd:lbmind+1].astype('int64')
+
+        # Set the year of the data time to the year of the validity
+        # time, or the year after if that would be earlier than the
+        # validity time
+        def _month_to_minute(x):
+            return ((x[:, 1] * 32 + x[:, 2]) * 24 + x[:, 3]) * 60 + x[:, 4]
+
+        LBDTIME[:, 0] = LBVTIME[:, 0]
+        LBDTIME[:, 0] += _month_to_minute(LBDTIME) < _month_to_minute(LBVTIME)
+
+        ctimes = _date2num(LBDTIME, self.int_hdr[lbyr], self.calendar)
+        if ctimes is None:
+            ctimes = numpy_array([self.ctime(rec) for rec in self.t_recs])
+
+        return ctimes
+
     def header_vtime(self, rec):
         '''Return the list [LBYR, LBMON, LBDAT, LBHR, LBMIN] for the given
     record.
@@ -1552,6 +1837,8 @@ class UMField:
         nt = self.nt
         recs = self.recs
 
+        data_shape = self.data_shape(nt, nz)
+
         units = self.um_Units
 
         data_type_in_file = self.data_type_in_file
@@ -1580,7 +1867,9 @@ class UMField:
                                 disk_length=rec.disk_length,
                                 fmt=self.fmt,
                                 word_size=self.word_size,
-                                byte_ordering=self.byte_ordering),
+                                byte_ordering=self.byte_ordering,
+                                int_hdr=rec.int_hdr.copy(),
+                                real_hdr=rec.real_hdr.copy()),
                         units=units,
                         fill_value=fill_value)
 
@@ -1612,11 +1901,9 @@ class UMField:
                 data_ndim = 3
                 if nz > 1:
                     pmaxes = [_axis[self.z_axis]]
-                    data_shape = (nz, LBROW, LBNPT)
                     data_size = nz * yx_size
                 else:
                     pmaxes = [_axis['t']]
-                    data_shape = (nt, LBROW, LBNPT)
                     data_size = nt * yx_size
 
                 partition_shape = [1, LBROW, LBNPT]
@@ -1636,7 +1923,9 @@ class UMField:
                                        disk_length=rec.disk_length,
                                        fmt=self.fmt,
                                        word_size=self.word_size,
-                                       byte_ordering=self.byte_ordering)
+                                       byte_ordering=self.byte_ordering,
+                                       int_hdr=rec.int_hdr.copy(),
+                                       real_hdr=rec.real_hdr.copy())
 
                     location = [(i, i+1), zero_to_LBROW, zero_to_LBNPT]
 
@@ -1665,7 +1954,6 @@ class UMField:
                 # 2-d partition matrix
                 # ----------------------------------------------------
                 pmaxes = [_axis['t'], _axis[self.z_axis]]
-                data_shape = (nt, nz, LBROW, LBNPT)
                 data_size = nt * nz * yx_size
                 data_ndim = 4
 
@@ -1689,7 +1977,9 @@ class UMField:
                                        disk_length=rec.disk_length,
                                        fmt=self.fmt,
                                        word_size=self.word_size,
-                                       byte_ordering=self.byte_ordering)
+                                       byte_ordering=self.byte_ordering,
+                                       int_hdr=rec.int_hdr.copy(),
+                                       real_hdr=rec.real_hdr.copy())
 
                     location = [(t, t+1), (z, z+1), zero_to_LBROW,
                                 zero_to_LBNPT]
@@ -1703,11 +1993,11 @@ class UMField:
                         part=empty_list,
                         Units=units))
 
-                    logger.info(
-                        "    location = {}, subarray[...].max() = {}".format(
-                            location, subarray[...].max()
-                        )
-                    )  # pragma: no cover
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info(
+                            "    location = {}, subarray[...].max() = "
+                            "{}".format(location, subarray[...].max())
+                        )  # pragma: no cover
                 # --- End: for
 
                 # Populate the 2-d partition matrix
@@ -1737,6 +2027,39 @@ class UMField:
 
         return data
 
+    def data_shape(self, nt, nz):
+        '''The shape of the data of a field construct.
+
+    .. versionadded:: 3.8.0
+
+    :Parameters:
+
+        nt: `int`
+            The number of T axis records.
+
+        nz: `int`
+            The number of Z axis records.
+
+    :Returns:
+
+        `tuple`
+            The data shape.
+
+    **Examples:**
+
+    >>> u.lbrow, u.lbnpt
+    (73, 96)
+    >>> u.data_shape(1, 1)
+    (73, 96)
+    >>> u.data_shape(1, 17)
+    (17, 73, 96)
+    >>> u.data_shape(12, 17)
+    (12, 17, 73, 96)
+
+        '''
+        return (tuple(int(n) for n in (nt, nz) if n > 1)
+                + (self.lbrow, self.lbnpt))
+
     def decode_lbexp(self):
         '''Decode the integer value of LBEXP in the PP header into a runid.
 
@@ -1833,6 +2156,26 @@ class UMField:
 
         return time
 
+    def dtimes(self):
+        '''Return the elapsed times since the data times of the T records.
+
+    .. versionadded:: 3.8.0
+
+    .. seealso:: `dtime`
+
+    :Returns:
+
+        `numpy.ndarray`
+
+        '''
+        dtimes = _date2num(self.t_int_hdr[:, lbyrd:lbmind+1],
+                           self.int_hdr[lbyr], self.calendar)
+        if dtimes is None:
+            dtimes = numpy_array([self.dtime(rec) for rec in self.t_recs],
+                                 dtype=float)
+
+        return dtimes
+
     def fdr(self):
         '''Return a the contents of PP field headers as strings.
 
@@ -1971,7 +2314,7 @@ class UMField:
         out : `AuxiliaryCoordinate` or `DimensionCoordinate` or `None`
 
     '''
-        array = tuple([rec.int_hdr.item(lblev,) for rec in self.z_recs])
+        array = tuple(self.z_int_hdr[:, lblev].tolist())
 
         key = array
         c = _cached_model_level_number_coordinate.get(key, None)
@@ -2067,9 +2410,7 @@ class UMField:
             array = numpy_array((LBUSER5,), dtype=self.int_hdr_dtype)
         else:
             # 'Z' aggregation has been done along the pseudolevel axis
-            array = numpy_array([rec.int_hdr.item(lbuser5,)
-                                 for rec in self.z_recs],
-                                dtype=self.int_hdr_dtype)
+            array = self.z_int_hdr[:, lbuser5].astype(self.int_hdr_dtype)
             self.z_axis = 'p'
 
         axiscode = 40
@@ -2172,6 +2513,71 @@ class UMField:
                                                      copy=copy)
         return dc
 
+    def stash_record(self, submodel, stash, LBCODE, BPLAT, BPLON):
+        '''Return the STASH to standard name conversion table record that
+    applies to the variable.
+
+    The first record of the STASH code whose UM version range and UM
+    condition are satisfied is returned. The choice is remembered for
+    each combination of the arguments, the UM version and the
+    tolerances used to test the UM condition.
+
+    .. versionadded:: 3.8.0
+
+    :Parameters:
+
+        submodel: `int`
+
+        stash: `int`
+
+        LBCODE: `int`
+
+        BPLAT: `float`
+
+        BPLON: `float`
+
+    :Returns:
+
+        `tuple` or `None`
+            The table record, or `None` if there is no record that
+            applies.
+
+        '''
+        um_version = self.um_version
+        key = (submodel, stash, um_version, LBCODE, BPLAT, BPLON,
+               self.atol, cf_rtol())
+
+        try:
+            return _stash2standard_name_matches[key]
+        except KeyError:
+            pass
+
+        stash_records = _get_stash2standard_name().get((submodel, stash),
+                                                       ())
+
+        out = None
+        for stash_record in stash_records:
+            valid_from, valid_to = stash_record[2:4]
+            um_condition = stash_record[6]
+
+            # Check that conditions are met
+            if not self.test_um_version(valid_from, valid_to, um_version):
+                continue
+
+            if um_condition:
+                if not self.test_um_condition(um_condition,
+                                              LBCODE, BPLAT, BPLON):
+                    continue
+
+            # Still here? Then we have our standard_name, etc.
+            out = stash_record
+            break
+        # --- End: for
+
+        _stash2standard_name_matches[key] = out
+
+        return out
+
     def test_um_condition(self, um_condition, LBCODE, BPLAT, BPLON):
         '''Return `True` if a field satisfies the condition specified for a
     STASH code to standard name conversion.
@@ -2281,10 +2687,8 @@ class UMField:
         `DimensionCoordinate`
 
         '''
-        recs = self.t_recs
-
-        vtimes = numpy_array([self.vtime(rec) for rec in recs], dtype=float)
-        dtimes = numpy_array([self.dtime(rec) for rec in recs], dtype=float)
+        vtimes = self.vtimes()
+        dtimes = self.dtimes()
 
         if numpy_isnan(vtimes.sum()) or numpy_isnan(dtimes.sum()):
             return  # ppp
@@ -2298,7 +2702,7 @@ class UMField:
         elif IB == 3:
             # The field is a time mean from T1 to T2 for each year
             # from LBYR to LBYRD
-            ctimes = numpy_array([self.ctime(rec) for rec in recs])
+            ctimes = self.ctimes()
             array = 0.5*(vtimes + ctimes)
             bounds = numpy_column_stack((vtimes, dtimes))
             climatology = True
@@ -2416,6 +2820,27 @@ class UMField:
 
         return time
 
+    def vtimes(self):
+        '''Return the elapsed times since the validity times of the T
+    records.
+
+    .. versionadded:: 3.8.0
+
+    .. seealso:: `vtime`
+
+    :Returns:
+
+        `numpy.ndarray`
+
+        '''
+        vtimes = _date2num(self.t_int_hdr[:, lbyr:lbmin+1],
+                           self.int_hdr[lbyr], self.calendar)
+        if vtimes is None:
+            vtimes = numpy_array([self.vtime(rec) for rec in self.t_recs],
+                                 dtype=float)
+
+        return vtimes
+
     def dddd(self):
         '''TODO
 
@@ -2650,11 +3075,10 @@ class UMField:
             'BRSVD1:'
         )  # pragma: no cover
 
-        z_recs = self.z_recs
-        array = tuple([rec.real_hdr.item(blev,) for rec in z_recs])
-        bounds0 = tuple(
-            [rec.real_hdr[brlev] for rec in z_recs])  # lower level boundary
-        bounds1 = tuple([rec.real_hdr[brsvd1] for rec in z_recs])  # bulev
+        z_real_hdr = self.z_real_hdr
+        array = z_real_hdr[:, blev]
+        bounds0 = z_real_hdr[:, brlev]  # lower level boundary
+        bounds1 = z_real_hdr[:, brsvd1]  # bulev
         if _coord_positive.get(axiscode, None) == 'down':
             bounds0, bounds1 = bounds1, bounds0
 
@@ -2691,7 +3115,8 @@ class UMField:
         self.implementation.set_dimension_coordinate(
             self.field, dc, axes=[_axis['z']], copy=copy)
 
-        logger.info('    ' + dc.dump(display=False))  # pragma: no cover
+        if logger.isEnabledFor(logging.INFO):
+            logger.info('    ' + dc.dump(display=False))  # pragma: no cover
 
         return dc
 
@@ -2755,6 +3180,231 @@ class UMField:
 
 # --- End: class
 
+
+class LazyUMField(Field):
+    '''A field construct of a UM variable that is populated when needed.
+
+    The field construct is initialised with only the CF properties
+    and units that can be found from the PP headers. Its identities,
+    properties, STASH code, LBPROC, LBTIM and data shape may be
+    inspected, and it may be selected, without reading any more of
+    the file.
+
+    The field construct is populated with its data and metadata
+    constructs the first time that any other attribute is accessed,
+    after which it is a `Field` instance.
+
+    .. versionadded:: 3.8.0
+
+    **Examples:**
+
+    >>> f = cf.read('file.ff', um={'lazy': True}, aggregate=False)[0]
+    >>> f
+    <CF LazyUMField: air_temperature(17, 73, 96) K>
+    >>> f.data
+    <CF Data(17, 73, 96): [[[249.5, ..., 293.75]]] K>
+    >>> f
+    <CF Field: air_temperature(air_pressure(17), latitude(73), longitude(96)) K>
+
+    '''
+    # The variable whose field construct has not yet been populated
+    _um = None
+
+    def __init__(self, um):
+        '''**Initialization**
+
+    :Parameters:
+
+        um: `UMField`
+            The variable, whose field construct creation has been
+            deferred.
+
+        '''
+        args = um._create_args
+
+        header_field = um.header_fields(
+            args['groups'], args['cf_properties'], args['identity'],
+            args['standard_name'], args['submodel'], args['kwargs'])[0]
+
+        super().__init__(source=header_field, copy=False)
+
+        self.stash_code = um.stash
+        self.lbproc = um.lbproc
+        self.lbtim = um.lbtim
+
+        self._lazy_shape = um.data_shape(args['groups_nt'][0],
+                                         args['groups_nz'][0])
+        self._um = um
+
+    def __getattribute__(self, attr):
+        '''x.__getattribute__(attr) <==> x.attr
+
+    Accessing a public attribute that can not be found from the PP
+    headers populates the field construct.
+
+        '''
+        if (attr[0] != '_' and attr not in _lazy_attributes
+                and object.__getattribute__(self, '_um') is not None):
+            # Note that the populated field construct is a Field
+            # instance, so super() can not be used hereafter
+            object.__getattribute__(self, '_populate')()
+
+        return Field.__getattribute__(self, attr)
+
+    def __setattr__(self, attr, value):
+        '''x.__setattr__(attr, value) <==> x.attr=value
+
+    Setting a public attribute populates the field construct.
+
+        '''
+        if attr[0] != '_' and self._um is not None:
+            self._populate()
+
+        Field.__setattr__(self, attr, value)
+
+    def __delattr__(self, attr):
+        '''x.__delattr__(attr) <==> del x.attr
+
+    Deleting a public attribute populates the field construct.
+
+        '''
+        if attr[0] != '_' and self._um is not None:
+            self._populate()
+
+        Field.__delattr__(self, attr)
+
+    def __repr__(self):
+        '''x.__repr__() <==> repr(x)
+
+        '''
+        units = getattr(self.Units, 'units', None)
+        if units is None:
+            units = ''
+
+        return '<CF {0}: {1}{2} {3}>'.format(
+            self.__class__.__name__, self.identity(''), self.shape,
+            units)
+
+    def _populate(self):
+        '''Populate the field construct with its data and metadata
+    constructs.
+
+    The file descriptor of the UM file is only open for the duration
+    of the creation of the field construct. Once populated, the
+    instance becomes a `Field`.
+
+    :Returns:
+
+        `None`
+
+        '''
+        um = self._um
+        umfile = um._create_args['var'].file
+
+        close = umfile.fd is None
+        umfile.open_fd()
+        try:
+            field = um.create_fields()[0]
+        finally:
+            if close:
+                umfile.close_fd()
+        # --- End: try
+
+        # Release the records and headers
+        um._create_args = None
+        self._um = None
+        del self._lazy_shape
+
+        standard_name = field._custom.pop('standard_name', None)
+        if standard_name is not None:
+            field.set_property('standard_name', standard_name)
+
+        super().__init__(source=field, copy=False)
+
+        self.__class__ = Field
+
+        self.autocyclic()
+
+    @property
+    def Units(self):
+        '''The `cf.Units` object containing the units of the data array.
+
+        '''
+        if self._um is None:
+            # Initialising or populating the field construct
+            return super().Units
+
+        return self._custom['Units']
+
+    @Units.setter
+    def Units(self, value):
+        Field.Units.fset(self, value)
+
+    @Units.deleter
+    def Units(self):
+        Field.Units.fdel(self)
+
+    @property
+    def shape(self):
+        '''The shape of the data.
+
+        '''
+        return self._lazy_shape
+
+    @property
+    def ndim(self):
+        '''The number of data dimensions.
+
+        '''
+        return len(self._lazy_shape)
+
+    @property
+    def size(self):
+        '''The number of elements in the data.
+
+        '''
+        size = 1
+        for n in self._lazy_shape:
+            size *= n
+
+        return size
+
+# --- End: class
+
+
+# Attributes of a lazy UM field construct that may be accessed without
+# populating it
+_lazy_attributes = frozenset((
+    'Flags',
+    'T',
+    'Units',
+    'X',
+    'Y',
+    'Z',
+    'calendar',
+    'flag_masks',
+    'flag_meanings',
+    'flag_values',
+    'get_property',
+    'has_property',
+    'id',
+    'identities',
+    'identity',
+    'lbproc',
+    'lbtim',
+    'match_by_identity',
+    'match_by_ncvar',
+    'match_by_property',
+    'nc_get_variable',
+    'nc_has_variable',
+    'ndim',
+    'properties',
+    'shape',
+    'size',
+    'stash_code',
+    'units',
+))
+
 # _stash2standard_name = {}
 #
 # def load_stash2standard_name(table=None, delimiter='!', merge=True):
@@ -2883,12 +3533,6 @@ class UMField:
 #     _stash2standard_name.update(stash2sn)
 
 
-# ---------------------------------------------------------------------
-# Create the STASH code to standard_name conversion dictionary
-# ---------------------------------------------------------------------
-stash2standard_name = load_stash2standard_name()
-
-
 class UMRead(cfdm.read_write.IORead):
     '''TODO
 
@@ -2897,7 +3541,7 @@ class UMRead(cfdm.read_write.IORead):
     def read(self, filename, um_version=405, aggregate=True,
              endian=None, word_size=None, set_standard_name=True,
              height_at_top_of_model=None, fmt=None, chunk=True,
-             verbose=None):
+             verbose=None, select=None, lazy=False):
         '''Read fields from a PP file or UM fields file.
 
     The file may be big or little endian, 32 or 64 bit
@@ -2946,6 +3590,21 @@ class UMRead(cfdm.read_write.IORead):
 
         set_standard_name: `bool`, optional
 
+        select: sequence of `str` or `Query` or `re.Pattern`, optional
+            Do not create field constructs that could not be selected
+            by these criteria. Unselected variables are identified
+            from their PP headers alone.
+
+            .. versionadded:: 3.8.0
+
+        lazy: `bool`, optional
+            If True then return a `LazyUMField` in place of the field
+            construct of each variable that forms a single field
+            construct, so that its coordinates, data and cell methods
+            are only created when they are needed.
+
+            .. versionadded:: 3.8.0
+
     :Returns:
 
         `list`
@@ -2981,11 +3640,19 @@ class UMRead(cfdm.read_write.IORead):
         um = [UMField(var, f.fmt, f.byte_ordering, f.word_size,
                       um_version, set_standard_name, history=history,
                       height_at_top_of_model=height_at_top_of_model,
-                      verbose=verbose,
+                      verbose=verbose, select=select, lazy=lazy,
                       implementation=self.implementation)
               for var in f.vars]
 
-        return [field for x in um for field in x.fields if field]
+        out = []
+        for x in um:
+            if x.lazy is not None:
+                out.append(x.lazy)
+            else:
+                out.extend(field for field in x.fields if field)
+        # --- End: for
+
+        return out
 
     def is_um_file(self, filename):
         '''Whether or not a file is a PP file or UM fields file.
@@ -4,10 +4,20 @@ from numpy import empty as numpy_empty
 from numpy import where as numpy_where
 from numpy import sum as numpy_sum
 from numpy import finfo as numpy_finfo
+from numpy import concatenate as numpy_concatenate
+
+try:
+    from scipy.sparse import csr_matrix as scipy_csr_matrix
+except ImportError:
+    pass
+
 from .data.data import Data
 from .dimensioncoordinate import DimensionCoordinate
 from .functions import regrid_logging
 from . import _found_ESMF
+from . import mpi_on
+if mpi_on:
+    from . import mpi_comm
 if _found_ESMF:
     try:
         import ESMF
@@ -22,7 +32,8 @@ class Regrid:
     '''
 
     def __init__(self, srcfield, dstfield, srcfracfield, dstfracfield,
-                 method='conservative_1st', ignore_degenerate=False):
+                 method='conservative_1st', ignore_degenerate=False,
+                 factors=False):
         '''Creates a handle for regridding fields from a source grid to a
     destination grid that can then be used by the run_regridding method.
 
@@ -60,6 +71,11 @@ class Regrid:
         ignore_degenerate: `bool`, optional
             Whether to check for degenerate points.
 
+        factors: `bool`, optional
+            If True then keep the regridding weights, so that they
+            may be retrieved with `get_weights`. Requires ESMPy
+            version 8.0.0 or later.
+
         '''
         # create a handle to the regridding method
         regrid_method_map = {
@@ -77,6 +93,12 @@ class Regrid:
         # could mislead or confuse for Cartesian regridding in 1D or 3D.
         regrid_method = regrid_method_map.get(
             method, ValueError('Regrid method not recognised.'))
+        # Only request the factors when needed, since older versions
+        # of ESMPy do not recognise the keyword
+        kwargs = {}
+        if factors:
+            kwargs['factors'] = True
+
         # Initialise the regridder. This also creates the
         # weights needed for the regridding.
         self.regridSrc2Dst = ESMF.Regrid(
@@ -85,7 +107,63 @@ class Regrid:
             dst_mask_values=numpy_array([0], dtype='int32'),
             src_frac_field=srcfracfield, dst_frac_field=dstfracfield,
             unmapped_action=ESMF.UnmappedAction.IGNORE,
-            ignore_degenerate=ignore_degenerate)
+            ignore_degenerate=ignore_degenerate, **kwargs)
+
+    def get_weights(self, src_size, dst_size):
+        '''Return the regridding weights as a sparse matrix.
+
+    The regridder must have been created with ``factors=True``.
+
+    :Parameters:
+
+        src_size: `int`
+            The number of points in the source grid.
+
+        dst_size: `int`
+            The number of points in the destination grid.
+
+    When ESMF is running in parallel, each process holds only part of
+    the weights, and the weights from every process are combined, so
+    this method must be called on all processes.
+
+    :Returns:
+
+        `scipy.sparse.csr_matrix`
+            The weights, with one row for each destination grid point
+            and one column for each source grid point. The grid points
+            are ordered as the elements of the grid arrays flattened
+            in Fortran (column-major) order, i.e. ESMF sequence index
+            order.
+
+        '''
+        try:
+            scipy_csr_matrix
+        except NameError:
+            raise ImportError(
+                "Must install scipy to retrieve regridding weights")
+
+        w = self.regridSrc2Dst.get_weights_dict(deep_copy=True)
+        weights = w['weights']
+        row = w['row_dst']
+        col = w['col_src']
+
+        if Regrid.initialize().pet_count > 1:
+            # ESMF is running in parallel: The sequence indices are
+            # for the whole grids, so the weights held by each
+            # process may be combined into the full matrix
+            if not mpi_on:
+                raise RuntimeError(
+                    "Must install mpi4py to retrieve regridding weights "
+                    "when ESMF is running in parallel")
+
+            weights, row, col = zip(*mpi_comm.allgather((weights, row, col)))
+            weights = numpy_concatenate(weights)
+            row = numpy_concatenate(row)
+            col = numpy_concatenate(col)
+
+        # ESMF sequence indices start at 1
+        return scipy_csr_matrix((weights, (row - 1, col - 1)),
+                                shape=(dst_size, src_size))
 
     def destroy(self):
         '''Free the memory associated with the ESMF.Regrid instance.
@@ -114,6 +192,41 @@ class Regrid:
 
         return manager
 
+    @staticmethod
+    def local_array(grid, staggerloc, array):
+        '''Return the part of a global grid array held by this process.
+
+    When ESMF is running in parallel, each process holds only part of
+    each grid. Otherwise the whole array is returned.
+
+    .. versionadded:: 3.8.0
+
+    :Parameters:
+
+        grid: ESMF.Grid
+            The ESMPy grid.
+
+        staggerloc: ESMF.StaggerLoc
+            The stagger location of the array.
+
+        array: `numpy.ndarray`
+            The array for the whole grid. A dimension of size 1 is
+            broadcast across the grid.
+
+    :Returns:
+
+        `numpy.ndarray`
+            The part of the array held by this process.
+
+        '''
+        lower = grid.lower_bounds[staggerloc]
+        upper = grid.upper_bounds[staggerloc]
+
+        return array[tuple(
+            slice(None) if n == 1 else slice(lb, ub)
+            for n, lb, ub in zip(array.shape, lower, upper)
+        )]
+
     @staticmethod
     def create_grid(coords, use_bounds, mask=None, cartesian=False,
                     cyclic=False, coords_2D=False, coord_order=None):
@@ -243,45 +356,57 @@ class Regrid:
             else:
                 grid = ESMF.Grid(max_index, staggerloc=staggerLocs)
 
-            # Populate grid centres
+            # Populate grid centres. When ESMF is running in parallel,
+            # each process holds only part of the grid.
             x, y = 0, 1
-            gridXCentre = grid.get_coords(x, staggerloc=ESMF.StaggerLoc.CENTER)
-            gridYCentre = grid.get_coords(y, staggerloc=ESMF.StaggerLoc.CENTER)
+            center = ESMF.StaggerLoc.CENTER
+            corner = ESMF.StaggerLoc.CORNER
+            gridXCentre = grid.get_coords(x, staggerloc=center)
+            gridYCentre = grid.get_coords(y, staggerloc=center)
             if not coords_2D:
-                gridXCentre[...] = lon.array.reshape((lon.size, 1))
-                gridYCentre[...] = lat.array.reshape((1, lat.size))
+                gridXCentre[...] = Regrid.local_array(
+                    grid, center, lon.array.reshape((lon.size, 1)))
+                gridYCentre[...] = Regrid.local_array(
+                    grid, center, lat.array.reshape((1, lat.size)))
             else:
-                gridXCentre[...] = lon.transpose(x_order).array
-                gridYCentre[...] = lat.transpose(y_order).array
+                gridXCentre[...] = Regrid.local_array(
+                    grid, center, lon.transpose(x_order).array)
+                gridYCentre[...] = Regrid.local_array(
+                    grid, center, lat.transpose(y_order).array)
 
             # Populate grid corners if there are bounds
             if use_bounds:
-                gridCorner = grid.coords[ESMF.StaggerLoc.CORNER]
+                gridCorner = grid.coords[corner]
                 if not coords_2D:
                     if cyclic:
-                        gridCorner[x][...] = x_bounds[:, 0].reshape(
-                            lon.size, 1)
+                        gridCorner[x][...] = Regrid.local_array(
+                            grid, corner,
+                            x_bounds[:, 0].reshape(lon.size, 1))
                     else:
                         n = x_bounds.shape[0]
                         tmp_x = numpy_empty(n + 1)
                         tmp_x[:n] = x_bounds[:, 0]
                         tmp_x[n] = x_bounds[-1, 1]
-                        gridCorner[x][...] = tmp_x.reshape(lon.size + 1, 1)
+                        gridCorner[x][...] = Regrid.local_array(
+                            grid, corner, tmp_x.reshape(lon.size + 1, 1))
 
                     n = y_bounds.shape[0]
                     tmp_y = numpy_empty(n + 1)
                     tmp_y[:n] = y_bounds[:, 0]
                     tmp_y[n] = y_bounds[-1, 1]
-                    gridCorner[y][...] = tmp_y.reshape(1, lat.size + 1)
+                    gridCorner[y][...] = Regrid.local_array(
+                        grid, corner, tmp_y.reshape(1, lat.size + 1))
                 else:
-                    gridCorner = grid.coords[ESMF.StaggerLoc.CORNER]
+                    gridCorner = grid.coords[corner]
                     x_bounds = x_bounds.transpose(x_order)
                     y_bounds = y_bounds.transpose(y_order)
                     if cyclic:
                         x_bounds = x_bounds[:-1, :]
                         y_bounds = y_bounds[:-1, :]
-                    gridCorner[x][...] = x_bounds
-                    gridCorner[y][...] = y_bounds
+                    gridCorner[x][...] = Regrid.local_array(
+                        grid, corner, x_bounds)
+                    gridCorner[y][...] = Regrid.local_array(
+                        grid, corner, y_bounds)
             # --- End: if
         else:
             # Test the dimensionality of the list of coordinates
@@ -329,24 +454,25 @@ class Regrid:
             grid = ESMF.Grid(max_index, coord_sys=ESMF.CoordSys.CART,
                              staggerloc=staggerLocs)
 
-            # Populate the grid centres
+            # Populate the grid centres. When ESMF is running in
+            # parallel, each process holds only part of the grid.
+            if ndim < 3:
+                center = ESMF.StaggerLoc.CENTER
+                corner = ESMF.StaggerLoc.CORNER
+            else:
+                center = ESMF.StaggerLoc.CENTER_VCENTER
+                corner = ESMF.StaggerLoc.CORNER_VFACE
+
             for d in range(0, ndim):
-                if ndim < 3:
-                    gridCentre = grid.get_coords(
-                        d, staggerloc=ESMF.StaggerLoc.CENTER)
-                else:
-                    gridCentre = grid.get_coords(
-                        d, staggerloc=ESMF.StaggerLoc.CENTER_VCENTER)
-                gridCentre[...] = coords[d].array.reshape(
-                    [shape[d] if x == d else 1 for x in range(0, ndim)])
+                gridCentre = grid.get_coords(d, staggerloc=center)
+                gridCentre[...] = Regrid.local_array(
+                    grid, center, coords[d].array.reshape(
+                        [shape[d] if x == d else 1 for x in range(0, ndim)]))
             # --- End: for
 
             # Populate grid corners
             if use_bounds:
-                if ndim < 3:
-                    gridCorner = grid.coords[ESMF.StaggerLoc.CORNER]
-                else:
-                    gridCorner = grid.coords[ESMF.StaggerLoc.CORNER_VFACE]
+                gridCorner = grid.coords[corner]
 
                 for d in range(0, ndim):
                     # boundsD = coords[d].get_bounds(create=True).array
@@ -362,9 +488,10 @@ class Regrid:
                         tmp[-1] = boundsD[-1, 1]
                         boundsD = tmp
 
-                    gridCorner[d][...] = boundsD.reshape(
-                        [shape[d] + 1 if x == d else 1
-                         for x in range(0, ndim)])
+                    gridCorner[d][...] = Regrid.local_array(
+                        grid, corner, boundsD.reshape(
+                            [shape[d] + 1 if x == d else 1
+                             for x in range(0, ndim)]))
             # --- End: if
         # --- End: if
 
@@ -372,7 +499,7 @@ class Regrid:
         if mask is not None:
             gmask = grid.add_item(ESMF.GridItem.MASK)
             gmask[...] = 1
-            gmask[mask] = 0
+            gmask[Regrid.local_array(grid, ESMF.StaggerLoc.CENTER, mask)] = 0
 
         return grid
 
@@ -0,0 +1,657 @@
+import pickle
+
+from copy import deepcopy
+
+from numpy import array as numpy_array
+from numpy import broadcast_to as numpy_broadcast_to
+from numpy import diff as numpy_diff
+from numpy import errstate as numpy_errstate
+from numpy import float64 as numpy_float64
+
+from numpy.ma import getmaskarray as numpy_ma_getmaskarray
+from numpy.ma import filled as numpy_ma_filled
+from numpy.ma import is_masked as numpy_ma_is_masked
+from numpy.ma import MaskedArray as numpy_ma_MaskedArray
+
+try:
+    from scipy.sparse import csr_matrix as scipy_csr_matrix
+    from scipy.sparse import kron as scipy_kron
+except ImportError:
+    pass
+
+from .functions import inspect as cf_inspect
+
+
+# --------------------------------------------------------------------
+# Conservative regridding methods, for which the regridded values are
+# normalised by the fraction of each destination cell that is covered
+# by non-missing source cells
+# --------------------------------------------------------------------
+_conservative_methods = set((
+    'conservative',
+    'conservative_1st',
+    'conservative_2nd',
+))
+
+# --------------------------------------------------------------------
+# Regridding methods for which the weights of non-missing source
+# points depend on which other source points are missing
+# --------------------------------------------------------------------
+_mask_dependent_methods = set((
+    'conservative_2nd',
+    'patch',
+))
+
+
+class RegridOperator:
+    '''A regrid operator between a source and a destination grid.
+
+    A regrid operator contains the regridding weights, as a sparse
+    matrix, that map data values on a source grid to data values on a
+    destination grid, together with the description of the
+    destination grid. Creating the weights is usually by far the most
+    expensive part of regridding, so a regrid operator allows the
+    weights to be created once and then reused for any number of
+    field constructs that share the same source grid.
+
+    A regrid operator is created by setting the *return_operator*
+    parameter of `cf.Field.regrids` or `cf.Field.regridc`, and is
+    applied by passing it as the destination grid to the same method
+    with which it was created. Applying a regrid operator does not
+    require the `ESMPy` package.
+
+    A regrid operator may be saved to a file with `save` and restored
+    with `load`.
+
+    .. versionadded:: 3.8.0
+
+    .. seealso:: `cf.Field.regridc`, `cf.Field.regrids`
+
+    **Examples:**
+
+    >>> op = f.regrids(g, 'conservative', return_operator=True)
+    >>> op
+    <CF RegridOperator: spherical conservative (96, 73) to (144, 91)>
+    >>> h = f.regrids(op)
+    >>> op.save('regrid_operator.pkl')
+
+    and later:
+
+    >>> op = cf.RegridOperator.load('regrid_operator.pkl')
+    >>> h2 = f2.regrids(op)
+
+    '''
+    def __init__(self, weights, method, src_shape, dst_shape,
+                 coord_sys='spherical', src_signature=None,
+                 parameters=None, src_mask=None, axis_weights=None):
+        '''**Initialization**
+
+    :Parameters:
+
+        weights: array_like
+            The regridding weights, as a sparse matrix (or any object
+            accepted by `scipy.sparse.csr_matrix`) with one row for
+            each destination grid point and one column for each source
+            grid point. The grid points are ordered as the elements of
+            the grid arrays flattened in Fortran (column-major) order.
+
+            May be `None` if the *axis_weights* parameter is set.
+
+        method: `str`
+            The regridding method used to create the weights.
+
+        src_shape: sequence of `int`
+            The shape of the source grid.
+
+        dst_shape: sequence of `int`
+            The shape of the destination grid.
+
+        coord_sys: `str`, optional
+            The coordinate system of the grids, either
+            ``'spherical'`` or ``'Cartesian'``.
+
+        src_signature: optional
+            A description of the source grid coordinates that must be
+            matched by any field construct regridded by the operator.
+
+        parameters: `dict`, optional
+            The description of the destination grid, and any other
+            parameters needed to create the regridded field construct.
+
+        src_mask: array_like, optional
+            The source grid mask with which the weights were created,
+            for regridding methods whose weights depend on the source
+            mask. True elements correspond to missing source points.
+
+        axis_weights: sequence of array_like, optional
+            For two dimensional grids whose weights are separable, the
+            weights of each grid axis, in the order of the grid
+            axes. Each is a matrix (or any object accepted by
+            `scipy.sparse.csr_matrix`) with one row for each
+            destination point and one column for each source point of
+            its axis. The weights of the grids are then the Kronecker
+            product of the second and the first axis weights, and are
+            applied to data one axis at a time.
+
+        '''
+        try:
+            scipy_csr_matrix
+        except NameError:
+            raise ImportError(
+                "Must install scipy to create a regrid operator")
+
+        src_shape = tuple(src_shape)
+        dst_shape = tuple(dst_shape)
+
+        src_size = 1
+        for n in src_shape:
+            src_size *= n
+
+        dst_size = 1
+        for n in dst_shape:
+            dst_size *= n
+
+        if axis_weights is not None:
+            axis_weights = tuple(scipy_csr_matrix(w, dtype=numpy_float64)
+                                 for w in axis_weights)
+            if len(axis_weights) != 2:
+                raise ValueError(
+                    "Can't create regrid operator: Must provide the "
+                    "weights of exactly two grid axes")
+
+            if (tuple(w.shape[1] for w in axis_weights) != src_shape or
+                    tuple(w.shape[0] for w in axis_weights) != dst_shape):
+                raise ValueError(
+                    "Can't create regrid operator: Axis weights matrix "
+                    "shapes {} do not match source grid shape {} and "
+                    "destination grid shape {}".format(
+                        tuple(w.shape for w in axis_weights),
+                        src_shape, dst_shape)
+                )
+
+            if weights is None:
+                weights = scipy_kron(axis_weights[1], axis_weights[0])
+        # --- End: if
+
+        weights = scipy_csr_matrix(weights, dtype=numpy_float64)
+        if weights.shape != (dst_size, src_size):
+            raise ValueError(
+                "Can't create regrid operator: Weights matrix shape {} "
+                "does not match source grid shape {} and destination "
+                "grid shape {}".format(weights.shape, src_shape, dst_shape)
+            )
+
+        if parameters is None:
+            parameters = {}
+
+        if src_mask is not None:
+            src_mask = numpy_array(src_mask, dtype=bool)
+            if src_mask.size != src_size:
+                raise ValueError(
+                    "Can't create regrid operator: Source mask shape {} "
+                    "does not match source grid shape {}".format(
+                        src_mask.shape, src_shape)
+                )
+        # --- End: if
+
+        self._weights = weights
+        self._method = method
+        self._src_shape = src_shape
+        self._dst_shape = dst_shape
+        self._coord_sys = coord_sys
+        self._src_signature = src_signature
+        self._parameters = parameters
+        self._src_mask = src_mask
+        self._axis_weights = axis_weights
+
+    def __repr__(self):
+        '''Called by the `repr` built-in function.
+
+    x.__repr__() <==> repr(x)
+
+        '''
+        return '<CF {}: {}>'.format(self.__class__.__name__, self)
+
+    def __str__(self):
+        '''Called by the `str` built-in function.
+
+    x.__str__() <==> str(x)
+
+        '''
+        return '{} {} {} to {}'.format(self._coord_sys, self._method,
+                                       self._src_shape, self._dst_shape)
+
+    # ----------------------------------------------------------------
+    # Attributes
+    # ----------------------------------------------------------------
+    @property
+    def coord_sys(self):
+        '''The coordinate system of the grids.
+
+    Either ``'spherical'`` or ``'Cartesian'``.
+
+    **Examples:**
+
+    >>> op.coord_sys
+    'spherical'
+
+        '''
+        return self._coord_sys
+
+    @property
+    def dst_shape(self):
+        '''The shape of the destination grid.
+
+    **Examples:**
+
+    >>> op.dst_shape
+    (144, 91)
+
+        '''
+        return self._dst_shape
+
+    @property
+    def method(self):
+        '''The regridding method.
+
+    **Examples:**
+
+    >>> op.method
+    'conservative'
+
+        '''
+        return self._method
+
+    @property
+    def src_mask(self):
+        '''The source grid mask with which the weights were created.
+
+    `None` if the weights were created for an unmasked source grid.
+
+    **Examples:**
+
+    >>> print(op.src_mask)
+    None
+
+        '''
+        return self._src_mask
+
+    @property
+    def src_shape(self):
+        '''The shape of the source grid.
+
+    **Examples:**
+
+    >>> op.src_shape
+    (96, 73)
+
+        '''
+        return self._src_shape
+
+    @property
+    def weights(self):
+        '''The regridding weights.
+
+    A `scipy.sparse.csr_matrix` with one row for each destination grid
+    point and one column for each source grid point, where the grid
+    points are ordered as the elements of the grid arrays flattened in
+    Fortran (column-major) order.
+
+    **Examples:**
+
+    >>> op.weights
+    <13104x7008 sparse matrix of type '<class 'numpy.float64'>'
+            with 31104 stored elements in Compressed Sparse Row format>
+
+        '''
+        return self._weights
+
+    # ----------------------------------------------------------------
+    # Methods
+    # ----------------------------------------------------------------
+    def _check_source(self, coord_sys, src_signature):
+        '''Check that a source grid matches that of the operator.
+
+    :Parameters:
+
+        coord_sys: `str`
+            The coordinate system of the source grid.
+
+        src_signature:
+            The description of the source grid coordinates.
+
+    :Returns:
+
+        `None`
+
+        '''
+        if coord_sys != self._coord_sys:
+            raise ValueError(
+                "Can't regrid with a {} regrid operator: Regridding is "
+                "{}".format(self._coord_sys, coord_sys)
+            )
+
+        if src_signature != self._src_signature:
+            raise ValueError(
+                "Can't regrid with {!r}: The source grid is different to "
+                "the one used to create the regrid operator".format(self)
+            )
+
+    def _dot(self, x):
+        '''Multiply flattened source grids by the weights.
+
+    :Parameters:
+
+        x: `numpy.ndarray`
+            The source grids, with one row for each source grid point
+            and one column for each grid.
+
+    :Returns:
+
+        `numpy.ndarray`
+            The product, with one row for each destination grid point
+            and one column for each grid.
+
+        '''
+        axis_weights = self._axis_weights
+        if axis_weights is None:
+            return self._weights.dot(x)
+
+        # Apply separable weights one axis at a time
+        wx, wy = axis_weights
+        src_nx, src_ny = self._src_shape
+        dst_nx, dst_ny = self._dst_shape
+        n = x.shape[-1]
+
+        x = x.reshape((src_nx, src_ny, n), order='F')
+        x = wx.dot(x.reshape(src_nx, src_ny * n))
+        x = x.reshape(dst_nx, src_ny, n).transpose(1, 0, 2)
+        x = wy.dot(x.reshape(src_ny, dst_nx * n))
+        x = x.reshape(dst_ny, dst_nx, n).transpose(1, 0, 2)
+
+        return x.reshape((dst_nx * dst_ny, n), order='F')
+
+    def _get_parameter(self, parameter):
+        '''Return a parameter needed to create the regridded field.
+
+    :Parameters:
+
+        parameter: `str`
+            The name of the parameter.
+
+    :Returns:
+
+            The value of the parameter.
+
+        '''
+        return self._parameters[parameter]
+
+    def _matches_src_mask(self, mask):
+        '''Whether or not a mask is that with which the weights were created.
+
+    :Parameters:
+
+        mask: `numpy.ndarray`
+            The masks of any number of source grids, with one column
+            for each grid, and with the grid points of each column
+            ordered as for the columns of the weights.
+
+    :Returns:
+
+        `bool`
+            True if every column of *mask* equals the source mask.
+
+        '''
+        src_mask = self._src_mask
+        if src_mask is None:
+            return False
+
+        src_mask = src_mask.reshape((src_mask.size, 1), order='F')
+        return bool((mask == src_mask).all())
+
+    @staticmethod
+    def _available():
+        '''Whether or not regrid operators may be created.
+
+    Regrid operators require the scipy package.
+
+    :Returns:
+
+        `bool`
+
+        '''
+        try:
+            scipy_csr_matrix
+        except NameError:
+            return False
+
+        return True
+
+    @staticmethod
+    def _mask_dependent(method, use_src_mask=True):
+        '''Whether or not regridding weights depend on the source mask.
+
+    :Parameters:
+
+        method: `str`
+            The regridding method.
+
+        use_src_mask: `bool`, optional
+            Whether or not the source mask is used for nearest source
+            to destination regridding.
+
+    :Returns:
+
+        `bool`
+            True if the weights of non-missing source points depend
+            on which other source points are missing.
+
+        '''
+        return (method in _mask_dependent_methods or
+                (method == 'nearest_stod' and not use_src_mask))
+
+    def _regrid_array(self, array, fracfield=False, use_src_mask=True):
+        '''Regrid an array with the weights.
+
+    Any number of source grids may be regridded at once by stacking
+    them along a trailing axis of the array, in which case all of
+    them are regridded with a single sparse matrix product.
+
+    Missing source values are accounted for as follows:
+
+    * For conservative regridding, the weights are renormalised to
+      exclude missing source points, and destination points to which
+      no non-missing source points contribute are missing.
+
+    * For nearest destination to source regridding, destination
+      points to which no non-missing source points contribute are
+      missing.
+
+    * For all other methods, destination points to which any missing
+      source point contributes are missing.
+
+    In all cases, destination points to which no source points
+    contribute are missing.
+
+    Methods for which the weights of non-missing source points depend
+    on which other source points are missing (second-order
+    conservative and patch recovery regridding, and nearest source to
+    destination regridding when *use_src_mask* is False) can only be
+    applied to data whose missing values are those of the source mask
+    with which the weights were created.
+
+    :Parameters:
+
+        array: `numpy.ndarray`
+            The source data, with the shape of the source grid
+            followed by a trailing axis that stacks the grids to be
+            regridded. The trailing axis may be omitted if there is
+            only one grid.
+
+        fracfield: `bool`, optional
+            For conservative regridding, return the fraction of each
+            destination grid cell that is covered by non-missing
+            source cells, instead of the regridded data.
+
+        use_src_mask: `bool`, optional
+            For nearest source to destination regridding, whether or
+            not destination points which are nearest to missing source
+            points are missing (True) or are mapped to the nearest
+            non-missing source points (False).
+
+    :Returns:
+
+        `numpy.ndarray`
+            The regridded data, with the shape of the destination
+            grid followed by the trailing stacking axis.
+
+        '''
+        method = self._method
+        weights = self._weights
+        src_size, dst_size = weights.shape[1], weights.shape[0]
+
+        # Flatten each source grid in Fortran order, so that the
+        # grid points are in the same order as the weights
+        array = array.reshape(self._src_shape + (-1,))
+        n = array.shape[-1]
+        out_shape = self._dst_shape + (n,)
+
+        if numpy_ma_is_masked(array):
+            mask = numpy_ma_getmaskarray(array).reshape((src_size, n),
+                                                        order='F')
+        else:
+            mask = None
+
+        if (mask is not None and self._mask_dependent(method, use_src_mask)
+                and not self._matches_src_mask(mask)):
+            raise ValueError(
+                "Can't regrid masked data with a regrid operator for "
+                "method {!r}{}".format(
+                    method,
+                    ' with use_src_mask=False' if not use_src_mask else '')
+            )
+
+        x = numpy_ma_filled(array, 0).astype(numpy_float64, copy=False)
+        x = x.reshape((src_size, n), order='F')
+
+        if method in _conservative_methods:
+            if mask is None:
+                frac = numpy_broadcast_to(weights.sum(axis=1).A,
+                                          (dst_size, n)).copy()
+            else:
+                frac = self._dot((~mask).astype(numpy_float64))
+
+            if fracfield:
+                return frac.reshape(out_shape, order='F')
+
+            out_mask = (frac == 0)
+            frac[out_mask] = 1.0
+            with numpy_errstate(invalid='ignore'):
+                out = self._dot(x) / frac
+        else:
+            out = self._dot(x)
+
+            counts = numpy_diff(weights.indptr).reshape(dst_size, 1)
+            out_mask = numpy_broadcast_to(counts == 0, (dst_size, n))
+            if mask is not None:
+                pattern = weights.copy()
+                pattern.data[...] = 1.0
+                n_masked = pattern.dot(mask.astype(numpy_float64))
+                if method == 'nearest_dtos':
+                    out_mask = out_mask | (n_masked == counts)
+                else:
+                    out_mask = out_mask | (n_masked > 0)
+        # --- End: if
+
+        return numpy_ma_MaskedArray(
+            out.reshape(out_shape, order='F'),
+            mask=out_mask.reshape(out_shape, order='F')
+        )
+
+    def copy(self):
+        '''Return a deep copy.
+
+    ``op.copy()`` is equivalent to ``copy.deepcopy(op)``.
+
+    :Returns:
+
+        `RegridOperator`
+            The deep copy.
+
+    **Examples:**
+
+    >>> op2 = op.copy()
+
+        '''
+        return deepcopy(self)
+
+    def inspect(self):
+        '''Inspect the object for debugging.
+
+    .. seealso:: `cf.inspect`
+
+    :Returns:
+
+        `None`
+
+        '''
+        print(cf_inspect(self))  # pragma: no cover
+
+    @classmethod
+    def load(cls, filename):
+        '''Load a regrid operator from a file.
+
+    .. seealso:: `save`
+
+    :Parameters:
+
+        filename: `str`
+            The name of a file created by `save`.
+
+    :Returns:
+
+        `RegridOperator`
+            The regrid operator.
+
+    **Examples:**
+
+    >>> op = cf.RegridOperator.load('regrid_operator.pkl')
+
+        '''
+        with open(filename, 'rb') as fh:
+            op = pickle.load(fh)
+
+        if not isinstance(op, cls):
+            raise ValueError(
+                "Can't load {}: {!r} does not contain a {}".format(
+                    cls.__name__, filename, cls.__name__)
+            )
+
+        return op
+
+    def save(self, filename):
+        '''Save the regrid operator to a file.
+
+    The weights and the description of the destination grid are
+    saved, and the regrid operator may be restored with `load`.
+
+    .. seealso:: `load`
+
+    :Parameters:
+
+        filename: `str`
+            The name of the file.
+
+    :Returns:
+
+        `None`
+
+    **Examples:**
+
+    >>> op.save('regrid_operator.pkl')
+
+        '''
+        with open(filename, 'wb') as fh:
+            pickle.dump(self, fh, protocol=pickle.HIGHEST_PROTOCOL)
+
+# --- End: class
@@ -0,0 +1,172 @@
+import atexit
+import datetime
+import inspect
+import os
+import tempfile
+import unittest
+
+import numpy
+
+import cf
+
+
+tmpfile = tempfile.mkstemp('_test_CollapseAccumulator.pkl',
+                           dir=os.getcwd())[1]
+
+
+def _remove_tmpfiles():
+    '''Remove temporary files created during tests.
+    '''
+    try:
+        os.remove(tmpfile)
+    except OSError:
+        pass
+
+
+atexit.register(_remove_tmpfiles)
+
+
+class CollapseAccumulatorTest(unittest.TestCase):
+    f = cf.example_field(2)
+
+    methods = ['mean', 'maximum', 'minimum', 'range', 'sum',
+               'sample_size', 'variance', 'standard_deviation',
+               'root_mean_square']
+
+    test_only = []
+
+    def accumulate(self, f, methods, step=1, **kwargs):
+        a = cf.CollapseAccumulator(methods, **kwargs)
+        for i in range(0, f.domain_axis('T').get_size(), step):
+            a.update(f[i:i+step])
+
+        return a
+
+    def test_CollapseAccumulator_update(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        f = self.f.copy()
+        f[1:3, 1, :] = cf.masked
+
+        for step in (1, 5, 36):
+            a = self.accumulate(f, self.methods, step=step)
+            self.assertEqual(a.sample_size, 36)
+
+            for method, g in zip(self.methods, a.fields()):
+                ddof = 1 if method in ('variance',
+                                       'standard_deviation') else None
+                kwargs = {} if ddof is None else {'ddof': ddof}
+                h = f.collapse(method, axes='T', **kwargs)
+
+                self.assertEqual(g.shape, h.shape)
+                self.assertTrue(g.Units.equals(h.Units), method)
+                self.assertTrue(numpy.allclose(g.array, h.array), method)
+                self.assertTrue(
+                    (numpy.ma.getmaskarray(g.array) ==
+                     numpy.ma.getmaskarray(h.array)).all(), method)
+
+                self.assertTrue(g.dimension_coordinate('T').equals(
+                    h.dimension_coordinate('T'), verbose=2), method)
+                self.assertTrue(g.cell_methods.equals(h.cell_methods,
+                                                      verbose=2), method)
+        # --- End: for
+
+    def test_CollapseAccumulator_weights(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        f = self.f
+
+        a = self.accumulate(f, 'mean', step=7, weights='T')
+        g = a.field()
+        h = f.collapse('mean', axes='T', weights='T')
+        self.assertTrue(numpy.allclose(g.array, h.array))
+
+    def test_CollapseAccumulator_field(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        a = cf.CollapseAccumulator(['mean', 'maximum'])
+        with self.assertRaises(ValueError):
+            a.field('mean')
+
+        a.update(self.f[:2])
+        m = a.field('mean')
+        self.assertTrue(numpy.allclose(
+            m.array, self.f[:2].collapse('T: mean').array))
+
+        # Fields may be returned while accumulating
+        a.update(self.f[2:4])
+        m = a.field('mean')
+        self.assertTrue(numpy.allclose(
+            m.array, self.f[:4].collapse('T: mean').array))
+
+        with self.assertRaises(ValueError):
+            a.field()
+
+        with self.assertRaises(ValueError):
+            a.field('minimum')
+
+        with self.assertRaises(ValueError):
+            cf.CollapseAccumulator('median')
+
+        with self.assertRaises(ValueError):
+            a.update(self.f[:2, :2])
+
+    def test_CollapseAccumulator_domain(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        f = self.f[:, :5, :5]
+
+        a = cf.CollapseAccumulator('mean')
+        a.update(f[:2])
+        a.update(f[2:4])
+        self.assertEqual(a.sample_size, 4)
+
+        # A different grid of the same shape
+        g = f[4:6].copy()
+        lat = g.dimension_coordinate('Y')
+        lat += 1
+        with self.assertRaises(ValueError):
+            a.update(g)
+
+        # Transposed non-collapse axes of the same sizes
+        with self.assertRaises(ValueError):
+            a.update(f[4:6].transpose(['T', 'X', 'Y']))
+
+        # Missing dimension coordinates
+        g = f[4:6].copy()
+        g.del_construct('X')
+        with self.assertRaises(ValueError):
+            a.update(g)
+
+        self.assertEqual(a.sample_size, 4)
+
+    def test_CollapseAccumulator_save_load(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        f = self.f
+
+        a = self.accumulate(f[:10], ['mean', 'maximum'])
+        a.save(tmpfile)
+        b = cf.CollapseAccumulator.load(tmpfile)
+
+        a.update(f[10:])
+        b.update(f[10:])
+        for g, h in zip(a.fields(), b.fields()):
+            self.assertTrue(g.equals(h, verbose=2))
+
+        self.assertTrue(numpy.allclose(a.field('mean').array,
+                                       f.collapse('T: mean').array))
+
+# --- End: class
+
+
+if __name__ == '__main__':
+    print('Run date:', datetime.datetime.now())
+    cf.environment()
+    print()
+    unittest.main(verbosity=2)
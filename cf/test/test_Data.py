@@ -297,6 +297,114 @@ class DataTest(unittest.TestCase):
 
         cf.chunksize(self.original_chunksize)
 
+    def test_Data_moving_window(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        d = cf.Data(self.ma, units='m')
+
+        e = d.moving_window('maximum', 3, axis=-1, inplace=True)
+        self.assertIsNone(e)
+
+        d = cf.Data(self.ma, units='m')
+        d[0, 1, 2, 3] = cf.masked
+        a = d.array.filled(numpy.nan)
+
+        # numpy.pad equivalents of the boundary modes
+        pad_modes = {'constant': 'constant', 'wrap': 'wrap',
+                     'reflect': 'symmetric', 'mirror': 'reflect',
+                     'nearest': 'edge'}
+
+        functions = {
+            'sum': numpy.sum,
+            'mean': numpy.mean,
+            'maximum': numpy.max,
+            'minimum': numpy.min,
+            'range': numpy.ptp,
+            'variance': lambda x, axis: numpy.var(x, axis=axis, ddof=1),
+            'standard_deviation': lambda x, axis: numpy.std(x, axis=axis,
+                                                            ddof=1),
+        }
+
+        for chunksize in self.chunk_sizes:
+            cf.chunksize(chunksize)
+            for method, func in functions.items():
+                for mode, cval in (('constant', None), ('constant', 0),
+                                   ('wrap', None), ('reflect', None),
+                                   ('nearest', None), ('mirror', None)):
+                    for window_size, origin in ((3, 0), (4, 0), (4, 1)):
+                        e = d.moving_window(method, window_size, axis=2,
+                                            mode=mode, cval=cval,
+                                            origin=origin)
+
+                        # Brute force the windows
+                        before = window_size - 1 - window_size//2 - origin
+                        after = window_size - 1 - before
+                        kwargs = {}
+                        if mode == 'constant':
+                            kwargs['constant_values'] = (
+                                numpy.nan if cval is None else cval)
+
+                        x = numpy.pad(numpy.moveaxis(a, 2, -1),
+                                      [(0, 0)] * 3 + [(before, after)],
+                                      mode=pad_modes[mode], **kwargs)
+                        n = d.shape[2]
+                        x = numpy.stack([x[..., i:i+window_size]
+                                         for i in range(n)], axis=-2)
+                        b = numpy.moveaxis(func(x, axis=-1), -1, 2)
+
+                        self.assertTrue(numpy.allclose(
+                            e.array.filled(numpy.nan), b, equal_nan=True,
+                            atol=1e-6),
+                            (method, mode, cval, window_size, origin))
+            # --- End: for
+
+            # Weighted mean and variance
+            weights = numpy.arange(1., 6.)
+            e = d.moving_window('mean', 3, axis=-1, weights=weights,
+                                mode='nearest')
+            w = numpy.array([1, 1, 2, 3, 4, 5, 5.])
+            x = numpy.concatenate((a[..., :1], a, a[..., -1:]), axis=-1)
+            b = numpy.stack([(x[..., i:i+3] * w[i:i+3]).sum(axis=-1) /
+                             w[i:i+3].sum() for i in range(5)], axis=-1)
+            self.assertTrue(numpy.allclose(e.array.filled(numpy.nan), b,
+                                           equal_nan=True))
+
+            e = d.moving_window('variance', 3, axis=-1, weights=weights,
+                                mode='nearest', ddof=0)
+            b = numpy.stack([
+                numpy.average((x[..., i:i+3] - b[..., i:i+1])**2,
+                              weights=w[i:i+3], axis=-1)
+                for i in range(5)], axis=-1)
+            self.assertTrue(numpy.allclose(e.array.filled(numpy.nan), b,
+                                           equal_nan=True))
+            self.assertTrue(e.Units.equals(cf.Units('m2')))
+        # --- End: for
+
+        cf.chunksize(self.original_chunksize)
+
+        # Windows with no degrees of freedom give missing variances
+        for method in ('variance', 'standard_deviation'):
+            e = d.moving_window(method, 1, axis=-1)
+            self.assertTrue(e.array.mask.all(), method)
+
+            e = d.moving_window(method, 2, axis=-1, ddof=2)
+            self.assertTrue(e.array.mask.all(), method)
+
+            e = d.moving_window(method, 1, axis=-1, ddof=0)
+            self.assertTrue((e.array == 0).all(), method)
+
+            e = d.moving_window(method, 1, axis=-1, weights=weights,
+                                mode='nearest')
+            self.assertTrue(e.array.mask.all(), method)
+        # --- End: for
+
+        with self.assertRaises(ValueError):
+            d.moving_window('median', 3, axis=-1)
+
+        with self.assertRaises(ValueError):
+            d.moving_window('mean', 3, axis=-1, weights=[1, 2])
+
     def test_Data_diff(self):
         if self.test_only and inspect.stack()[0][3] not in self.test_only:
             return
@@ -2787,6 +2895,43 @@ class DataTest(unittest.TestCase):
 
         cf.chunksize(self.original_chunksize)
 
+    def test_Data_collapse_multiple(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        methods = ('min', 'max', 'mean', 'sd', 'var', 'sample_size')
+
+        for chunksize in self.chunk_sizes:
+            cf.chunksize(chunksize)
+            for a in (self.a, self.ma):
+                d = cf.Data(a, units='K')
+                for weights in (None, self.w):
+                    for axes in self.axes_combinations:
+                        out = d.collapse_multiple(methods, axes=axes,
+                                                  weights=weights, ddof=1)
+                        self.assertEqual(len(out), len(methods))
+                        for h, e in zip(methods, out):
+                            kwargs = {}
+                            if h in ('mean', 'sd', 'var'):
+                                kwargs['weights'] = weights
+                            if h in ('sd', 'var'):
+                                kwargs['ddof'] = 1
+
+                            b = getattr(d, h)(axes=axes, **kwargs)
+                            self.assertEqual(e.shape, b.shape)
+                            self.assertEqual(e.Units, b.Units)
+                            self.assertTrue(
+                                e.equals(b, rtol=1e-05, atol=1e-08),
+                                "{}, axes={}, weights={}".format(
+                                    h, axes, weights is not None)
+                            )
+        # --- End: for
+
+        cf.chunksize(self.original_chunksize)
+
+        with self.assertRaises(ValueError):
+            d.collapse_multiple(['median', 'max'])
+
     def test_Data_dumpd_loadd_dumps(self):
         if self.test_only and inspect.stack()[0][3] not in self.test_only:
             return
@@ -2822,6 +2967,56 @@ class DataTest(unittest.TestCase):
 
         cf.chunksize(self.original_chunksize)
 
+    def test_Data__share_arrays(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        arrays = {}
+        d = cf.Data([1.0, 2.0, 3.0], 'm')
+        e = cf.Data([1.0, 2.0, 3.0], 'km')
+        f = cf.Data(numpy.ma.array([1.0, 2.0, 3.0], mask=[0, 1, 0]), 'm')
+        for x in (d, e, f):
+            x._share_arrays(arrays)
+
+        self.assertEqual(len(arrays), 2)
+        self.assertIs(d.partitions.matrix.item().subarray,
+                      e.partitions.matrix.item().subarray)
+
+        g = d.copy()
+        g._share_arrays(arrays)
+        self.assertTrue(d._shares_arrays(g))
+        self.assertTrue(d.equals(g))
+        self.assertFalse(d._shares_arrays(e))
+        self.assertFalse(d.equals(e))
+        self.assertFalse(d._shares_arrays(f))
+
+        # Shared arrays are copied before they are changed
+        g[0] = 9.0
+        self.assertEqual(d.array.tolist(), [1.0, 2.0, 3.0])
+        self.assertEqual(e.array.tolist(), [1.0, 2.0, 3.0])
+        self.assertEqual(g.array.tolist(), [9.0, 2.0, 3.0])
+        self.assertFalse(d._shares_arrays(g))
+        self.assertFalse(d.equals(g))
+
+        # NaNs are never equal
+        d = cf.Data([1.0, numpy.nan])
+        self.assertFalse(d._shares_arrays(d.copy()))
+        self.assertFalse(d.equals(d.copy()))
+
+        # Arrays with equal hash values are only shared if they are
+        # equal
+        for a, b in ((numpy.array([1.0, 2.0]), numpy.array([1.0, 3.0])),
+                     (numpy.array([1.0, 2.0]), numpy.array([1, 2])),
+                     (numpy.array([1.0, 2.0]), numpy.array([[1.0, 2.0]])),
+                     (numpy.ma.array([1.0, 2.0], mask=[1, 0]),
+                      numpy.ma.array([1.0, 2.0], mask=[0, 1]))):
+            d = cf.Data(a)
+            subarray = d.partitions.matrix.item().subarray
+            arrays = {(cf.hash_array(subarray), numpy.ma.isMA(subarray)): [b]}
+            d._share_arrays(arrays)
+            self.assertIs(d.partitions.matrix.item().subarray, subarray)
+            self.assertEqual(len(next(iter(arrays.values()))), 2)
+
     def test_Data_count(self):
         if self.test_only and inspect.stack()[0][3] not in self.test_only:
             return
@@ -1616,6 +1616,41 @@ class FieldTest(unittest.TestCase):
         with self.assertRaises(Exception):
             f.indices(grid_latitude=cf.contains(-23.2))
 
+        # Range conditions on monotonic dimension coordinates, which
+        # are resolved by binary search
+        f = cf.example_field(2)
+        for g in (f, f.flip('T')):
+            t = g.dimension_coordinate('T')
+            for q in (cf.lt(500), cf.le(t.datum(5)), cf.gt(t.datum(5)),
+                      cf.ge(t.datum(5)), cf.wi(100, 900),
+                      cf.ge(cf.dt('1960-06-01')),
+                      cf.wi(cf.dt(1960, 1, 1), cf.dt(1961, 1, 1)),
+                      cf.gt(cf.Data(2, 'year since 1959-01-01')),
+                      cf.ge(200) & cf.lt(400)):
+                match = (q == t).array
+                for mode in ('compress', 'envelope'):
+                    indices = g.indices(mode, T=q)
+                    self.assertTrue(
+                        g[indices].equals(g[match], verbose=2), (q, mode))
+        # --- End: for
+
+        t = f.dimension_coordinate('T')
+        indices = f.indices(T=cf.month(4))
+        self.assertTrue(f[indices].equals(f[(cf.month(4) == t).array]))
+
+        with self.assertRaises(ValueError):
+            f.indices(T=cf.lt(-1000))
+
+        # Reference times in a different calendar are not converted
+        g = f.copy()
+        g.dimension_coordinate('T').override_calendar('360_day',
+                                                      inplace=True)
+        q = cf.lt(cf.Data(400, 'days since 1959-01-01'))
+        self.assertIsNone(
+            g._indices_monotonic(g.dimension_coordinate('T'), q))
+        with self.assertRaises(Exception):
+            g.indices(T=q)
+
     def test_Field_match(self):
         if self.test_only and inspect.stack()[0][3] not in self.test_only:
             return
@@ -1773,6 +1808,75 @@ class FieldTest(unittest.TestCase):
         self.assertTrue(
             f.constructs('X', 'Y').equals(f.items(*['X', 'Y']), verbose=2))
 
+    def test_Field_nearest_indices(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        lats = [52.0, 51.2, 50.1, 54.2]
+        lons = [5.3, 6.1, 2.5, 8.0]
+
+        # 2-d auxiliary coordinates, with transposed longitudes
+        f = cf.example_field(1)
+        lat = numpy.radians(f.construct('latitude').array)
+        lon = numpy.radians(f.construct('longitude').array.T)
+
+        for k in (1, 3):
+            indices, distance = f.nearest_indices(lats, lons, k=k,
+                                                  distance=True)
+            self.assertEqual(set(indices), set(('domainaxis1',
+                                                'domainaxis2')))
+            for n, (y, x) in enumerate(zip(numpy.radians(lats),
+                                           numpy.radians(lons))):
+                # Brute force great circle distances
+                d = numpy.arccos(numpy.clip(
+                    numpy.sin(lat) * numpy.sin(y) +
+                    numpy.cos(lat) * numpy.cos(y) * numpy.cos(lon - x),
+                    -1, 1))
+                nearest = numpy.argsort(d, axis=None)[:k]
+                i, j = numpy.unravel_index(nearest, d.shape)
+                self.assertTrue(
+                    (indices['domainaxis1'][n] == i.squeeze()).all())
+                self.assertTrue(
+                    (indices['domainaxis2'][n] == j.squeeze()).all())
+                self.assertTrue(numpy.allclose(
+                    distance.array[n],
+                    d.flatten()[nearest].squeeze() * 6371007.0))
+        # --- End: for
+
+        self.assertEqual(distance.Units, cf.Units('m'))
+
+        # The spatial index is reused by copies, and rebuilt when the
+        # coordinates change
+        g = f.copy()
+        self.assertIs(g._horizontal_spatial_index()[2],
+                      f._horizontal_spatial_index()[2])
+        g.construct('latitude')[0, 0] = 52.0
+        g.construct('longitude')[0, 0] = 5.3
+        self.assertIsNot(g._horizontal_spatial_index()[2],
+                         f._horizontal_spatial_index()[2])
+        indices = g.nearest_indices(52.0, 5.3)
+        self.assertEqual(indices['domainaxis1'], 0)
+        self.assertEqual(indices['domainaxis2'], 0)
+
+        # Changes made through an in-place view of the coordinates
+        # are detected
+        tree = g._horizontal_spatial_index()[2]
+        g.construct('latitude').data.varray[0, 0] = 50.0
+        self.assertIsNot(g._horizontal_spatial_index()[2], tree)
+
+        # 1-d dimension coordinates
+        f = cf.example_field(0)
+        indices = f.nearest_indices(cf.Data([44.0, -80.0], 'degrees_north'),
+                                    cf.Data([1.6, 0.4], 'radians'))
+        self.assertTrue((indices['domainaxis0'] == [3, 0]).all())
+        self.assertTrue((indices['domainaxis1'] == [2, 0]).all())
+
+        with self.assertRaises(ValueError):
+            f.nearest_indices(0, 0, k=41)
+
+        with self.assertRaises(ValueError):
+            f.nearest_indices([0, 1], 0)
+
     def test_Field_convolution_filter(self):
         if self.test_only and inspect.stack()[0][3] not in self.test_only:
             return
@@ -1921,6 +2025,30 @@ class FieldTest(unittest.TestCase):
 
         self.assertTrue(len(g.cell_methods) == len(f.cell_methods) + 1)
 
+        # ------------------------------------------------------------
+        # Maximum, minimum, range, standard deviation and variance
+        # ------------------------------------------------------------
+        for method, func in (('maximum', numpy.max),
+                             ('minimum', numpy.min),
+                             ('range', numpy.ptp),
+                             ('standard_deviation', numpy.std),
+                             ('variance', numpy.var)):
+            g = f.moving_window(method, window_size=3, axis='X', ddof=0)
+            for i in range(1, 7):
+                x = func(a[:, i-1:i+2], axis=1)
+                numpy.testing.assert_allclose(x, g.array[:, i], atol=1e-12)
+
+            # Cyclic
+            x = func(a[:, [-1, 0, 1]], axis=1)
+            numpy.testing.assert_allclose(x, g.array[:, 0], atol=1e-12)
+
+            cell_method = tuple(g.cell_methods.ordered().values())[-1]
+            self.assertEqual(cell_method.method, method)
+        # --- End: for
+
+        g = f.moving_window('variance', window_size=3, axis='X')
+        self.assertTrue(g.Units.equals(f.Units ** 2))
+
     def test_Field_derivative(self):
         if self.test_only and inspect.stack()[0][3] not in self.test_only:
             return
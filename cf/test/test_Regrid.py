@@ -1,11 +1,30 @@
+import atexit
 import datetime
 import os
+import tempfile
 import unittest
 import inspect
 
+import numpy
+
 import cf
 
 
+tmpfile = tempfile.mkstemp('_test_Regrid.pkl', dir=os.getcwd())[1]
+
+
+def _remove_tmpfiles():
+    '''Remove temporary files created during tests.
+    '''
+    try:
+        os.remove(tmpfile)
+    except OSError:
+        pass
+
+
+atexit.register(_remove_tmpfiles)
+
+
 class RegridTest(unittest.TestCase):
     filename1 = os.path.join(os.path.dirname(os.path.abspath(__file__)),
                              'regrid_file1.nc')
@@ -161,6 +180,409 @@ class RegridTest(unittest.TestCase):
 
         cf.atol(original_atol)
 
+    def test_Field_regridc_linear_1d(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        # Linear interpolation along one axis does not need ESMPy
+        original_atol = cf.atol(1e-12)
+
+        for chunksize in self.chunk_sizes:
+            cf.chunksize(chunksize)
+            f1 = cf.read(self.filename7)[0]
+            f2 = cf.read(self.filename8)[0]
+            f3 = cf.read(self.filename9)[0]
+            self.assertTrue(
+                f3.equals(f1.regridc(
+                    f2, axes='T', method='linear'), verbose=2),
+                'destination = time series, CHUNKSIZE = %s' % chunksize
+            )
+        # --- End: for
+        cf.chunksize(self.original_chunksize)
+
+        cf.atol(original_atol)
+
+        # Source coordinates that vary between the points of the
+        # other axes
+        f = cf.example_field(2)
+        t = f.dimension_coordinate('T')
+        dst = t[2:10].copy()
+        dst.del_bounds()
+        dst.set_data(cf.Data(t.array[2:10] + 3.5, units=t.Units))
+
+        z = t.array.reshape(36, 1, 1) + numpy.arange(40).reshape(5, 8)
+        aux = cf.AuxiliaryCoordinate(data=cf.Data(z, units=t.Units))
+        aux.set_property('long_name', 'z')
+        f.set_construct(aux, axes=f.get_data_axes())
+
+        for ln_z in (False, True):
+            g = f.regridc({'T': dst}, axes='T', method='linear',
+                          z='long_name=z', ln_z=ln_z)
+            self.assertEqual(g.shape, (8, 5, 8))
+            self.assertFalse(g.auxiliary_coordinates)
+
+            x = z
+            x_new = dst.array
+            if ln_z:
+                x = numpy.log(x)
+                x_new = numpy.log(x_new)
+
+            for j in range(5):
+                for i in range(8):
+                    self.assertTrue(numpy.allclose(
+                        g.array[:, j, i],
+                        numpy.interp(x_new, x[:, j, i], f.array[:, j, i])))
+        # --- End: for
+
+        # Ancillary constructs that span the interpolation axis are
+        # interpolated, unless their source coordinates vary along
+        # axes that they do not span, and cell measure constructs that
+        # span it are removed
+        anc = cf.FieldAncillary(data=f.data * 2)
+        anc.set_property('long_name', 'anc')
+        f.set_construct(anc, axes=f.get_data_axes())
+
+        anc_t = cf.FieldAncillary(data=cf.Data(numpy.arange(36.0)))
+        anc_t.set_property('long_name', 'anc_t')
+        f.set_construct(anc_t, axes=f.get_data_axes()[:1])
+
+        cm = cf.CellMeasure(data=cf.Data(numpy.ones(f.shape), 'm3'))
+        cm.set_measure('volume')
+        f.set_construct(cm, axes=f.get_data_axes())
+
+        g = f.regridc({'T': dst}, axes='T', method='linear',
+                      z='long_name=z')
+        self.assertTrue(numpy.allclose(
+            g.field_ancillary('long_name=anc').array, g.array * 2))
+        self.assertIsNone(g.field_ancillary('long_name=anc_t', None))
+        self.assertFalse(g.cell_measures)
+
+        f.del_construct('long_name=z')
+        g = f.regridc({'T': dst}, axes='T', method='linear')
+        self.assertTrue(numpy.allclose(
+            g.field_ancillary('long_name=anc').array, g.array * 2))
+        self.assertTrue(numpy.allclose(
+            g.field_ancillary('long_name=anc_t').array,
+            numpy.interp(dst.array, t.array, numpy.arange(36.0))))
+        self.assertFalse(g.cell_measures)
+
+        with self.assertRaises(ValueError):
+            f.regridc({'T': dst}, axes='T', method='linear', z='foo')
+
+        with self.assertRaises(ValueError):
+            f.regridc({'T': dst}, axes='T', method='nearest_stod',
+                      z='long_name=z')
+
+    def test_Field_regrids_separable(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        # Separable first-order conservative regridding between
+        # grids with one dimensional latitude and longitude
+        # coordinates does not need ESMPy
+        f = cf.example_field(0)
+
+        lon = cf.DimensionCoordinate(
+            properties={'standard_name': 'longitude'},
+            data=cf.Data([-90.0, 90.0], 'degrees_east'),
+            bounds=cf.Bounds(data=cf.Data([[-180.0, 0.0], [0.0, 180.0]],
+                                          'degrees_east')))
+        lat = cf.DimensionCoordinate(
+            properties={'standard_name': 'latitude'},
+            data=cf.Data([-45.0, 45.0], 'degrees_north'),
+            bounds=cf.Bounds(data=cf.Data([[-90.0, 0.0], [0.0, 90.0]],
+                                          'degrees_north')))
+        dst = {'longitude': lon, 'latitude': lat}
+
+        g = f.regrids(dst, 'conservative', separable=True)
+        self.assertEqual(g.shape, (2, 2))
+
+        # Check against the fractions of the source cells that lie in
+        # each destination cell, with longitudes wrapped around
+        x = f.dimension_coordinate('X').bounds.array
+        y = numpy.sin(numpy.radians(f.dimension_coordinate('Y').bounds.array))
+        for j, (y0, y1) in enumerate(numpy.sin(numpy.radians(
+                lat.bounds.array))):
+            for i, (x0, x1) in enumerate(lon.bounds.array % 360):
+                wy = numpy.clip(numpy.minimum(y1, y[:, 1]) -
+                                numpy.maximum(y0, y[:, 0]), 0, None)
+                wx = numpy.clip(numpy.minimum(x1 or 360, x[:, 1]) -
+                                numpy.maximum(x0, x[:, 0]), 0, None)
+                w = numpy.outer(wy, wx)
+                self.assertTrue(numpy.allclose(
+                    g.array[j, i], (f.array * w).sum() / w.sum()))
+        # --- End: for
+
+        # Regridding to a single global cell gives the area-weighted
+        # mean
+        lon = lon[:1].copy()
+        lon.set_data(cf.Data([180.0], 'degrees_east'))
+        lon.set_bounds(cf.Bounds(data=cf.Data([[0.0, 360.0]],
+                                              'degrees_east')))
+        lat = lat[:1].copy()
+        lat.set_data(cf.Data([0.0], 'degrees_north'))
+        lat.set_bounds(cf.Bounds(data=cf.Data([[-90.0, 90.0]],
+                                              'degrees_north')))
+        g = f.regrids({'longitude': lon, 'latitude': lat}, 'conservative',
+                      separable=True)
+        self.assertTrue(numpy.allclose(
+            g.array, f.collapse('area: mean', weights='area').array))
+
+        # Regrid operator
+        op = f.regrids(dst, 'conservative', return_operator=True,
+                       separable=True)
+        self.assertEqual(op.weights.shape, (4, 40))
+        self.assertTrue(numpy.allclose(
+            f.regrids(op).array,
+            f.regrids(dst, 'conservative', separable=True).array))
+
+    @unittest.skipUnless(cf._found_ESMF, "Requires esmf package.")
+    @unittest.skipIf(cf.mpi_on, "Not run in parallel with MPI.")
+    def test_Field_regrid_workers(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        # Sections regridded concurrently give the same result as
+        # sections regridded one after another
+        original_workers = cf.regrid_workers()
+        original_atol = cf.atol(1e-12)
+
+        cf.chunksize(self.chunk_sizes[-1])
+        f1 = cf.read(self.filename7)[0]
+        f2 = cf.read(self.filename8)[0]
+        f3 = cf.read(self.filename9)[0]
+
+        f = cf.example_field(2)
+        lon = cf.DimensionCoordinate(
+            properties={'standard_name': 'longitude'},
+            data=cf.Data([-90.0, 90.0], 'degrees_east'),
+            bounds=cf.Bounds(data=cf.Data([[-180.0, 0.0], [0.0, 180.0]],
+                                          'degrees_east')))
+        lat = cf.DimensionCoordinate(
+            properties={'standard_name': 'latitude'},
+            data=cf.Data([-45.0, 45.0], 'degrees_north'),
+            bounds=cf.Bounds(data=cf.Data([[-90.0, 0.0], [0.0, 90.0]],
+                                          'degrees_north')))
+        dst = {'longitude': lon, 'latitude': lat}
+        op = f.regrids(dst, 'conservative', return_operator=True)
+        g = f.regrids(dst, 'conservative')
+
+        for workers in (2, 3):
+            cf.regrid_workers(workers)
+            self.assertTrue(
+                f3.equals(f1.regridc(f2, axes='T', method='linear'),
+                          verbose=2),
+                'REGRID_WORKERS = %s' % workers
+            )
+            self.assertTrue(
+                g.equals(f.regrids(op), verbose=2),
+                'REGRID_WORKERS = %s' % workers
+            )
+        # --- End: for
+
+        cf.regrid_workers(original_workers)
+        cf.chunksize(self.original_chunksize)
+        cf.atol(original_atol)
+
+        for workers in (0, -1, 1.5, True):
+            with self.assertRaises(ValueError):
+                cf.regrid_workers(workers)
+
+    # Run in parallel with, for example,
+    # mpirun -n 2 python test_Regrid.py
+    @unittest.skipUnless(cf._found_ESMF, "Requires esmf package.")
+    @unittest.skipUnless(cf.mpi_on, "Requires running in parallel with MPI.")
+    def test_Field_regrid_mpi(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        original_atol = cf.atol(1e-12)
+
+        f1 = cf.read(self.filename1)[0]
+        f2 = cf.read(self.filename2)[0]
+        f3 = cf.read(self.filename3)[0]
+
+        # Every process holds all of the weights, whether or not ESMF
+        # is running in parallel
+        op = f1.regrids(f2, 'conservative', return_operator=True)
+        self.assertEqual(
+            op.weights.shape,
+            (numpy.prod(op.dst_shape), numpy.prod(op.src_shape)))
+
+        self.assertTrue(f3.equals(f1.regrids(op), verbose=2))
+        self.assertTrue(f3.equals(f1.regrids(f2, 'conservative'),
+                                  verbose=2))
+
+        f4 = cf.read(self.filename4)[0]
+        f5 = cf.read(self.filename5)[0]
+        self.assertTrue(f4.equals(f1.regrids(f5, 'linear'), verbose=2))
+
+        f6 = cf.read(self.filename10)[0]
+        self.assertTrue(
+            f6.equals(f1.regridc(f2, axes=('X', 'Y'),
+                                 method='conservative'), verbose=2))
+
+        cf.atol(original_atol)
+
+    @unittest.skipUnless(cf._found_ESMF, "Requires esmf package.")
+    def test_Field_regrid_operator(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        original_atol = cf.atol(1e-12)
+
+        f1 = cf.read(self.filename1)[0]
+        f2 = cf.read(self.filename2)[0]
+        f3 = cf.read(self.filename3)[0]
+
+        op = f1.regrids(f2, 'conservative', return_operator=True)
+        self.assertIsInstance(op, cf.RegridOperator)
+        self.assertTrue(f3.equals(f1.regrids(op), verbose=2))
+
+        op.save(tmpfile)
+        op = cf.RegridOperator.load(tmpfile)
+        self.assertTrue(f3.equals(f1.regrids(op), verbose=2))
+
+        with self.assertRaises(ValueError):
+            f1.regrids(op, method='linear')
+
+        with self.assertRaises(ValueError):
+            f2.regrids(op)
+
+        f4 = cf.read(self.filename1)[0]
+        f5 = cf.read(self.filename2)[0]
+        f6 = cf.read(self.filename10)[0]
+        op = f4.regridc(f5, axes=('X', 'Y'), method='conservative',
+                        return_operator=True)
+        self.assertTrue(f6.equals(f4.regridc(op, axes=('X', 'Y')),
+                                  verbose=2))
+
+        cf.atol(original_atol)
+
+    def test_RegridOperator(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        # Create a first-order conservative regrid operator that halves
+        # the resolution of the time axis
+        f = cf.example_field(2)
+        t = f.dimension_coordinate('T')
+        bounds = t.bounds.array
+        lower = bounds[::2, 0]
+        upper = bounds[1::2, 1]
+
+        dst_t = t[::2].copy()
+        dst_t.set_data(cf.Data((lower + upper) / 2, units=t.Units))
+        dst_t.set_bounds(cf.Bounds(data=cf.Data(
+            numpy.stack([lower, upper], axis=-1), units=t.Units)))
+
+        weights = numpy.zeros((18, 36))
+        for i in range(18):
+            for j in range(36):
+                overlap = (min(upper[i], bounds[j, 1]) -
+                           max(lower[i], bounds[j, 0]))
+                if overlap > 0:
+                    weights[i, j] = overlap / (upper[i] - lower[i])
+        # --- End: for
+
+        op = cf.RegridOperator(
+            weights, 'conservative', (1, 36), (1, 18),
+            coord_sys='Cartesian',
+            src_signature=f._regrid_get_source_signature(
+                [t], 'conservative'),
+            parameters={'dst': {'T': dst_t},
+                        'dst_dict': True,
+                        'dst_axis_keys': None,
+                        'dst_coords': [dst_t]}
+        )
+        self.assertEqual(op.method, 'conservative')
+        self.assertEqual(op.src_shape, (1, 36))
+        self.assertEqual(op.dst_shape, (1, 18))
+        self.assertEqual(op.weights.shape, (18, 36))
+
+        expected = numpy.einsum('ij,jkl->ikl', weights, f.array)
+
+        g = f.regridc(op, axes='T')
+        self.assertEqual(g.shape, (18, 5, 8))
+        self.assertTrue(g.dimension_coordinate('T').equals(dst_t))
+        self.assertTrue(numpy.allclose(g.array, expected))
+
+        # Missing source values are excluded from the weights
+        h = f.copy()
+        h[3, 0, 0] = cf.masked
+        g = h.regridc(op, axes='T')
+        self.assertFalse(numpy.ma.is_masked(g.array))
+        self.assertEqual(g.array[1, 0, 0], f.array[2, 0, 0])
+
+        h[2, 0, 0] = cf.masked
+        g = h.regridc(op, axes='T')
+        self.assertEqual(numpy.ma.count_masked(g.array), 1)
+        self.assertTrue(g.array.mask[1, 0, 0])
+
+        # Save and load
+        op.save(tmpfile)
+        op2 = cf.RegridOperator.load(tmpfile)
+        self.assertEqual(op2.method, op.method)
+        self.assertTrue(numpy.allclose(f.regridc(op2, axes='T').array,
+                                       expected))
+
+        # The source grid must match
+        with self.assertRaises(ValueError):
+            f[1:].regridc(op, axes='T')
+
+        with self.assertRaises(ValueError):
+            f.regridc(op, axes='T', method='linear')
+
+        with self.assertRaises(ValueError):
+            f.regrids(op)
+
+        # Non-conservative methods: A destination point is missing if
+        # any of its source points are missing
+        op = cf.RegridOperator(numpy.array([[0.5, 0.5, 0.0],
+                                            [0.0, 0.5, 0.5],
+                                            [0.0, 0.0, 0.0]]),
+                               'linear', (3,), (3,))
+        a = numpy.ma.array([1.0, 2.0, 4.0], mask=[True, False, False])
+        b = op._regrid_array(a)
+        self.assertEqual(b.shape, (3, 1))
+        self.assertEqual(b.mask[:, 0].tolist(), [True, False, True])
+        self.assertEqual(b[1, 0], 3.0)
+
+        # Grids stacked along a trailing axis are regridded together,
+        # each with its own mask
+        a = numpy.ma.array([[1.0, 1.0], [2.0, 2.0], [4.0, 4.0]],
+                           mask=[[True, False], [False, False],
+                                 [False, True]])
+        b = op._regrid_array(a)
+        self.assertEqual(b.shape, (3, 2))
+        self.assertEqual(b.mask.tolist(), [[True, False], [False, True],
+                                           [True, True]])
+        self.assertEqual(b[1, 0], 3.0)
+        self.assertEqual(b[0, 1], 1.5)
+
+        # Mask-dependent methods: The weights may only be applied to
+        # data with the source mask for which they were created
+        op = cf.RegridOperator(numpy.array([[0.0, 1.0, 0.0],
+                                            [0.0, 0.5, 0.5],
+                                            [0.0, 0.0, 1.0]]),
+                               'patch', (3,), (3,),
+                               src_mask=[True, False, False])
+        self.assertEqual(op.src_mask.tolist(), [True, False, False])
+        a = numpy.ma.array([[1.0, 1.0], [2.0, 2.0], [4.0, 4.0]],
+                           mask=[[True, True], [False, False],
+                                 [False, False]])
+        b = op._regrid_array(a)
+        self.assertFalse(numpy.ma.is_masked(b))
+        self.assertEqual(b[:, 1].tolist(), [2.0, 3.0, 4.0])
+
+        a[2, 1] = numpy.ma.masked
+        with self.assertRaises(ValueError):
+            op._regrid_array(a)
+
+        with self.assertRaises(ValueError):
+            cf.RegridOperator(numpy.identity(3), 'patch', (3,), (3,),
+                              src_mask=[True, False])
+
 
 # --- End: class
 
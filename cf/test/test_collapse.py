@@ -343,6 +343,51 @@ class Field_collapseTest(unittest.TestCase):
         i = cf.example_field(4)
         i.collapse('area: maximum')
 
+    def test_Field_collapse_MULTIPLE(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        f = cf.example_field(2)
+
+        methods = ['minimum', 'maximum', 'mean', 'standard_deviation']
+        for axes in ('T', ['X', 'Y'], None):
+            fl = f.collapse(methods, axes=axes)
+            self.assertIsInstance(fl, cf.FieldList)
+            self.assertEqual(len(fl), len(methods))
+            for method, g in zip(methods, fl):
+                h = f.collapse(method, axes=axes)
+                self.assertTrue(g.equals(h, verbose=2), method)
+
+        # Weighted and unweighted statistics together
+        fl = f.collapse(['mean', 'max'], axes='area', weights='area')
+        for method, g in zip(['mean', 'max'], fl):
+            h = f.collapse(method, axes='area', weights='area')
+            self.assertTrue(g.equals(h, verbose=2), method)
+
+        # Grouped collapses fall back to one collapse per method
+        fl = f.collapse(['mean', 'max'], axes='T', group=cf.M(12))
+        for method, g in zip(['mean', 'max'], fl):
+            h = f.collapse(method, axes='T', group=cf.M(12))
+            self.assertTrue(g.equals(h, verbose=2), method)
+
+        # CF-like cell methods strings fall back to one collapse per
+        # method
+        methods = ['T: mean', 'X: max', 'area: minimum T: mean']
+        fl = f.collapse(methods)
+        self.assertEqual(len(fl), len(methods))
+        for method, g in zip(methods, fl):
+            h = f.collapse(method)
+            self.assertTrue(g.equals(h, verbose=2), method)
+
+        with self.assertRaises(ValueError):
+            f.collapse(['mean', 'max'], inplace=True)
+
+        with self.assertRaises(ValueError):
+            f.collapse([])
+
+        with self.assertRaises(ValueError):
+            f.collapse(['mean', 'bad method'])
+
     def test_Field_collapse_GROUPS(self):
         if self.test_only and inspect.stack()[0][3] not in self.test_only:
             return
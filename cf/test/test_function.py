@@ -65,7 +65,7 @@ class functionTest(unittest.TestCase):
         self.assertIsInstance(org, dict)
 
         # Check all keys that should be there are, with correct value type:
-        self.assertEqual(len(org), 13)  # update expected len if add new key(s)
+        self.assertEqual(len(org), 14)  # update expected len if add new key(s)
         # Floats expected as values for most keys. Store these for later as
         # floats need assertAlmostEqual rather than assertEqual tests:
         keys_with_float_values = [
@@ -84,6 +84,7 @@ class functionTest(unittest.TestCase):
         self.assertIsInstance(org['collapse_parallel_mode'], int)
         self.assertIsInstance(org['relaxed_identities'], bool)
         self.assertIsInstance(org['regrid_logging'], bool)
+        self.assertIsInstance(org['regrid_workers'], int)
         # Log level may be input as an int but always given as equiv. string
         self.assertIsInstance(org['log_level'], str)
         self.assertIsInstance(org['tempdir'], str)
@@ -105,6 +106,7 @@ class functionTest(unittest.TestCase):
             'total_memory': 5e10,  # can't in fact be (re)set: test for error
             'free_memory_factor': 0.25,
             'regrid_logging': True,
+            'regrid_workers': 4,
             'collapse_parallel_mode': 2,
             'relaxed_identities': True,
             'log_level': 'INFO',
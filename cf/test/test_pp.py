@@ -1,18 +1,35 @@
 import atexit
 import datetime
+import inspect
 import os
+import pickle
+import shutil
+import sys
 import tempfile
 import unittest
 
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy
+import psutil
 
 import cf
 
+from cf.umread_lib import umfile
+
 n_tmpfiles = 1
 tmpfiles = [tempfile.mkstemp('_test_pp.nc', dir=os.getcwd())[1]
             for i in range(n_tmpfiles)]
 [tmpfile] = tmpfiles
 
+tmpfiles.extend(tempfile.mkstemp('_test_pp.pp', dir=os.getcwd())[1]
+                for i in range(4))
+unpacked_ppfile, scaled_ppfile, packed_ppfile, stash_ppfile = tmpfiles[-4:]
+
+tmpfiles.append(tempfile.mkstemp('_new_STASH_to_CF.txt',
+                                 dir=os.getcwd())[1])
+new_table = tmpfiles[-1]
+
 
 def _remove_tmpfiles():
     '''
@@ -28,12 +45,13 @@ atexit.register(_remove_tmpfiles)
 
 
 class ppTest(unittest.TestCase):
+    test_only = []
+
     def setUp(self):
         self.ppfilename = os.path.join(
             os.path.dirname(os.path.abspath(__file__)), 'wgdos_packed.pp')
 
-        self.new_table = os.path.join(
-            os.path.dirname(os.path.abspath(__file__)), 'new_STASH_to_CF.txt')
+        self.new_table = new_table
 
         text_file = open(self.new_table, 'w')
         text_file.write(
@@ -43,7 +61,56 @@ class ppTest(unittest.TestCase):
         self.chunk_sizes = (100000, 300, 34)
         self.original_chunksize = cf.chunksize()
 
+    def _write_unpacked_ppfile(self, filename=unpacked_ppfile, bmdi=None,
+                               bmks=None):
+        '''Write the data of the WGDOS packed file to an unpacked PP file,
+    returning the data.
+
+        '''
+        with open(self.ppfilename, 'rb') as fh:
+            header = numpy.frombuffer(fh.read(264)[4:260], dtype='<i4')
+
+        f = cf.read(self.ppfilename)[0]
+        array = f.array.astype('<f4')
+
+        int_hdr = header[:45].copy()
+        int_hdr[14] = array.size   # LBLREC
+        int_hdr[20] = 0            # LBPACK
+        int_hdr[28] = 0            # LBEGIN
+
+        real_hdr = header[45:].view('<f4').copy()
+        if bmdi is not None:
+            real_hdr[17] = bmdi
+        if bmks is not None:
+            real_hdr[18] = bmks
+
+        nbytes = numpy.array([array.nbytes], dtype='<i4').tobytes()
+        with open(filename, 'wb') as fh:
+            fh.write(numpy.array([256], dtype='<i4').tobytes())
+            fh.write(int_hdr.tobytes())
+            fh.write(real_hdr.tobytes())
+            fh.write(numpy.array([256], dtype='<i4').tobytes())
+            fh.write(nbytes + array.tobytes() + nbytes)
+
+        return array
+
+    def _write_packed_ppfile(self):
+        '''Write 5 copies of the WGDOS packed record, each at a different
+    hour.
+
+        '''
+        with open(self.ppfilename, 'rb') as fh:
+            record = bytearray(fh.read())
+
+        with open(packed_ppfile, 'wb') as fh:
+            for hour in range(5):
+                record[16:20] = numpy.array([hour], dtype='<i4').tobytes()
+                fh.write(record)
+
     def test_PP_load_stash2standard_name(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
         f = cf.read(self.ppfilename)[0]
         self.assertEqual(f.identity(), 'surface_temperature')
         self.assertEqual(f.Units, cf.Units('K'))
@@ -60,7 +127,102 @@ class ppTest(unittest.TestCase):
 
         cf.load_stash2standard_name()
 
+    def test_PP_stash2standard_name_cache(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        from cf.functions import _stash2standard_name_cache_file
+
+        cache_dir = tempfile.mkdtemp(dir=os.getcwd())
+        xdg_cache_home = os.environ.get('XDG_CACHE_HOME')
+        os.environ['XDG_CACHE_HOME'] = cache_dir
+        try:
+            cache_file = _stash2standard_name_cache_file(self.new_table,
+                                                         '!')
+            self.assertFalse(os.path.isfile(cache_file))
+
+            table = cf.load_stash2standard_name(self.new_table, merge=False)
+            self.assertTrue(os.path.isfile(cache_file))
+            self.assertEqual(table[(1, 24)][0][4], 'NEW_NAME')
+
+            # The binary file is used while the table is unchanged
+            self.assertEqual(
+                cf.load_stash2standard_name(self.new_table, merge=False),
+                table)
+
+            # The binary file is replaced when the table changes
+            with open(self.new_table, 'w') as fh:
+                fh.write('1!24!SURFACE TEMPERATURE!K!!!OTHER_NAME!!')
+
+            stat = os.stat(self.new_table)
+            os.utime(self.new_table,
+                     ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+            table = cf.load_stash2standard_name(self.new_table, merge=False)
+            self.assertEqual(table[(1, 24)][0][4], 'OTHER_NAME')
+            f = cf.read(self.ppfilename)[0]
+            self.assertEqual(f.identity(), 'OTHER_NAME')
+        finally:
+            if xdg_cache_home is None:
+                del os.environ['XDG_CACHE_HOME']
+            else:
+                os.environ['XDG_CACHE_HOME'] = xdg_cache_home
+
+            shutil.rmtree(cache_dir)
+            cf.load_stash2standard_name()
+
+    def test_PP_lazy(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        f = cf.read(self.ppfilename)[0]
+
+        fl = cf.read(self.ppfilename, um={'lazy': True})
+        self.assertEqual(len(fl), 1)
+        g = fl[0]
+        self.assertIsInstance(g, cf.Field)
+        self.assertIsInstance(g, cf.read_write.um.LazyUMField)
+        self.assertEqual(g.identity(), 'surface_temperature')
+        self.assertEqual(g.shape, f.shape)
+        self.assertEqual(g.ndim, f.ndim)
+        self.assertEqual(g.size, f.size)
+        self.assertEqual(g.stash_code, 24)
+        self.assertEqual(g.get_property('stash_code'), '24')
+        self.assertEqual(len(fl.select('surface_temperature')), 1)
+        self.assertEqual(len(fl.select('air_pressure')), 0)
+        self.assertEqual(g.Units, cf.Units('K'))
+        self.assertIsInstance(g, cf.read_write.um.LazyUMField)
+
+        # Populating the field construct does not leave a file open
+        process = psutil.Process()
+        num_fds = process.num_fds()
+        self.assertEqual(g.data.shape, f.shape)
+        self.assertEqual(process.num_fds(), num_fds)
+        self.assertNotIsInstance(g, cf.read_write.um.LazyUMField)
+        self.assertIs(type(g), cf.Field)
+        self.assertEqual(g.shape, f.shape)
+        self.assertTrue(g.equals(f, verbose=2))
+        self.assertTrue(f.equals(g, verbose=2))
+
+        # The default UM version is used for a STASH code whose
+        # standard name depends on the UM version
+        with open(self.ppfilename, 'rb') as fh:
+            record = bytearray(fh.read())
+
+        # LBUSER4
+        record[168:172] = numpy.array([16203], dtype='<i4').tobytes()
+        with open(stash_ppfile, 'wb') as fh:
+            fh.write(record)
+
+        f = cf.read(stash_ppfile)[0]
+        g = cf.read(stash_ppfile, um={'lazy': True})[0]
+        self.assertEqual(g.identity(), 'air_temperature')
+        self.assertTrue(g.equals(f, verbose=2))
+
     def test_PP_WGDOS_UNPACKING(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
         f = cf.read(self.ppfilename)[0]
 
         self.assertTrue(f.minimum() > 221.71,
@@ -93,6 +255,260 @@ class ppTest(unittest.TestCase):
 
         cf.chunksize(self.original_chunksize)
 
+    def test_PP_header_table(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        from cf.umread_lib.umfile import File
+
+        f = File(self.ppfilename)
+        try:
+            self.assertEqual(len(f.headers), 1)
+            var = f.vars[0]
+            rec = var.recs[0]
+            self.assertIs(rec.file, f)
+            self.assertIs(rec.var, var)
+            self.assertTrue((var.int_hdr[0] == rec.int_hdr).all())
+            self.assertTrue((var.real_hdr[0] == rec.real_hdr).all())
+            self.assertEqual(rec.int_hdr.item(41,), 24)
+            self.assertEqual(rec.hdr_offset, f.headers['hdr_offset'][0])
+            self.assertEqual(rec.get_data().size, 73 * 96)
+        finally:
+            f.close_fd()
+
+    def test_PP_extra_data_key(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        from cf.umread_lib.extraData import ExtraData, ExtraDataUnpacker
+
+        x = numpy.array([1, 2, -0.0], dtype='float32')
+        a = ExtraData({'x': x, 'title': 'station'})
+        self.assertEqual(
+            a.key(), ExtraData({'title': 'station', 'x': x.copy()}).key())
+        self.assertEqual(a.compare(ExtraData({'title': 'station',
+                                              'x': x.copy()})), 0)
+
+        # Keys are exact, comparisons have a tolerance
+        b = ExtraData({'title': 'station',
+                       'x': numpy.array([1.000001, 2, 0], 'float32')})
+        self.assertNotEqual(a.key(), b.key())
+        self.assertEqual(a.compare(b), 0)
+        self.assertEqual(b.compare(a), 0)
+
+        b = ExtraData({'title': 'station',
+                       'x': numpy.array([1.01, 2, 0], 'float32')})
+        self.assertNotEqual(a.key(), b.key())
+        self.assertEqual(a.compare(b), -1)
+        self.assertEqual(b.compare(a), 1)
+
+        self.assertNotEqual(a.key(), ExtraData({'x': x}).key())
+        self.assertNotEqual(a.compare(ExtraData({'x': x})), 0)
+        self.assertEqual(ExtraData().key(), ())
+
+        # Extra data are unpacked after conversion to native byte order
+        raw = (numpy.array([3001], dtype='int32').tobytes() +
+               x.tobytes() +
+               numpy.array([0], dtype='int32').tobytes())
+        extra = ExtraDataUnpacker(raw, 4,
+                                  sys.byteorder + '_endian').get_data()
+        self.assertEqual(list(extra), ['x'])
+        self.assertTrue((extra['x'] == x).all())
+        self.assertEqual(extra.key(), ExtraData({'x': x}).key())
+
+        f = umfile.File(self.ppfilename)
+        try:
+            var = f.vars[0]
+            self.assertEqual(var.group_records_by_extra_data(), [var.recs])
+
+            # Records whose extra data are equal to within the
+            # tolerance are grouped together, and the groups are
+            # ordered by their extra data
+            values = (1.01, 1, 0.5, 1.000004, 1.00002)
+            table = numpy.concatenate([var.headers()] * len(values))
+            table['int_hdr'][:, 19] = 4
+            var = umfile.Var(table, numpy.arange(len(values)), 1,
+                             len(values))
+            recs = var.recs
+            for rec, value in zip(recs, values):
+                rec._extra_data = ExtraData(
+                    {'x': numpy.array([value], dtype='float32')})
+
+            self.assertEqual(var.group_records_by_extra_data(),
+                             [[recs[2]], [recs[1], recs[3]], [recs[4]],
+                              [recs[0]]])
+        finally:
+            f.close_fd()
+
+    def test_PP_date2num(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        import cftime
+        from cf.read_write.um.umread import _date2num
+
+        dates = numpy.array([[1991, 1, 1, 0, 0],
+                             [1991, 2, 28, 12, 30],
+                             [1992, 12, 30, 23, 59],
+                             [2000, 3, 1, 6, 0]])
+
+        for calendar in ('360_day', '365_day', 'gregorian'):
+            times = _date2num(dates, 1990, calendar)
+            for date, time in zip(dates.tolist(), times):
+                self.assertEqual(
+                    time,
+                    cftime.date2num(cftime.datetime(*date),
+                                    'days since 1990-1-1', calendar))
+
+        self.assertIsNone(_date2num(dates, 1990, 'julian'))
+        self.assertIsNone(_date2num(dates, 1500, 'gregorian'))
+        self.assertIsNone(
+            _date2num(numpy.array([[1991, 2, 29, 0, 0]]), 1990, '365_day'))
+
+    def test_PP_partial_read(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        array = self._write_unpacked_ppfile()
+
+        f = cf.read(unpacked_ppfile)[0]
+        self.assertTrue((f.array == array).all())
+
+        for indices in ((slice(10, 20), slice(30, 35)),
+                        (slice(None, None, -3), slice(None)),
+                        ([1, 5, 70], [3, 4]),
+                        (numpy.arange(73) % 7 == 0, slice(0, 96, 5)),
+                        (slice(-1, None), 4)):
+            f = cf.read(unpacked_ppfile)[0]
+            self.assertTrue(
+                (f[indices].array == cf.Data(array)[indices].array).all(),
+                indices)
+
+    def test_PP_unpack_mapped(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        array = self._write_unpacked_ppfile(scaled_ppfile)
+        fill_value = array[0, 0]
+        self._write_unpacked_ppfile(scaled_ppfile, bmdi=fill_value, bmks=2)
+
+        mask = (array == fill_value)
+        self.assertTrue(mask.any())
+
+        for indices in (Ellipsis, (slice(0, 10), slice(None))):
+            f = cf.read(scaled_ppfile)[0]
+            g = f[indices].array
+            self.assertTrue((numpy.ma.getmaskarray(g) == mask[indices]).all())
+            self.assertTrue((g == array[indices] * 2).all())
+            self.assertTrue(g.dtype.isnative)
+
+    def test_PP_prefetch(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        self._write_packed_ppfile()
+
+        array = cf.read(self.ppfilename)[0].array
+
+        f = cf.read(packed_ppfile)[0]
+        self.assertEqual(f.shape, (5,) + array.shape)
+
+        subarrays = [p.subarray for p in f.data.partitions.flat]
+        prefetched = cf.data.UMArray.prefetch(subarrays)
+        self.assertEqual(prefetched, subarrays)
+        for subarray in subarrays:
+            self.assertIsNotNone(getattr(subarray, '_prefetched', None))
+            # Prefetched records are not pickled
+            self.assertNotIn('_prefetched',
+                             pickle.loads(pickle.dumps(subarray)).__dict__)
+
+        cf.data.UMArray.release(prefetched)
+        for subarray in subarrays:
+            self.assertIsNone(getattr(subarray, '_prefetched', None))
+
+        # Prefetched records do not outlive a partially completed loop
+        for partition in f.data._prefetched_partitions():
+            break
+
+        for subarray in subarrays:
+            self.assertIsNone(getattr(subarray, '_prefetched', None))
+
+        g = f.array
+        for subarray in subarrays:
+            self.assertIsNone(getattr(subarray, '_prefetched', None))
+
+        for hour in range(5):
+            self.assertTrue((g[hour] == array).all())
+
+        f = cf.read(packed_ppfile)[0]
+        self.assertTrue((f.array == g).all())
+
+    def test_PP_read_records_data(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        self._write_packed_ppfile()
+
+        f = umfile.File(packed_ppfile)
+        recs = [rec for var in f.vars for rec in var.recs]
+        self.assertEqual(len(recs), 5)
+
+        expected = [rec.get_data() for rec in recs]
+        records = [(rec.data_offset, rec.disk_length, rec.int_hdr,
+                    rec.real_hdr)
+                   for rec in recs[::-1]]
+
+        c = f._c_interface
+        try:
+            for max_workers in (None, 1, 2, 8):
+                data = c.read_records_data(f.fd, records, f.byte_ordering,
+                                           f.word_size,
+                                           max_workers=max_workers)
+                for x, y in zip(data, expected[::-1]):
+                    self.assertTrue((x == y).all())
+
+                # Each record has its own memory
+                self.assertFalse(numpy.shares_memory(data[0], data[1]))
+
+            self.assertEqual(c.read_records_data(f.fd, [], f.byte_ordering,
+                                                 f.word_size), [])
+        finally:
+            f.close_fd()
+
+    def test_PP_c_interface(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        from cf.umread_lib import cInterface
+
+        self._write_packed_ppfile()
+
+        f = umfile.File(self.ppfilename)
+        g = umfile.File(packed_ppfile)
+        try:
+            c = f._c_interface
+            self.assertIs(g._c_interface, c)
+            self.assertIs(
+                cInterface.c_interface(f.word_size, f.byte_ordering), c)
+            self.assertIsNot(cInterface.c_interface(8, f.byte_ordering), c)
+            self.assertIs(cInterface.c_interface(8, f.byte_ordering).lib,
+                          c.lib)
+
+            # Records may be read concurrently through the shared
+            # interface
+            recs = [rec for x in (f, g) for var in x.vars
+                    for rec in var.recs]
+            expected = [rec.get_data() for rec in recs]
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                data = list(executor.map(lambda rec: rec.get_data(),
+                                         recs * 4))
+
+            for x, y in zip(data, expected * 4):
+                self.assertTrue((x == y).all())
+        finally:
+            f.close_fd()
+            g.close_fd()
+
 # --- End: class
 
 
@@ -7,10 +7,14 @@ import inspect
 import shutil
 import subprocess
 
+from unittest import mock
+
 import numpy
 
 import cf
 
+from cf.read_write.read import _cached_arrays_to_memory, _save_cache_file
+
 
 n_tmpfiles = 6
 tmpfiles = [tempfile.mkstemp('_test_read_write.nc', dir=os.getcwd())[1]
@@ -175,6 +179,31 @@ class read_writeTest(unittest.TestCase):
 
         shutil.rmtree(dir)
 
+    def test_read_share_masked_strings(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        # Equal masked string arrays are shared between the fields of
+        # different files
+        f = cf.example_field(0)
+        names = numpy.ma.array(['a', 'bb', 'ccc', 'dd', 'e', 'ff', 'g',
+                                'hh'], mask=[0, 0, 1, 0, 0, 0, 0, 0])
+        aux = cf.AuxiliaryCoordinate(data=cf.Data(names))
+        aux.set_property('long_name', 'name')
+        f.set_construct(aux, axes='X')
+
+        cf.write(f, tmpfile0)
+        cf.write(f, tmpfile1)
+
+        g = cf.read([tmpfile0, tmpfile1], aggregate=False)
+        self.assertEqual(len(g), 2)
+
+        a0 = g[0].auxiliary_coordinate('long_name=name')
+        a1 = g[1].auxiliary_coordinate('long_name=name')
+        self.assertTrue(a0.data.equals(a1.data))
+        self.assertTrue(a0.data._shares_arrays(a1.data))
+        self.assertTrue((a0.data.mask.array == names.mask).all())
+
     def test_read_select(self):
         if self.test_only and inspect.stack()[0][3] not in self.test_only:
             return
@@ -185,6 +214,63 @@ class read_writeTest(unittest.TestCase):
         self.assertTrue(f.equals(g, verbose=2),
                         'Bad read with select keyword')
 
+    def test_read_select_pushdown(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        cf.write([cf.example_field(i) for i in (0, 1, 2)], tmpfile0)
+
+        g = cf.read(tmpfile0)
+        for select in ('specific_humidity', 'air_temperature',
+                       'ncvar%q', 'units=K', 'latitude',
+                       'long_name=Grid latitude name', 'foo'):
+            f = cf.read(tmpfile0, select=select)
+            self.assertTrue(
+                f.equals(g.select_by_identity(select), verbose=2), select)
+
+        f = cf.read(tmpfile0, select=['air_temperature', 'ncvar%q'])
+        self.assertEqual(len(f), 2)
+
+        # Keywords of cell_measures and formula_terms attributes that
+        # are also netCDF variable names
+        f = cf.example_field(1)
+        f.cell_measure().nc_set_variable('areacella')
+        area = cf.example_field(0)
+        area.del_property('standard_name')
+        area.set_property('long_name', 'land area')
+        area.nc_set_variable('area')
+        orog = cf.example_field(0)
+        orog.del_property('standard_name')
+        orog.set_property('long_name', 'orography')
+        orog.nc_set_variable('orog')
+        cf.write([f, area, orog], tmpfile0)
+
+        g = cf.read(tmpfile0)
+        self.assertEqual(len(g), 3)
+        for select in ('long_name=land area', 'long_name=orography',
+                       'air_temperature'):
+            f = cf.read(tmpfile0, select=select)
+            self.assertEqual(len(f), 1, select)
+            self.assertTrue(
+                f.equals(g.select_by_identity(select), verbose=2), select)
+
+        # PP: the field constructs of non-matching records are never
+        # created
+        g = cf.read('wgdos_packed.pp')
+        UMField = cf.read_write.um.umread.UMField
+        for select, n in (('surface_temperature', 1),
+                          ('stash_code=24', 1),
+                          ('units=K', 1),
+                          ('air_temperature', 0),
+                          ('units=Pa', 0)):
+            with mock.patch.object(UMField, 'create_fields', autospec=True,
+                                   side_effect=UMField.create_fields) as m:
+                f = cf.read('wgdos_packed.pp', select=select)
+
+            self.assertEqual(m.call_count, n, select)
+            self.assertTrue(
+                f.equals(g.select_by_identity(select), verbose=2), select)
+
     def test_read_squeeze(self):
         if self.test_only and inspect.stack()[0][3] not in self.test_only:
             return
@@ -203,6 +289,96 @@ class read_writeTest(unittest.TestCase):
         f = cf.read(self.filename, aggregate=False)
         f = cf.read(self.filename, aggregate={})
 
+    def test_read_workers(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        pwd = os.path.dirname(os.path.abspath(__file__))
+        files = [os.path.join(pwd, f)
+                 for f in ('test_file.nc', 'test_file2.nc', 'test_file3.nc',
+                           'file.nc', 'wgdos_packed.pp')]
+
+        for aggregate in (False, True):
+            f = cf.read(files, aggregate=aggregate)
+            g = cf.read(files, aggregate=aggregate, workers=3)
+            self.assertEqual(len(g), len(f))
+            for x, y in zip(f, g):
+                self.assertTrue(x.equals(y, verbose=2))
+        # --- End: for
+
+        for workers in (0, 1.5, True):
+            with self.assertRaises(ValueError):
+                cf.read(self.filename, workers=workers)
+
+        # Data in temporary files are moved to memory before being
+        # returned from a worker process
+        f = cf.example_field(0)
+        f.data.to_disk()
+        partitions = list(f.data.partitions.matrix.flat)
+        self.assertTrue(all(p.in_cached_file for p in partitions))
+        cached_files = [p.subarray._partition_file for p in partitions]
+        array = f.array
+
+        _cached_arrays_to_memory([f])
+        self.assertTrue(all(p.in_memory for p in partitions))
+        self.assertFalse(any(map(os.path.exists, cached_files)))
+        self.assertTrue((f.array == array).all())
+
+    def test_read_cache(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        cache = tempfile.mkdtemp(dir=os.getcwd())
+        try:
+            cf.write(cf.read(self.filename), tmpfile)
+            f = cf.read(tmpfile)
+
+            g = cf.read(tmpfile, cache=cache)
+            self.assertEqual(len(os.listdir(cache)), 1)
+            self.assertTrue(f.equals(g, verbose=2))
+
+            # Read from the cache
+            g = cf.read(tmpfile, cache=cache)
+            self.assertEqual(len(os.listdir(cache)), 1)
+            self.assertTrue(f.equals(g, verbose=2))
+
+            # Different keyword parameters
+            g = cf.read(tmpfile, cache=cache, extra='dimension_coordinate')
+            self.assertEqual(len(os.listdir(cache)), 2)
+            self.assertTrue(
+                cf.read(tmpfile, extra='dimension_coordinate').equals(
+                    g, verbose=2))
+
+            # A changed file is read again, and its cache file is
+            # replaced
+            cache_files = set(os.listdir(cache))
+            h = f.copy()
+            h[0].set_property('foo', 'bar')
+            cf.write(h, tmpfile)
+            g = cf.read(tmpfile, cache=cache)
+            self.assertEqual(len(os.listdir(cache)), 2)
+            self.assertEqual(len(cache_files.intersection(os.listdir(cache))),
+                             1)
+            self.assertTrue(h.equals(g, verbose=2))
+
+            # Different chunk size
+            chunksize = cf.chunksize()
+            try:
+                cf.chunksize(chunksize // 2)
+                g = cf.read(tmpfile, cache=cache)
+                self.assertEqual(len(os.listdir(cache)), 3)
+            finally:
+                cf.chunksize(chunksize)
+
+            # Fields with data in temporary files are not cached
+            h = cf.example_field(0)
+            h.data.to_disk()
+            cache_file = os.path.join(cache, 'tempdir_test.pickle')
+            _save_cache_file(cache_file, [h])
+            self.assertFalse(os.path.exists(cache_file))
+        finally:
+            shutil.rmtree(cache)
+
     def test_read_extra(self):
         if self.test_only and inspect.stack()[0][3] not in self.test_only:
             return
@@ -19,6 +19,12 @@ size_t read_words(int fd,
 		  size_t num_words,
 		  Byte_ordering byte_ordering);
 
+size_t pread_words(int fd, 
+		   void *ptr,
+		   size_t num_words,
+		   size_t offset,
+		   Byte_ordering byte_ordering);
+
 int read_extra_data_at_offset(int fd,
 			      size_t extra_data_offset,
 			      size_t extra_data_length,
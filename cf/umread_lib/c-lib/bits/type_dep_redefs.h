@@ -49,6 +49,7 @@
 #define read_hdr_at_offset read_hdr_at_offset_sgl
 #define read_record_data_core read_record_data_core_sgl
 #define read_record_data_dummy read_record_data_dummy_sgl
+#define pread_words pread_words_sgl
 #define read_words read_words_sgl
 #define records_from_different_vars records_from_different_vars_sgl
 #define sec_to_day sec_to_day_sgl
@@ -116,6 +117,7 @@
 #define read_hdr_at_offset read_hdr_at_offset_dbl
 #define read_record_data_core read_record_data_core_dbl
 #define read_record_data_dummy read_record_data_dummy_dbl
+#define pread_words pread_words_dbl
 #define read_words read_words_dbl
 #define records_from_different_vars records_from_different_vars_dbl
 #define sec_to_day sec_to_day_dbl
@@ -26,6 +26,31 @@ size_t read_words(int fd,
 }
 
 
+/*
+ * as read_words, but reads from the given file offset in bytes without
+ * using or changing the file position, so that it is safe to call
+ * concurrently on the same file descriptor
+ */
+size_t pread_words(int fd, 
+		   void *ptr,
+		   size_t num_words,
+		   size_t offset,
+		   Byte_ordering byte_ordering)
+{
+  ssize_t nbytes;
+  size_t nread;
+
+  CKP(ptr);
+  nbytes = pread(fd, ptr, num_words * WORD_SIZE, offset);
+  ERRIF(nbytes < 0);
+  nread = nbytes / WORD_SIZE;
+  if (byte_ordering == REVERSE_ORDERING)
+    swap_bytes(ptr, nread);
+  return nread;
+  ERRBLKI;
+}
+
+
 int read_extra_data_core(int fd,
 			 size_t extra_data_offset,
 			 size_t extra_data_length, 
@@ -345,13 +370,16 @@ int read_record_data_core(int fd,
 
   packed_data = NULL;
 
-  CKI(   lseek(fd, data_offset, SEEK_SET)   );
+  /* The data are read with pread rather than lseek and read, so that
+   * several records in the same file may be read concurrently
+   */
   pack = get_var_packing(int_hdr);
 
   if (pack == 0)
     {
       /* unpacked data -- read, and byte swap if necessary */
-      ERRIF(   read_words(fd, data_return, nwords, byte_ordering)  != nwords);
+      ERRIF(   pread_words(fd, data_return, nwords, data_offset, 
+			   byte_ordering)  != nwords);
     }
   else
     {
@@ -393,7 +421,7 @@ int read_record_data_core(int fd,
        * see the Python code.)
        */
       CKP(   packed_data = malloc(packed_bytes)  );
-      ERRIF(   read(fd, packed_data, packed_bytes)  != packed_bytes   );
+      ERRIF(   pread(fd, packed_data, packed_bytes, data_offset)  != packed_bytes   );
 
       /* NOW UNPACK ACCORDING TO PACKING TYPE (including byte swapping where necessary). */
       
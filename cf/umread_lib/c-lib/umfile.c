@@ -102,6 +102,53 @@ int read_header(int fd,
 }
 
 
+int read_many_records_data(int fd, 
+			   size_t nrecs,
+			   const size_t *data_offsets, 
+			   const size_t *disk_lengths, 
+			   Byte_ordering byte_ordering, 
+			   int word_size, 
+			   const void *int_hdrs,
+			   const void *real_hdrs,
+			   const size_t *nwords, 
+			   void *data_return)
+{
+  size_t irec, pos;
+
+  errorhandle_init();
+
+  pos = 0;
+  for (irec = 0; irec < nrecs; irec++)
+    {
+      switch(word_size) 
+	{
+	case 4:
+	  CKI(  read_record_data_core_sgl(fd, data_offsets[irec], disk_lengths[irec], 
+					  byte_ordering, 
+					  (const int32_t *) int_hdrs + irec * N_INT_HDR, 
+					  (const float32_t *) real_hdrs + irec * N_REAL_HDR, 
+					  nwords[irec], 
+					  (int32_t *) data_return + pos)  );
+	  break;
+	case 8:
+	  CKI(  read_record_data_core_dbl(fd, data_offsets[irec], disk_lengths[irec], 
+					  byte_ordering, 
+					  (const int64_t *) int_hdrs + irec * N_INT_HDR, 
+					  (const float64_t *) real_hdrs + irec * N_REAL_HDR, 
+					  nwords[irec], 
+					  (int64_t *) data_return + pos)  );
+	  break;
+	default:
+	  /* invalid word size */
+	  ERR;
+	}
+      pos += nwords[irec];
+    }
+  return 0;
+  ERRBLKI;
+}
+
+
 File *file_parse(int fd,
 		 File_type file_type)
 {
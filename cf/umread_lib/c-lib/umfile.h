@@ -166,6 +166,33 @@ int read_record_data(int fd,
 /* ------------------------------------------------------------------- */
 
 
+int read_many_records_data(int fd, 
+			   size_t nrecs,
+			   const size_t *data_offsets, 
+			   const size_t *disk_lengths, 
+			   Byte_ordering byte_ordering, 
+			   int word_size, 
+			   const void *int_hdrs,
+			   const void *real_hdrs,
+			   const size_t *nwords, 
+			   void *data_return);
+/* 
+   As read_record_data, but reads the data of nrecs records of the same
+   file in one call.  The data offsets, disk lengths and numbers of words
+   of the records are provided as arrays of length nrecs, and their PP 
+   headers as contiguous arrays of nrecs * 45 ints and nrecs * 19 
+   floats/doubles.  
+
+   The data of the records are returned one after another in 
+   data_return, for which the caller must provide storage of the sum of
+   nwords words.  The records should be in order of increasing data 
+   offset, so that the file is read sequentially.
+
+   Return value is 0 for success, 1 for failure.
+*/
+/* ------------------------------------------------------------------- */
+
+
 int get_extra_data_offset_and_length(int word_size, 
 				     const void *int_hdr,
 				     size_t data_offset,
@@ -1,7 +1,10 @@
 import os
+import threading
 
 import ctypes as CT
 
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy
 import numpy.ctypeslib
 
@@ -11,6 +14,15 @@ from . import umfile
 _len_real_hdr = 19
 _len_int_hdr = 45
 
+# The loaded C libraries, keyed by their paths
+_libs = {}
+
+# The shared CInterface objects, keyed by (word size, byte ordering,
+# library name) tuples
+_c_interfaces = {}
+
+_lock = threading.RLock()
+
 
 class File_type(CT.Structure):
     _fields_ = [
@@ -40,6 +52,23 @@ def _get_ctypes_array(dtype, size=None):
     return numpy.ctypeslib.ndpointer(**kwargs)
 
 
+def header_dtype(int_type, float_type):
+    '''Get the numpy structured data type of a table of record headers.
+
+    Each element of the table contains the integer and real headers
+    of a record, and the offsets and length of the record in the
+    file.
+
+    '''
+    return numpy.dtype([
+        ('int_hdr', int_type, (_len_int_hdr,)),
+        ('real_hdr', float_type, (_len_real_hdr,)),
+        ('hdr_offset', numpy.int64),
+        ('data_offset', numpy.int64),
+        ('disk_length', numpy.int64),
+    ])
+
+
 def _gen_rec_class(int_type, float_type):
     class Rec(CT.Structure):
         '''ctypes object corresponding to the `Rec` object in the C code.
@@ -125,6 +154,51 @@ enum_byte_ordering = Enum('little_endian', 'big_endian')
 enum_data_type = Enum('integer', 'real')
 
 
+def c_interface(word_size=None, byte_ordering=None, lib_name='umfile.so'):
+    '''Return the process-wide `CInterface` for a file type.
+
+    There is one `CInterface` for each combination of arguments,
+    which is created the first time that it is needed and then shared
+    by all files of that type, so that the C library is loaded, and
+    the function prototypes are built, only once. A `CInterface` is
+    never changed after creation, so may be used by many threads.
+
+    .. versionadded:: 3.8.0
+
+    :Parameters:
+
+        word_size: `int`, optional
+            4 or 8. If not set then the returned `CInterface` may
+            only be used to detect file types.
+
+        byte_ordering: `str`, optional
+            'little_endian' or 'big_endian'
+
+        lib_name: `str`, optional
+            The name of the C library binary.
+
+    :Returns:
+
+        `CInterface`
+
+    '''
+    key = (word_size, byte_ordering, lib_name)
+    c = _c_interfaces.get(key)
+    if c is None:
+        with _lock:
+            c = _c_interfaces.get(key)
+            if c is None:
+                c = CInterface(lib_name)
+                if word_size is not None:
+                    c.set_word_size(word_size)
+
+                c.byte_ordering = byte_ordering
+                _c_interfaces[key] = c
+        # --- End: with
+
+    return c
+
+
 class CInterface:
     '''Interface to the C shared library functions.
 
@@ -142,7 +216,72 @@ class CInterface:
             os.path.dirname(__file__) or '.', 'c-lib'
         )
         lib_path = os.path.join(lib_dir, lib_name)
-        self.lib = CT.CDLL(lib_path)
+
+        lib = _libs.get(lib_path)
+        if lib is None:
+            with _lock:
+                lib = _libs.get(lib_path)
+                if lib is None:
+                    lib = CT.CDLL(lib_path)
+                    _libs[lib_path] = lib
+        # --- End: if
+
+        self.lib = lib
+        self.byte_ordering = None
+
+        # Output arguments, reused by the calls made from each thread
+        self._scratch = threading.local()
+
+    def _function(self, name, argtypes=None, restype=None):
+        '''Return a function of the C library with fixed argument and
+    return types.
+
+    The function pointer is private to this object, so its types are
+    not changed by the prototypes of other `CInterface` objects, which
+    share the same library.
+
+    .. versionadded:: 3.8.0
+
+    :Parameters:
+
+        name: `str`
+            The name of the function.
+
+        argtypes: sequence of ctypes types, optional
+
+        restype: ctypes type, optional
+
+    :Returns:
+
+            The ctypes function pointer.
+
+        '''
+        func = self.lib[name]
+        if argtypes is not None:
+            func.argtypes = argtypes
+
+        if restype is not None:
+            func.restype = restype
+
+        return func
+
+    def _scratch_values(self):
+        '''Return the output arguments of the calling thread.
+
+    .. versionadded:: 3.8.0
+
+    :Returns:
+
+        `CT.c_int`, `CT.c_size_t`, `CT.c_size_t`
+
+        '''
+        scratch = self._scratch
+        try:
+            return scratch.values
+        except AttributeError:
+            values = (CT.c_int(), CT.c_size_t(), CT.c_size_t())
+            scratch.values = values
+            return values
 
     def _is_null_pointer(self, ptr):
         '''TODO
@@ -233,7 +372,11 @@ class CInterface:
         '''Sets the word size used to interpret returned pointers from
     subsequent calls, in particular the pointers to PP headers
     embedded in the tree of objects returned by `file_parse` and the
-    data array that is populated by `read_record_data`.
+    data array that is populated by `read_record_data`, and builds
+    the prototypes of the C library functions for that word size.
+
+    A `CInterface` returned by `c_interface` already has its word
+    size set, and must not be changed, as it is shared.
 
    :Parameters:
 
@@ -264,6 +407,58 @@ class CInterface:
                 "Word size must be 4 or 8 (not {!r})".format(word_size)
             )
 
+        # Build the prototypes of the functions whose types depend on
+        # the word size
+        int_array = self._get_ctypes_int_array()
+        real_array = self._get_ctypes_real_array()
+        file_p_type = CT.POINTER(self.file_class)
+
+        self._file_parse = self._function('file_parse',
+                                          restype=file_p_type)
+        self._file_free = self._function('file_free', [file_p_type])
+        self._get_type_and_num_words = self._function(
+            'get_type_and_num_words',
+            [CT.c_int, int_array, CT.POINTER(CT.c_int),
+             CT.POINTER(CT.c_size_t)])
+        self._get_extra_data_offset_and_length = self._function(
+            'get_extra_data_offset_and_length',
+            [CT.c_int, int_array, CT.c_size_t, CT.c_size_t,
+             CT.POINTER(CT.c_size_t), CT.POINTER(CT.c_size_t)])
+        self._read_header = self._function(
+            'read_header',
+            [CT.c_int, CT.c_size_t, CT.c_int, CT.c_int, int_array,
+             real_array])
+        self._read_extra_data = self._function(
+            'read_extra_data',
+            [CT.c_int, CT.c_size_t, CT.c_size_t, CT.c_int, CT.c_int,
+             CT.c_char_p])
+        self._read_record_data = {
+            data_type: self._function(
+                'read_record_data',
+                [CT.c_int, CT.c_size_t, CT.c_size_t, CT.c_int, CT.c_int,
+                 int_array, real_array, CT.c_size_t, ctypes_data])
+            for data_type, ctypes_data in (('integer', int_array),
+                                           ('real', real_array))
+        }
+        self._read_many_records_data = self._function(
+            'read_many_records_data',
+            [CT.c_int, CT.c_size_t, _get_ctypes_array(numpy.uintp),
+             _get_ctypes_array(numpy.uintp), CT.c_int, CT.c_int,
+             CT.c_void_p, CT.c_void_p, _get_ctypes_array(numpy.uintp),
+             CT.c_void_p])
+
+    def header_dtype(self):
+        '''Get the numpy structured data type of a table of record headers
+    according to word size previously set with `set_word_size`.
+
+    :Returns:
+
+        `numpy.dtype`
+
+        '''
+        return header_dtype(self.file_data_int_type,
+                            self.file_data_real_type)
+
     def _get_ctypes_int_array(self, size=None):
         '''TODO
 
@@ -310,92 +505,99 @@ class CInterface:
             variables, as that is all that the caller requires.
 
         '''
-        func = self.lib.file_parse
-        file_p_type = CT.POINTER(self.file_class)
-        func.restype = file_p_type
-
-        file_p = func(fh, file_type)
+        file_p = self._file_parse(fh, file_type)
         if self._is_null_pointer(file_p):
             raise umfile.UMFileException("File parsing failed")
 
         file = file_p.contents
-        c_vars = file.vars[:file.nvars]
-        rv = {'vars': list(map(self.c_var_to_py_var, c_vars))}
+        c_vars = [c_var_p.contents for c_var_p in file.vars[:file.nvars]]
+
+        # Copy the headers of all records into a single table
+        table = numpy.empty(sum([c_var.nz * c_var.nt for c_var in c_vars]),
+                            dtype=self.header_dtype())
+
+        vars = []
+        start = 0
+        for c_var in c_vars:
+            stop = start + c_var.nz * c_var.nt
+            self.c_recs_to_table(c_var.recs, table, start, stop)
+
+            svi = c_var.supervar_index
+            if svi < 0:
+                svi = None
+
+            vars.append(umfile.Var(table, numpy.arange(start, stop),
+                                   c_var.nz, c_var.nt, svi))
+            start = stop
+        # --- End: for
+
+        rv = {'vars': vars, 'headers': table}
 
         # Now that we have copied all the data into python objects for
         # the caller, free any memory allocated in the C code before
         # returning
-        free_func = self.lib.file_free
-        free_func._fields_ = file_p_type
-        free_func(file_p)
+        self._file_free(file_p)
 
         return rv
 
-    def c_var_to_py_var(self, c_var_p):
-        '''Create a `umfile.Var` object from a ctypes object corresponding to
-    'Var*' in the C code.
+    def c_recs_to_table(self, c_recs, table, start, stop):
+        '''Copy the headers, offsets and lengths of records from a ctypes
+    object corresponding to 'Rec**' in the C code into rows of a table
+    of record headers.
 
-   :Returns:
+    The headers are copied directly from the memory allocated in the
+    C code, rather than via intermediate Python objects.
 
-       `umfile.Var`
+    :Parameters:
 
-        '''
-        c_var = c_var_p.contents
-        nz = c_var.nz
-        nt = c_var.nt
-        svi = c_var.supervar_index
-        if svi < 0:
-            svi = None
-
-        c_recs = c_var.recs
-        recs = [
-            self.c_rec_to_py_rec(c_recs[recid]) for recid in range(nz * nt)
-        ]
+        c_recs: ctypes pointer
+            The records.
 
-        return umfile.Var(recs, nz, nt, svi)
+        table: `numpy.ndarray`
+            The table of record headers, with the data type given by
+            `header_dtype`.
 
-    def c_rec_to_py_rec(self, c_rec_p):
-        '''Create a `umfile.Rec` object from a ctypes object corresponding to
-   'Rec*' in the C code.
+        start, stop: `int`
+            The rows of the table to fill.
 
    :Returns:
 
-       `umfile.Rec`
+       `None`
 
         '''
-        c_rec = c_rec_p.contents
-
-        # ============================================================
-        # Previous code - causing memory leaks per
-        # https://github.com/numpy/numpy/issues/6511
-        #
-        #     # numpy.copy used here so we can go back and free the memory
-        #     # allocated by C without affecting the python object
-        #     int_hdr = numpy.copy(numpy.ctypeslib.as_array(c_rec.int_hdr))
-        #     real_hdr = numpy.copy(numpy.ctypeslib.as_array(c_rec.real_hdr))
-        # ============================================================
-
-        #
-        # -------------------------------
-        # Workaround: instead cast to a pointer, obtain the values knowing
-        # the length of the header arrays, and copy into an appropriate
-        # numpy array
-        #
-        ptr = CT.cast(c_rec.int_hdr, self._int_ptr)
-        int_hdr = numpy.array(
-            ptr[:_len_int_hdr], dtype=self.file_data_int_type)
-
-        ptr = CT.cast(c_rec.real_hdr, self._real_ptr)
-        real_hdr = numpy.array(
-            ptr[:_len_real_hdr], dtype=self.file_data_real_type)
-        # ============================================================
-
-        header_offset = c_rec.header_offset
-        data_offset = c_rec.data_offset
-        disk_length = c_rec.disk_length
-        return umfile.Rec(
-            int_hdr, real_hdr, header_offset, data_offset, disk_length
-        )
+        fields = table.dtype.fields
+        int_hdr_offset = fields['int_hdr'][1]
+        real_hdr_offset = fields['real_hdr'][1]
+        int_hdr_size = fields['int_hdr'][0].itemsize
+        real_hdr_size = fields['real_hdr'][0].itemsize
+
+        itemsize = table.dtype.itemsize
+        address = table.ctypes.data + start * itemsize
+
+        hdr_offset = []
+        data_offset = []
+        disk_length = []
+        for recid in range(stop - start):
+            c_rec = c_recs[recid].contents
+
+            # Note: Copying the header memory, rather than creating
+            #       numpy arrays from the ctypes arrays, also avoids
+            #       the memory leaks described in
+            #       https://github.com/numpy/numpy/issues/6511
+            CT.memmove(address + int_hdr_offset,
+                       CT.cast(c_rec.int_hdr, CT.c_void_p), int_hdr_size)
+            CT.memmove(address + real_hdr_offset,
+                       CT.cast(c_rec.real_hdr, CT.c_void_p), real_hdr_size)
+            address += itemsize
+
+            hdr_offset.append(c_rec.header_offset)
+            data_offset.append(c_rec.data_offset)
+            disk_length.append(c_rec.disk_length)
+        # --- End: for
+
+        table['hdr_offset'][start:stop] = hdr_offset
+        table['data_offset'][start:stop] = data_offset
+        table['disk_length'][start:stop] = disk_length
 
     def get_type_and_num_words(self, int_hdr):
         '''From the integer header, work out data type and number of words to
@@ -408,19 +610,12 @@ class CInterface:
 
         '''
         word_size = int_hdr.itemsize
-        self.lib.get_type_and_num_words.argtypes = [
-            CT.c_int,
-            self._get_ctypes_int_array(),
-            CT.POINTER(CT.c_int),
-            CT.POINTER(CT.c_size_t),
-        ]
-        data_type = CT.c_int()
-        num_words = CT.c_size_t()
-        rv = self.lib.get_type_and_num_words(
+        data_type, num_words, _ = self._scratch_values()
+        rv = self._get_type_and_num_words(
             word_size,
             int_hdr,
-            CT.pointer(data_type),
-            CT.pointer(num_words),
+            CT.byref(data_type),
+            CT.byref(num_words),
         )
         if rv != 0:
             raise umfile.UMFileException(
@@ -440,20 +635,10 @@ class CInterface:
 
         '''
         word_size = int_hdr.itemsize
-        func = self.lib.get_extra_data_offset_and_length
-        func.argtypes = [
-            CT.c_int,
-            self._get_ctypes_int_array(),
-            CT.c_size_t,
-            CT.c_size_t,
-            CT.POINTER(CT.c_size_t),
-            CT.POINTER(CT.c_size_t),
-        ]
-        extra_data_offset = CT.c_size_t()
-        extra_data_length = CT.c_size_t()
-        rv = func(
+        _, extra_data_offset, extra_data_length = self._scratch_values()
+        rv = self._get_extra_data_offset_and_length(
             word_size, int_hdr, data_offset, disk_length,
-            CT.pointer(extra_data_offset), CT.pointer(extra_data_length)
+            CT.byref(extra_data_offset), CT.byref(extra_data_length)
         )
         if rv != 0:
             raise umfile.UMFileException(
@@ -471,18 +656,9 @@ class CInterface:
             The integer and real parts of the header.
 
         '''
-        self.lib.read_header.argtypes = [
-            CT.c_int,
-            CT.c_size_t,
-            CT.c_int,
-            CT.c_int,
-            self._get_ctypes_int_array(),
-            self._get_ctypes_real_array(),
-        ]
-
         int_hdr = self._get_empty_int_array(_len_int_hdr)
         real_hdr = self._get_empty_real_array(_len_real_hdr)
-        rv = self.lib.read_header(
+        rv = self._read_header(
             fd,
             header_offset,
             enum_byte_ordering.as_index(byte_ordering),
@@ -510,16 +686,7 @@ class CInterface:
         '''
         extra_data = b"\0" * extra_data_length
 
-        self.lib.read_extra_data.argtypes = [
-            CT.c_int,
-            CT.c_size_t,
-            CT.c_size_t,
-            CT.c_int,
-            CT.c_int,
-            CT.c_char_p,
-        ]
-
-        rv = self.lib.read_extra_data(
+        rv = self._read_extra_data(
             fd,
             extra_data_offset,
             extra_data_length,
@@ -553,26 +720,12 @@ class CInterface:
         '''
         if data_type == 'integer':
             data = self._get_empty_int_array(nwords)
-            ctypes_data = self._get_ctypes_int_array()
         elif data_type == 'real':
             data = self._get_empty_real_array(nwords)
-            ctypes_data = self._get_ctypes_real_array()
         else:
             raise ValueError("data_type must be 'integer' or 'real'")
 
-        self.lib.read_record_data.argtypes = [
-            CT.c_int,
-            CT.c_size_t,
-            CT.c_size_t,
-            CT.c_int,
-            CT.c_int,
-            self._get_ctypes_int_array(),
-            self._get_ctypes_real_array(),
-            CT.c_size_t,
-            ctypes_data,
-        ]
-
-        rv = self.lib.read_record_data(
+        rv = self._read_record_data[data_type](
             fd,
             data_offset,
             disk_length,
@@ -589,6 +742,117 @@ class CInterface:
 
         return data
 
+    def read_records_data(self, fd, records, byte_ordering, word_size,
+                          max_workers=None):
+        '''Reads the data of many records from an open file.
+
+    The records are sorted by data offset and split into contiguous
+    runs, one for each thread. Each run is read and unpacked by a
+    single call to the C library, into its own part of one
+    preallocated block of memory. The C library reads each record
+    without using the file position, and ctypes releases the GIL for
+    the duration of each call, so the runs are read in parallel.
+
+    Each record is copied out of the block, so that the block is
+    freed on return and a record that is kept does not keep the
+    memory of the others.
+
+    .. versionadded:: 3.8.0
+
+        inputs:
+           fd - integer low-level file descriptor
+           records - sequence of (data_offset, disk_length, int_hdr,
+                     real_hdr) tuples, as for `read_record_data`
+           byte_ordering - 'little_endian' or 'big_endian'
+           word_size - 4 or 8
+           max_workers - the maximum number of threads, by default
+                         the number of CPUs
+
+        returns:
+           list of numpy arrays, one for each record
+
+        '''
+        nrecs = len(records)
+        if not nrecs:
+            return []
+
+        int_type = self.file_data_int_type
+        real_type = self.file_data_real_type
+
+        order = sorted(range(nrecs), key=lambda i: records[i][0])
+
+        data_offsets = numpy.empty(nrecs, dtype=numpy.uintp)
+        disk_lengths = numpy.empty(nrecs, dtype=numpy.uintp)
+        int_hdrs = numpy.empty((nrecs, _len_int_hdr), dtype=int_type)
+        real_hdrs = numpy.empty((nrecs, _len_real_hdr), dtype=real_type)
+        for n, i in enumerate(order):
+            data_offset, disk_length, int_hdr, real_hdr = records[i]
+            data_offsets[n] = data_offset
+            disk_lengths[n] = disk_length
+            int_hdrs[n] = int_hdr
+            real_hdrs[n] = real_hdr
+
+        # Find the data type and number of words of each record
+        func = self._get_type_and_num_words
+        data_type, num_words, _ = self._scratch_values()
+        integer = enum_data_type.as_index('integer')
+        is_integer = []
+        nwords = numpy.empty(nrecs, dtype=numpy.uintp)
+        for n, int_hdr in enumerate(int_hdrs):
+            rv = func(word_size, int_hdr, CT.byref(data_type),
+                      CT.byref(num_words))
+            if rv != 0:
+                raise umfile.UMFileException(
+                    "Error determining data type and size from integer "
+                    "header"
+                )
+
+            is_integer.append(data_type.value == integer)
+            nwords[n] = num_words.value
+
+        ends = numpy.cumsum(nwords)
+        starts = ends - nwords
+        data = numpy.empty(int(ends[-1]), dtype=real_type)
+
+        func = self._read_many_records_data
+        byte_ordering = enum_byte_ordering.as_index(byte_ordering)
+
+        def read(run):
+            start, stop = run
+            rv = func(fd, stop - start,
+                      data_offsets[start:stop],
+                      disk_lengths[start:stop],
+                      byte_ordering, word_size,
+                      int_hdrs[start:stop].ctypes.data,
+                      real_hdrs[start:stop].ctypes.data,
+                      nwords[start:stop],
+                      data[starts[start]:].ctypes.data)
+            if rv != 0:
+                raise umfile.UMFileException("Error reading record data")
+
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+
+        nruns = max(1, min(nrecs, max_workers))
+        bounds = numpy.linspace(0, nrecs, nruns + 1).astype(int).tolist()
+        runs = list(zip(bounds[:-1], bounds[1:]))
+
+        if nruns == 1:
+            read(runs[0])
+        else:
+            with ThreadPoolExecutor(max_workers=nruns) as executor:
+                list(executor.map(read, runs))
+
+        out = [None] * nrecs
+        for n, i in enumerate(order):
+            array = data[starts[n]:ends[n]].copy()
+            if is_integer[n]:
+                array = array.view(int_type)
+
+            out[i] = array
+
+        return out
+
 # --- End: class
 
 
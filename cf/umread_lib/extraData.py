@@ -1,5 +1,4 @@
 import sys
-import string
 import numpy
 
 
@@ -29,61 +28,87 @@ class ExtraData(dict):
 
     _key_to_type = dict([(key, typ) for key, typ in _codes.values()])
 
-    def sorted_keys(self):
-        k = self.keys()
-        k.sort()
-        return k
-
     _tolerances = {numpy.dtype(numpy.float32): 1e-5,
                    numpy.dtype(numpy.float64): 1e-13}
 
-    def _cmp_floats(self, a, b, tolerance):
-        if a == b:
-            return 0
-        delta = abs(b * tolerance)
-        if a < b - delta:
-            return -1
-        if a > b + delta:
-            return 1
-        return 0
+    def key(self):
+        """Return a hashable key that identifies the extra data exactly.
 
-    def _cmp_float_arrays(self, avals, bvals):
-        n = len(avals)
-        c = cmp(n, len(bvals))
-        if c != 0:
-            return c
-        tolerance = self._tolerances[avals.dtype]
-        for i in range(n):
-            c = self._cmp_floats(avals[i], bvals[i], tolerance)
-            if c != 0:
-                return c
-        return 0
+        Extra data with equal keys compare equal, so records may be
+        put into groups of identical extra data by their keys, and
+        only one member of each group needs to be compared with
+        `compare`.
+
+        """
+        out = []
+        for name in sorted(self):
+            vals = self[name]
+            if self._key_to_type[name] == float:
+                vals = numpy.asanyarray(vals)
+                vals = (vals.dtype.str, vals.tobytes())
+
+            out.append((name, vals))
+
+        return tuple(out)
+
+    def compare(self, other):
+        """Compare with the extra data of another record.
+
+        Floating point values are equal if they agree to within the
+        relative tolerance for their data type.
+
+        :Returns:
 
-    def __cmp__(self, other):
-        """Compare two extra data dictionaries returned by unpacker
+            `int`
+                -1, 0 or 1 if the extra data are respectively less
+                than, equal to or greater than *other*.
 
         """
-        if other is None:
-            return 1
-        ka = self.sorted_keys()
-        kb = other.sorted_keys()
-        c = cmp(ka, kb)
-        if c != 0:
-            return c
-        for key in ka:
-            valsa = self[key]
-            valsb = other[key]
-            typ = self._key_to_type[key]
-            if typ == float:
-                c = self._cmp_float_arrays(valsa, valsb)
-            elif type == str:
-                c = cmp(valsa, valsb)
+        names = sorted(self)
+        other_names = sorted(other)
+        if names != other_names:
+            return -1 if names < other_names else 1
+
+        for name in names:
+            a = self[name]
+            b = other[name]
+            if self._key_to_type[name] == float:
+                c = self._compare_float_arrays(a, b)
             else:
-                assert(False)
-            if c != 0:
+                c = (a > b) - (a < b)
+
+            if c:
                 return c
+        # --- End: for
+
         return 0
 
+    def _compare_float_arrays(self, a, b):
+        """Compare two arrays of floating point values.
+
+        The arrays are compared by length and then element by element,
+        with elements equal if they agree to within the relative
+        tolerance for their data type.
+
+        :Returns:
+
+            `int`
+                -1, 0 or 1.
+
+        """
+        n = len(a)
+        if n != len(b):
+            return -1 if n < len(b) else 1
+
+        delta = abs(b * self._tolerances[a.dtype])
+        less = a < b - delta
+        greater = a > b + delta
+        differ = less | greater
+        if not differ.any():
+            return 0
+
+        return -1 if less[differ.argmax()] else 1
+
 
 class ExtraDataUnpacker:
 
@@ -116,11 +141,9 @@ class ExtraDataUnpacker:
         """
         if self.is_swapped:
             # concatenate backwards substrings
-            st = string.join([st[pos: pos + self.ws][::-1]
-                              for pos in range(0, len(st), self.ws)], "")
-        while st.endswith("\x00"):
-            st = st[:-1]
-        return st
+            st = b"".join([st[pos: pos + self.ws][::-1]
+                           for pos in range(0, len(st), self.ws)])
+        return st.rstrip(b"\x00").decode("latin-1")
 
     def get_data(self):
         """
@@ -128,14 +151,14 @@ class ExtraDataUnpacker:
         """
         d = {}
         while self.rdata:
-            i = numpy.fromstring(self.next_words(1), self.itype)[0]
+            i = int(numpy.frombuffer(self.next_words(1), self.itype)[0])
             if i == 0:
                 break
-            ia, ib = (i / 1000, i % 1000)
+            ia, ib = divmod(i, 1000)
             key, type = _codes[ib]
             rawvals = self.next_words(ia)
             if type == float:
-                vals = numpy.fromstring(rawvals, self.ftype)
+                vals = numpy.frombuffer(rawvals, self.ftype)
             elif type == str:
                 vals = self.tweak_string(rawvals)
             d[key] = vals
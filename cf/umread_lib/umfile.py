@@ -1,3 +1,4 @@
+import mmap
 import os
 
 from functools import cmp_to_key
@@ -5,7 +6,12 @@ from functools import cmp_to_key
 import numpy
 
 from . import cInterface
-from .extraData import ExtraDataUnpacker
+from .extraData import ExtraData, ExtraDataUnpacker
+
+
+# The index of LBEXT (the length of the extra data) in the integer
+# header
+_LBEXT = 19
 
 
 class UMFileException(Exception):
@@ -53,11 +59,9 @@ class File:
             `get_data` method of those `Rec` objects will work.
 
         '''
-        c = cInterface.CInterface()
-        self._c_interface = c
-
         self.path = path
         self.fd = None
+        self._mmap = None
         self.open_fd()
 
         if byte_ordering and word_size and fmt:
@@ -67,14 +71,15 @@ class File:
         else:
             self._detect_file_type()
 
-        self.path = path
+        # Use the shared C interface for this file type, which has
+        # the word size used to interpret file pointers already set
+        c = cInterface.c_interface(self.word_size, self.byte_ordering)
+        self._c_interface = c
+
         file_type_obj = c.create_file_type(
             self.fmt, self.byte_ordering, self.word_size
         )
 
-        # Set the word size used to interpret file pointers
-        c.set_word_size(file_type_obj)
-
         if parse:
             # --------------------------------------------------------
             # Work out information from the file and store it in the
@@ -85,6 +90,7 @@ class File:
             # --------------------------------------------------------
             info = c.parse_file(self.fd, file_type_obj)
             self.vars = info["vars"]
+            self.headers = info["headers"]
             self._add_back_refs()
 
     def open_fd(self):
@@ -109,11 +115,40 @@ class File:
         `None`
 
         '''
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # There are still numpy views of the memory map, which
+                # will keep it open until they are garbage collected
+                pass
+
+            self._mmap = None
+
         if self.fd:
             os.close(self.fd)
 
         self.fd = None
 
+    def mmap(self):
+        '''Return a read-only memory map of the whole file.
+
+    The memory map is created the first time it is needed and is
+    closed along with the low-level file descriptor.
+
+    .. versionadded:: 3.8.0
+
+    :Returns:
+
+        `mmap.mmap`
+
+        '''
+        if self._mmap is None:
+            self._mmap = mmap.mmap(self.open_fd(), 0,
+                                   access=mmap.ACCESS_READ)
+
+        return self._mmap
+
     def _detect_file_type(self):
         '''TODO
 
@@ -122,7 +157,7 @@ class File:
         `None`
 
         '''
-        c = self._c_interface
+        c = cInterface.c_interface()
         try:
             file_type_obj = c.detect_file_type(self.fd)
         except Exception:
@@ -135,11 +170,12 @@ class File:
         self.word_size = d["word_size"]
 
     def _add_back_refs(self):
-        '''Add file attribute to `Var` objects, and both `!file` and `!var`
-    attributes to `Rec` objects.
+        '''Add file attribute to `Var` objects.
 
-    The important one is the file attribute in the `Rec` object, as
-    this is used when reading data. The others are provided for extra
+    The `Rec` objects of each `Var` object, which are created when
+    first accessed, are given both `!file` and `!var` attributes. The
+    important one is the file attribute in the `Rec` object, as this
+    is used when reading data. The others are provided for extra
     convenience.
 
     :Returns:
@@ -149,9 +185,6 @@ class File:
         '''
         for var in self.vars:
             var.file = self
-            for rec in var.recs:
-                rec.var = var
-                rec.file = self
 
 # --- End: class
 
@@ -159,51 +192,102 @@ class File:
 class Var:
     '''Container for some information about variables.
 
+    The record headers are not stored by the variable, which is a
+    view of the rows of a table of record headers that is shared by
+    all of the variables in a file.
+
     '''
-    def __init__(self, recs, nz, nt, supervar_index=None):
-        self.recs = recs
+    def __init__(self, table, indices, nz, nt, supervar_index=None):
+        '''**Initialisation**
+
+    :Parameters:
+
+        table: `numpy.ndarray`
+            The table of record headers, as created by
+            `CInterface.parse_file`.
+
+        indices: `numpy.ndarray`
+            The rows of the table that contain the records of the
+            variable.
+
+        nz, nt: `int`
+            The numbers of vertical levels and times.
+
+        supervar_index: `int`, optional
+
+        '''
+        self.table = table
+        self.indices = indices
         self.nz = nz
         self.nt = nt
         self.supervar_index = supervar_index
+        self._recs = None
 
-    @staticmethod
-    def _compare(x, y):
-        '''Method equivalent to the Python 2 'cmp'.
+    @property
+    def recs(self):
+        '''The `Rec` objects of the variable, created when first accessed.
 
-    Note that (x > y) - (x < y) is equivalent but not as performant
-    since it would not short-circuit.
+    :Returns:
+
+        `list`
+
+        '''
+        recs = self._recs
+        if recs is None:
+            file = getattr(self, 'file', None)
+            table = self.table
+            recs = [Rec.from_table(table, index, file=file)
+                    for index in self.indices.tolist()]
+            for rec in recs:
+                rec.var = self
+
+            self._recs = recs
+
+        return recs
+
+    def headers(self, recs=None):
+        '''Return the rows of the table of record headers for records of
+    the variable.
+
+    :Parameters:
+
+        recs: sequence of `Rec`, optional
+            The records, which must belong to the variable. By
+            default all records are selected, in their original
+            order.
 
     :Returns:
 
-        `int`
+        `numpy.ndarray`
+            The table rows, one for each record.
 
         '''
-        if x == y:
-            return 0
-        elif x > y:
-            return 1
-        else:
-            return -1
+        if recs is None:
+            return self.table[self.indices]
 
-    def _compare_recs_by_extra_data(self, a, b):
-        '''TODO
+        return self.table[[rec._index for rec in recs]]
+
+    @property
+    def int_hdr(self):
+        '''The integer headers of all records, one row per record.
 
     :Returns:
 
-        `int`
+        `numpy.ndarray`
 
         '''
-        return self._compare(a.get_extra_data(), b.get_extra_data())
+        return self.table['int_hdr'][self.indices]
 
-    def _compare_recs_by_orig_order(self, a, b):
-        '''TODO
+    @property
+    def real_hdr(self):
+        '''The real headers of all records, one row per record.
 
     :Returns:
 
-        `int`
+        `numpy.ndarray`
 
         '''
-        return self._compare(self.recs.index(a), self.recs.index(b))
+        return self.table['real_hdr'][self.indices]
 
     def group_records_by_extra_data(self):
         '''Returns a list of (sub)lists of records where each records within
@@ -212,39 +296,79 @@ class Var:
     of length 1.
 
     Within each group, the ordering of returned records is the same as
-    in the `!recs` attribute.
+    in the `!recs` attribute. The groups are ordered by their extra
+    data, as compared by `ExtraData.compare`.
+
+    The records are first labelled by the exact values of their extra
+    data (see `ExtraData.key`), so that only one record for each
+    distinct set of values is read and compared. The distinct extra
+    data are then sorted, and neighbours that are equal to within the
+    comparison tolerance are put into the same group. Records without
+    extra data, as indicated by the LBEXT header item, are not read.
 
     :Returns:
 
         `list`
 
         '''
-        compare = self._compare_recs_by_extra_data
-        recs = self.recs[:]
+        recs = self.recs
         n = len(recs)
         if n == 0:
             # shouldn't have a var without records, but...
             return []
 
-#        recs.sort(compare) #python2
-        recs.sort(key=cmp_to_key(compare))
-
-        # optimise simple case - if two ends of a sorted list match,
-        # the whole list matches
-        if not compare(recs[0], recs[-1]):
-            return [self.recs[:]]
-
-        groups = []
-        this_grp = []
-        for i, rec in enumerate(recs):
-            this_grp.append(rec)
-            if i == n - 1 or compare(rec, recs[i + 1]):
-                this_grp.sort(key=self._compare_recs_by_orig_order)
-                groups.append(this_grp)
-                this_grp = []
+        lbext = self.int_hdr[:, _LBEXT]
+        if (lbext <= 0).all():
+            # No record has extra data
+            return [recs[:]]
+
+        labels = {}
+        extra_data = []
+        rec_labels = []
+        for rec, x in zip(recs, lbext.tolist()):
+            if x > 0:
+                extra = rec.get_extra_data()
+            else:
+                extra = ExtraData()
+
+            label = labels.setdefault(extra.key(), len(labels))
+            if label == len(extra_data):
+                extra_data.append(extra)
+
+            rec_labels.append(label)
+        # --- End: for
+
+        if len(labels) == 1:
+            return [recs[:]]
+
+        # Sort the distinct extra data, and merge neighbours that are
+        # equal to within the tolerance
+        key = cmp_to_key(ExtraData.compare)
+        order = sorted(range(len(extra_data)),
+                       key=lambda i: key(extra_data[i]))
+
+        group_index = numpy.empty(len(extra_data), dtype=int)
+        group = 0
+        group_index[order[0]] = group
+        for previous, label in zip(order[:-1], order[1:]):
+            if extra_data[previous].compare(extra_data[label]):
+                group += 1
+
+            group_index[label] = group
         # --- End: for
 
-        return groups
+        if not group:
+            return [recs[:]]
+
+        # A stable sort of the records' group indices gives the
+        # groups in order, each with its records in the original
+        # order
+        rec_groups = group_index[rec_labels]
+        order = numpy.argsort(rec_groups, kind='stable')
+        splits = numpy.flatnonzero(numpy.diff(rec_groups[order])) + 1
+
+        return [[recs[i] for i in group.tolist()]
+                for group in numpy.split(order, splits)]
 
 # --- End: class
 
@@ -252,6 +376,10 @@ class Var:
 class Rec:
     '''Container for some information about records.
 
+    The headers, offsets and length of the record are stored in a row
+    of a table of record headers, which may be shared with other
+    records.
+
     '''
     def __init__(self, int_hdr, real_hdr, hdr_offset, data_offset, disk_length,
                  file=None):
@@ -270,15 +398,107 @@ class Rec:
             than directly.
 
         '''
-        self.int_hdr = int_hdr
-        self.real_hdr = real_hdr
-        self.hdr_offset = hdr_offset
-        self.data_offset = data_offset
-        self.disk_length = disk_length
+        table = numpy.empty(
+            1, dtype=cInterface.header_dtype(int_hdr.dtype, real_hdr.dtype)
+        )
+        table['int_hdr'] = int_hdr
+        table['real_hdr'] = real_hdr
+        table['hdr_offset'] = hdr_offset
+        table['data_offset'] = data_offset
+        table['disk_length'] = disk_length
+
+        self._table = table
+        self._index = 0
         self._extra_data = None
         if file:
             self.file = file
 
+    @classmethod
+    def from_table(cls, table, index, file=None):
+        '''Instantiate a `Rec` object as a view of a row of a table of
+    record headers.
+
+    :Parameters:
+
+        table: `numpy.ndarray`
+            The table of record headers, as created by
+            `CInterface.parse_file`.
+
+        index: `int`
+            The row of the table that contains the record.
+
+        file: `File`, optional
+            Used to set the `!file` attribute.
+
+   :Returns:
+
+        `Rec`
+
+        '''
+        rec = cls.__new__(cls)
+        rec._table = table
+        rec._index = index
+        rec._extra_data = None
+        if file:
+            rec.file = file
+
+        return rec
+
+    @property
+    def int_hdr(self):
+        '''The integer header.
+
+    :Returns:
+
+        `numpy.ndarray`
+
+        '''
+        return self._table['int_hdr'][self._index]
+
+    @property
+    def real_hdr(self):
+        '''The real header.
+
+    :Returns:
+
+        `numpy.ndarray`
+
+        '''
+        return self._table['real_hdr'][self._index]
+
+    @property
+    def hdr_offset(self):
+        '''The start word in the file of the header.
+
+    :Returns:
+
+        `int`
+
+        '''
+        return self._table['hdr_offset'].item(self._index)
+
+    @property
+    def data_offset(self):
+        '''The start word in the file of the data.
+
+    :Returns:
+
+        `int`
+
+        '''
+        return self._table['data_offset'].item(self._index)
+
+    @property
+    def disk_length(self):
+        '''The length in words of the data in the file.
+
+    :Returns:
+
+        `int`
+
+        '''
+        return self._table['disk_length'].item(self._index)
+
     @classmethod
     def from_file_and_offsets(cls, file, hdr_offset, data_offset,
                               disk_length):